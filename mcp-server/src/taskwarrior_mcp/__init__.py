@@ -1,11 +1,26 @@
 """Taskwarrior MCP Server — Python-Backend für Claude Code und andere MCP-Clients."""
 
-from taskwarrior_mcp.server import mcp
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from taskwarrior_mcp.server import mcp
 
 
 def main() -> None:
     """Entry-Point für `taskwarrior-mcp` CLI und `uvx taskwarrior-mcp`."""
+    from taskwarrior_mcp.server import mcp
+
     mcp.run()
 
 
+def __getattr__(name: str) -> Any:
+    # FastMCP (und damit das mcp-Paket) erst laden, wenn der Server gebraucht wird:
+    # `import taskwarrior_mcp.dates` o.ä. bleibt so schnell
+    if name == "mcp":
+        from taskwarrior_mcp.server import mcp
+
+        return mcp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = ["main", "mcp"]
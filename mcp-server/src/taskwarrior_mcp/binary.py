@@ -0,0 +1,76 @@
+"""Persistenter Cache für das Ergebnis von `task --version`.
+
+Jede MCP-Sitzung startet einen eigenen Serverprozess. Damit nicht jeder
+Start `task --version` ausführen muss, wird die Version pro aufgelöstem
+Binary-Pfad gespeichert — zusammen mit Inode, mtime und Größe der Datei.
+Ein Update des Binaries ändert diese Werte und macht den Eintrag ungültig.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_CACHE_FILENAME = "binary.json"
+
+
+def default_cache_path() -> Path:
+    """$XDG_CACHE_HOME/taskwarrior-mcp/binary.json (Standard: ~/.cache)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "taskwarrior-mcp" / _CACHE_FILENAME
+
+
+def binary_stamp(path: str) -> list[int] | None:
+    """Inode, mtime (ns) und Größe des Binaries (None, falls nicht lesbar)."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_ino, st.st_mtime_ns, st.st_size]
+
+
+class VersionCache:
+    """Zuordnung aufgelöster Binary-Pfad → (Stempel, Version) in einer JSON-Datei.
+
+    Fehler beim Lesen oder Schreiben sind nie fatal: im schlimmsten Fall wird
+    `task --version` wie bisher ausgeführt.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def _load(self) -> dict:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def get(self, binary: str) -> str | None:
+        """Gespeicherte Version, solange das Binary unverändert ist."""
+        entry = self._load().get(os.path.realpath(binary))
+        if not isinstance(entry, dict):
+            return None
+        stamp = binary_stamp(binary)
+        if stamp is None or entry.get("stamp") != stamp:
+            return None
+        version = entry.get("version")
+        return version if isinstance(version, str) and version else None
+
+    def put(self, binary: str, version: str) -> None:
+        stamp = binary_stamp(binary)
+        if stamp is None:
+            return
+        data = self._load()
+        data[os.path.realpath(binary)] = {"stamp": stamp, "version": version}
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(data, indent=1), encoding="utf-8")
+            # Atomar ersetzen: parallel startende Server lesen nie eine halbe Datei
+            os.replace(tmp, self.path)
+        except OSError as exc:
+            logger.debug("Versions-Cache nicht schreibbar (%s): %s", self.path, exc)
+            tmp.unlink(missing_ok=True)
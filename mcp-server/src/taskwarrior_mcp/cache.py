@@ -0,0 +1,240 @@
+"""In-Process-Cache für den vollständigen Task-Export.
+
+Hält pro data.location den letzten vollständigen Export (Snapshot). Ein
+Snapshot gilt, solange sich die Datendateien (mtime/Größe/Inode) nicht
+geändert haben und er jünger als die TTL ist. Der TaskwarriorClient
+invalidiert ihn zusätzlich nach jedem Schreibzugriff; Änderungen an genau
+einem Task (modify, start, stop) ersetzt er per replace() direkt im Snapshot.
+
+Filter werden über einen TaskIndex (index.py) ausgewertet, der beim ersten
+select() entsteht und bei replace() inkrementell nachgeführt wird; ebenso
+die Urgency-Spalten für task_next und der Volltextindex für task_search.
+"""
+
+import itertools
+import logging
+import os
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from taskwarrior_mcp.filters import SimpleFilter
+from taskwarrior_mcp.index import TaskIndex
+
+if TYPE_CHECKING:
+    from taskwarrior_mcp.search import SearchIndex
+    from taskwarrior_mcp.urgency import UrgencyCoefficients, UrgencyColumns
+
+logger = logging.getLogger(__name__)
+
+# Dateien, deren Änderung einen Snapshot ungültig macht (TW2 und TW3)
+WATCHED_FILES = (
+    "pending.data",
+    "completed.data",
+    "undo.data",
+    "taskchampion.sqlite3",
+    "taskchampion.sqlite3-wal",
+)
+
+FileStamp = tuple[tuple[str, int, int, int], ...]
+
+_versions = itertools.count(1)
+
+
+@dataclass
+class CacheStats:
+    """Zähler für Cache-Zugriffe."""
+
+    hits: int = 0
+    misses: int = 0
+    loads: int = 0
+    invalidations: int = 0
+    updates: int = 0
+    discarded: int = 0
+
+    def as_dict(self) -> dict[str, int | float]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "loads": self.loads,
+            "invalidations": self.invalidations,
+            "updates": self.updates,
+            "discarded": self.discarded,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+@dataclass
+class Snapshot:
+    """Unveränderlicher Stand aller Tasks (Format von `task export`).
+
+    Die enthaltenen Dicts werden geteilt und dürfen nicht verändert werden.
+    """
+
+    tasks: list[dict]
+    stamp: FileStamp
+    version: int = field(default_factory=lambda: next(_versions))
+    loaded_at: float = field(default_factory=time.monotonic)
+    _index: TaskIndex | None = field(default=None, repr=False)
+    _urgency: "UrgencyColumns | None" = field(default=None, repr=False)
+    _search: "SearchIndex | None" = field(default=None, repr=False)
+
+    @property
+    def index(self) -> TaskIndex:
+        """Sekundärindizes, beim ersten Zugriff aufgebaut."""
+        if self._index is None:
+            self._index = TaskIndex(self.tasks)
+        return self._index
+
+    def matching(self, query: SimpleFilter, now: float) -> Iterator[int]:
+        """Positionen aller Treffer in Snapshot-Reihenfolge (limit wird ignoriert)."""
+        tasks = self.tasks
+        plan = self.index.plan(query)
+        if plan is None:
+            return (p for p, task in enumerate(tasks) if query.matches(task, now))
+        positions, residual = plan
+        return (p for p in positions if residual.matches(tasks[p], now))
+
+    def select(self, query: SimpleFilter, now: float) -> list[dict]:
+        """Wie query.select(self.tasks, now), aber nur über die Index-Kandidaten."""
+        positions = itertools.islice(self.matching(query, now), query.limit)
+        return [dict(self.tasks[position]) for position in positions]
+
+    def urgency(self, coefficients: "UrgencyCoefficients") -> "UrgencyColumns":
+        """Urgency-Spalten für diese Koeffizienten, beim ersten Zugriff aufgebaut."""
+        if self._urgency is None or self._urgency.coefficients != coefficients:
+            from taskwarrior_mcp.urgency import UrgencyColumns
+
+            self._urgency = UrgencyColumns(self.tasks, coefficients)
+        return self._urgency
+
+    @property
+    def search(self) -> "SearchIndex":
+        """Volltextindex über Beschreibungen und Annotationen, beim ersten Zugriff aufgebaut."""
+        if self._search is None:
+            from taskwarrior_mcp.search import SearchIndex
+
+            self._search = SearchIndex(self.tasks)
+        return self._search
+
+
+class SnapshotCache:
+    """Snapshot-Cache für genau ein Datenverzeichnis."""
+
+    def __init__(self, data_dir: Path, ttl: float = 30.0) -> None:
+        self.data_dir = data_dir
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._snapshot: Snapshot | None = None
+        # Zählt Invalidierungen und Ersetzungen; erkennt Schreibzugriffe während eines Exports
+        self.generation = 0
+
+    def stamp(self) -> FileStamp:
+        """Aktueller Zustand der Datendateien."""
+        entries = []
+        for name in WATCHED_FILES:
+            try:
+                st = os.stat(self.data_dir / name)
+            except OSError:
+                continue
+            entries.append((name, st.st_ino, st.st_size, st.st_mtime_ns))
+        return tuple(entries)
+
+    def get(self) -> Snapshot | None:
+        """Gültiger Snapshot oder None (zählt Treffer bzw. Fehlschlag)."""
+        snapshot = self._snapshot
+        if (
+            snapshot is not None
+            and time.monotonic() - snapshot.loaded_at < self.ttl
+            and snapshot.stamp == self.stamp()
+        ):
+            self.stats.hits += 1
+            return snapshot
+        self.stats.misses += 1
+        return None
+
+    def store(self, tasks: list[dict], stamp: FileStamp, generation: int | None = None) -> Snapshot:
+        """Speichert einen vollständigen Export als Snapshot.
+
+        stamp und generation müssen vor dem Export gelesen werden. Hat sich
+        eines von beiden seitdem geändert (Schreibzugriff während des Exports),
+        wird der Snapshot nur zurückgegeben, aber nicht gespeichert.
+        """
+        snapshot = Snapshot(tasks=tasks, stamp=stamp)
+        if (generation is not None and generation != self.generation) or stamp != self.stamp():
+            self.stats.discarded += 1
+            return snapshot
+        self.stats.loads += 1
+        self._snapshot = snapshot
+        return snapshot
+
+    def replace(self, task: dict, expected: FileStamp, stamp: FileStamp) -> bool:
+        """Ersetzt einen geänderten Task im Snapshot (gleiche UUID, Status, depends).
+
+        expected ist der Dateistempel vor dem Schreibzugriff, stamp der danach.
+        Passt der Snapshot nicht zu expected (zwischendurch andere Änderungen)
+        oder ändert sich mehr als dieser eine Task (Status, Wiederholungen),
+        wird der Snapshot verworfen. Der neue Snapshot übernimmt die Indizes
+        des alten und führt sie nach; die TTL läuft weiter.
+
+        Returns:
+            True, wenn der Snapshot aktualisiert wurde.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            return False
+        position = snapshot.index.positions.get(task["uuid"])
+        old = snapshot.tasks[position] if position is not None else None
+        if (
+            old is None
+            or snapshot.stamp != expected
+            or old.get("status") != task.get("status")
+            or old.get("depends") != task.get("depends")  # ändert Urgency anderer Tasks
+            or any(key in item for key in ("recur", "parent") for item in (old, task))
+        ):
+            self.invalidate()
+            return False
+        self.generation += 1
+        tasks = list(snapshot.tasks)
+        tasks[position] = task
+        index, snapshot._index = snapshot._index, None
+        index.update(position, old, task)
+        urgency, snapshot._urgency = snapshot._urgency, None
+        if urgency is not None:
+            urgency.update(position, task)
+        search, snapshot._search = snapshot._search, None
+        if search is not None:
+            search.update(position, old, task)
+        self._snapshot = Snapshot(
+            tasks=tasks,
+            stamp=stamp,
+            loaded_at=snapshot.loaded_at,
+            _index=index,
+            _urgency=urgency,
+            _search=search,
+        )
+        self.stats.updates += 1
+        return True
+
+    def invalidate(self) -> None:
+        self.generation += 1
+        if self._snapshot is not None:
+            self.stats.invalidations += 1
+            self._snapshot = None
+
+
+# Ein Cache pro data.location — auch über mehrere Clients hinweg
+_CACHES: dict[Path, SnapshotCache] = {}
+
+
+def get_snapshot_cache(data_dir: Path, ttl: float = 30.0) -> SnapshotCache:
+    """Gibt den gemeinsamen Cache für ein Datenverzeichnis zurück."""
+    key = Path(os.path.abspath(data_dir))
+    cache = _CACHES.get(key)
+    if cache is None:
+        cache = SnapshotCache(key, ttl)
+        _CACHES[key] = cache
+    return cache
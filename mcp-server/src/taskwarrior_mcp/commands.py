@@ -0,0 +1,124 @@
+"""Befehle von `task`, gemeinsam für Validierung, Metriken und Protokolle.
+
+TASK_COMMANDS enthält alle Befehle und Reports von Taskwarrior 2.6/3 samt
+mitgelieferter Aliase (sync, burndown, history, ...) und der internen
+Hilfsbefehle (_get, _unique, ...). `task` erkennt Befehle auch abgekürzt
+(abbreviation.minimum, Standard 2): `mod` ist modify, `del` ist delete.
+"""
+
+# Alle Befehle, Reports und Standard-Aliase von `task`
+TASK_COMMANDS = frozenset(
+    {
+        "_aliases",
+        "_columns",
+        "_commands",
+        "_config",
+        "_context",
+        "_get",
+        "_ids",
+        "_projects",
+        "_show",
+        "_tags",
+        "_udas",
+        "_unique",
+        "_urgency",
+        "_uuids",
+        "_version",
+        "_zshattributes",
+        "_zshcommands",
+        "_zshids",
+        "_zshuuids",
+        "active",
+        "add",
+        "all",
+        "annotate",
+        "append",
+        "blocked",
+        "blocking",
+        "burndown",
+        "burndown.daily",
+        "burndown.monthly",
+        "burndown.weekly",
+        "calc",
+        "calendar",
+        "colors",
+        "columns",
+        "commands",
+        "completed",
+        "config",
+        "context",
+        "count",
+        "delete",
+        "denotate",
+        "diagnostics",
+        "done",
+        "duplicate",
+        "edit",
+        "execute",
+        "export",
+        "gc",
+        "ghistory",
+        "ghistory.annual",
+        "ghistory.daily",
+        "ghistory.monthly",
+        "ghistory.weekly",
+        "help",
+        "history",
+        "history.annual",
+        "history.daily",
+        "history.monthly",
+        "history.weekly",
+        "ids",
+        "import",
+        "import-v2",
+        "information",
+        "list",
+        "log",
+        "logo",
+        "long",
+        "ls",
+        "minimal",
+        "modify",
+        "newest",
+        "news",
+        "next",
+        "oldest",
+        "overdue",
+        "prepend",
+        "projects",
+        "purge",
+        "ready",
+        "recurring",
+        "reports",
+        "rm",
+        "show",
+        "start",
+        "stats",
+        "stop",
+        "summary",
+        "sync",
+        "synchronize",
+        "tags",
+        "timesheet",
+        "udas",
+        "unblocked",
+        "undo",
+        "uuids",
+        "version",
+        "waiting",
+    }
+)
+
+# Erstes dieser Argumente einer Befehlszeile ist der Unterbefehl (Metriken, Trace)
+SUBCOMMANDS = TASK_COMMANDS | {"--version"}
+
+# Kürzeste Abkürzung, die `task` als Befehl auflöst (abbreviation.minimum)
+MIN_ABBREVIATION = 2
+
+
+def abbreviates_command(word: str) -> bool:
+    """True, wenn `task` das Wort als (abgekürzten) Befehl verstehen würde."""
+    word = word.lower()
+    return len(word) >= MIN_ABBREVIATION and any(
+        command.startswith(word) for command in TASK_COMMANDS
+    )
@@ -13,11 +13,32 @@ class Settings(BaseSettings):
     """
 
     task_binary: str = "task"
-    task_data: str | None = None        # Override rc.data.location
-    taskrc: str | None = None           # Override TASKRC path
+    task_data: str | None = None  # Override rc.data.location
+    taskrc: str | None = None  # Override TASKRC path
     default_limit: int = 50
     command_timeout: int = 30
     log_level: str = "INFO"
-    auto_sync: bool = False             # task sync nach Schreiboperationen
+    auto_sync: bool = False  # task sync im Hintergrund nach Schreiboperationen
+    sync_debounce: float = 5.0  # Ruhezeit nach der letzten Änderung vor dem Sync (s)
+    sync_max_backoff: float = 300.0  # Max. Wartezeit zwischen Wiederholungen nach Fehlern (s)
+    max_parallel_reads: int = 4  # Gleichzeitige task-Prozesse pro data.location
+    max_pending_writes: int = 64  # Wartende Schreibzugriffe, 0 = unbegrenzt
+    cache_enabled: bool = False  # Snapshot-Cache für Lesezugriffe
+    cache_ttl: float = 30.0  # Max. Alter eines Snapshots in Sekunden
+    report_ttl: float = 5.0  # Geteilter Export für Übersichten ohne Cache (s), 0 = aus
+    page_snapshots: int = 16  # Gehaltene Paginierungs-Snapshots (LRU)
+    page_ttl: float = 300.0  # Gültigkeit eines Paginierungs-Cursors in Sekunden
+    native_reads: bool = False  # Lesen ohne task-Prozess (TW3 SQLite, TW2 *.data)
+    version_cache: bool = True  # task --version pro Binary (Inode/mtime) zwischenspeichern
+    metrics_file: str | None = None  # Metriken periodisch als Prometheus-Textdatei schreiben
+    metrics_interval: float = 15.0  # Schreibintervall für metrics_file in Sekunden
+    profile: str | None = None  # Verzeichnis für cProfile/tracemalloc-Profile (aus = None)
+    profile_rate: float = 1.0  # Anteil der profilierten Aufrufe (0.0-1.0)
+    profile_slow: float = 0.0  # Nur Aufrufe ab dieser Dauer (s) speichern
+    profile_tools: str = ""  # Kommagetrennte Tool-Namen, leer = alle Tools
+    profile_memory: bool = True  # tracemalloc-Snapshot zusätzlich zum cProfile
+    trace_file: str | None = None  # JSON-Lines-Span pro task-Prozess (Freitext geschwärzt)
+    slow_query_file: str | None = None  # JSON-Lines-Protokoll langsamer Exporte
+    slow_query_threshold: float = 1.0  # Ab dieser Dauer (s) gilt ein Export als langsam
 
     model_config = {"env_prefix": "TW_MCP_"}
@@ -0,0 +1,222 @@
+"""Nativer, inkrementeller Lesezugriff auf Taskwarrior-2-Datendateien.
+
+Taskwarrior 2 speichert Tasks zeilenweise im FF4-Format
+(`[description:"..." entry:"1700000000" status:"pending" ...]`) in
+pending.data und completed.data. Dieser Reader mappt die Dateien per mmap,
+merkt sich Größe, Offset und Prüfsummen von Anfang und Ende des bereits
+geparsten Bereichs und parst bei Änderungen nur angehängte bzw. tatsächlich
+geänderte Zeilen neu.
+"""
+
+import json
+import logging
+import mmap
+import os
+import re
+import time
+import zlib
+from pathlib import Path
+
+from taskwarrior_mcp.filters import SimpleFilter
+from taskwarrior_mcp.native import ACTIVE_STATUSES, NativeReadError, build_task
+from taskwarrior_mcp.urgency import UrgencyCoefficients, annotate_urgency, dependency_sets
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover — Windows
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# Bytes am Anfang und Ende des geparsten Bereichs, die die Anhänge-Prüfung vergleicht
+EDGE_WINDOW = 4096
+
+_ATTRIBUTE = re.compile(r'([^\s:\[\]"]+):"((?:[^"\\]|\\.)*)"')
+
+# Kodierung von Taskwarrior für Zeichen, die das FF4-Format selbst nutzt
+_FF4_ENTITIES = (("&open;", "["), ("&close;", "]"), ("&dquot;", '"'))
+
+
+def parse_ff4_line(line: str) -> dict[str, str]:
+    """Parst eine FF4-Zeile in ein Dict der gespeicherten Attribute."""
+    line = line.strip()
+    if not (line.startswith("[") and line.endswith("]")):
+        raise ValueError("Keine FF4-Zeile")
+    attrs: dict[str, str] = {}
+    for key, value in _ATTRIBUTE.findall(line[1:-1]):
+        if "\\" in value:
+            value = json.loads(f'"{value}"')
+        if "&" in value:
+            for entity, char in _FF4_ENTITIES:
+                value = value.replace(entity, char)
+        attrs[key] = value
+    return attrs
+
+
+class DataFile:
+    """Inkrementell geparste FF4-Datei.
+
+    tasks() liefert die Tasks der Datei in Dateireihenfolge (Exportformat ohne
+    Urgency). Bei unveränderter Datei (Inode, Größe, mtime) wird nichts gelesen.
+    Wurde nur angehängt (gleicher Inode, größer, Prüfsumme der ersten und
+    letzten EDGE_WINDOW Bytes des bekannten Bereichs unverändert), werden nur
+    die neuen Bytes geparst — ohne den bekannten Bereich erneut zu lesen. Sonst
+    wird die Datei zeilenweise verglichen und nur Zeilen mit neuer Prüfsumme
+    werden geparst.
+
+    Nicht erkannt wird eine Änderung gleicher Länge mitten in einer großen
+    Datei, zu der seit dem letzten Lesen zusätzlich Zeilen angehängt wurden;
+    jede Längenänderung verschiebt das Ende und fällt auf.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        numeric: frozenset[str] = frozenset(),
+        dates: frozenset[str] = frozenset(),
+    ) -> None:
+        self.path = path
+        self.numeric = numeric
+        self.dates = dates
+        self.parsed_lines = 0  # Anzahl tatsächlich geparster Zeilen (Diagnose)
+        self._stamp: tuple[int, int, int] | None = None
+        self._offset = 0
+        self._edge_crc = 0
+        self._keys: list[tuple[int, int]] = []
+        self._tasks: list[dict] = []
+
+    def tasks(self) -> list[dict]:
+        try:
+            fd = os.open(self.path, os.O_RDONLY)
+        except FileNotFoundError:
+            self._reset()
+            return self._tasks
+        except OSError as exc:
+            raise NativeReadError(f"{self.path} nicht lesbar: {exc}") from exc
+        try:
+            st = os.fstat(fd)
+            stamp = (st.st_ino, st.st_size, st.st_mtime_ns)
+            if stamp == self._stamp:
+                return self._tasks
+            self._lock_shared(fd)
+            if st.st_size == 0:
+                self._reset()
+            else:
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                    self._refresh(mm, st)
+            self._stamp = stamp
+            return self._tasks
+        finally:
+            os.close(fd)  # gibt auch den flock frei
+
+    def _lock_shared(self, fd: int) -> None:
+        """Shared Lock, damit keine halb geschriebene Datei gelesen wird."""
+        if fcntl is None:
+            return
+        try:
+            fcntl.flock(fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+        except OSError as exc:
+            raise NativeReadError(f"{self.path} ist gesperrt") from exc
+
+    def _reset(self) -> None:
+        self._stamp = None
+        self._offset = 0
+        self._edge_crc = 0
+        self._keys = []
+        self._tasks = []
+
+    def _refresh(self, mm: mmap.mmap, st: os.stat_result) -> None:
+        old_stamp = self._stamp
+        appended = (
+            old_stamp is not None
+            and old_stamp[0] == st.st_ino
+            and st.st_size > old_stamp[1]
+            and self._edges(mm, self._offset) == self._edge_crc
+        )
+        if appended:
+            self._scan(mm, self._offset, reuse={})
+        else:
+            reuse = dict(zip(self._keys, self._tasks))
+            self._keys, self._tasks, self._offset, self._edge_crc = [], [], 0, 0
+            self._scan(mm, 0, reuse)
+
+    def _scan(self, mm: mmap.mmap, start: int, reuse: dict[tuple[int, int], dict]) -> None:
+        """Liest vollständige Zeilen ab `start` und hängt sie an."""
+        size = len(mm)
+        pos = start
+        while pos < size:
+            end = mm.find(b"\n", pos)
+            if end == -1:
+                break  # unvollständige letzte Zeile — beim nächsten Mal
+            raw = mm[pos : end + 1]
+            pos = end + 1
+            key = (zlib.crc32(raw), len(raw))
+            task = reuse.get(key)
+            if task is None:
+                task = self._parse(raw)
+                if task is None:
+                    continue
+            self._keys.append(key)
+            self._tasks.append(task)
+        self._edge_crc = self._edges(mm, pos)
+        self._offset = pos
+
+    @staticmethod
+    def _edges(mm: mmap.mmap, end: int) -> int:
+        """Prüfsumme der ersten und letzten EDGE_WINDOW Bytes vor `end`."""
+        head = zlib.crc32(mm[: min(end, EDGE_WINDOW)])
+        return zlib.crc32(mm[max(0, end - EDGE_WINDOW) : end], head)
+
+    def _parse(self, raw: bytes) -> dict | None:
+        self.parsed_lines += 1
+        try:
+            attrs = parse_ff4_line(raw.decode("utf-8"))
+        except (UnicodeDecodeError, ValueError) as exc:
+            if raw.strip():
+                logger.debug("Ungültige Zeile in %s übersprungen: %s", self.path, exc)
+            return None
+        uuid = attrs.get("uuid")
+        if not uuid:
+            return None
+        return build_task(uuid, attrs, 0, self.numeric, self.dates)
+
+
+class DataDirReader:
+    """Read-only Reader für ein Taskwarrior-2-Datenverzeichnis."""
+
+    def __init__(
+        self,
+        data_dir: Path,
+        coefficients: UrgencyCoefficients,
+        numeric: frozenset[str] = frozenset(),
+        dates: frozenset[str] = frozenset(),
+    ) -> None:
+        self.data_dir = data_dir
+        self.coefficients = coefficients
+        self.pending = DataFile(data_dir / "pending.data", numeric, dates)
+        self.completed = DataFile(data_dir / "completed.data", numeric, dates)
+
+    def export(self, query: SimpleFilter) -> list[dict]:
+        """Liefert alle Tasks, die `query` erfüllen, im Format von `task export`."""
+        if not self.data_dir.is_dir():
+            raise NativeReadError(f"{self.data_dir} existiert nicht")
+        now = time.time()
+        # IDs zählen die offenen Tasks in pending.data durch; erledigte Zeilen
+        # (bis zum nächsten `task gc`) bekommen 0. Die Dicts von DataFile sind
+        # gecacht und werden daher nur als Kopie nummeriert und bewertet.
+        pending = []
+        next_id = 1
+        for task in self.pending.tasks():
+            if task.get("status") in ACTIVE_STATUSES:
+                pending.append({**task, "id": next_id})
+                next_id += 1
+            else:
+                pending.append({**task, "id": 0})
+        candidates = pending
+        if query.status not in ACTIVE_STATUSES:
+            candidates = pending + [{**task} for task in self.completed.tasks()]
+
+        matched = query.select(candidates, now)
+        open_uuids, blocking = dependency_sets(pending)
+        annotate_urgency(matched, self.coefficients, now, open_uuids, blocking)
+        return matched
@@ -0,0 +1,175 @@
+"""Auflösung von Taskwarrior-Datumsangaben ohne `task`-Prozess.
+
+Deckt die Formen ab, deren Bedeutung in Taskwarrior 2 und 3 identisch ist:
+ISO-Datum/-Zeit, Epoch-Sekunden, now/today/sod/yesterday/tomorrow,
+Wochentage, som/soy und relative Dauern (+2d, 3w, -1h). Alles andere
+(eow, eom, eoy, Ausdrücke, ...) liefert None — der Aufrufer muss dann
+`task` selbst auswerten lassen.
+
+Mit periods=True kommen die Periodengrenzen sow/eow, soq/eoq, eod, eom und
+eoy hinzu. eo* ist dabei wie seit Taskwarrior 2.6 die letzte Sekunde der
+Periode (ältere Versionen liefern den Beginn der nächsten); die Woche beginnt
+am Tag aus `weekstart` der taskrc.
+"""
+
+import re
+from datetime import datetime, timedelta, timezone
+
+# Dauer in Sekunden wie bei Taskwarrior (Monat = 30 Tage, Jahr = 365 Tage)
+_DURATION_UNITS = {
+    "s": 1,
+    "sec": 1,
+    "secs": 1,
+    "second": 1,
+    "seconds": 1,
+    "min": 60,
+    "mins": 60,
+    "minute": 60,
+    "minutes": 60,
+    "h": 3600,
+    "hr": 3600,
+    "hrs": 3600,
+    "hour": 3600,
+    "hours": 3600,
+    "d": 86400,
+    "day": 86400,
+    "days": 86400,
+    "w": 604800,
+    "wk": 604800,
+    "wks": 604800,
+    "week": 604800,
+    "weeks": 604800,
+    "mo": 2592000,
+    "mos": 2592000,
+    "month": 2592000,
+    "months": 2592000,
+    "q": 7776000,
+    "qtr": 7776000,
+    "qtrs": 7776000,
+    "quarter": 7776000,
+    "quarters": 7776000,
+    "y": 31536000,
+    "yr": 31536000,
+    "yrs": 31536000,
+    "year": 31536000,
+    "years": 31536000,
+}
+
+_WEEKDAYS = {
+    "monday": 0,
+    "mon": 0,
+    "tuesday": 1,
+    "tue": 1,
+    "wednesday": 2,
+    "wed": 2,
+    "thursday": 3,
+    "thu": 3,
+    "friday": 4,
+    "fri": 4,
+    "saturday": 5,
+    "sat": 5,
+    "sunday": 6,
+    "sun": 6,
+}
+
+# Python-Wochentag (Montag = 0) des Wochenbeginns je Wert von rc.weekstart
+WEEKSTARTS = {"sunday": 6, "monday": 0}
+
+_DURATION = re.compile(r"^([+-]?)(\d+)\s*([a-z]+)$")
+_EPOCH = re.compile(r"^\d{9,10}$")
+_ISO_DATE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})$")
+_ISO_DATETIME = re.compile(r"^(\d{4})-(\d{2})-(\d{2})[T ](\d{2}):(\d{2})(?::(\d{2}))?(Z)?$")
+_COMPACT = re.compile(r"^(\d{4})(\d{2})(\d{2})T(\d{2})(\d{2})(\d{2})Z$")
+
+
+def _local_midnight(now: float, days: int = 0) -> float:
+    """Lokale Mitternacht des Tages von `now` plus `days` Tage (DST-sicher)."""
+    day = datetime.fromtimestamp(now).date() + timedelta(days=days)
+    return datetime(day.year, day.month, day.day).timestamp()
+
+
+def _named(value: str, now: float) -> float | None:
+    if value == "now":
+        return now
+    if value in ("today", "sod"):
+        return _local_midnight(now)
+    if value == "yesterday":
+        return _local_midnight(now, -1)
+    if value == "tomorrow":
+        return _local_midnight(now, 1)
+    if value in _WEEKDAYS:
+        # Wie Taskwarrior: das nächste Vorkommen, heute ausgenommen
+        today = datetime.fromtimestamp(now).weekday()
+        ahead = (_WEEKDAYS[value] - today) % 7 or 7
+        return _local_midnight(now, ahead)
+    if value == "som":
+        local = datetime.fromtimestamp(now)
+        return datetime(local.year, local.month, 1).timestamp()
+    if value == "soy":
+        return datetime(datetime.fromtimestamp(now).year, 1, 1).timestamp()
+    return None
+
+
+def _period(value: str, now: float, weekstart: str) -> float | None:
+    """Beginn (so*) bzw. letzte Sekunde (eo*) der aktuellen Periode."""
+    local = datetime.fromtimestamp(now)
+    if value == "eod":
+        return _local_midnight(now, 1) - 1
+    if value in ("sow", "eow"):
+        start = (local.weekday() - WEEKSTARTS[weekstart]) % 7
+        if value == "sow":
+            return _local_midnight(now, -start)
+        return _local_midnight(now, 7 - start) - 1
+    if value == "eom":
+        year, month = (local.year + 1, 1) if local.month == 12 else (local.year, local.month + 1)
+        return datetime(year, month, 1).timestamp() - 1
+    if value in ("soq", "eoq"):
+        first = 3 * ((local.month - 1) // 3) + 1
+        if value == "soq":
+            return datetime(local.year, first, 1).timestamp()
+        year, month = (local.year + 1, 1) if first == 10 else (local.year, first + 3)
+        return datetime(year, month, 1).timestamp() - 1
+    if value == "eoy":
+        return datetime(local.year + 1, 1, 1).timestamp() - 1
+    return None
+
+
+def resolve_date(
+    value: str, now: float, *, periods: bool = False, weekstart: str = "sunday"
+) -> float | None:
+    """Wandelt eine Taskwarrior-Datumsangabe in Epoch-Sekunden um.
+
+    Lokale Angaben (ohne Z) werden in der lokalen Zeitzone interpretiert,
+    wie es `task` tut. None, wenn die Form nicht sicher auflösbar ist.
+    periods aktiviert sow/eow/eod/eom/soq/eoq/eoy (siehe Modul-Docstring).
+    """
+    text = value.strip().lower()
+    if not text:
+        return None
+    named = _named(text, now)
+    if named is None and periods and weekstart in WEEKSTARTS:
+        named = _period(text, now, weekstart)
+    if named is not None:
+        return named
+    if _EPOCH.match(text):
+        return float(text)
+    try:
+        if match := _ISO_DATE.match(text):
+            year, month, day = map(int, match.groups())
+            return datetime(year, month, day).timestamp()
+        if match := _ISO_DATETIME.match(value.strip()):
+            year, month, day, hour, minute = map(int, match.groups()[:5])
+            second = int(match.group(6) or 0)
+            tz = timezone.utc if match.group(7) else None
+            return datetime(year, month, day, hour, minute, second, tzinfo=tz).timestamp()
+        if match := _COMPACT.match(value.strip()):
+            parts = map(int, match.groups())
+            return datetime(*parts, tzinfo=timezone.utc).timestamp()
+    except ValueError:
+        return None  # z.B. 2025-02-30
+    if match := _DURATION.match(text):
+        sign, amount, unit = match.groups()
+        if unit in _DURATION_UNITS:
+            seconds = int(amount) * _DURATION_UNITS[unit]
+            return now - seconds if sign == "-" else now + seconds
+    return None
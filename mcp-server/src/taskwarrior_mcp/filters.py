@@ -0,0 +1,439 @@
+"""Auswertung häufiger Taskwarrior-Filter ohne `task`-Prozess.
+
+Unterstützt UUIDs bzw. UUID-Präfixe, status:, project: (das Projekt samt
+Unterprojekten), priority:, +tag/-tag, limit:, leere Attribute
+(due:), <datum>.before:/.after: mit benannten Daten (eow, today, +2d, ...),
+description.contains: sowie and/or und Klammern. Für alles andere liefert
+parse_filter() None und der Aufrufer nutzt `task`.
+
+Wie bei `task` bindet and stärker als or, und aufeinanderfolgende Terme ohne
+Operator sind and-verknüpft. Einfache Terme auf oberster Ebene landen in den
+Feldern von SimpleFilter (die nativen Reader filtern damit vor), alle übrigen
+Bedingungen in SimpleFilter.conditions.
+"""
+
+import re
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+
+from taskwarrior_mcp.dates import resolve_date
+from taskwarrior_mcp.native import DATE_ATTRIBUTES, effective_status, format_date
+
+_UUID_ARG = re.compile(
+    r"^[0-9a-f]{8}(?:-[0-9a-f]{4}(?:-[0-9a-f]{4}(?:-[0-9a-f]{4}(?:-[0-9a-f]{12})?)?)?)?$"
+)
+_TAG_ARG = re.compile(r"^[+-][\w\-\.]+$")
+_VALID_STATUSES = frozenset({"pending", "completed", "deleted", "waiting", "recurring"})
+
+# Modifikatoren für Datumsvergleiche: `task` behandelt below/under wie before
+_DATE_MODIFIERS = {
+    "before": "before",
+    "below": "before",
+    "under": "before",
+    "after": "after",
+    "above": "after",
+    "over": "after",
+}
+# contains ist ein Regex-Vergleich; nur Werte ohne Metazeichen sind reine Teilstrings
+_REGEX_META = re.compile(r"[\\^$.|?*+()\[\]{}]")
+# Operatoren, die nur `task` auswertet
+_UNSUPPORTED_OPERATORS = frozenset({"xor", "not", "!", "<", "<=", ">", ">=", "=", "==", "!=", "~"})
+
+# Virtuelle Tags wertet nur `task` selbst aus
+VIRTUAL_TAGS = frozenset(
+    {
+        "ACTIVE",
+        "ANNOTATED",
+        "BLOCKED",
+        "BLOCKING",
+        "CHILD",
+        "COMPLETED",
+        "DELETED",
+        "DUE",
+        "DUETODAY",
+        "INSTANCE",
+        "LATEST",
+        "MONTH",
+        "ORPHAN",
+        "OVERDUE",
+        "PARENT",
+        "PENDING",
+        "PRIORITY",
+        "PROJECT",
+        "QUARTER",
+        "READY",
+        "SCHEDULED",
+        "TAGGED",
+        "TEMPLATE",
+        "TODAY",
+        "TOMORROW",
+        "UDA",
+        "UNBLOCKED",
+        "UNTIL",
+        "WAITING",
+        "WEEK",
+        "YEAR",
+        "YESTERDAY",
+    }
+)
+
+
+@dataclass(frozen=True)
+class FilterOptions:
+    """Einstellungen aus der taskrc, die die Auswertung beeinflussen.
+
+    periods schaltet sow/eow/eom/... frei (Semantik ab Taskwarrior 2.6).
+    """
+
+    weekstart: str = "sunday"
+    case_sensitive: bool = True
+    periods: bool = False
+
+    @classmethod
+    def from_config(cls, config: dict[str, str], version: str) -> "FilterOptions":
+        """Liest weekstart und search.case.sensitive; periods erst ab Version 2.6."""
+        try:
+            major, minor = (int(part) for part in version.split(".")[:2])
+        except ValueError:
+            major, minor = 0, 0
+        sensitive = config.get("search.case.sensitive", "yes").strip().lower()
+        return cls(
+            weekstart=config.get("weekstart", "sunday").strip().lower(),
+            case_sensitive=sensitive in ("1", "yes", "on", "true", "y"),
+            periods=(major, minor) >= (2, 6),
+        )
+
+
+class _Unsupported(Exception):
+    """Intern: der Filter muss von `task` ausgewertet werden."""
+
+
+class Condition(ABC):
+    """Basisklasse der Bedingungen in SimpleFilter.conditions."""
+
+    @abstractmethod
+    def matches(self, task: dict, now: float) -> bool:
+        """Prüft ob ein Task (Exportformat) die Bedingung erfüllt."""
+
+
+def in_project(project: str, value: str) -> bool:
+    """project:value — das Projekt selbst oder ein Unterprojekt (Work trifft nicht Workshop)."""
+    return project == value or project.startswith(value + ".")
+
+
+@dataclass
+class AnyOf(Condition):
+    """Oder-Verknüpfung."""
+
+    terms: list[Condition]
+
+    def matches(self, task: dict, now: float) -> bool:
+        return any(term.matches(task, now) for term in self.terms)
+
+
+@dataclass
+class AllOf(Condition):
+    """Und-Verknüpfung."""
+
+    terms: list[Condition]
+
+    def matches(self, task: dict, now: float) -> bool:
+        return all(term.matches(task, now) for term in self.terms)
+
+
+@dataclass
+class StatusIs(Condition):
+    status: str
+
+    def matches(self, task: dict, now: float) -> bool:
+        return effective_status(task, now) == self.status
+
+
+@dataclass
+class ProjectIs(Condition):
+    """project:value; leerer Wert = Task ohne Projekt."""
+
+    value: str
+
+    def matches(self, task: dict, now: float) -> bool:
+        project = task.get("project") or ""
+        if self.value == "":
+            return not project
+        return in_project(project, self.value)
+
+
+@dataclass
+class StartsWith(Condition):
+    """attr:value wie `task`: linksbündiger Vergleich, leerer Wert = Attribut fehlt."""
+
+    attr: str
+    value: str
+
+    def matches(self, task: dict, now: float) -> bool:
+        actual = task.get(self.attr, "")
+        if self.value == "":
+            return not actual
+        return isinstance(actual, str) and actual.startswith(self.value)
+
+
+@dataclass
+class HasTag(Condition):
+    tag: str
+    present: bool = True
+
+    def matches(self, task: dict, now: float) -> bool:
+        return (self.tag in (task.get("tags") or ())) == self.present
+
+
+@dataclass
+class DateCompare(Condition):
+    """<attr>.before:/.after: — Tasks ohne das Attribut treffen nie zu.
+
+    Die Grenze liegt im Exportformat vor (UTC, feste Breite), daher genügt
+    ein Stringvergleich.
+    """
+
+    attr: str
+    modifier: str
+    bound: str
+
+    def matches(self, task: dict, now: float) -> bool:
+        actual = task.get(self.attr)
+        if not actual:
+            return False
+        return actual < self.bound if self.modifier == "before" else actual > self.bound
+
+
+@dataclass
+class Contains(Condition):
+    attr: str
+    needle: str
+    case_sensitive: bool = True
+
+    def matches(self, task: dict, now: float) -> bool:
+        actual = task.get(self.attr) or ""
+        if self.case_sensitive:
+            return self.needle in actual
+        return self.needle.lower() in actual.lower()
+
+
+@dataclass
+class _Uuid:
+    """Nur auf oberster Ebene erlaubt (wird dort zu SimpleFilter.uuids)."""
+
+    prefix: str
+
+
+@dataclass
+class _Limit:
+    value: int
+
+
+@dataclass
+class SimpleFilter:
+    """Konjunktion von Filterbedingungen (UUIDs untereinander ODER-verknüpft).
+
+    Die Felder decken die einfachen Terme ab; conditions enthält alle weiteren
+    Bedingungen, die zusätzlich erfüllt sein müssen.
+    """
+
+    uuids: list[str] = field(default_factory=list)
+    status: str | None = None
+    project: str | None = None
+    priority: str | None = None
+    tags_include: list[str] = field(default_factory=list)
+    tags_exclude: list[str] = field(default_factory=list)
+    limit: int | None = None
+    conditions: list[Condition] = field(default_factory=list)
+
+    def matches(self, task: dict, now: float) -> bool:
+        """Prüft ob ein Task (Exportformat) alle Bedingungen erfüllt."""
+        if self.uuids and not any(task["uuid"].startswith(u) for u in self.uuids):
+            return False
+        if self.status is not None and effective_status(task, now) != self.status:
+            return False
+        if self.project is not None:
+            # project:Work trifft Work und Work.Sub, aber nicht Workshop
+            project = task.get("project", "")
+            if self.project == "":
+                if project:
+                    return False
+            elif not in_project(project, self.project):
+                return False
+        if self.priority is not None:
+            priority = task.get("priority", "")
+            if self.priority == "":
+                if priority:
+                    return False
+            elif not priority.startswith(self.priority):
+                return False
+        if self.tags_include or self.tags_exclude:
+            tags = task.get("tags") or ()
+            if any(tag not in tags for tag in self.tags_include):
+                return False
+            if any(tag in tags for tag in self.tags_exclude):
+                return False
+        return all(condition.matches(task, now) for condition in self.conditions)
+
+    def select(self, tasks: Iterable[dict], now: float) -> list[dict]:
+        """Passende Tasks in Eingabereihenfolge als flache Kopien, höchstens limit."""
+        matched = []
+        for task in tasks:
+            if self.matches(task, now):
+                matched.append(dict(task))
+                if self.limit is not None and len(matched) >= self.limit:
+                    break
+        return matched
+
+
+def _tokenize(args: Sequence[str]) -> list[str]:
+    """Trennt Klammern ab, auch wenn sie am Argument hängen ("(project:A")."""
+    tokens: list[str] = []
+    for arg in args:
+        closing = 0
+        while arg.startswith("("):
+            tokens.append("(")
+            arg = arg[1:]
+        while arg.endswith(")"):
+            closing += 1
+            arg = arg[:-1]
+        if arg:
+            tokens.append(arg)
+        tokens.extend(")" * closing)
+    return tokens
+
+
+class _Parser:
+    """Rekursiver Abstieg: expr := and ("or" and)*, and := primary (["and"] primary)*."""
+
+    def __init__(self, tokens: list[str], options: FilterOptions, now: float) -> None:
+        self.tokens = tokens
+        self.pos = 0
+        self.options = options
+        self.now = now
+
+    def parse(self) -> object:
+        term = self._or()
+        if self.pos != len(self.tokens):
+            raise _Unsupported  # überzählige ")"
+        return term
+
+    def _peek(self) -> str | None:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def _or(self) -> object:
+        terms = [self._and()]
+        while self._peek() == "or":
+            self.pos += 1
+            terms.append(self._and())
+        return terms[0] if len(terms) == 1 else AnyOf(terms)
+
+    def _and(self) -> object:
+        terms = [self._primary()]
+        while (token := self._peek()) is not None and token not in ("or", ")"):
+            if token == "and":
+                self.pos += 1
+            terms.append(self._primary())
+        return terms[0] if len(terms) == 1 else AllOf(terms)
+
+    def _primary(self) -> object:
+        token = self._peek()
+        if token is None or token in ("and", "or", ")"):
+            raise _Unsupported
+        self.pos += 1
+        if token == "(":
+            term = self._or()
+            if self._peek() != ")":
+                raise _Unsupported
+            self.pos += 1
+            return term
+        return self._leaf(token)
+
+    def _leaf(self, arg: str) -> object:
+        lowered = arg.lower()
+        if arg in _UNSUPPORTED_OPERATORS:
+            raise _Unsupported
+        if _UUID_ARG.match(lowered):
+            return _Uuid(lowered)
+        if _TAG_ARG.match(arg):
+            name = arg[1:]
+            if name in VIRTUAL_TAGS:
+                raise _Unsupported
+            return HasTag(name, arg[0] == "+")
+        if ":" not in arg:
+            raise _Unsupported  # Freitext sucht auch in Annotationen
+        key, value = arg.split(":", 1)
+        attr, _, modifier = key.partition(".")
+        if not modifier:
+            if key == "status" and value in _VALID_STATUSES:
+                return StatusIs(value)
+            if key == "project":
+                return ProjectIs(value)
+            if key == "priority":
+                return StartsWith(key, value)
+            if key == "limit" and value.isdigit():
+                return _Limit(int(value))
+            if key in DATE_ATTRIBUTES and value == "":
+                return StartsWith(key, "")
+        elif attr in DATE_ATTRIBUTES and modifier in _DATE_MODIFIERS:
+            epoch = resolve_date(
+                value, self.now, periods=self.options.periods, weekstart=self.options.weekstart
+            )
+            if epoch is not None:
+                return DateCompare(attr, _DATE_MODIFIERS[modifier], format_date(epoch))
+        elif key == "description.contains" and value and not _REGEX_META.search(value):
+            return Contains("description", value, self.options.case_sensitive)
+        raise _Unsupported
+
+
+def _conjuncts(term: object) -> list[object]:
+    """Terme einer Und-Verknüpfung auf oberster Ebene (geklammerte Unds flach)."""
+    if isinstance(term, AllOf):
+        return [part for sub in term.terms for part in _conjuncts(sub)]
+    return [term]
+
+
+def _nested_only(term: object) -> bool:
+    """UUIDs und limit: sind nur auf oberster Ebene sinnvoll."""
+    if isinstance(term, (_Uuid, _Limit)):
+        return False
+    if isinstance(term, (AnyOf, AllOf)):
+        return all(_nested_only(sub) for sub in term.terms)
+    return True
+
+
+def parse_filter(
+    args: Sequence[str], options: FilterOptions | None = None, now: float | None = None
+) -> SimpleFilter | None:
+    """Übersetzt Filterargumente in einen SimpleFilter, None wenn nicht unterstützt.
+
+    Relative Daten (today, eow, +2d) werden einmalig zu `now` aufgelöst.
+    """
+    if not args:
+        return SimpleFilter()
+    parser = _Parser(_tokenize(args), options or FilterOptions(), now or time.time())
+    try:
+        terms = _conjuncts(parser.parse())
+    except _Unsupported:
+        return None
+    result = SimpleFilter()
+    for term in terms:
+        if isinstance(term, _Uuid):
+            result.uuids.append(term.prefix)
+        elif isinstance(term, _Limit):
+            result.limit = term.value
+        elif isinstance(term, HasTag):
+            (result.tags_include if term.present else result.tags_exclude).append(term.tag)
+        elif isinstance(term, StatusIs) and result.status is None:
+            result.status = term.status
+        elif isinstance(term, ProjectIs) and result.project is None:
+            result.project = term.value
+        elif isinstance(term, StartsWith) and term.attr == "priority" and result.priority is None:
+            result.priority = term.value
+        elif _nested_only(term):
+            result.conditions.append(term)  # type: ignore[arg-type]
+        else:
+            return None
+    return result
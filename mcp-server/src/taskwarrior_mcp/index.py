@@ -0,0 +1,246 @@
+"""Sekundärindizes über einen Snapshot, damit Filter nicht alle Tasks prüfen.
+
+Der TaskIndex ordnet Status, Projekt und Tag jeweils der Menge passender
+Positionen im Snapshot zu und hält für due, scheduled und wait sortierte
+Arrays für Bereichsabfragen per bisect. Datumswerte liegen im Exportformat
+vor (UTC, feste Breite) — ihre Stringreihenfolge ist die zeitliche.
+
+Mengen sind Bitmasken (int, Bit n = Position n): Schnitt und Vereinigung
+laufen so in C über ganze Maschinenwörter, und die Positionen kommen beim
+Auslesen ohne Sortieren in Snapshot-Reihenfolge heraus.
+
+plan() liefert die Kandidaten und den Teil des Filters, den der Index nicht
+exakt beantwortet (z.B. priority:, -tag oder der virtuelle Status waiting);
+nur dieser Rest wird pro Kandidat geprüft — und nur, bis limit erreicht ist.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+from dataclasses import replace
+
+from taskwarrior_mcp.filters import (
+    AllOf,
+    AnyOf,
+    Condition,
+    DateCompare,
+    HasTag,
+    ProjectIs,
+    SimpleFilter,
+    StatusIs,
+    in_project,
+)
+
+# Attribute mit sortiertem Index
+INDEXED_DATES = ("due", "scheduled", "wait")
+
+# Ob ein Task als pending oder waiting gilt, hängt von wait und der Uhrzeit ab
+_WAITING_GROUP = ("pending", "waiting")
+
+
+def to_mask(positions: Iterable[int], size: int) -> int:
+    """Bitmaske aus einzelnen Positionen (< size)."""
+    buffer = bytearray(size // 8 + 1)
+    for position in positions:
+        buffer[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def iter_positions(mask: int) -> Iterator[int]:
+    """Gesetzte Bits einer Maske in aufsteigender Reihenfolge."""
+    bits = bin(mask)
+    top = len(bits) - 1  # bits[top] ist Bit 0 ("0b" vorne)
+    index = bits.rfind("1", 2)
+    while index >= 2:
+        yield top - index
+        index = bits.rfind("1", 2, index)
+
+
+class _DateColumn:
+    """Sortierte Paare (Datum, Position) eines Datumsattributs.
+
+    Für Bereichsabfragen hält die Spalte alle _STEP Einträge die Maske des
+    bisherigen Präfixes; eine Bereichsmaske braucht so höchstens _STEP
+    Einzelbits. Nach Änderungen werden die Stützstellen neu aufgebaut.
+    """
+
+    _STEP = 512
+
+    def __init__(self, entries: Iterable[tuple[str, int]], size: int) -> None:
+        pairs = sorted(entries)
+        self.size = size
+        self.keys = [key for key, _ in pairs]
+        self.positions = [position for _, position in pairs]
+        self._prefixes: list[int] | None = None
+
+    def add(self, key: str, position: int) -> None:
+        index = bisect_right(self.keys, key)
+        self.keys.insert(index, key)
+        self.positions.insert(index, position)
+        self._prefixes = None
+
+    def remove(self, key: str, position: int) -> None:
+        index = bisect_left(self.keys, key)
+        while self.positions[index] != position:
+            index += 1
+        del self.keys[index]
+        del self.positions[index]
+        self._prefixes = None
+
+    def _prefix(self, stop: int) -> int:
+        """Maske der ersten stop Einträge."""
+        if self._prefixes is None:
+            mask = 0
+            self._prefixes = [mask]
+            for start in range(0, len(self.positions), self._STEP):
+                mask |= to_mask(self.positions[start : start + self._STEP], self.size)
+                self._prefixes.append(mask)
+        base = stop // self._STEP
+        return self._prefixes[base] | to_mask(self.positions[base * self._STEP : stop], self.size)
+
+    def range(self, modifier: str, bound: str) -> int:
+        if modifier == "before":
+            return self._prefix(bisect_left(self.keys, bound))
+        return self._prefix(len(self.keys)) ^ self._prefix(bisect_right(self.keys, bound))
+
+
+class TaskIndex:
+    """Indizes über eine Taskliste; Positionen beziehen sich auf diese Liste."""
+
+    def __init__(self, tasks: list[dict]) -> None:
+        self.size = len(tasks)
+        self.positions: dict[str, int] = {}
+        status: dict[str, list[int]] = {}
+        project: dict[str, list[int]] = {}
+        tags: dict[str, list[int]] = {}
+        for position, task in enumerate(tasks):
+            self.positions[task["uuid"]] = position
+            status.setdefault(task.get("status", "pending"), []).append(position)
+            project.setdefault(task.get("project", ""), []).append(position)
+            for tag in task.get("tags") or ():
+                tags.setdefault(tag, []).append(position)
+        self.status = {key: to_mask(p, self.size) for key, p in status.items()}
+        self.project = {key: to_mask(p, self.size) for key, p in project.items()}
+        self.tags = {key: to_mask(p, self.size) for key, p in tags.items()}
+        # pending und waiting zusammen (siehe _WAITING_GROUP)
+        self.open = 0
+        for key in _WAITING_GROUP:
+            self.open |= self.status.get(key, 0)
+        self._uuids = sorted(self.positions)
+        self.dates = {
+            attr: _DateColumn(
+                ((task[attr], position) for position, task in enumerate(tasks) if task.get(attr)),
+                self.size,
+            )
+            for attr in INDEXED_DATES
+        }
+
+    def update(self, position: int, old: dict, new: dict) -> None:
+        """Ersetzt den Task an position (gleiche UUID) in allen Indizes."""
+        bit = 1 << position
+        for masks, before, after in (
+            (self.status, old.get("status", "pending"), new.get("status", "pending")),
+            (self.project, old.get("project", ""), new.get("project", "")),
+        ):
+            masks[before] &= ~bit
+            masks[after] = masks.get(after, 0) | bit
+        for tag in old.get("tags") or ():
+            self.tags[tag] &= ~bit
+        for tag in new.get("tags") or ():
+            self.tags[tag] = self.tags.get(tag, 0) | bit
+        if new.get("status", "pending") in _WAITING_GROUP:
+            self.open |= bit
+        else:
+            self.open &= ~bit
+        for attr, column in self.dates.items():
+            if old.get(attr) != new.get(attr):
+                if old.get(attr):
+                    column.remove(old[attr], position)
+                if new.get(attr):
+                    column.add(new[attr], position)
+
+    def _uuid_prefix(self, prefix: str) -> list[int]:
+        matched = []
+        for uuid in self._uuids[bisect_left(self._uuids, prefix) :]:
+            if not uuid.startswith(prefix):
+                break
+            matched.append(self.positions[uuid])
+        return matched
+
+    def _status(self, status: str) -> int:
+        if status in _WAITING_GROUP:
+            return self.open
+        return self.status.get(status, 0)
+
+    def _project(self, value: str) -> int:
+        if value == "":
+            return self.project.get("", 0)
+        mask = 0
+        for name, positions in self.project.items():
+            if in_project(name, value):
+                mask |= positions
+        return mask
+
+    def _condition(self, condition: Condition) -> tuple[int | None, bool]:
+        """Kandidaten einer Bedingung und ob sie genau den Treffern entsprechen.
+
+        (None, False), wenn die Bedingung nicht indiziert ist.
+        """
+        if isinstance(condition, HasTag) and condition.present:
+            return self.tags.get(condition.tag, 0), True
+        if isinstance(condition, StatusIs):
+            return self._status(condition.status), condition.status not in _WAITING_GROUP
+        if isinstance(condition, ProjectIs):
+            return self._project(condition.value), True
+        if isinstance(condition, DateCompare) and condition.attr in self.dates:
+            return self.dates[condition.attr].range(condition.modifier, condition.bound), True
+        if isinstance(condition, AnyOf):
+            mask, exact = 0, True
+            for term in condition.terms:
+                part, part_exact = self._condition(term)
+                if part is None:
+                    return None, False
+                mask |= part
+                exact = exact and part_exact
+            return mask, exact
+        if isinstance(condition, AllOf):
+            parts = [self._condition(term) for term in condition.terms]
+            exact = all(part is not None and part_exact for part, part_exact in parts)
+            return _intersect(part for part, _ in parts), exact
+        return None, False
+
+    def plan(self, query: SimpleFilter) -> tuple[Iterator[int], SimpleFilter] | None:
+        """Kandidaten in Snapshot-Reihenfolge und der noch zu prüfende Rest des Filters.
+
+        Bedingungen, die der Index exakt beantwortet, fehlen im Rest. None,
+        wenn kein Index greift.
+        """
+        masks: list[int | None] = []
+        residual = replace(query, uuids=[], project=None, tags_include=[], conditions=[])
+        if query.uuids:
+            prefixed = (p for prefix in query.uuids for p in self._uuid_prefix(prefix))
+            masks.append(to_mask(prefixed, self.size))
+        if query.status is not None:
+            masks.append(self._status(query.status))
+            if query.status not in _WAITING_GROUP:
+                residual.status = None
+        if query.project is not None:
+            masks.append(self._project(query.project))
+        masks.extend(self.tags.get(tag, 0) for tag in query.tags_include)
+        for condition in query.conditions:
+            mask, exact = self._condition(condition)
+            masks.append(mask)
+            if not exact:
+                residual.conditions.append(condition)
+        matched = _intersect(masks)
+        if matched is None:
+            return None
+        return iter_positions(matched), residual
+
+
+def _intersect(masks: Iterable[int | None]) -> int | None:
+    """Schnittmenge der indizierten Masken, None ohne Index."""
+    result = None
+    for mask in masks:
+        if mask is not None:
+            result = mask if result is None else result & mask
+    return result
@@ -0,0 +1,142 @@
+"""Inkrementelles Parsen der Ausgabe von `task export`.
+
+Mit rc.json.array=on schreibt Taskwarrior ein JSON-Array von Objekten.
+JSONArrayParser nimmt die Ausgabe stückweise entgegen und liefert jedes
+vollständige Objekt, sobald es eingetroffen ist — der Puffer enthält nie
+mehr als ein unvollständiges Objekt plus den zuletzt gelesenen Chunk.
+RawArrayCollector reicht die Ausgabe stattdessen als Text weiter, ohne
+Python-Objekte zu erzeugen (task_list ohne Nachbearbeitung).
+"""
+
+import json
+import re
+from typing import Any
+
+# Whitespace und Trennkommas zwischen den Array-Elementen
+_SEPARATORS = re.compile(r"[\s,]*")
+
+
+class JSONArrayParser:
+    """Parser für ein JSON-Array, das in beliebigen Stücken ankommt.
+
+    Ohne öffnende Klammer werden die Objekte wie JSON Lines gelesen
+    (Ausgabe mit rc.json.array=off).
+    """
+
+    def __init__(self) -> None:
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._started = False
+        self._finished = False
+
+    def feed(self, text: str) -> list[Any]:
+        """Nimmt weitere Ausgabe entgegen und gibt alle neu vollständigen Elemente zurück."""
+        if self._finished:
+            return []
+        buffer = self._buffer + text
+        items: list[Any] = []
+        pos = 0
+        while True:
+            pos = _SEPARATORS.match(buffer, pos).end()
+            if pos >= len(buffer):
+                break
+            if not self._started:
+                self._started = True
+                if buffer[pos] == "[":
+                    pos += 1
+                    continue
+            if buffer[pos] == "]":
+                self._finished = True
+                pos = len(buffer)
+                break
+            try:
+                item, pos_end = self._decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                break  # Element noch unvollständig — auf weitere Ausgabe warten
+            items.append(item)
+            pos = pos_end
+        self._buffer = buffer[pos:]
+        return items
+
+    def close(self) -> None:
+        """Prüft am Ende der Ausgabe, dass kein Rest übrig ist.
+
+        Raises:
+            ValueError: Die Ausgabe endet mitten in einem Element bzw. ist kein JSON.
+        """
+        if self._buffer.strip():
+            raise ValueError(f"Ungültiges oder unvollständiges JSON: {self._buffer[:80]!r}")
+
+
+class RawArrayCollector:
+    """Sammelt die Elemente eines `task export` als Rohtext, ohne sie zu parsen.
+
+    Taskwarrior schreibt mit rc.json.array=on "[", dann jedes Objekt in einer
+    eigenen Zeile (durch Kommas getrennt) und "]". Die Prüfung beschränkt sich
+    auf diese Zeilenform; weicht die Ausgabe davon ab, meldet result() einen
+    ValueError und der Aufrufer parst wie gewohnt.
+    """
+
+    def __init__(self, limit: int | None = None) -> None:
+        self.limit = limit
+        self._lines: list[bytes] = []
+        self._rest = b""
+        self._started = False
+        self._finished = False
+        self._invalid = False
+
+    @property
+    def done(self) -> bool:
+        """True, sobald weitere Ausgabe nichts mehr ändert (Ende, limit oder ungültig)."""
+        return (
+            self._finished
+            or self._invalid
+            or (self.limit is not None and len(self._lines) >= self.limit)
+        )
+
+    @property
+    def count(self) -> int:
+        """Bisher gesammelte Elemente."""
+        return len(self._lines)
+
+    def feed(self, chunk: bytes) -> None:
+        """Nimmt weitere Ausgabe entgegen; b"" markiert das Ende."""
+        if self.done:
+            return
+        lines = (self._rest + chunk).split(b"\n")
+        self._rest = lines.pop() if chunk else b""
+        for line in lines:
+            self._line(line.strip())
+            if self.done:
+                return
+
+    def _line(self, line: bytes) -> None:
+        if not line:
+            return
+        if not self._started:
+            self._started = True
+            self._finished = line == b"[]"
+            self._invalid = line not in (b"[", b"[]")
+            return
+        if line == b"]":
+            self._finished = True
+            return
+        if line.endswith(b","):
+            line = line[:-1]
+        if line[:1] != b"{" or line[-1:] != b"}":
+            self._invalid = True
+            return
+        self._lines.append(line)
+
+    def result(self) -> str:
+        """Das (ggf. auf limit gekürzte) Array als JSON-Text.
+
+        Raises:
+            ValueError: Die Ausgabe hat nicht die erwartete Zeilenform.
+        """
+        complete = self._finished or (self.limit is not None and len(self._lines) >= self.limit)
+        if self._invalid or (self._started and not complete):
+            raise ValueError("Ausgabe von task export hat nicht die erwartete Zeilenform")
+        if not self._lines:
+            return "[]"
+        return "[\n" + b",\n".join(self._lines).decode("utf-8", errors="replace") + "\n]"
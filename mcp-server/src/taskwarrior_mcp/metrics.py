@@ -0,0 +1,276 @@
+"""Laufzeitmetriken für Tool-Aufrufe und `task`-Prozesse.
+
+Metrics zählt pro MCP-Tool Aufrufe, Fehler und die Latenz (Histogramm),
+pro Taskwarrior-Unterbefehl (export, add, modify, ...) gestartete Prozesse,
+Fehlschläge, Laufzeit, stdout-Bytes und die Zeit für das JSON-Parsing.
+Die Histogramme haben feste Bucket-Grenzen wie bei Prometheus; Quantile
+werden daraus linear interpoliert und sind entsprechend Näherungen.
+
+as_dict() liefert die Werte für das Tool task_server_metrics,
+to_prometheus() das Prometheus-Textformat, das MetricsFileWriter bei
+gesetztem metrics_file periodisch schreibt (z.B. für den Textfile-Collector
+des node_exporter).
+"""
+
+import asyncio
+import logging
+import os
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from taskwarrior_mcp.commands import SUBCOMMANDS
+
+logger = logging.getLogger(__name__)
+
+# Obergrenzen der Latenz-Buckets in Sekunden
+LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+_PREFIX = "taskwarrior_mcp"
+
+
+def subcommand(cmd: Sequence[str]) -> str:
+    """Unterbefehl einer Befehlszeile (ohne Binary), "other" wenn keiner erkannt wird."""
+    for arg in cmd[1:]:
+        if arg in SUBCOMMANDS:
+            return arg
+    return "other"
+
+
+class Histogram:
+    """Verteilung von Messwerten über feste Buckets."""
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # letzter Bucket: +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """Näherung des q-Quantils (0 ohne Messwerte).
+
+        Interpoliert linear im Bucket, begrenzt auf kleinsten und größten Messwert.
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                lower = self.buckets[index - 1] if index else 0.0
+                upper = self.buckets[index] if index < len(self.buckets) else self.max
+                lower, upper = max(lower, self.min), min(upper, self.max)
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return self.max
+
+    def summary_ms(self) -> dict[str, float]:
+        """Mittelwert, p50/p95/p99 und Maximum in Millisekunden."""
+        mean = self.sum / self.count if self.count else 0.0
+        return {
+            "mean_ms": round(mean * 1000, 3),
+            "p50_ms": round(self.quantile(0.5) * 1000, 3),
+            "p95_ms": round(self.quantile(0.95) * 1000, 3),
+            "p99_ms": round(self.quantile(0.99) * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+@dataclass
+class ToolMetrics:
+    """Zähler eines MCP-Tools."""
+
+    calls: int = 0
+    errors: int = 0
+    latency: Histogram = field(default_factory=Histogram)
+
+    def as_dict(self) -> dict[str, int | float]:
+        return {"calls": self.calls, "errors": self.errors, **self.latency.summary_ms()}
+
+
+@dataclass
+class CommandMetrics:
+    """Zähler eines Taskwarrior-Unterbefehls."""
+
+    spawns: int = 0
+    failures: int = 0
+    stdout_bytes: int = 0
+    parse_seconds: float = 0.0
+    wall: Histogram = field(default_factory=Histogram)
+
+    def as_dict(self) -> dict[str, int | float]:
+        return {
+            "spawns": self.spawns,
+            "failures": self.failures,
+            "wall_s": round(self.wall.sum, 3),
+            **self.wall.summary_ms(),
+            "stdout_bytes": self.stdout_bytes,
+            "json_parse_ms": round(self.parse_seconds * 1000, 3),
+        }
+
+
+class Metrics:
+    """Metriken eines Servers (ein Exemplar pro TaskwarriorClient)."""
+
+    def __init__(self) -> None:
+        self.started = time.monotonic()
+        self.tools: dict[str, ToolMetrics] = {}
+        self.commands: dict[str, CommandMetrics] = {}
+
+    def observe_tool(self, name: str, seconds: float, failed: bool) -> None:
+        metrics = self.tools.get(name)
+        if metrics is None:
+            metrics = self.tools[name] = ToolMetrics()
+        metrics.calls += 1
+        metrics.errors += failed
+        metrics.latency.observe(seconds)
+
+    def observe_command(
+        self,
+        cmd: Sequence[str],
+        seconds: float,
+        failed: bool,
+        stdout_bytes: int,
+        parse_seconds: float = 0.0,
+    ) -> None:
+        name = subcommand(cmd)
+        metrics = self.commands.get(name)
+        if metrics is None:
+            metrics = self.commands[name] = CommandMetrics()
+        metrics.spawns += 1
+        metrics.failures += failed
+        metrics.stdout_bytes += stdout_bytes
+        metrics.parse_seconds += parse_seconds
+        metrics.wall.observe(seconds)
+
+    def as_dict(self) -> dict:
+        return {
+            "uptime_s": round(time.monotonic() - self.started, 1),
+            "tools": {name: m.as_dict() for name, m in sorted(self.tools.items())},
+            "commands": {name: m.as_dict() for name, m in sorted(self.commands.items())},
+        }
+
+    def to_prometheus(self, extra: Mapping[str, Mapping | None] | None = None) -> str:
+        """Prometheus-Textformat; extra: weitere Kennzahlen je Gruppe als Gauges."""
+        lines: list[str] = []
+        _metric(lines, "uptime_seconds", "gauge", "Laufzeit des Servers")
+        lines.append(f"{_PREFIX}_uptime_seconds {time.monotonic() - self.started:.3f}")
+
+        tools = sorted(self.tools.items())
+        _metric(lines, "tool_calls_total", "counter", "Aufrufe pro Tool")
+        lines.extend(_sample("tool_calls_total", {"tool": n}, m.calls) for n, m in tools)
+        _metric(lines, "tool_errors_total", "counter", "Fehlgeschlagene Aufrufe pro Tool")
+        lines.extend(_sample("tool_errors_total", {"tool": n}, m.errors) for n, m in tools)
+        _metric(lines, "tool_duration_seconds", "histogram", "Latenz pro Tool")
+        for name, metrics in tools:
+            _histogram(lines, "tool_duration_seconds", {"tool": name}, metrics.latency)
+
+        commands = sorted(self.commands.items())
+        for metric, help_text, attr in (
+            ("command_spawns_total", "Gestartete task-Prozesse", "spawns"),
+            ("command_failures_total", "task-Prozesse mit Fehler oder Timeout", "failures"),
+            ("command_stdout_bytes_total", "Gelesene stdout-Bytes", "stdout_bytes"),
+            ("command_json_parse_seconds_total", "Zeit für das JSON-Parsing", "parse_seconds"),
+        ):
+            _metric(lines, metric, "counter", help_text)
+            lines.extend(_sample(metric, {"command": n}, getattr(m, attr)) for n, m in commands)
+        _metric(lines, "command_duration_seconds", "histogram", "Laufzeit pro Unterbefehl")
+        for name, metrics in commands:
+            _histogram(lines, "command_duration_seconds", {"command": name}, metrics.wall)
+
+        for group, stats in (extra or {}).items():
+            for key, value in (stats or {}).items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    metric = f"{group}_{key}"
+                    _metric(lines, metric, "gauge", f"{group}: {key}")
+                    lines.append(_sample(metric, {}, value))
+        return "\n".join(lines) + "\n"
+
+
+def _metric(lines: list[str], name: str, kind: str, help_text: str) -> None:
+    lines.append(f"# HELP {_PREFIX}_{name} {help_text}")
+    lines.append(f"# TYPE {_PREFIX}_{name} {kind}")
+
+
+def _sample(name: str, labels: Mapping[str, str], value: float) -> str:
+    if labels:
+        rendered = ",".join(f'{key}="{_escape(val)}"' for key, val in labels.items())
+        return f"{_PREFIX}_{name}{{{rendered}}} {value}"
+    return f"{_PREFIX}_{name} {value}"
+
+
+def _histogram(lines: list[str], name: str, labels: dict[str, str], hist: Histogram) -> None:
+    cumulative = 0
+    for bound, count in zip((*hist.buckets, "+Inf"), hist.counts):
+        cumulative += count
+        lines.append(_sample(f"{name}_bucket", {**labels, "le": str(bound)}, cumulative))
+    lines.append(_sample(f"{name}_sum", labels, round(hist.sum, 6)))
+    lines.append(_sample(f"{name}_count", labels, hist.count))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsFileWriter:
+    """Schreibt das Prometheus-Textformat alle interval Sekunden atomar nach path."""
+
+    def __init__(self, path: Path, render: Callable[[], str], interval: float) -> None:
+        self.path = path
+        self.render = render
+        self.interval = interval
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.ensure_future(self._loop())
+
+    async def _loop(self) -> None:
+        while True:
+            self.write()
+            await asyncio.sleep(self.interval)
+
+    def write(self) -> None:
+        """Schreibt über eine temporäre Datei, damit Leser nie eine halbe Datei sehen."""
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        try:
+            tmp.write_text(self.render(), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError as exc:
+            logger.warning("Metrik-Datei %s nicht schreibbar: %s", self.path, exc)
+
+    async def close(self) -> None:
+        """Beendet das periodische Schreiben und schreibt ein letztes Mal."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.write()
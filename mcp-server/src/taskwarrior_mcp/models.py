@@ -4,9 +4,12 @@ Shell-Injection-Prevention: Blockiert gefährliche Zeichen in Freitext-Feldern.
 """
 
 import re
-from typing import Annotated
+import shlex
+from typing import Annotated, Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from taskwarrior_mcp.commands import abbreviates_command
 
 # Regex für UUID-Matching (vollständig oder Prefix ≥8 Zeichen)
 _UUID_PATTERN = re.compile(
@@ -23,7 +26,22 @@ _TAG_PATTERN = re.compile(r"^[\w\-\.]+$")
 # Erlaubte Priority-Werte
 _VALID_PRIORITIES = {"H", "M", "L"}
 
-# Erlaubte Status-Werte für task_list
+# Maximale Anzahl Tasks pro task_add_batch
+MAX_BATCH_SIZE = 500
+
+
+# Bausteine eines Bulk-Filters (Allowlist): Operatoren und Klammern, IDs, UUIDs,
+# +tag/-tag und attribut[.modifikator]:wert
+_FILTER_OPERATORS = frozenset({"and", "or", "xor", "not", "!"})
+_FILTER_ID = re.compile(r"^\d+(?:-\d+)?(?:,\d+(?:-\d+)?)*$")
+_FILTER_UUID = re.compile(
+    r"^[0-9a-f]{8}(?:-[0-9a-f]{4}(?:-[0-9a-f]{4}(?:-[0-9a-f]{4}(?:-[0-9a-f]{12})?)?)?)?$",
+    re.IGNORECASE,
+)
+_FILTER_TAG = re.compile(r"^[+-][\w\-\.]+$")
+_FILTER_ATTRIBUTE = re.compile(r"^([A-Za-z_]\w*)(?:\.[A-Za-z]+)?[:=]")
+
+# Erlaubte Status-Werte für task_list und task_search
 _VALID_STATUSES = {"pending", "completed", "deleted", "waiting", "recurring"}
 
 
@@ -36,6 +54,29 @@ def _check_uuid(value: str) -> str:
     return value
 
 
+def _check_filter_term(token: str) -> bool:
+    """Lässt nur Filterterme zu — Befehle, rc-Overrides und Freitext nicht.
+
+    Gibt True für echte Terme zurück, False für Klammern und Operatoren.
+    """
+    term = token.strip("()")
+    if not term or term.lower() in _FILTER_OPERATORS:
+        return False
+    if _FILTER_ID.match(term) or _FILTER_UUID.match(term) or _FILTER_TAG.match(term):
+        return True
+    attribute = _FILTER_ATTRIBUTE.match(term)
+    if attribute and attribute.group(1).lower() != "rc":
+        return True
+    if attribute or term.lower().startswith("rc."):
+        raise ValueError(f"Filter darf keine rc-Overrides enthalten: '{token}'")
+    if abbreviates_command(term):
+        raise ValueError(f"Filter darf keine Taskwarrior-Befehle enthalten: '{token}'")
+    raise ValueError(
+        f"Kein gültiger Filterterm: '{token}'. Erlaubt sind attribut:wert, +tag/-tag, "
+        "IDs, UUIDs, and/or/xor/not und Klammern (Freitext als description.contains:...)"
+    )
+
+
 def _check_shell_injection(value: str) -> str:
     """Blockiert Shell-Injection-Zeichen in Freitext-Feldern."""
     if _SHELL_INJECTION_CHARS.search(value):
@@ -61,6 +102,18 @@ TagStr = Annotated[
     Field(pattern=r"^[\w\-\.]+$", description="Tag-Name (nur Wörter, Bindestriche, Punkte)"),
 ]
 
+FieldStr = Annotated[
+    str,
+    Field(
+        pattern=r"^[A-Za-z_][A-Za-z0-9_]*$",
+        max_length=64,
+        description="Attributname (Core-Attribut oder UDA)",
+    ),
+]
+
+# Antwortformat von task_list ("table" ist ein Alias für "columnar")
+ResponseFormat = Literal["objects", "columnar", "table"]
+
 
 class TaskAddInput(BaseModel):
     """Parameter für task_add."""
@@ -100,10 +153,15 @@ class TaskAddInput(BaseModel):
         return v
 
 
-class TaskModifyInput(BaseModel):
-    """Parameter für task_modify."""
+class TaskAddBatchInput(BaseModel):
+    """Parameter für task_add_batch (Records werden einzeln als TaskAddInput geprüft)."""
+
+    tasks: list[dict] = Field(min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+class TaskModifyFields(BaseModel):
+    """Änderbare Felder für task_modify und task_bulk_modify."""
 
-    uuid: str = Field(min_length=8)
     description: str | None = Field(default=None, max_length=4096)
     project: str | None = Field(default=None, max_length=256)
     priority: str | None = Field(default=None)
@@ -114,11 +172,6 @@ class TaskModifyInput(BaseModel):
     tags_add: list[str] | None = Field(default=None)
     tags_remove: list[str] | None = Field(default=None)
 
-    @field_validator("uuid")
-    @classmethod
-    def valid_uuid(cls, v: str) -> str:
-        return _check_uuid(v)
-
     @field_validator("description", "project", "due", "scheduled", "wait", "recur", mode="before")
     @classmethod
     def no_shell_injection(cls, v: str | None) -> str | None:
@@ -145,6 +198,72 @@ class TaskModifyInput(BaseModel):
         return v
 
 
+class TaskModifyInput(TaskModifyFields):
+    """Parameter für task_modify."""
+
+    uuid: str = Field(min_length=8)
+
+    @field_validator("uuid")
+    @classmethod
+    def valid_uuid(cls, v: str) -> str:
+        return _check_uuid(v)
+
+
+class TaskBulkInput(BaseModel):
+    """Parameter für task_bulk_done und task_bulk_delete.
+
+    Genau eines von uuids oder filter_expr. Ein leerer Filter (auch einer nur aus
+    Klammern und Operatoren) würde alle Tasks treffen und ist nicht erlaubt. filter_expr darf nur aus Filtertermen
+    bestehen (siehe _check_filter_term): Alles andere könnte `task` als Befehl,
+    Konfiguration oder Freitextsuche über alle Tasks auslegen.
+    """
+
+    uuids: list[str] | None = Field(default=None, min_length=1, max_length=MAX_BATCH_SIZE)
+    filter_expr: str | None = Field(default=None, max_length=1024)
+    dry_run: bool = False
+
+    @field_validator("uuids")
+    @classmethod
+    def valid_uuids(cls, v: list[str] | None) -> list[str] | None:
+        if v is not None:
+            for uuid in v:
+                _check_uuid(uuid)
+        return v
+
+    @field_validator("filter_expr", mode="before")
+    @classmethod
+    def valid_filter(cls, v: str | None) -> str | None:
+        if v is not None:
+            _check_shell_injection(v)
+            if not v.strip():
+                raise ValueError("Leerer Filter würde alle Tasks betreffen")
+            try:
+                tokens = shlex.split(v)
+            except ValueError as exc:
+                raise ValueError(f"Filter nicht lesbar: {exc}") from exc
+            # Alle Tokens prüfen (kein any() mit Abbruch beim ersten Term)
+            terms = [_check_filter_term(token) for token in tokens]
+            if not any(terms):
+                raise ValueError("Filter ohne Term würde alle Tasks betreffen")
+        return v
+
+    @model_validator(mode="after")
+    def uuids_or_filter(self) -> "TaskBulkInput":
+        if (self.uuids is None) == (self.filter_expr is None):
+            raise ValueError("Genau eines von uuids oder filter_expr angeben")
+        return self
+
+
+class TaskBulkModifyInput(TaskBulkInput, TaskModifyFields):
+    """Parameter für task_bulk_modify."""
+
+    @model_validator(mode="after")
+    def has_modifications(self) -> "TaskBulkModifyInput":
+        if not any(getattr(self, name) is not None for name in TaskModifyFields.model_fields):
+            raise ValueError("Mindestens eine Änderung angeben")
+        return self
+
+
 class TaskListInput(BaseModel):
     """Parameter für task_list."""
 
@@ -153,6 +272,10 @@ class TaskListInput(BaseModel):
     tags: list[str] | None = Field(default=None)
     status: str = Field(default="pending")
     limit: int = Field(default=50, ge=1, le=1000)
+    cursor: str | None = Field(default=None, max_length=512, pattern=r"^[A-Za-z0-9_\-]+$")
+    paginate: bool = False
+    fields: list[FieldStr] | None = Field(default=None, min_length=1, max_length=64)
+    format: ResponseFormat = "objects"
 
     @field_validator("status")
     @classmethod
@@ -176,9 +299,59 @@ class TaskListInput(BaseModel):
         if v is not None:
             for tag in v:
                 if not _TAG_PATTERN.match(tag):
-                    raise ValueError(
-                        f"Tag '{tag}' enthält ungültige Zeichen."
-                    )
+                    raise ValueError(f"Tag '{tag}' enthält ungültige Zeichen.")
+        return v
+
+
+class TaskNextInput(BaseModel):
+    """Parameter für task_next."""
+
+    filter_expr: str | None = Field(default=None, max_length=1024)
+    project: str | None = Field(default=None, max_length=256)
+    tags: list[str] | None = Field(default=None)
+    limit: int = Field(default=10, ge=1, le=100)
+    fields: list[FieldStr] | None = Field(default=None, min_length=1, max_length=64)
+
+    @field_validator("filter_expr", "project", mode="before")
+    @classmethod
+    def no_shell_injection(cls, v: str | None) -> str | None:
+        if v is not None:
+            _check_shell_injection(v)
+        return v
+
+    @field_validator("tags", mode="before")
+    @classmethod
+    def valid_tags(cls, v: list[str] | None) -> list[str] | None:
+        if v is not None:
+            for tag in v:
+                if not _TAG_PATTERN.match(tag):
+                    raise ValueError(f"Tag '{tag}' enthält ungültige Zeichen.")
+        return v
+
+
+class TaskSearchInput(BaseModel):
+    """Parameter für task_search."""
+
+    query: str = Field(min_length=1, max_length=512)
+    status: str | None = Field(default=None)
+    project: str | None = Field(default=None, max_length=256)
+    limit: int = Field(default=20, ge=1, le=200)
+    fields: list[FieldStr] | None = Field(default=None, min_length=1, max_length=64)
+
+    @field_validator("status")
+    @classmethod
+    def valid_status(cls, v: str | None) -> str | None:
+        if v is not None and v not in _VALID_STATUSES:
+            raise ValueError(
+                f"Ungültiger Status '{v}'. Erlaubt: {', '.join(sorted(_VALID_STATUSES))}"
+            )
+        return v
+
+    @field_validator("query", "project", mode="before")
+    @classmethod
+    def no_shell_injection(cls, v: str | None) -> str | None:
+        if v is not None:
+            _check_shell_injection(v)
         return v
 
 
@@ -191,3 +364,9 @@ class UUIDInput(BaseModel):
     @classmethod
     def valid_uuid(cls, v: str) -> str:
         return _check_uuid(v)
+
+
+class TaskGetInput(UUIDInput):
+    """Parameter für task_get."""
+
+    fields: list[FieldStr] | None = Field(default=None, min_length=1, max_length=64)
@@ -0,0 +1,227 @@
+"""Gemeinsame Bausteine für native Lesepfade ohne `task`-Prozess.
+
+Die nativen Reader lesen die Taskwarrior-Daten direkt und liefern dieselben
+Dicts wie `task export` (Datumsformat, Tags, Annotationen, Abhängigkeiten,
+Urgency). Alles hier ist strikt lesend — geschrieben wird nur über `task`.
+"""
+
+import logging
+import os
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Attribute, die Taskwarrior als Epoch speichert und als ISO-Datum exportiert
+DATE_ATTRIBUTES = frozenset(
+    {"entry", "modified", "due", "wait", "scheduled", "start", "end", "until"}
+)
+
+# Attribute, die Taskwarrior als Zahl exportiert
+NUMERIC_ATTRIBUTES = frozenset({"imask"})
+
+# Attribute, die `task export` ohne UDAs liefern kann (priority ist seit 2.6 eine
+# mitgelieferte UDA, steht aber in keiner taskrc)
+CORE_ATTRIBUTES = frozenset(
+    {
+        "annotations",
+        "depends",
+        "description",
+        "due",
+        "end",
+        "entry",
+        "id",
+        "imask",
+        "mask",
+        "modified",
+        "parent",
+        "priority",
+        "project",
+        "recur",
+        "scheduled",
+        "start",
+        "status",
+        "tags",
+        "until",
+        "urgency",
+        "uuid",
+        "wait",
+    }
+)
+
+# Status, bei denen ein Task im Working Set eine ID hat
+ACTIVE_STATUSES = frozenset({"pending", "waiting", "recurring"})
+
+_EXPORT_DATE_FORMAT = "%Y%m%dT%H%M%SZ"
+
+
+class NativeReadError(Exception):
+    """Nativer Lesezugriff nicht möglich — Aufrufer fällt auf `task` zurück."""
+
+
+def format_date(epoch: str | float) -> str:
+    """Formatiert einen Epoch-Wert im Exportformat von Taskwarrior (UTC)."""
+    return time.strftime(_EXPORT_DATE_FORMAT, time.gmtime(int(float(epoch))))
+
+
+def parse_date(value: str) -> int:
+    """Wandelt ein Exportdatum (20250315T000000Z) zurück in einen Epoch-Wert."""
+    # Manuell statt strptime: deutlich schneller bei großen Task-Mengen
+    year, month, day = int(value[0:4]), int(value[4:6]), int(value[6:8])
+    hour, minute, second = int(value[9:11]), int(value[11:13]), int(value[13:15])
+    days = _days_from_civil(year, month, day)
+    return days * 86400 + hour * 3600 + minute * 60 + second
+
+
+def _days_from_civil(year: int, month: int, day: int) -> int:
+    """Tage seit 1970-01-01 für ein gregorianisches Datum."""
+    year -= month <= 2
+    era = (year if year >= 0 else year - 399) // 400
+    yoe = year - era * 400
+    doy = (153 * (month + (-3 if month > 2 else 9)) + 2) // 5 + day - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    return era * 146097 + doe - 719468
+
+
+def read_taskrc(path: str | os.PathLike[str] | None) -> dict[str, str]:
+    """Liest key=value-Einträge einer taskrc inklusive `include`-Dateien.
+
+    Kommentare und unbekannte Zeilen werden ignoriert. Fehlt die Datei,
+    ist das Ergebnis leer.
+    """
+    config: dict[str, str] = {}
+    if not path:
+        return config
+    _read_taskrc_into(Path(os.path.expanduser(str(path))), config, depth=0)
+    return config
+
+
+def _read_taskrc_into(path: Path, config: dict[str, str], depth: int) -> None:
+    if depth > 8:
+        return
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return
+    for line in lines:
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        if line.startswith("include "):
+            target = Path(os.path.expanduser(line[len("include ") :].strip()))
+            if not target.is_absolute():
+                target = path.parent / target
+            _read_taskrc_into(target, config, depth + 1)
+            continue
+        key, sep, value = line.partition("=")
+        if sep:
+            config[key.strip()] = value.strip()
+
+
+def resolve_taskrc(taskrc: str | None) -> Path:
+    """Ermittelt die taskrc wie `task`: Override, dann $TASKRC, dann ~/.taskrc."""
+    path = taskrc or os.environ.get("TASKRC") or "~/.taskrc"
+    return Path(os.path.expanduser(path))
+
+
+def resolve_data_location(task_data: str | None, config: dict[str, str]) -> Path:
+    """Ermittelt rc.data.location wie `task`: Override, $TASKDATA, taskrc, ~/.task."""
+    location = task_data or os.environ.get("TASKDATA") or config.get("data.location") or "~/.task"
+    return Path(os.path.expanduser(location))
+
+
+def uda_names(config: dict[str, str]) -> frozenset[str]:
+    """Namen aller in der taskrc definierten UDAs."""
+    return frozenset(
+        key[len("uda.") : -len(".type")]
+        for key in config
+        if key.startswith("uda.") and key.endswith(".type")
+    )
+
+
+def numeric_udas(config: dict[str, str]) -> frozenset[str]:
+    """Namen aller UDAs vom Typ numeric (werden als Zahl exportiert)."""
+    return _udas_of_type(config, "numeric")
+
+
+def date_udas(config: dict[str, str]) -> frozenset[str]:
+    """Namen aller UDAs vom Typ date (werden wie due als ISO-Datum exportiert)."""
+    return _udas_of_type(config, "date")
+
+
+def _udas_of_type(config: dict[str, str], uda_type: str) -> frozenset[str]:
+    return frozenset(
+        key[len("uda.") : -len(".type")]
+        for key, value in config.items()
+        if key.startswith("uda.") and key.endswith(".type") and value == uda_type
+    )
+
+
+def build_task(
+    uuid: str,
+    attrs: dict[str, str],
+    task_id: int = 0,
+    numeric: frozenset[str] = frozenset(),
+    dates: frozenset[str] = frozenset(),
+) -> dict:
+    """Baut aus gespeicherten Attributen ein Dict im Format von `task export`.
+
+    Versteht sowohl das TW3-Format (tag_<name>, dep_<uuid>, annotation_<epoch>)
+    als auch das TW2-Format (tags/depends als kommagetrennte Strings).
+    numeric und dates sind die UDAs vom Typ numeric bzw. date aus der taskrc.
+    Die Urgency wird separat via urgency.annotate_urgency ergänzt.
+    """
+    task: dict = {"id": task_id}
+    tags: list[str] = []
+    depends: list[str] = []
+    annotations: list[tuple[int, str]] = []
+    for key, value in attrs.items():
+        if key.startswith("tag_"):
+            tags.append(key[4:])
+        elif key.startswith("dep_"):
+            depends.append(key[4:])
+        elif key.startswith("annotation_"):
+            annotations.append((int(key[len("annotation_") :]), value))
+        elif key == "tags":
+            tags.extend(tag for tag in value.split(",") if tag)
+        elif key == "depends":
+            depends.extend(dep for dep in value.split(",") if dep)
+        elif key in DATE_ATTRIBUTES or key in dates:
+            if value:
+                task[key] = format_date(value)
+        elif key in NUMERIC_ATTRIBUTES or key in numeric:
+            task[key] = _to_number(value)
+        elif key != "uuid":
+            task[key] = value
+    task["uuid"] = uuid
+    if tags:
+        task["tags"] = tags
+    if depends:
+        task["depends"] = depends
+    if annotations:
+        task["annotations"] = [
+            {"entry": format_date(entry), "description": text}
+            for entry, text in sorted(annotations)
+        ]
+    return task
+
+
+def _to_number(value: str) -> int | float | str:
+    try:
+        number = float(value)
+    except ValueError:
+        return value
+    return int(number) if number.is_integer() else number
+
+
+def is_waiting(task: dict, now: float) -> bool:
+    """Virtueller Status 'waiting': pending mit wait-Datum in der Zukunft."""
+    if task.get("status") == "waiting":
+        return True
+    wait = task.get("wait")
+    return task.get("status") == "pending" and wait is not None and parse_date(wait) > now
+
+
+def effective_status(task: dict, now: float) -> str:
+    """Status so, wie Taskwarrior-Filter ihn sehen (inkl. virtuellem 'waiting')."""
+    return "waiting" if is_waiting(task, now) else task.get("status", "pending")
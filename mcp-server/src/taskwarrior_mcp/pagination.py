@@ -0,0 +1,112 @@
+"""Cursor-basierte Paginierung für task_list.
+
+Die erste Seite exportiert alle Treffer einmal, sortiert sie nach
+(entry, uuid) und legt sie als PageSnapshot ab. Der Cursor enthält die
+Snapshot-Version, den Sortierschlüssel und die UUID des letzten gelieferten
+Tasks sowie einen Hash des Filters. Folgeseiten kommen per Binärsuche aus
+demselben Snapshot — ohne erneuten Export und konsistent zur ersten Seite.
+"""
+
+import base64
+import binascii
+import bisect
+import hashlib
+import itertools
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+
+class CursorError(ValueError):
+    """Cursor ist ungültig, gehört zu einem anderen Filter oder ist abgelaufen."""
+
+
+_versions = itertools.count(1)
+
+
+def sort_key(task: dict) -> tuple[str, str]:
+    """Stabile Sortierung: Erstellungszeitpunkt, bei Gleichstand UUID."""
+    return (task.get("entry", ""), task.get("uuid", ""))
+
+
+def filter_hash(filter_args: list[str]) -> str:
+    return hashlib.sha256(json.dumps(filter_args).encode("utf-8")).hexdigest()[:16]
+
+
+def encode_cursor(version: int, key: tuple[str, str], digest: str) -> str:
+    payload = json.dumps({"v": version, "k": list(key), "f": digest}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[int, tuple[str, str], str]:
+    """Gibt (Version, Sortierschlüssel, Filter-Hash) zurück."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        entry, uuid = data["k"]
+        return int(data["v"]), (str(entry), str(uuid)), str(data["f"])
+    except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError) as exc:
+        raise CursorError("Ungültiger Cursor") from exc
+
+
+@dataclass
+class PageSnapshot:
+    """Sortierte Treffer einer Abfrage; wird nicht mehr verändert."""
+
+    tasks: list[dict]
+    digest: str
+    version: int = field(default_factory=lambda: next(_versions))
+    created: float = field(default_factory=time.monotonic)
+    keys: list[tuple[str, str]] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.tasks.sort(key=sort_key)
+        self.keys = [sort_key(task) for task in self.tasks]
+
+    def page(self, after: tuple[str, str] | None, limit: int) -> dict:
+        """Seite ab dem ersten Task mit Schlüssel > after, inklusive Folge-Cursor."""
+        start = 0 if after is None else bisect.bisect_right(self.keys, after)
+        end = start + limit
+        tasks = [dict(task) for task in self.tasks[start:end]]
+        next_cursor = None
+        if end < len(self.tasks):
+            next_cursor = encode_cursor(self.version, self.keys[end - 1], self.digest)
+        return {
+            "tasks": tasks,
+            "next_cursor": next_cursor,
+            "total": len(self.tasks),
+            "offset": start,
+        }
+
+
+class PageStore:
+    """Hält die jüngsten PageSnapshots (LRU, begrenzte Lebensdauer)."""
+
+    def __init__(self, max_snapshots: int = 16, ttl: float = 300.0) -> None:
+        self.max_snapshots = max_snapshots
+        self.ttl = ttl
+        self._snapshots: OrderedDict[int, PageSnapshot] = OrderedDict()
+
+    def add(self, tasks: list[dict], filter_args: list[str]) -> PageSnapshot:
+        snapshot = PageSnapshot(tasks, filter_hash(filter_args))
+        self._snapshots[snapshot.version] = snapshot
+        while len(self._snapshots) > self.max_snapshots:
+            self._snapshots.popitem(last=False)
+        return snapshot
+
+    def resume(self, cursor: str, filter_args: list[str]) -> tuple[PageSnapshot, tuple[str, str]]:
+        """Snapshot und Position zu einem Cursor.
+
+        Raises:
+            CursorError: Cursor ungültig, für einen anderen Filter oder abgelaufen.
+        """
+        version, key, digest = decode_cursor(cursor)
+        if digest != filter_hash(filter_args):
+            raise CursorError("Cursor gehört zu einer anderen Abfrage")
+        snapshot = self._snapshots.get(version)
+        if snapshot is None or time.monotonic() - snapshot.created > self.ttl:
+            self._snapshots.pop(version, None)
+            raise CursorError("Cursor abgelaufen — Abfrage ohne cursor neu starten")
+        self._snapshots.move_to_end(version)
+        return snapshot, key
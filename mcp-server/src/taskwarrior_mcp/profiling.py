@@ -0,0 +1,126 @@
+"""Optionales Profiling einzelner Tool-Aufrufe (cProfile und tracemalloc).
+
+Mit gesetztem profile-Verzeichnis (TW_MCP_PROFILE) profiliert der Server
+einen Anteil profile_rate der Aufrufe der Tools aus profile_tools (leer =
+alle). Pro Aufruf laufen cProfile und tracemalloc; dauert der Aufruf
+mindestens profile_slow Sekunden, landen beide Ergebnisse im Verzeichnis:
+
+    <tool>-<args-hash>-<dauer>ms-<zeitstempel>.prof        (pstats / snakeviz)
+    <tool>-<args-hash>-<dauer>ms-<zeitstempel>.tracemalloc (tracemalloc.Snapshot.load)
+
+Der Hash (sha256 der Argumente) erlaubt es, Aufrufe mit gleichen Argumenten
+zuzuordnen, ohne Task-Texte in Dateinamen zu schreiben.
+
+cProfile und tracemalloc sind prozessweit: Es wird immer nur ein Aufruf
+gleichzeitig profiliert, parallele Aufrufe laufen ungemessen weiter. Da
+alle Tools in einer Event-Loop laufen, enthält ein Profil auch die Arbeit
+anderer Coroutinen während des Aufrufs. Nicht ausgewählte Aufrufe kosten
+nur eine Zufallszahl.
+"""
+
+import asyncio
+import cProfile
+import hashlib
+import json
+import logging
+import random
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable, Mapping
+from pathlib import Path
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Frames pro Allokation im tracemalloc-Snapshot
+TRACE_FRAMES = 10
+
+
+def args_hash(arguments: Mapping[str, Any]) -> str:
+    """Kurzer, stabiler Hash der Tool-Argumente."""
+    payload = json.dumps(arguments, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:12]
+
+
+class Profiler:
+    """Profiliert ausgewählte Tool-Aufrufe und schreibt die Ergebnisse nach directory."""
+
+    def __init__(
+        self,
+        directory: Path,
+        rate: float = 1.0,
+        slow: float = 0.0,
+        tools: frozenset[str] = frozenset(),
+        memory: bool = True,
+    ) -> None:
+        self.directory = directory
+        self.rate = rate
+        self.slow = slow
+        self.tools = tools
+        self.memory = memory
+        self._active = False
+        self.stats = {"profiled": 0, "written": 0, "skipped_busy": 0}
+
+    def selects(self, tool: str) -> bool:
+        """True, wenn dieser Aufruf profiliert werden soll (Tool-Auswahl und Stichprobe)."""
+        if self.tools and tool not in self.tools:
+            return False
+        return self.rate >= 1.0 or random.random() < self.rate
+
+    async def run(
+        self,
+        tool: str,
+        arguments: Mapping[str, Any],
+        call: Callable[[], Awaitable[T]],
+    ) -> T:
+        """Führt call() aus — profiliert, falls ausgewählt und kein anderer Aufruf läuft."""
+        if not self.selects(tool):
+            return await call()
+        if self._active:
+            self.stats["skipped_busy"] += 1
+            return await call()
+        self._active = True
+        self.stats["profiled"] += 1
+        # Läuft tracemalloc bereits (z.B. -X tracemalloc), bleibt es an
+        own_trace = self.memory and not tracemalloc.is_tracing()
+        if own_trace:
+            tracemalloc.start(TRACE_FRAMES)
+        profile = cProfile.Profile()
+        start = time.perf_counter()
+        profile.enable()
+        try:
+            return await call()
+        finally:
+            profile.disable()
+            duration = time.perf_counter() - start
+            snapshot = tracemalloc.take_snapshot() if self.memory else None
+            if own_trace:
+                tracemalloc.stop()
+            self._active = False
+            if duration >= self.slow:
+                await asyncio.to_thread(
+                    self._write, tool, args_hash(arguments), duration, profile, snapshot
+                )
+
+    def _write(
+        self,
+        tool: str,
+        digest: str,
+        duration: float,
+        profile: cProfile.Profile,
+        snapshot: tracemalloc.Snapshot | None,
+    ) -> None:
+        stamp = time.strftime("%Y%m%dT%H%M%S")
+        base = self.directory / f"{tool}-{digest}-{duration * 1000:.0f}ms-{stamp}"
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            profile.dump_stats(f"{base}.prof")
+            if snapshot is not None:
+                snapshot.dump(f"{base}.tracemalloc")
+        except OSError as exc:
+            logger.warning("Profil für %s nicht schreibbar: %s", tool, exc)
+            return
+        self.stats["written"] += 1
+        logger.info("Profil geschrieben: %s (%.1f ms)", base, duration * 1000)
@@ -0,0 +1,141 @@
+"""Nativer Lesezugriff auf Taskwarrior-3-Replicas (taskchampion.sqlite3).
+
+Taskwarrior 3 speichert jeden Task als Zeile (uuid, data) mit einem JSON-Objekt
+aus String-Attributen, das Working Set (IDs) in einer eigenen Tabelle. Dieser
+Reader öffnet die Datenbank read-only und erzeugt daraus dieselben Dicts wie
+`task export`. Status- und UUID-Bedingungen werden als SQL vorgefiltert, damit
+nur passende Zeilen in Python dekodiert werden.
+"""
+
+import json
+import logging
+import sqlite3
+import time
+from pathlib import Path
+
+from taskwarrior_mcp.filters import SimpleFilter
+from taskwarrior_mcp.native import ACTIVE_STATUSES, NativeReadError, build_task
+from taskwarrior_mcp.urgency import UrgencyCoefficients, annotate_urgency, dependency_sets
+
+logger = logging.getLogger(__name__)
+
+REPLICA_FILENAME = "taskchampion.sqlite3"
+
+
+class SQLiteReplicaReader:
+    """Read-only Reader für eine TaskChampion-SQLite-Datenbank."""
+
+    def __init__(
+        self,
+        path: Path,
+        coefficients: UrgencyCoefficients,
+        numeric: frozenset[str] = frozenset(),
+        dates: frozenset[str] = frozenset(),
+    ) -> None:
+        self.path = path
+        self.coefficients = coefficients
+        self.numeric = numeric
+        self.dates = dates
+        self._conn: sqlite3.Connection | None = None
+        self._has_json1 = True
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if not self.path.exists():
+                raise NativeReadError(f"{self.path} existiert nicht")
+            try:
+                conn = sqlite3.connect(
+                    f"{self.path.as_uri()}?mode=ro",
+                    uri=True,
+                    timeout=1.0,
+                    check_same_thread=False,
+                )
+                conn.execute("SELECT uuid, data FROM tasks LIMIT 0")
+            except sqlite3.Error as exc:
+                raise NativeReadError(f"Replica nicht lesbar: {exc}") from exc
+            try:
+                conn.execute("SELECT json_extract('{}', '$.status')")
+            except sqlite3.Error:
+                self._has_json1 = False
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _select(self, where: str = "", params: tuple = ()) -> list[tuple[str, str]]:
+        try:
+            return (
+                self._connection()
+                .execute(f"SELECT uuid, data FROM tasks {where}", params)
+                .fetchall()
+            )
+        except sqlite3.Error as exc:
+            # z.B. "database is locked" während `task` schreibt
+            self.close()
+            raise NativeReadError(f"SQLite-Fehler: {exc}") from exc
+
+    def _working_set(self) -> dict[str, int]:
+        try:
+            rows = (
+                self._connection()
+                .execute("SELECT id, uuid FROM working_set WHERE uuid IS NOT NULL")
+                .fetchall()
+            )
+        except sqlite3.Error as exc:
+            self.close()
+            raise NativeReadError(f"SQLite-Fehler: {exc}") from exc
+        return {uuid: task_id for task_id, uuid in rows}
+
+    def _decode(self, rows: list[tuple[str, str]], ids: dict[str, int]) -> list[dict]:
+        tasks = []
+        for uuid, data in rows:
+            try:
+                attrs = json.loads(data)
+            except (TypeError, json.JSONDecodeError):
+                logger.debug("Ungültige Replica-Zeile %s übersprungen", uuid)
+                continue
+            tasks.append(build_task(uuid, attrs, ids.get(uuid, 0), self.numeric, self.dates))
+        return tasks
+
+    def _open_tasks(self, ids: dict[str, int]) -> list[dict]:
+        if self._has_json1:
+            placeholders = ",".join("?" * len(ACTIVE_STATUSES))
+            rows = self._select(
+                f"WHERE json_extract(data, '$.status') IN ({placeholders})",
+                tuple(sorted(ACTIVE_STATUSES)),
+            )
+            return self._decode(rows, ids)
+        return [t for t in self._decode(self._select(), ids) if t.get("status") in ACTIVE_STATUSES]
+
+    def export(self, query: SimpleFilter) -> list[dict]:
+        """Liefert alle Tasks, die `query` erfüllen, im Format von `task export`."""
+        now = time.time()
+        ids = self._working_set()
+        open_tasks = self._open_tasks(ids)
+        # Offene Tasks werden für blocked/blocking ohnehin benötigt
+        if query.status in ACTIVE_STATUSES:
+            candidates = open_tasks
+        elif query.uuids:
+            clauses = " OR ".join("uuid LIKE ?" for _ in query.uuids)
+            candidates = self._decode(
+                self._select(f"WHERE {clauses}", tuple(f"{u}%" for u in query.uuids)), ids
+            )
+        elif query.status is not None and self._has_json1:
+            candidates = self._decode(
+                self._select("WHERE json_extract(data, '$.status') = ?", (query.status,)), ids
+            )
+        else:
+            candidates = self._decode(self._select(), ids)
+
+        matched = [task for task in candidates if query.matches(task, now)]
+        # Reihenfolge wie `task export`: Working Set nach ID, danach nach Erstellung
+        matched.sort(key=lambda t: (t["id"] == 0, t["id"], t.get("entry", "")))
+        if query.limit is not None:
+            matched = matched[: query.limit]
+
+        open_uuids, blocking = dependency_sets(open_tasks)
+        annotate_urgency(matched, self.coefficients, now, open_uuids, blocking)
+        return matched
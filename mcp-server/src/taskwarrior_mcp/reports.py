@@ -0,0 +1,169 @@
+"""Strukturierte Übersichten (Projekte, Tags, Statistik) aus einem Task-Export.
+
+Ersetzt das Parsen der Textausgabe von `task projects`, `task tags` und
+`task stats`: alle drei Übersichten werden in-process aus derselben
+Task-Liste (vollständiger Export oder Snapshot) berechnet.
+"""
+
+from collections import Counter
+
+from taskwarrior_mcp.native import effective_status, parse_date
+
+_SECONDS_PER_DAY = 86400.0
+
+# Reihenfolge der Statuszählung; unbekannte Status werden angehängt
+_STATUSES = ("pending", "waiting", "recurring", "completed", "deleted")
+_OPEN = frozenset({"pending", "waiting"})
+
+
+def _epoch(task: dict, key: str) -> int | None:
+    value = task.get(key)
+    if not value:
+        return None
+    try:
+        return parse_date(value)
+    except ValueError:
+        return None
+
+
+def project_tree(tasks: list[dict]) -> dict:
+    """Projekthierarchie mit offenen und erledigten Tasks je Knoten.
+
+    Übergeordnete Projekte zählen die Tasks ihrer Unterprojekte mit (wie
+    `task projects`). Gelöschte Tasks und Wiederholungs-Vorlagen zählen nicht.
+
+    Returns:
+        {"projects": [{"name", "project", "pending", "completed", "children"}],
+         "without_project": {"pending", "completed"}}
+    """
+    counts: dict[str, Counter[str]] = {}
+    without: Counter[str] = Counter()
+    for task in tasks:
+        status = task.get("status")
+        # waiting zählt wie bei `task projects` als offen
+        bucket = "completed" if status == "completed" else "pending"
+        if status not in ("pending", "waiting", "completed"):
+            continue
+        project = task.get("project")
+        if not project:
+            without[bucket] += 1
+            continue
+        parts = project.split(".")
+        for depth in range(1, len(parts) + 1):
+            counts.setdefault(".".join(parts[:depth]), Counter())[bucket] += 1
+
+    nodes: dict[str, dict] = {}
+    roots: list[dict] = []
+    for project in sorted(counts):
+        parent, _, name = project.rpartition(".")
+        node = {
+            "name": name,
+            "project": project,
+            "pending": counts[project]["pending"],
+            "completed": counts[project]["completed"],
+            "children": [],
+        }
+        nodes[project] = node
+        (nodes[parent]["children"] if parent else roots).append(node)
+    return {
+        "projects": roots,
+        "without_project": {
+            "pending": without["pending"],
+            "completed": without["completed"],
+        },
+    }
+
+
+def tag_counts(tasks: list[dict]) -> dict:
+    """Tag-Häufigkeiten offener und erledigter Tasks, häufigste zuerst.
+
+    Returns:
+        {"tags": [{"tag", "pending", "completed"}], "untagged_pending"}
+    """
+    pending: Counter[str] = Counter()
+    completed: Counter[str] = Counter()
+    untagged = 0
+    for task in tasks:
+        status = task.get("status")
+        tags = task.get("tags") or ()
+        if status in _OPEN:
+            pending.update(tags)
+            untagged += not tags
+        elif status == "completed":
+            completed.update(tags)
+    names = sorted(pending.keys() | completed.keys(), key=lambda t: (-pending[t], t))
+    return {
+        "tags": [
+            {"tag": tag, "pending": pending[tag], "completed": completed[tag]} for tag in names
+        ],
+        "untagged_pending": untagged,
+    }
+
+
+def task_stats(tasks: list[dict], now: float) -> dict:
+    """Statuszählung und Kennzahlen ähnlich `task stats`.
+
+    Zeiten in Tagen (eine Nachkommastelle), Zeitpunkte im Exportformat.
+    waiting ist hier ein eigener Status, auch wenn TW3 "pending" exportiert.
+    """
+    status_counts: Counter[str] = Counter()
+    open_ages: list[float] = []
+    completion_times: list[float] = []
+    entries: list[tuple[int, str]] = []
+    active = overdue = blocked = annotations = tagged = 0
+    projects: set[str] = set()
+    tags: set[str] = set()
+    open_uuids = {task.get("uuid") for task in tasks if task.get("status") in _OPEN}
+    for task in tasks:
+        # TW2 exportiert "waiting", TW3 "pending" mit wait in der Zukunft
+        status = effective_status(task, now)
+        status_counts[status] += 1
+        annotations += len(task.get("annotations") or ())
+        if task.get("tags"):
+            tagged += 1
+            tags.update(task["tags"])
+        if task.get("project"):
+            projects.add(task["project"])
+        entry = _epoch(task, "entry")
+        if entry is not None:
+            entries.append((entry, task["entry"]))
+        if status in _OPEN:
+            if entry is not None:
+                open_ages.append(now - entry)
+            if task.get("start"):
+                active += 1
+            due = _epoch(task, "due")
+            if due is not None and due < now:
+                overdue += 1
+            depends = task.get("depends") or ()
+            if isinstance(depends, str):  # ältere TW2-Exporte: kommagetrennt
+                depends = depends.split(",")
+            if any(dep in open_uuids for dep in depends):
+                blocked += 1
+        elif status == "completed":
+            end = _epoch(task, "end")
+            if entry is not None and end is not None:
+                completion_times.append(end - entry)
+    entries.sort()
+    return {
+        "total": len(tasks),
+        "status": {name: status_counts[name] for name in _STATUSES}
+        | {name: count for name, count in status_counts.items() if name not in _STATUSES},
+        "active": active,
+        "overdue": overdue,
+        "blocked": blocked,
+        "annotations": annotations,
+        "tagged": tagged,
+        "unique_tags": len(tags),
+        "projects": len(projects),
+        "oldest_entry": entries[0][1] if entries else None,
+        "newest_entry": entries[-1][1] if entries else None,
+        "average_age_days": _average_days(open_ages),
+        "average_completion_days": _average_days(completion_times),
+    }
+
+
+def _average_days(seconds: list[float]) -> float | None:
+    if not seconds:
+        return None
+    return round(sum(seconds) / len(seconds) / _SECONDS_PER_DAY, 1)
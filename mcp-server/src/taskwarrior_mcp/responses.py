@@ -0,0 +1,60 @@
+"""Aufbereitung von Task-Listen für MCP-Antworten.
+
+Reduziert die Antwortgröße, bevor FastMCP die Tasks serialisiert: per
+Projektion auf einzelne Felder und optional spaltenweise (columnar) statt
+als Liste von Objekten, in der jeder Schlüssel in jeder Zeile wiederholt wird.
+"""
+
+from typing import Any
+
+from taskwarrior_mcp.native import DATE_ATTRIBUTES, parse_date
+
+# Listen von Bezeichnern ohne Leerzeichen: als ein String mit Leerzeichen kodiert
+_JOINED_LISTS = frozenset({"tags", "depends"})
+
+# Beschreibung der Kodierung, wird jeder columnar-Antwort beigelegt
+COLUMNAR_ENCODING = {
+    "dates": "Unix-Epoch in Sekunden (UTC)",
+    "tags": "durch Leerzeichen getrennt",
+    "depends": "UUIDs durch Leerzeichen getrennt",
+    "annotations": "Liste von [entry, description]",
+    "missing": "null",
+}
+
+
+def project(tasks: list[dict], fields: list[str]) -> list[dict]:
+    """Reduziert jeden Task auf die angefragten Felder (in dieser Reihenfolge).
+
+    Fehlt ein Feld bei einem Task (z.B. kein due), fehlt es auch im Ergebnis.
+    """
+    return [{key: task[key] for key in fields if key in task} for task in tasks]
+
+
+def _compact(key: str, value: Any) -> Any:
+    if key in DATE_ATTRIBUTES and isinstance(value, str):
+        try:
+            return parse_date(value)
+        except ValueError:
+            return value
+    if key in _JOINED_LISTS and isinstance(value, list):
+        return " ".join(value)
+    if key == "annotations" and isinstance(value, list):
+        return [[_compact("entry", note.get("entry")), note.get("description")] for note in value]
+    return value
+
+
+def to_columnar(tasks: list[dict], fields: list[str] | None = None) -> dict:
+    """Kodiert Tasks als Spaltenköpfe plus Zeilen-Arrays.
+
+    Ohne fields werden alle vorkommenden Attribute in der Reihenfolge ihres
+    ersten Auftretens zu Spalten.
+    """
+    if fields is None:
+        fields = list(dict.fromkeys(key for task in tasks for key in task))
+    rows = [[_compact(key, task.get(key)) for key in fields] for task in tasks]
+    return {
+        "format": "columnar",
+        "columns": fields,
+        "rows": rows,
+        "encoding": COLUMNAR_ENCODING,
+    }
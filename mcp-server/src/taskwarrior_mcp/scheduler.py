@@ -0,0 +1,158 @@
+"""Ausführungs-Scheduler für Taskwarrior-Prozesse.
+
+Begrenzt die Anzahl gleichzeitiger `task`-Prozesse pro Datenverzeichnis und
+serialisiert Schreibzugriffe, damit parallele Tool-Calls nicht um Lock und
+Datenbank von Taskwarrior konkurrieren.
+
+- Lesezugriffe teilen sich einen Pool von `max_parallel_reads` Slots.
+- Schreibzugriffe laufen einzeln nacheinander (Single-Writer-Queue) und
+  belegen zusätzlich einen Slot aus dem Pool.
+- Hintergrundarbeit (z.B. Auto-Sync) wartet mit niedrigerer Priorität:
+  Wird ein Slot frei, kommen wartende Lese- und Schreibzugriffe zuerst dran.
+"""
+
+import asyncio
+import heapq
+import itertools
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Literal
+
+Access = Literal["read", "write", "background"]
+
+# Kleinere Zahl = höhere Priorität
+PRIORITY_FOREGROUND = 0
+PRIORITY_BACKGROUND = 1
+
+
+class SchedulerBusyError(RuntimeError):
+    """Die Schreib-Queue ist voll."""
+
+
+class _SlotPool:
+    """Zählender Semaphor mit Prioritäten und FIFO innerhalb einer Priorität.
+
+    Wartende werden als Futures erst beim Warten am laufenden Event-Loop
+    angelegt, der Pool selbst ist daher an keinen Loop gebunden.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = max(1, capacity)
+        self.in_use = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._seq = itertools.count()
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self, priority: int = PRIORITY_FOREGROUND) -> None:
+        if self.in_use < self.capacity and not self._waiters:
+            self.in_use += 1
+            return
+        fut: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        entry = (priority, next(self._seq), fut)
+        heapq.heappush(self._waiters, entry)
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # Slot wurde bereits übergeben — direkt weiterreichen
+                self.release()
+            else:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+            raise
+
+    def release(self) -> None:
+        """Gibt einen Slot frei bzw. übergibt ihn an den wichtigsten Wartenden."""
+        while self._waiters:
+            _, _, fut = heapq.heappop(self._waiters)
+            if not fut.done():
+                fut.set_result(None)
+                return
+        self.in_use -= 1
+
+
+class ExecutionScheduler:
+    """Koordiniert `task`-Prozesse für genau ein Datenverzeichnis."""
+
+    def __init__(self, max_parallel_reads: int = 4, max_pending_writes: int = 0) -> None:
+        self.max_parallel_reads = max(1, max_parallel_reads)
+        self.max_pending_writes = max_pending_writes
+        self._slots = _SlotPool(self.max_parallel_reads)
+        self._writer = _SlotPool(1)
+        self._pending_writes = 0
+
+    @asynccontextmanager
+    async def slot(self, access: Access = "read") -> AsyncIterator[None]:
+        """Reserviert einen Ausführungs-Slot für die Dauer des Kontexts."""
+        if access == "read":
+            await self._slots.acquire(PRIORITY_FOREGROUND)
+            try:
+                yield
+            finally:
+                self._slots.release()
+            return
+
+        priority = PRIORITY_BACKGROUND if access == "background" else PRIORITY_FOREGROUND
+        if (
+            access == "write"
+            and self.max_pending_writes
+            and self._pending_writes >= self.max_pending_writes
+        ):
+            raise SchedulerBusyError(f"Zu viele wartende Schreibzugriffe ({self._pending_writes})")
+        self._pending_writes += 1
+        try:
+            await self._writer.acquire(priority)
+            try:
+                await self._slots.acquire(priority)
+                try:
+                    yield
+                finally:
+                    self._slots.release()
+            finally:
+                self._writer.release()
+        finally:
+            self._pending_writes -= 1
+
+    def stats(self) -> dict[str, int]:
+        """Momentaufnahme der Auslastung (für Diagnose und Metriken)."""
+        return {
+            "max_parallel_reads": self.max_parallel_reads,
+            "running": self._slots.in_use,
+            "waiting": self._slots.waiting,
+            "pending_writes": self._pending_writes,
+        }
+
+
+# Ein Scheduler pro (data.location, taskrc) — auch über mehrere Clients hinweg
+_SCHEDULERS: dict[tuple[str | None, str | None], ExecutionScheduler] = {}
+
+
+def scheduler_key(task_data: str | None, taskrc: str | None) -> tuple[str | None, str | None]:
+    """Normalisiert Datenverzeichnis und taskrc zu einem Scheduler-Schlüssel."""
+
+    def _norm(path: str | None) -> str | None:
+        return os.path.abspath(os.path.expanduser(path)) if path else None
+
+    return (_norm(task_data), _norm(taskrc))
+
+
+def get_scheduler(
+    task_data: str | None,
+    taskrc: str | None,
+    max_parallel_reads: int = 4,
+    max_pending_writes: int = 0,
+) -> ExecutionScheduler:
+    """Gibt den gemeinsamen Scheduler für ein Datenverzeichnis zurück.
+
+    Die Limits des ersten Aufrufs für einen Schlüssel gelten.
+    """
+    key = scheduler_key(task_data, taskrc)
+    scheduler = _SCHEDULERS.get(key)
+    if scheduler is None:
+        scheduler = ExecutionScheduler(max_parallel_reads, max_pending_writes)
+        _SCHEDULERS[key] = scheduler
+    return scheduler
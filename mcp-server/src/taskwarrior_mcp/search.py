@@ -0,0 +1,190 @@
+"""Volltextsuche über Beschreibungen und Annotationen eines Snapshots.
+
+Der SearchIndex ist ein invertierter Index: jedes Token (Wort, casefold)
+verweist auf die Positionen der Tasks, die es enthalten, samt Häufigkeit.
+Ein Trigramm-Index über das Vokabular findet zu einem Suchbegriff alle
+Tokens, die ihn als Teilstring enthalten, und — wenn kein Token passt —
+ähnlich geschriebene Tokens (Tippfehler). Begriffe unter drei Zeichen
+werden als Präfix über das sortierte Vokabular gesucht.
+
+Gerankt wird mit BM25; Treffer in der Beschreibung zählen doppelt so viel
+wie in Annotationen, Teilstring- und unscharfe Treffer weniger als exakte.
+Alle Suchbegriffe müssen vorkommen. update() führt den Index nach einer
+Änderung an einem Task nach, statt ihn neu aufzubauen.
+"""
+
+import math
+import re
+from bisect import bisect_left, insort
+from collections import Counter
+
+_TOKEN = re.compile(r"\w+")
+
+# Gewichte der Fundstellen (ganzzahlig: gehen als Häufigkeit in BM25 ein)
+DESCRIPTION_WEIGHT = 2
+ANNOTATION_WEIGHT = 1
+
+# Abschlag für Tokens, die den Suchbegriff nur enthalten bzw. ihm nur ähneln
+SUBSTRING_WEIGHT = 0.7
+FUZZY_WEIGHT = 0.5
+
+# Mindestähnlichkeit (Jaccard über Trigramme) für unscharfe Treffer
+FUZZY_THRESHOLD = 0.35
+
+# BM25-Parameter
+_K1 = 1.2
+_B = 0.75
+
+
+def tokenize(text: str) -> list[str]:
+    """Wörter eines Textes in Kleinschreibung."""
+    return _TOKEN.findall(text.casefold())
+
+
+def trigrams(token: str, padded: bool = True) -> set[str]:
+    """Trigramme eines Tokens; mit padded zählen Wortanfang und -ende mit."""
+    if padded:
+        token = f"  {token} "
+    return {token[i : i + 3] for i in range(len(token) - 2)}
+
+
+def _terms(task: dict) -> Counter[str]:
+    """Gewichtete Token-Häufigkeiten eines Tasks."""
+    counts: Counter[str] = Counter()
+    for token in tokenize(task.get("description") or ""):
+        counts[token] += DESCRIPTION_WEIGHT
+    for annotation in task.get("annotations") or ():
+        for token in tokenize(annotation.get("description") or ""):
+            counts[token] += ANNOTATION_WEIGHT
+    return counts
+
+
+def _text(task: dict) -> tuple:
+    annotations = task.get("annotations") or ()
+    return task.get("description"), tuple(a.get("description") for a in annotations)
+
+
+class SearchIndex:
+    """Volltextindex über eine Taskliste; Positionen beziehen sich auf diese Liste."""
+
+    def __init__(self, tasks: list[dict]) -> None:
+        self.postings: dict[str, dict[int, int]] = {}
+        self.lengths = [0] * len(tasks)
+        self.documents = 0
+        self.total_length = 0
+        self._grams: dict[str, set[str]] = {}
+        for position, task in enumerate(tasks):
+            self._add(position, _terms(task))
+        self._vocabulary = sorted(self.postings)
+
+    def _add(self, position: int, counts: Counter[str]) -> list[str]:
+        """Trägt einen Task ein; gibt die neu ins Vokabular gekommenen Tokens zurück."""
+        new = []
+        for token, count in counts.items():
+            posting = self.postings.get(token)
+            if posting is None:
+                posting = self.postings[token] = {}
+                for gram in trigrams(token):
+                    self._grams.setdefault(gram, set()).add(token)
+                new.append(token)
+            posting[position] = count
+        length = sum(counts.values())
+        self.lengths[position] = length
+        self.total_length += length
+        self.documents += length > 0
+        return new
+
+    def _remove(self, position: int, counts: Counter[str]) -> None:
+        for token in counts:
+            posting = self.postings[token]
+            del posting[position]
+            if not posting:
+                del self.postings[token]
+                for gram in trigrams(token):
+                    self._grams[gram].discard(token)
+                del self._vocabulary[bisect_left(self._vocabulary, token)]
+        length = self.lengths[position]
+        self.total_length -= length
+        self.documents -= length > 0
+        self.lengths[position] = 0
+
+    def update(self, position: int, old: dict, new: dict) -> None:
+        """Ersetzt den Task an position in allen Postings."""
+        if _text(old) == _text(new):
+            return
+        self._remove(position, _terms(old))
+        for token in self._add(position, _terms(new)):
+            insort(self._vocabulary, token)
+
+    def _expand(self, term: str) -> list[tuple[str, float]]:
+        """Tokens, die für einen Suchbegriff zählen, mit ihrem Gewicht."""
+        expansions = [(term, 1.0)] if term in self.postings else []
+        if len(term) < 3:
+            start = bisect_left(self._vocabulary, term)
+            for token in self._vocabulary[start:]:
+                if not token.startswith(term):
+                    break
+                if token != term:
+                    expansions.append((token, SUBSTRING_WEIGHT))
+            return expansions
+        grams = sorted(trigrams(term, padded=False), key=lambda g: len(self._grams.get(g, ())))
+        candidates = set(self._grams.get(grams[0], ()))
+        for gram in grams[1:]:
+            if not candidates:
+                break
+            candidates &= self._grams.get(gram, set())
+        expansions.extend(
+            (token, SUBSTRING_WEIGHT) for token in candidates if token != term and term in token
+        )
+        if not expansions:
+            expansions = self._similar(term)
+        return expansions
+
+    def _similar(self, term: str) -> list[tuple[str, float]]:
+        """Unscharfe Treffer: Tokens mit ausreichend vielen gemeinsamen Trigrammen."""
+        grams = trigrams(term)
+        shared: Counter[str] = Counter()
+        for gram in grams:
+            shared.update(self._grams.get(gram, ()))
+        similar = []
+        for token, common in shared.items():
+            similarity = common / (len(grams) + len(trigrams(token)) - common)
+            if similarity >= FUZZY_THRESHOLD:
+                similar.append((token, FUZZY_WEIGHT * similarity))
+        return similar
+
+    def search(self, query: str) -> dict[int, float]:
+        """Positionen aller Tasks, die jeden Suchbegriff enthalten, mit Relevanz.
+
+        Leere Anfragen (keine Wörter) liefern keine Treffer.
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or not self.documents:
+            return {}
+        expanded = [self._expand(term) for term in terms]
+        # Seltenster Begriff zuerst: alle weiteren prüfen nur noch dessen Treffer
+        expanded.sort(key=lambda tokens: sum(len(self.postings[t]) for t, _ in tokens))
+        average = self.total_length / self.documents
+        scores: dict[int, float] | None = None
+        for tokens in expanded:
+            # Eine idf pro Suchbegriff (über alle passenden Tokens): seltene
+            # Teilstring-Treffer sollen exakte nicht überholen
+            frequency = min(sum(len(self.postings[t]) for t, _ in tokens), self.documents)
+            idf = math.log(1 + (self.documents - frequency + 0.5) / (frequency + 0.5))
+            best: dict[int, float] = {}
+            for token, weight in tokens:
+                posting = self.postings[token]
+                positions = posting if scores is None else (p for p in scores if p in posting)
+                for position in positions:
+                    tf = posting[position]
+                    norm = _K1 * (1 - _B + _B * self.lengths[position] / average)
+                    score = weight * idf * tf * (_K1 + 1) / (tf + norm)
+                    if score > best.get(position, 0.0):
+                        best[position] = score
+            if scores is None:
+                scores = best
+            else:
+                scores = {position: scores[position] + score for position, score in best.items()}
+            if not scores:
+                return {}
+        return scores or {}
@@ -1,16 +1,42 @@
-"""FastMCP Server für Taskwarrior — registriert alle 11 Tools."""
+"""FastMCP Server für Taskwarrior — registriert alle 20 Tools."""
 
+import functools
+import json
 import logging
 import shlex
+import time
+from collections.abc import Awaitable, Callable
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Any
+from pathlib import Path
+from typing import Any, TypeVar
 
 from mcp.server.fastmcp import Context, FastMCP
+from mcp.types import TextContent
+from pydantic import ValidationError
 
 from taskwarrior_mcp.config import Settings
-from taskwarrior_mcp.models import TaskAddInput, TaskListInput, TaskModifyInput, UUIDInput
-from taskwarrior_mcp.taskwarrior import TaskwarriorClient, TaskwarriorError
+from taskwarrior_mcp.metrics import MetricsFileWriter
+from taskwarrior_mcp.models import (
+    MAX_BATCH_SIZE,
+    ResponseFormat,
+    TaskAddBatchInput,
+    TaskAddInput,
+    TaskBulkInput,
+    TaskBulkModifyInput,
+    TaskGetInput,
+    TaskListInput,
+    TaskModifyFields,
+    TaskModifyInput,
+    TaskNextInput,
+    TaskSearchInput,
+    UUIDInput,
+)
+from taskwarrior_mcp.profiling import Profiler
+from taskwarrior_mcp.responses import project as project_fields
+from taskwarrior_mcp.responses import to_columnar
+from taskwarrior_mcp.taskwarrior import TaskwarriorClient
+from taskwarrior_mcp.tracing import call_context
 
 # Logging-Setup: KEIN print() — stdio ist für MCP-Protokoll reserviert
 logging.basicConfig(
@@ -26,20 +52,46 @@ class AppContext:
 
     tw: TaskwarriorClient
     settings: Settings
+    profiler: Profiler | None = None
 
 
 @asynccontextmanager
-async def lifespan(server: FastMCP):  # noqa: ANN001
-    """Initialisiert den TaskwarriorClient beim Server-Start."""
+async def lifespan(server: FastMCP):
+    """Initialisiert den TaskwarriorClient beim Server-Start.
+
+    Die Installationsprüfung (`task --version`) läuft im Hintergrund, damit
+    der Server sofort auf `initialize` antworten kann; Tool-Aufrufe warten
+    auf ihr Ergebnis und melden einen Fehler als TaskwarriorError.
+    Mit metrics_file schreibt ein MetricsFileWriter die Metriken periodisch
+    im Prometheus-Textformat; mit profile werden Tool-Aufrufe profiliert.
+    """
     settings = Settings()
     logging.getLogger().setLevel(settings.log_level)
+    tw = TaskwarriorClient(settings, verify=False)
+    tw.verify_in_background()
+    logger.info("TaskwarriorClient initialisiert, Installationsprüfung läuft")
+    writer = None
+    if settings.metrics_file:
+        writer = MetricsFileWriter(
+            Path(settings.metrics_file), tw.prometheus_metrics, settings.metrics_interval
+        )
+        writer.start()
+    profiler = None
+    if settings.profile:
+        profiler = Profiler(
+            Path(settings.profile),
+            rate=settings.profile_rate,
+            slow=settings.profile_slow,
+            tools=frozenset(t.strip() for t in settings.profile_tools.split(",") if t.strip()),
+            memory=settings.profile_memory,
+        )
+        logger.info("Profiling aktiv: %s", settings.profile)
     try:
-        tw = TaskwarriorClient(settings)
-        logger.info("TaskwarriorClient initialisiert (TW %s)", tw.version)
-        yield AppContext(tw=tw, settings=settings)
-    except TaskwarriorError as exc:
-        logger.error("Taskwarrior-Initialisierung fehlgeschlagen: %s", exc)
-        raise
+        yield AppContext(tw=tw, settings=settings, profiler=profiler)
+    finally:
+        if writer is not None:
+            await writer.close()
+        await tw.close()
 
 
 mcp = FastMCP("Taskwarrior", json_response=True, lifespan=lifespan)
@@ -55,12 +107,49 @@ def _get_settings(ctx: Context) -> Settings:
     return ctx.request_context.lifespan_context.settings
 
 
+T = TypeVar("T")
+
+
+def _instrumented(fn: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """Erfasst Aufrufe, Fehler und Latenz eines Tools in den Metriken des Clients.
+
+    Ist Profiling aktiv, läuft der Aufruf über Profiler.run (profiling.py).
+    call_context ordnet die gestarteten task-Prozesse Tool und Request-ID zu.
+    functools.wraps erhält Signatur und Docstring — FastMCP leitet daraus
+    das Eingabeschema ab.
+    """
+    name = fn.__name__
+
+    @functools.wraps(fn)
+    async def wrapper(ctx: Context, *args: Any, **kwargs: Any) -> T:
+        start = time.perf_counter()
+        failed = True
+        try:
+            with call_context(name, str(ctx.request_context.request_id)):
+                profiler = ctx.request_context.lifespan_context.profiler
+                if profiler is None:
+                    result = await fn(ctx, *args, **kwargs)
+                else:
+                    result = await profiler.run(
+                        name, {"args": args, **kwargs}, lambda: fn(ctx, *args, **kwargs)
+                    )
+            failed = False
+            return result
+        finally:
+            _get_tw(ctx).metrics.observe_tool(name, time.perf_counter() - start, failed)
+
+    return wrapper
+
+
 # ---------------------------------------------------------------------------
 # Lese-Tools
 # ---------------------------------------------------------------------------
 
 
-@mcp.tool()
+# Ohne Ausgabeschema: Listen kommen als ein JSON-Text (bei einfachen Abfragen
+# unverändert aus `task export`), nicht zusätzlich als structuredContent.
+@mcp.tool(structured_output=False)
+@_instrumented
 async def task_list(
     ctx: Context,
     filter_expr: str | None = None,
@@ -68,7 +157,11 @@ async def task_list(
     tags: list[str] | None = None,
     status: str = "pending",
     limit: int = 50,
-) -> list[dict[str, Any]]:
+    paginate: bool = False,
+    cursor: str | None = None,
+    fields: list[str] | None = None,
+    format: ResponseFormat = "objects",
+) -> TextContent | dict[str, Any]:
     """Liste Tasks mit optionalen Filtern auf.
 
     filter_expr unterstützt native Taskwarrior-Syntax:
@@ -76,6 +169,19 @@ async def task_list(
       'status:pending priority:H'
       '+OVERDUE'
       'description.contains:meeting'
+
+    Paginierung: paginate=true (oder ein cursor) liefert
+    {"tasks", "next_cursor", "total", "offset"} mit limit Tasks pro Seite,
+    sortiert nach Erstellung. Für die nächste Seite denselben Filter mit
+    cursor=next_cursor aufrufen; alle Seiten stammen aus demselben Stand.
+
+    fields: nur diese Attribute pro Task zurückgeben, z.B.
+      ['uuid', 'description', 'due'] (uuid mit angeben, wenn danach
+      geschrieben werden soll). Erlaubt sind Core-Attribute und UDAs.
+
+    format='columnar' (oder 'table') liefert bei großen Listen kompakter
+    {"columns": [...], "rows": [[...], ...]} statt einer Objektliste; Datumsfelder
+    als Epoch-Sekunden, Tags als ein String.
     """
     inp = TaskListInput(
         filter_expr=filter_expr,
@@ -83,8 +189,14 @@ async def task_list(
         tags=tags,
         status=status,
         limit=limit,
+        paginate=paginate,
+        cursor=cursor,
+        fields=fields,
+        format=format,
     )
+    columnar = inp.format != "objects"
     tw = _get_tw(ctx)
+    selected = tw.check_fields(inp.fields) if inp.fields else None
     filter_args: list[str] = []
     if inp.filter_expr:
         filter_args.extend(shlex.split(inp.filter_expr))  # ← shlex, NICHT str.split
@@ -93,43 +205,184 @@ async def task_list(
     if inp.tags:
         filter_args.extend(f"+{t}" for t in inp.tags)
     filter_args.append(f"status:{inp.status}")
+    if inp.paginate or inp.cursor:
+        page = await tw.export_page(filter_args, inp.limit, inp.cursor)
+        tasks = page.pop("tasks")
+        if columnar:
+            return {**to_columnar(tasks, selected), **page}
+        page["tasks"] = project_fields(tasks, selected) if selected else tasks
+        return page
     filter_args.append(f"limit:{inp.limit}")
-    return tw.export_tasks(filter_args)
+    if not columnar and not selected:
+        # Keine Nachbearbeitung: JSON aus `task export` direkt durchreichen
+        return TextContent(type="text", text=await tw.export_json(filter_args))
+    tasks = await tw.export_tasks(filter_args)
+    if columnar:
+        return to_columnar(tasks, selected)
+    return TextContent(
+        type="text", text=json.dumps(project_fields(tasks, selected), ensure_ascii=False)
+    )
 
 
 @mcp.tool()
+@_instrumented
 async def task_get(
     ctx: Context,
     uuid: str,
+    fields: list[str] | None = None,
 ) -> dict[str, Any]:
     """Gibt einen einzelnen Task per UUID zurück.
 
     Unterstützt vollständige UUIDs und Präfixe (mind. 8 Zeichen).
+    fields: nur diese Attribute zurückgeben (wie bei task_list).
     """
-    inp = UUIDInput(uuid=uuid)
+    inp = TaskGetInput(uuid=uuid, fields=fields)
+    tw = _get_tw(ctx)
+    selected = tw.check_fields(inp.fields) if inp.fields else None
+    task = await tw.get_task(inp.uuid)
+    return project_fields([task], selected)[0] if selected else task
+
+
+@mcp.tool()
+@_instrumented
+async def task_next(
+    ctx: Context,
+    limit: int = 10,
+    filter_expr: str | None = None,
+    project: str | None = None,
+    tags: list[str] | None = None,
+    fields: list[str] | None = None,
+) -> dict[str, Any]:
+    """Gibt die dringendsten offenen Tasks zurück (wie `task next`).
+
+    Sortiert nach Taskwarriors Urgency (Priorität, Fälligkeit, Alter, Tags,
+    Projekt, active, blocked; Koeffizienten aus der taskrc, auch
+    urgency.user.keyword.*), höchste zuerst. Mit urgency.inherit rankt
+    Taskwarrior selbst (ein `task export` pro Aufruf statt des Snapshots).
+    Wartende Tasks fehlen. filter_expr/project/tags schränken die Kandidaten
+    ein, z.B. filter_expr='due.before:eow' oder project='Work'.
+
+    Rückgabe: {"tasks": [...], "total": Anzahl offener Kandidaten}
+    """
+    inp = TaskNextInput(
+        limit=limit, filter_expr=filter_expr, project=project, tags=tags, fields=fields
+    )
+    tw = _get_tw(ctx)
+    selected = tw.check_fields(inp.fields) if inp.fields else None
+    filter_args: list[str] = []
+    if inp.filter_expr:
+        filter_args.extend(shlex.split(inp.filter_expr))
+    if inp.project:
+        filter_args.append(f"project:{inp.project}")
+    if inp.tags:
+        filter_args.extend(f"+{t}" for t in inp.tags)
+    result = await tw.next_tasks(inp.limit, filter_args)
+    if selected:
+        result["tasks"] = project_fields(result["tasks"], selected)
+    return result
+
+
+@mcp.tool()
+@_instrumented
+async def task_search(
+    ctx: Context,
+    query: str,
+    status: str | None = None,
+    project: str | None = None,
+    limit: int = 20,
+    fields: list[str] | None = None,
+) -> dict[str, Any]:
+    """Volltextsuche in Beschreibungen und Annotationen, nach Relevanz sortiert.
+
+    Alle Wörter aus query müssen vorkommen (Groß-/Kleinschreibung egal);
+    Wortteile und Tippfehler werden ebenfalls gefunden, aber niedriger
+    bewertet. Optional eingeschränkt per status (z.B. 'pending') und
+    project (inklusive Unterprojekten); ohne status alle Tasks.
+
+    Der Suchindex hängt am Snapshot: ohne TW_MCP_CACHE_ENABLED lebt er nur
+    TW_MCP_REPORT_TTL Sekunden und wird nach anderen Schreibzugriffen als
+    modify/start/stop neu aufgebaut. Für schnelle Folgesuchen den Cache
+    einschalten.
+
+    Rückgabe: {"tasks": [...] mit "score", "total": Anzahl Treffer}
+    """
+    inp = TaskSearchInput(query=query, status=status, project=project, limit=limit, fields=fields)
     tw = _get_tw(ctx)
-    return tw.get_task(inp.uuid)
+    selected = tw.check_fields(inp.fields) if inp.fields else None
+    result = await tw.search_tasks(inp.query, inp.limit, inp.status, inp.project)
+    if selected:
+        result["tasks"] = project_fields(result["tasks"], [*selected, "score"])
+    return result
 
 
 @mcp.tool()
-async def task_projects(ctx: Context) -> str:
-    """Gibt eine Liste aller Projekte mit Task-Anzahl zurück."""
+@_instrumented
+async def task_projects(ctx: Context) -> dict[str, Any]:
+    """Gibt den Projektbaum mit offenen und erledigten Tasks je Projekt zurück.
+
+    Übergeordnete Projekte zählen ihre Unterprojekte mit. Rückgabe:
+    {"projects": [{"name", "project", "pending", "completed", "children"}],
+     "without_project": {"pending", "completed"}}
+    """
     tw = _get_tw(ctx)
-    return tw.get_projects()
+    return await tw.get_projects()
 
 
 @mcp.tool()
-async def task_tags(ctx: Context) -> str:
-    """Gibt eine Liste aller Tags zurück."""
+@_instrumented
+async def task_tags(ctx: Context) -> dict[str, Any]:
+    """Gibt alle Tags mit Häufigkeit zurück (häufigste offene zuerst).
+
+    Rückgabe: {"tags": [{"tag", "pending", "completed"}], "untagged_pending"}
+    """
     tw = _get_tw(ctx)
-    return tw.get_tags()
+    return await tw.get_tags()
 
 
 @mcp.tool()
-async def task_stats(ctx: Context) -> str:
-    """Gibt Taskwarrior-Statistiken zurück (Anzahl Tasks, Velocity etc.)."""
+@_instrumented
+async def task_stats(ctx: Context) -> dict[str, Any]:
+    """Gibt Statistiken zurück (Anzahl je Status, Durchschnittsalter etc.).
+
+    Enthält aktive, überfällige und blockierte Tasks sowie Durchschnittsalter
+    offener und Bearbeitungsdauer erledigter Tasks (in Tagen).
+    task_projects, task_tags und task_stats teilen sich einen Export.
+    """
     tw = _get_tw(ctx)
-    return tw.get_stats()
+    return await tw.get_stats()
+
+
+@mcp.tool()
+@_instrumented
+async def task_sync_status(ctx: Context) -> dict[str, Any]:
+    """Gibt den Zustand des automatischen Hintergrund-Syncs zurück.
+
+    Mit TW_MCP_AUTO_SYNC=true: ob Änderungen auf den Sync warten (dirty),
+    Ergebnis und Zeitpunkt des letzten Versuchs bzw. Erfolgs, Fehlerzähler
+    und Sekunden bis zum nächsten Versuch nach einem Fehler (retry_in).
+    Ohne auto_sync: {"enabled": false}.
+    """
+    tw = _get_tw(ctx)
+    return tw.sync_status()
+
+
+@mcp.tool()
+@_instrumented
+async def task_server_metrics(ctx: Context) -> dict[str, Any]:
+    """Laufzeitmetriken des Servers (nur lesend, startet keinen task-Prozess).
+
+    tools: pro Tool calls, errors und Latenz (mean/p50/p95/p99/max in ms);
+    commands: pro Taskwarrior-Unterbefehl spawns, failures, Laufzeit,
+    stdout_bytes und json_parse_ms; dazu cache (None ohne Snapshot-Cache),
+    singleflight und scheduler. Perzentile sind Näherungen aus Histogrammen.
+    profiling (nur mit TW_MCP_PROFILE): profilierte, gespeicherte und wegen
+    eines laufenden Profils übersprungene Aufrufe.
+    """
+    result = _get_tw(ctx).server_metrics()
+    profiler = ctx.request_context.lifespan_context.profiler
+    if profiler is not None:
+        result["profiling"] = dict(profiler.stats)
+    return result
 
 
 # ---------------------------------------------------------------------------
@@ -138,6 +391,7 @@ async def task_stats(ctx: Context) -> str:
 
 
 @mcp.tool()
+@_instrumented
 async def task_add(
     ctx: Context,
     description: str,
@@ -166,6 +420,11 @@ async def task_add(
         recur=recur,
     )
     tw = _get_tw(ctx)
+    return await tw.add_task(inp.description, **_add_attrs(inp))
+
+
+def _add_attrs(inp: TaskAddInput) -> dict[str, Any]:
+    """Übersetzt ein validiertes TaskAddInput in die Attribute für add_task."""
     attrs: dict[str, Any] = {}
     if inp.project:
         attrs["project"] = inp.project
@@ -181,10 +440,52 @@ async def task_add(
         attrs["recur"] = inp.recur
     if inp.tags:
         attrs["tags"] = inp.tags
-    return tw.add_task(inp.description, **attrs)
+    return attrs
+
+
+@mcp.tool()
+@_instrumented
+async def task_add_batch(
+    ctx: Context,
+    tasks: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """Fügt viele Tasks auf einmal hinzu (ein `task import` statt N× task_add).
+
+    tasks: Liste von Objekten mit denselben Feldern wie task_add
+      (description, project, priority, due, scheduled, wait, recur, tags).
+    Alle Records werden vorab validiert; ungültige werden übersprungen.
+    Gibt die erstellten Tasks in Eingabereihenfolge zurück sowie unter
+    'failed' Index, Beschreibung und Fehler jedes nicht erstellten Records.
+    """
+    inp = TaskAddBatchInput(tasks=tasks)
+    failed: list[dict[str, Any]] = []
+    valid: list[tuple[int, dict[str, Any]]] = []
+    for index, raw in enumerate(inp.tasks):
+        try:
+            record = TaskAddInput(**raw)
+        except ValidationError as exc:
+            failed.append(
+                {"index": index, "description": raw.get("description"), "error": str(exc)}
+            )
+            continue
+        valid.append((index, {"description": record.description, **_add_attrs(record)}))
+
+    tw = _get_tw(ctx)
+    results = await tw.add_tasks([record for _, record in valid]) if valid else []
+    created: list[dict[str, Any]] = []
+    for (index, record), result in zip(valid, results):
+        if "error" in result:
+            failed.append(
+                {"index": index, "description": record["description"], "error": result["error"]}
+            )
+        else:
+            created.append(result)
+    failed.sort(key=lambda entry: entry["index"])
+    return {"created": created, "failed": failed}
 
 
 @mcp.tool()
+@_instrumented
 async def task_modify(
     ctx: Context,
     uuid: str,
@@ -217,6 +518,11 @@ async def task_modify(
         tags_remove=tags_remove,
     )
     tw = _get_tw(ctx)
+    return await tw.modify_task(inp.uuid, **_modify_attrs(inp))
+
+
+def _modify_attrs(inp: TaskModifyFields) -> dict[str, Any]:
+    """Übersetzt validierte Änderungsfelder in die Attribute für modify_task/bulk."""
     attrs: dict[str, Any] = {}
     if inp.description is not None:
         attrs["description"] = inp.description
@@ -236,10 +542,11 @@ async def task_modify(
         attrs["tags_add"] = inp.tags_add
     if inp.tags_remove is not None:
         attrs["tags_remove"] = inp.tags_remove
-    return tw.modify_task(inp.uuid, **attrs)
+    return attrs
 
 
 @mcp.tool()
+@_instrumented
 async def task_done(
     ctx: Context,
     uuid: str,
@@ -250,10 +557,11 @@ async def task_done(
     """
     inp = UUIDInput(uuid=uuid)
     tw = _get_tw(ctx)
-    return tw.complete_task(inp.uuid)
+    return await tw.complete_task(inp.uuid)
 
 
 @mcp.tool()
+@_instrumented
 async def task_delete(
     ctx: Context,
     uuid: str,
@@ -265,10 +573,11 @@ async def task_delete(
     """
     inp = UUIDInput(uuid=uuid)
     tw = _get_tw(ctx)
-    return tw.delete_task(inp.uuid)
+    return await tw.delete_task(inp.uuid)
 
 
 @mcp.tool()
+@_instrumented
 async def task_start(
     ctx: Context,
     uuid: str,
@@ -279,10 +588,11 @@ async def task_start(
     """
     inp = UUIDInput(uuid=uuid)
     tw = _get_tw(ctx)
-    return tw.start_task(inp.uuid)
+    return await tw.start_task(inp.uuid)
 
 
 @mcp.tool()
+@_instrumented
 async def task_stop(
     ctx: Context,
     uuid: str,
@@ -293,4 +603,116 @@ async def task_stop(
     """
     inp = UUIDInput(uuid=uuid)
     tw = _get_tw(ctx)
-    return tw.stop_task(inp.uuid)
+    return await tw.stop_task(inp.uuid)
+
+
+@mcp.tool()
+@_instrumented
+async def task_sync(ctx: Context) -> dict[str, Any]:
+    """Synchronisiert sofort mit dem in Taskwarrior konfigurierten Sync-Server.
+
+    Gibt die Ausgabe von `task sync` (output) und den Zustand des
+    Hintergrund-Syncs wie task_sync_status (status) zurück. Mit auto_sync
+    sind danach alle bisherigen Änderungen synchronisiert (dirty=false).
+    Ohne konfigurierten Sync meldet Taskwarrior einen Fehler.
+    """
+    tw = _get_tw(ctx)
+    output = await tw.sync()
+    return {"output": output, "status": tw.sync_status()}
+
+
+# ---------------------------------------------------------------------------
+# Bulk-Tools
+# ---------------------------------------------------------------------------
+
+
+def _bulk_selector(inp: TaskBulkInput) -> list[str]:
+    """UUID-Liste oder aufgesplitteter Filter für TaskwarriorClient.bulk."""
+    # shlex.split statt str.split — korrekt für Werte mit Leerzeichen
+    return list(inp.uuids) if inp.uuids is not None else shlex.split(inp.filter_expr or "")
+
+
+@mcp.tool()
+@_instrumented
+async def task_bulk_done(
+    ctx: Context,
+    uuids: list[str] | None = None,
+    filter_expr: str | None = None,
+    dry_run: bool = False,
+) -> dict[str, Any]:
+    """Markiert viele Tasks mit einem Aufruf als erledigt.
+
+    Genau eines von uuids oder filter_expr (z.B. 'project:Sprint12 +review';
+    nur Filterterme, kein Freitext).
+    dry_run=true meldet nur die Treffer, ohne etwas zu ändern.
+    Gibt die betroffenen UUIDs und pro Task die Änderungen vorher/nachher zurück.
+    """
+    inp = TaskBulkInput(uuids=uuids, filter_expr=filter_expr, dry_run=dry_run)
+    tw = _get_tw(ctx)
+    return await tw.bulk("done", _bulk_selector(inp), dry_run=inp.dry_run, max_tasks=MAX_BATCH_SIZE)
+
+
+@mcp.tool()
+@_instrumented
+async def task_bulk_delete(
+    ctx: Context,
+    uuids: list[str] | None = None,
+    filter_expr: str | None = None,
+    dry_run: bool = False,
+) -> dict[str, Any]:
+    """Löscht viele Tasks mit einem Aufruf.
+
+    ACHTUNG: Vorher mit dry_run=true die Treffer prüfen und beim Benutzer
+    bestätigen lassen. Genau eines von uuids oder filter_expr.
+    """
+    inp = TaskBulkInput(uuids=uuids, filter_expr=filter_expr, dry_run=dry_run)
+    tw = _get_tw(ctx)
+    return await tw.bulk(
+        "delete", _bulk_selector(inp), dry_run=inp.dry_run, max_tasks=MAX_BATCH_SIZE
+    )
+
+
+@mcp.tool()
+@_instrumented
+async def task_bulk_modify(
+    ctx: Context,
+    uuids: list[str] | None = None,
+    filter_expr: str | None = None,
+    dry_run: bool = False,
+    description: str | None = None,
+    project: str | None = None,
+    priority: str | None = None,
+    due: str | None = None,
+    scheduled: str | None = None,
+    wait: str | None = None,
+    recur: str | None = None,
+    tags_add: list[str] | None = None,
+    tags_remove: list[str] | None = None,
+) -> dict[str, Any]:
+    """Ändert Attribute vieler Tasks mit einem Aufruf (Felder wie task_modify).
+
+    Genau eines von uuids oder filter_expr; mindestens eine Änderung.
+    dry_run=true meldet nur die Treffer, ohne etwas zu ändern.
+    """
+    inp = TaskBulkModifyInput(
+        uuids=uuids,
+        filter_expr=filter_expr,
+        dry_run=dry_run,
+        description=description,
+        project=project,
+        priority=priority,
+        due=due,
+        scheduled=scheduled,
+        wait=wait,
+        recur=recur,
+        tags_add=tags_add,
+        tags_remove=tags_remove,
+    )
+    tw = _get_tw(ctx)
+    return await tw.bulk(
+        "modify",
+        _bulk_selector(inp),
+        modifications=_modify_attrs(inp),
+        dry_run=inp.dry_run,
+        max_tasks=MAX_BATCH_SIZE,
+    )
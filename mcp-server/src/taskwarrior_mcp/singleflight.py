@@ -0,0 +1,91 @@
+"""Single-Flight: gleichzeitige identische Lesezugriffe teilen sich eine Ausführung.
+
+Fragen mehrere Tool-Calls im selben Moment dasselbe ab (gleicher Filter,
+gleiche UUID), startet nur der erste einen `task export`; alle weiteren
+warten auf dessen Ergebnis. Der Schlüssel ist die vollständige Argumentliste
+des Befehls. Nach einem Schreibzugriff startet forget() neue Ausführungen,
+damit kein Lesezugriff ein Ergebnis von vor der Änderung erhält.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class SingleFlightStats:
+    """Zähler: executed = gestartete Ausführungen, shared = eingesparte Ausführungen."""
+
+    executed: int = 0
+    shared: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return {"executed": self.executed, "shared": self.shared}
+
+
+class _Call(Generic[T]):
+    def __init__(self, task: "asyncio.Task[T]") -> None:
+        self.task = task
+        self.waiters = 0
+        self.joined = 0
+
+
+class SingleFlight:
+    """Bündelt gleichzeitige Aufrufe mit gleichem Schlüssel zu einer Ausführung.
+
+    Die Ausführung läuft als eigener Task: bricht ein Aufrufer ab, warten die
+    übrigen weiter. Erst wenn alle Aufrufer abgebrochen haben, wird auch die
+    Ausführung abgebrochen.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, _Call] = {}
+        self.stats = SingleFlightStats()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    async def run(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> tuple[T, bool]:
+        """Führt fn aus oder wartet auf die laufende Ausführung mit gleichem Schlüssel.
+
+        Returns:
+            (Ergebnis, shared) — shared ist True, wenn mehrere Aufrufer dasselbe
+            Ergebnisobjekt erhalten; sie dürfen es dann nicht verändern.
+        """
+        call = self._calls.get(key)
+        if call is None:
+            call = _Call(asyncio.ensure_future(self._execute(key, fn)))
+            self._calls[key] = call
+            self.stats.executed += 1
+        else:
+            call.joined += 1
+            self.stats.shared += 1
+            logger.debug("Single-Flight: warte auf laufende Ausführung %s", key)
+        call.waiters += 1
+        try:
+            result = await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                call.task.cancel()
+        return result, call.joined > 0
+
+    async def _execute(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        try:
+            return await fn()
+        finally:
+            # Noch vor dem Ende des Tasks: später Kommende starten neu statt anzuhängen
+            call = self._calls.get(key)
+            if call is not None and call.task is asyncio.current_task():
+                del self._calls[key]
+
+    def forget(self) -> None:
+        """Laufende Ausführungen nicht mehr teilen (nach einem Schreibzugriff)."""
+        self._calls.clear()
@@ -0,0 +1,172 @@
+"""Hintergrund-Sync mit Entprellung für auto_sync.
+
+Statt nach jedem done/delete synchron `task sync` auszuführen, markiert jeder
+Schreibzugriff die Replica als "dirty". Der SyncWorker wartet, bis seit dem
+letzten Schreibzugriff `debounce` Sekunden vergangen sind, und fasst so eine
+ganze Serie von Änderungen zu einem Sync zusammen. Fehlgeschlagene Syncs
+werden mit exponentiell wachsender Pause (bis `max_backoff`) wiederholt.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+
+from taskwarrior_mcp.native import format_date
+
+logger = logging.getLogger(__name__)
+
+# Untergrenze der ersten Wiederholungspause (auch bei debounce=0 keine Endlosschleife)
+MIN_BACKOFF = 0.1
+
+# Höchstens so lange (s) wartet close() beim Beenden auf den letzten Sync
+CLOSE_TIMEOUT = 5.0
+
+
+class SyncWorker:
+    """Führt `run_sync` im Hintergrund aus, sobald nach Änderungen Ruhe herrscht.
+
+    Der Worker-Task entsteht beim ersten mark_dirty() am laufenden Event-Loop.
+    run_sync soll bei einem Fehlschlag TaskwarriorError oder OSError werfen.
+    """
+
+    def __init__(
+        self,
+        run_sync: Callable[[], Awaitable[object]],
+        debounce: float = 5.0,
+        max_backoff: float = 300.0,
+    ) -> None:
+        self._run_sync = run_sync
+        self.debounce = max(0.0, debounce)
+        self.max_backoff = max(self.debounce, max_backoff)
+        self.dirty = False
+        self.running = False
+        self.syncs = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.last_status: str | None = None
+        self.last_error: str | None = None
+        self.last_attempt: float | None = None
+        self.last_success: float | None = None
+        self._due_at = 0.0  # time.monotonic(), frühester Zeitpunkt des nächsten Syncs
+        self._retry_at = 0.0  # Backoff nach Fehlschlägen
+        self._wake = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._task: asyncio.Task[None] | None = None
+
+    def mark_dirty(self) -> None:
+        """Merkt einen Sync vor bzw. verschiebt ihn um die Entprell-Zeit."""
+        self.dirty = True
+        self._due_at = max(time.monotonic() + self.debounce, self._retry_at)
+        self._idle.clear()
+        self._wake.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._loop())
+
+    def mark_synced(self) -> None:
+        """Ein Sync außerhalb des Workers (task_sync) war erfolgreich."""
+        self.dirty = False
+        self._record_success(time.time())
+        self._idle.set()
+
+    async def _loop(self) -> None:
+        while True:
+            await self._wake.wait()
+            # Jede weitere Änderung während des Wartens schiebt _due_at nach hinten
+            while (delay := self._due_at - time.monotonic()) > 0:
+                await asyncio.sleep(delay)
+            # Erst jetzt: alle Änderungen bis hierher deckt der folgende Sync ab
+            self._wake.clear()
+            if self.dirty:
+                await self._sync_once()
+            if not self.dirty:
+                self._idle.set()
+
+    async def _sync_once(self) -> None:
+        # Erst hier: sync.py wird von taskwarrior.py importiert
+        from taskwarrior_mcp.taskwarrior import TaskwarriorError
+
+        self.dirty = False
+        self.running = True
+        self.last_attempt = time.time()
+        try:
+            await self._run_sync()
+        except asyncio.CancelledError:
+            self.dirty = True  # abgebrochen (Shutdown): gilt als nicht synchronisiert
+            raise
+        except (TaskwarriorError, OSError) as exc:
+            # Jeder Fehlschlag (kein Server, Netzwerk, Timeout) führt zu einem neuen Versuch
+            self.failures += 1
+            self.consecutive_failures += 1
+            self.last_status = "error"
+            self.last_error = str(exc) or type(exc).__name__
+            backoff = min(
+                max(self.debounce, MIN_BACKOFF) * 2 ** (self.consecutive_failures - 1),
+                self.max_backoff,
+            )
+            logger.warning("Sync fehlgeschlagen, neuer Versuch in %.0fs: %s", backoff, exc)
+            # Änderungen sind weiterhin nicht synchronisiert
+            self._retry_at = time.monotonic() + backoff
+            self.dirty = True
+            self._due_at = self._retry_at
+            self._wake.set()
+        else:
+            self._record_success(self.last_attempt)
+            logger.debug("Sync erfolgreich")
+        finally:
+            self.running = False
+
+    def _record_success(self, when: float) -> None:
+        self.syncs += 1
+        self.consecutive_failures = 0
+        self.last_status = "ok"
+        self.last_error = None
+        self.last_attempt = self.last_success = when
+        self._retry_at = 0.0
+
+    async def wait_idle(self) -> None:
+        """Wartet, bis keine Änderungen mehr auf einen Sync warten."""
+        await self._idle.wait()
+
+    async def close(self, timeout: float = CLOSE_TIMEOUT) -> None:
+        """Beendet den Worker; ausstehende Änderungen werden noch synchronisiert.
+
+        Der letzte Sync darf höchstens `timeout` Sekunden dauern, damit ein
+        nicht erreichbarer Server das Beenden nicht aufhält. Danach bleiben die
+        Änderungen lokal und gehen mit dem nächsten Sync hinaus.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self.dirty:
+            try:
+                await asyncio.wait_for(self._sync_once(), timeout)
+            except asyncio.TimeoutError:
+                logger.warning("Sync beim Beenden nach %.0fs abgebrochen", timeout)
+        if not self.dirty:
+            self._idle.set()
+
+    def status(self) -> dict:
+        """Zustand für task_sync_status (Zeitpunkte im Exportformat, UTC)."""
+        retry_in = None
+        if self.dirty and self.consecutive_failures:
+            retry_in = round(max(0.0, self._due_at - time.monotonic()), 1)
+        return {
+            "enabled": True,
+            "dirty": self.dirty,
+            "running": self.running,
+            "last_status": self.last_status,
+            "last_error": self.last_error,
+            "last_attempt": format_date(self.last_attempt) if self.last_attempt else None,
+            "last_success": format_date(self.last_success) if self.last_success else None,
+            "syncs": self.syncs,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+            "retry_in": retry_in,
+            "debounce": self.debounce,
+        }
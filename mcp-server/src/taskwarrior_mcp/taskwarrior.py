@@ -1,61 +1,237 @@
 """CLI-Wrapper für Taskwarrior — kapselt alle subprocess-Aufrufe."""
 
+import asyncio
+import codecs
+import heapq
 import json
 import logging
+import re
 import shutil
 import subprocess
+import time
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+from uuid import uuid4
 
+from taskwarrior_mcp.binary import VersionCache, default_cache_path
+from taskwarrior_mcp.cache import Snapshot, SnapshotCache, get_snapshot_cache
 from taskwarrior_mcp.config import Settings
+from taskwarrior_mcp.dates import resolve_date
+from taskwarrior_mcp.filters import FilterOptions, SimpleFilter, parse_filter
+from taskwarrior_mcp.jsonstream import JSONArrayParser, RawArrayCollector
+from taskwarrior_mcp.metrics import Metrics
+from taskwarrior_mcp.native import (
+    CORE_ATTRIBUTES,
+    NativeReadError,
+    date_udas,
+    format_date,
+    numeric_udas,
+    read_taskrc,
+    resolve_data_location,
+    resolve_taskrc,
+    uda_names,
+)
+from taskwarrior_mcp.pagination import CursorError, PageStore
+from taskwarrior_mcp.reports import project_tree, tag_counts, task_stats
+from taskwarrior_mcp.scheduler import Access, SchedulerBusyError, get_scheduler
+from taskwarrior_mcp.singleflight import SingleFlight
+from taskwarrior_mcp.sync import SyncWorker
+from taskwarrior_mcp.tracing import JsonLinesLog, call_context, current_call, redact
+
+if TYPE_CHECKING:
+    from taskwarrior_mcp.datafile import DataDirReader
+    from taskwarrior_mcp.replica import SQLiteReplicaReader
+    from taskwarrior_mcp.urgency import UrgencyCoefficients
 
 logger = logging.getLogger(__name__)
 
+# Überschreibt rc.verbose=nothing: `task add` meldet "Created task <uuid>."
+NEW_UUID_OVERRIDE = "rc.verbose=new-uuid"
+_CREATED_UUID = re.compile(
+    r"Created task ([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})"
+)
+
+
+# Datumsattribute, die für `task import` vorab aufgelöst werden müssen
+IMPORT_DATE_ATTRIBUTES = frozenset({"due", "scheduled", "wait", "until"})
+
+# Lesegröße beim Streamen von `task export`
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Status, bei denen ein Bulk-Befehl übersprungen wird
+_BULK_SKIP_STATUSES = {
+    "done": frozenset({"completed", "deleted", "recurring"}),
+    "delete": frozenset({"deleted"}),
+    "modify": frozenset({"deleted"}),
+}
+
+# Felder, die sich bei jeder Änderung ändern und die Zusammenfassung nur aufblähen
+_SUMMARY_IGNORED = frozenset({"id", "modified", "urgency"})
+
 
 class TaskwarriorError(Exception):
     """Fehler bei der Taskwarrior-Ausführung."""
 
 
+@dataclass
+class _StreamStats:
+    """Vom Leser eines gestreamten Exports gemeldete Werte für die Metriken."""
+
+    parse_seconds: float = 0.0
+    failed: bool = False
+
+
 class TaskwarriorClient:
     """Wrapper um die Taskwarrior CLI.
 
     Alle subprocess-Aufrufe nutzen shell=False mit Liste als Argumente.
+    Befehle laufen asynchron via asyncio.create_subprocess_exec, damit ein
+    langsamer `task`-Aufruf den Event-Loop des MCP-Servers nicht blockiert.
+    Pro data.location begrenzt ein gemeinsamer ExecutionScheduler die Anzahl
+    paralleler Prozesse und serialisiert Schreibzugriffe.
+    Mit native_reads liest export_tasks direkt aus der SQLite-Replica (TW3)
+    bzw. aus pending.data/completed.data (TW2), solange der Filter nativ
+    auswertbar ist.
+    Mit cache_enabled bedient ein Snapshot-Cache pro data.location Lesezugriffe
+    aus dem letzten vollständigen Export; Schreibzugriffe invalidieren ihn.
+    Gleichzeitige identische Exporte teilen sich einen Prozess (SingleFlight).
+    Mit auto_sync stößt jeder Schreibzugriff einen entprellten Hintergrund-Sync
+    an (SyncWorker), statt den Tool-Call auf `task sync` warten zu lassen.
+    Mit verify=False prüft der Konstruktor die Installation nicht; der Server
+    startet die Prüfung per verify_in_background() parallel zur
+    Protokoll-Initialisierung, Befehle warten bei Bedarf auf ihr Ergebnis.
+    Jeder Prozess wird in metrics (Metrics) pro Unterbefehl erfasst, mit
+    trace_file zusätzlich als JSON-Span; Exporte über slow_query_threshold
+    landen mit slow_query_file im Slow-Query-Log (tracing.py).
     Exit-Code 1 bedeutet "keine Ergebnisse" und ist kein Fehler.
     Nur Exit-Code ≥2 ist ein tatsächlicher Fehler.
     """
 
-    STANDARD_OVERRIDES = [
+    STANDARD_OVERRIDES = (
         "rc.verbose=nothing",
         "rc.confirmation=no",
         "rc.bulk=0",
         "rc.json.array=on",
-    ]
+    )
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(self, settings: Settings, verify: bool = True) -> None:
         self.task_bin = settings.task_binary
         self.data_location = settings.task_data
         self.taskrc = settings.taskrc
         self.timeout = settings.command_timeout
-        self.auto_sync = settings.auto_sync
-        self._verify_installation()
+        # auto_sync: Schreibzugriffe lösen entprellt einen Hintergrund-Sync aus
+        self._sync = (
+            SyncWorker(self._sync_background, settings.sync_debounce, settings.sync_max_backoff)
+            if settings.auto_sync
+            else None
+        )
+        self._config = read_taskrc(resolve_taskrc(self.taskrc))
+        self.data_dir = resolve_data_location(self.data_location, self._config)
+        self.known_fields = CORE_ATTRIBUTES | uda_names(self._config)
+        self._scheduler = get_scheduler(
+            settings.task_data,
+            settings.taskrc,
+            max_parallel_reads=settings.max_parallel_reads,
+            max_pending_writes=settings.max_pending_writes,
+        )
+        self.version = ""
+        self.major_version = 2
+        self._native_reads = settings.native_reads
+        self._native: SQLiteReplicaReader | DataDirReader | None = None
+        self._version_cache = VersionCache(default_cache_path()) if settings.version_cache else None
+        self._verification: asyncio.Future[None] | None = None
+        self._filter_options: tuple[str, FilterOptions] | None = None
+        self._coefficients: UrgencyCoefficients | None = None
+        if verify:
+            self._verify_installation()
+        self._cache = (
+            get_snapshot_cache(self.data_dir, settings.cache_ttl)
+            if settings.cache_enabled
+            else None
+        )
+        self._pages = PageStore(settings.page_snapshots, settings.page_ttl)
+        # Kurzlebiger Export nur für die Übersichten, wenn cache_enabled aus ist
+        self._reports = SnapshotCache(self.data_dir, settings.report_ttl)
+        self._reports_lock = asyncio.Lock()
+        self._flights = SingleFlight()
+        self.metrics = Metrics()
+        self._trace = JsonLinesLog(Path(settings.trace_file)) if settings.trace_file else None
+        self._slow_queries = (
+            JsonLinesLog(Path(settings.slow_query_file)) if settings.slow_query_file else None
+        )
+        self._slow_query_threshold = settings.slow_query_threshold
 
     def _verify_installation(self) -> None:
-        """Prüft ob Taskwarrior installiert ist und ermittelt die Version."""
-        if not shutil.which(self.task_bin):
+        """Prüft ob Taskwarrior installiert ist und ermittelt die Version.
+
+        Die Version kommt aus dem VersionCache, solange das Binary (Inode,
+        mtime, Größe) unverändert ist; nur sonst läuft `task --version`.
+        Öffnet danach den nativen Reader, da er von der Version abhängt.
+        """
+        task_path = shutil.which(self.task_bin)
+        if not task_path:
             raise TaskwarriorError(f"'{self.task_bin}' not found in PATH")
-        # Für --version keine STANDARD_OVERRIDES nutzen
-        result = subprocess.run(
-            [self.task_bin, "--version"],
-            capture_output=True,
-            text=True,
-            timeout=self.timeout,
-            shell=False,
-            check=False,
-        )
-        self.version = result.stdout.strip()
+        version = self._version_cache.get(task_path) if self._version_cache else None
+        if version is None:
+            # Synchron (ggf. im Thread). Für --version keine STANDARD_OVERRIDES nutzen
+            result = subprocess.run(
+                [self.task_bin, "--version"],
+                capture_output=True,
+                text=True,
+                timeout=self.timeout,
+                shell=False,
+                check=False,
+            )
+            version = result.stdout.strip()
+            if result.returncode == 0 and version and self._version_cache is not None:
+                self._version_cache.put(task_path, version)
+        self.version = version
         try:
             self.major_version = int(self.version.split(".")[0])
         except (ValueError, IndexError):
             self.major_version = 2
         logger.info("Taskwarrior %s gefunden", self.version)
+        if self._native_reads:
+            if self._urgency_coefficients().inherit:
+                # Die geerbte Urgency rechnet nur Taskwarrior selbst
+                logger.info("urgency.inherit gesetzt: keine nativen Lesezugriffe")
+            else:
+                self._native = self._open_native_reader()
+
+    def verify_in_background(self) -> None:
+        """Startet _verify_installation in einem Thread, ohne darauf zu warten.
+
+        Fehler (z.B. Binary nicht gefunden) werden beim nächsten Befehl über
+        ready() als TaskwarriorError gemeldet.
+        """
+        self._verification = asyncio.ensure_future(asyncio.to_thread(self._verify_installation))
+        self._verification.add_done_callback(_log_verification_error)
+
+    async def ready(self) -> None:
+        """Wartet auf eine laufende Installationsprüfung (sofort ohne)."""
+        if self._verification is not None:
+            await asyncio.shield(self._verification)
+
+    def _open_native_reader(self) -> "SQLiteReplicaReader | DataDirReader":
+        """Öffnet den nativen Reader passend zur Taskwarrior-Version."""
+        # Erst hier importiert: ohne native_reads bleiben sqlite3/mmap-Reader ungeladen
+        coefficients = self._urgency_coefficients()
+        numeric = numeric_udas(self._config)
+        dates = date_udas(self._config)
+        if self.major_version >= 3:
+            from taskwarrior_mcp.replica import REPLICA_FILENAME, SQLiteReplicaReader
+
+            logger.info("Native Lesezugriffe via %s", self.data_dir / REPLICA_FILENAME)
+            return SQLiteReplicaReader(
+                self.data_dir / REPLICA_FILENAME, coefficients, numeric, dates
+            )
+        from taskwarrior_mcp.datafile import DataDirReader
+
+        logger.info("Native Lesezugriffe via %s/*.data", self.data_dir)
+        return DataDirReader(self.data_dir, coefficients, numeric, dates)
 
     def _build_command(self, args: list[str]) -> list[str]:
         """Baut den vollständigen Befehl mit Overrides auf."""
@@ -68,60 +244,434 @@ class TaskwarriorClient:
         cmd.extend(args)
         return cmd
 
-    def _run(self, args: list[str]) -> str:
-        """Führt einen Taskwarrior-Befehl aus und gibt stdout zurück.
+    async def _run(
+        self,
+        args: list[str],
+        access: Access = "read",
+        input: str | None = None,
+        keep_snapshot: bool = False,
+    ) -> str:
+        """Führt einen Taskwarrior-Befehl asynchron aus und gibt stdout zurück.
 
-        WICHTIG: shell=False ist Pflicht. Niemals shell=True verwenden.
+        access bestimmt die Einplanung im Scheduler: "read" läuft parallel,
+        "write" exklusiv pro data.location, "background" exklusiv und nachrangig.
+        keep_snapshot: der Aufrufer aktualisiert den Snapshot selbst (_write_one).
+
+        WICHTIG: Nur create_subprocess_exec (Argumentliste), niemals eine Shell.
+        stdin ist /dev/null — der stdin des Servers gehört dem MCP-Protokoll.
+        Nur mit `input` (z.B. für `task import`) bekommt der Prozess eine eigene Pipe.
         Exit-Code 1 = "no matching tasks" — kein Fehler.
         Nur Exit-Code ≥2 ist ein tatsächlicher Fehler.
         """
+        await self.ready()
         cmd = self._build_command(args)
-        logger.debug("Ausführen: %s", cmd)
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=self.timeout,
-                shell=False,        # ← NIEMALS True
-                check=False,
+            async with self._scheduler.slot(access):
+                logger.debug("Ausführen: %s", cmd)
+                returncode, stdout, stderr = await self._exec(cmd, input)
+        except SchedulerBusyError as exc:
+            raise TaskwarriorError(str(exc)) from exc
+        finally:
+            # Jeder (auch fehlgeschlagene) Schreibzugriff macht den Snapshot ungültig
+            if access != "read":
+                self._flights.forget()
+                if not keep_snapshot:
+                    self._reports.invalidate()
+                    if self._cache is not None:
+                        self._cache.invalidate()
+            if access == "write" and self._sync is not None and args != ["sync"]:
+                self._sync.mark_dirty()
+        # Exit-Code 1 = "no matching tasks" — kein Fehler
+        if returncode == 1 and stderr.strip():
+            logger.debug("Exit-Code 1 mit stderr: %s", stderr.strip())
+        if returncode >= 2:
+            error_msg = stderr.strip() or stdout.strip()
+            if error_msg:
+                raise TaskwarriorError(error_msg)
+        # Ein expliziter Sync (task_sync) deckt alle bisherigen Änderungen ab
+        if access == "write" and self._sync is not None and args == ["sync"] and returncode < 2:
+            self._sync.mark_synced()
+        return stdout
+
+    async def _spawn(self, cmd: list[str], stdin: int) -> asyncio.subprocess.Process:
+        """Startet `task` ohne Shell mit Pipes für stdout und stderr."""
+        try:
+            return await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=stdin,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
             )
-            # Exit-Code 1 = "no matching tasks" — kein Fehler
-            if result.returncode == 1 and result.stderr.strip():
-                logger.debug("Exit-Code 1 mit stderr: %s", result.stderr.strip())
-            if result.returncode >= 2:
-                error_msg = result.stderr.strip() or result.stdout.strip()
-                if error_msg:
-                    raise TaskwarriorError(error_msg)
-            return result.stdout
-        except subprocess.TimeoutExpired as exc:
-            raise TaskwarriorError(f"Timeout nach {self.timeout}s") from exc
         except FileNotFoundError as exc:
             raise TaskwarriorError(f"Binary '{self.task_bin}' nicht gefunden") from exc
 
-    def export_tasks(self, filter_args: list[str] | None = None) -> list[dict]:
+    async def _exec(self, cmd: list[str], input: str | None = None) -> tuple[int, str, str]:
+        """Startet den Prozess und wartet mit Timeout auf seine Ausgabe."""
+        started = time.time()
+        start = time.perf_counter()
+        proc = await self._spawn(
+            cmd, asyncio.subprocess.DEVNULL if input is None else asyncio.subprocess.PIPE
+        )
+        stdout_raw = stderr_raw = b""
+        try:
+            stdout_raw, stderr_raw = await asyncio.wait_for(
+                proc.communicate(None if input is None else input.encode("utf-8")),
+                timeout=self.timeout,
+            )
+        except asyncio.TimeoutError as exc:
+            raise TaskwarriorError(f"Timeout nach {self.timeout}s") from exc
+        finally:
+            # Bei Timeout oder Abbruch des Tool-Calls keinen Prozess zurücklassen
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+            elapsed = time.perf_counter() - start
+            self._record_process(
+                cmd, started, elapsed, proc.returncode, len(stdout_raw), len(stderr_raw)
+            )
+        return (
+            proc.returncode,
+            stdout_raw.decode("utf-8", errors="replace"),
+            stderr_raw.decode("utf-8", errors="replace"),
+        )
+
+    def check_fields(self, fields: list[str]) -> list[str]:
+        """Prüft Feldnamen für eine Projektion gegen Core-Attribute und UDAs.
+
+        Raises:
+            TaskwarriorError: Mindestens ein Feld ist unbekannt.
+        """
+        unknown = [name for name in fields if name not in self.known_fields]
+        if unknown:
+            raise TaskwarriorError(
+                f"Unbekannte Felder: {', '.join(unknown)}. "
+                f"Erlaubt: {', '.join(sorted(self.known_fields))}"
+            )
+        return list(dict.fromkeys(fields))
+
+    async def export_tasks(self, filter_args: list[str] | None = None) -> list[dict]:
         """Exportiert Tasks als JSON-Liste.
 
+        Nativ auswertbare Filter (siehe filters.py) werden bei aktivem Cache
+        aus dem Snapshot bedient, sonst über den nativen Reader (falls aktiv).
+        Alle anderen Filter laufen wie bisher über `task export`.
+
         Args:
             filter_args: Taskwarrior-Filterargumente als Liste (bereits aufgesplittet).
                          Für Filter-Strings: shlex.split() verwenden, NICHT str.split()!
         """
-        args = (filter_args or []) + ["export"]
-        raw = self._run(args)
-        if not raw.strip():
-            return []
+        filter_args = filter_args or []
+        # Die Bedeutung von eow & Co. hängt von der Version ab
+        await self.ready()
+        query = parse_filter(filter_args, self.filter_options())
+        start = time.perf_counter()
+        if query is not None and self._cache is not None:
+            snapshot = await self._snapshot()
+            tasks = snapshot.select(query, time.time())
+        else:
+            tasks = await self._export_direct(filter_args, query)
+        self._log_slow_query(filter_args, query, time.perf_counter() - start, len(tasks))
+        return tasks
+
+    async def export_json(self, filter_args: list[str] | None = None) -> str:
+        """Wie export_tasks, aber als JSON-Text (Array) ohne Umweg über Python-Objekte.
+
+        Läuft der Export über `task export`, wird dessen Ausgabe nur auf ihre
+        Zeilenform geprüft, bei limit: gekürzt und unverändert zurückgegeben
+        (RawArrayCollector). Snapshot-Cache und nativer Reader liefern ohnehin
+        Objekte, die einmal serialisiert werden; ebenso eine Ausgabe, die nicht
+        die erwartete Form hat.
+        """
+        filter_args = filter_args or []
+        await self.ready()
+        query = parse_filter(filter_args, self.filter_options())
+        if query is not None and (self._cache is not None or self._native is not None):
+            return json.dumps(await self.export_tasks(filter_args), ensure_ascii=False)
+        start = time.perf_counter()
+        key = ("json", *self._build_command(filter_args + ["export"]))
+        (text, rows), _ = await self._flights.run(key, lambda: self._export_raw(filter_args))
+        self._log_slow_query(filter_args, query, time.perf_counter() - start, rows)
+        return text
+
+    def _log_slow_query(
+        self, filter_args: list[str], query: SimpleFilter | None, elapsed: float, rows: int
+    ) -> None:
+        """Schreibt einen Export ab slow_query_threshold ins Slow-Query-Log."""
+        if self._slow_queries is not None and elapsed >= self._slow_query_threshold:
+            self._slow_queries.write(
+                {
+                    "time": round(time.time(), 6),
+                    "duration_ms": round(elapsed * 1000, 3),
+                    "filter": redact(filter_args),
+                    "rows": rows,
+                    "native_filter": query is not None,
+                    **current_call(),
+                }
+            )
+
+    def filter_options(self) -> FilterOptions:
+        """Optionen für parse_filter aus taskrc und Taskwarrior-Version."""
+        if self._filter_options is None or self._filter_options[0] != self.version:
+            self._filter_options = (
+                self.version,
+                FilterOptions.from_config(self._config, self.version),
+            )
+        return self._filter_options[1]
+
+    async def export_page(
+        self, filter_args: list[str], limit: int, cursor: str | None = None
+    ) -> dict:
+        """Eine Seite der Treffer, sortiert nach (entry, uuid).
+
+        Ohne cursor werden alle Treffer einmal exportiert und als Snapshot
+        abgelegt; mit dem zurückgegebenen next_cursor kommen die Folgeseiten
+        aus genau diesem Snapshot. filter_args darf kein limit: enthalten und
+        muss bei allen Seiten gleich sein.
+
+        Returns:
+            {"tasks", "next_cursor" (None auf der letzten Seite), "total", "offset"}
+        """
+        if cursor is None:
+            tasks = await self.export_tasks(filter_args)
+            return self._pages.add(tasks, filter_args).page(None, limit)
         try:
-            return json.loads(raw)
-        except json.JSONDecodeError as exc:
+            snapshot, after = self._pages.resume(cursor, filter_args)
+        except CursorError as exc:
+            raise TaskwarriorError(str(exc)) from exc
+        return snapshot.page(after, limit)
+
+    async def _export_direct(
+        self, filter_args: list[str], query: SimpleFilter | None
+    ) -> list[dict]:
+        """Export ohne Cache; gleichzeitige identische Exporte laufen nur einmal.
+
+        Schlüssel ist die vollständige Befehlszeile. Bei geteiltem Ergebnis
+        bekommt jeder Aufrufer eigene (flache) Kopien der Tasks.
+        """
+        key = tuple(self._build_command(filter_args + ["export"]))
+        tasks, shared = await self._flights.run(key, lambda: self._export_once(filter_args, query))
+        return [dict(task) for task in tasks] if shared else tasks
+
+    async def _export_once(self, filter_args: list[str], query: SimpleFilter | None) -> list[dict]:
+        """Nativer Reader wenn möglich, sonst gestreamtes `task export`."""
+        await self.ready()
+        if self._native is not None and query is not None:
+            try:
+                return self._native.export(query)
+            except NativeReadError as exc:
+                logger.debug("Nativer Lesezugriff nicht möglich, nutze task: %s", exc)
+        try:
+            async with aclosing(self.stream_export(filter_args, _limit_arg(filter_args))) as stream:
+                return [task async for task in stream]
+        except ValueError as exc:
             logger.warning("JSON-Parsing fehlgeschlagen: %s", exc)
             return []
 
-    def add_task(self, description: str, **attrs) -> dict:
+    async def _export_raw(self, filter_args: list[str]) -> tuple[str, int]:
+        """Ausgabe von `task export` als Text und Anzahl der Tasks (siehe export_json)."""
+        collector = RawArrayCollector(_limit_arg(filter_args))
+        stats = _StreamStats()
+        async with aclosing(self._export_chunks(filter_args, stats)) as chunks:
+            async for chunk in chunks:
+                check_start = time.perf_counter()
+                collector.feed(chunk)
+                stats.parse_seconds += time.perf_counter() - check_start
+                if collector.done:
+                    break
+        try:
+            return collector.result(), collector.count
+        except ValueError as exc:
+            logger.debug("Rohausgabe nicht verwendbar, parse JSON: %s", exc)
+        tasks = await self._export_once(filter_args, None)
+        return json.dumps(tasks, ensure_ascii=False), len(tasks)
+
+    async def stream_export(
+        self, filter_args: list[str], limit: int | None = None
+    ) -> AsyncIterator[dict]:
+        """Liefert die Tasks von `task export` einzeln, während stdout gelesen wird.
+
+        Der Speicherbedarf hängt nur von der Chunk-Größe und den bereits
+        gelieferten Tasks ab, nicht von der Größe der Datenbank. Sind `limit`
+        Tasks geliefert (oder bricht der Aufrufer ab), wird der Prozess beendet,
+        statt den Rest der Ausgabe zu lesen. Aufrufer sollten den Generator mit
+        contextlib.aclosing verwenden, damit der Slot sofort frei wird.
+
+        Raises:
+            TaskwarriorError: Exit-Code ≥2 oder Timeout.
+            ValueError: Ausgabe ist kein gültiges JSON.
+        """
+        stats = _StreamStats()
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        parser = JSONArrayParser()
+        delivered = 0
+        async with aclosing(self._export_chunks(filter_args, stats)) as chunks:
+            async for chunk in chunks:
+                if limit is not None and delivered >= limit:
+                    return
+                parse_start = time.perf_counter()
+                try:
+                    tasks = parser.feed(decoder.decode(chunk, final=not chunk))
+                    if not chunk:
+                        parser.close()
+                except ValueError:
+                    stats.failed = True
+                    raise
+                stats.parse_seconds += time.perf_counter() - parse_start
+                for task in tasks:
+                    yield task
+                    delivered += 1
+                    if limit is not None and delivered >= limit:
+                        return
+
+    async def _export_chunks(
+        self, filter_args: list[str], stats: _StreamStats
+    ) -> AsyncIterator[bytes]:
+        """stdout von `task export` stückweise; b"" als letzter Chunk nach geprüftem Exit-Code.
+
+        Beendet der Aufrufer die Iteration vorzeitig (aclosing), wird der
+        Prozess beendet, statt den Rest der Ausgabe zu lesen. Parse-Zeit und
+        Parse-Fehler meldet der Aufrufer über stats für die Metriken.
+
+        Raises:
+            TaskwarriorError: Exit-Code ≥2 oder Timeout.
+        """
+        await self.ready()
+        cmd = self._build_command(filter_args + ["export"])
+        loop = asyncio.get_running_loop()
+        async with self._scheduler.slot("read"):
+            logger.debug("Streamen: %s", cmd)
+            started = time.time()
+            start = time.perf_counter()
+            proc = await self._spawn(cmd, asyncio.subprocess.DEVNULL)
+            stderr_task = asyncio.ensure_future(proc.stderr.read())
+            deadline = loop.time() + self.timeout
+            stdout_bytes = stderr_bytes = 0
+            failed = False
+            try:
+                while True:
+                    try:
+                        chunk = await asyncio.wait_for(
+                            proc.stdout.read(STREAM_CHUNK_SIZE),
+                            timeout=max(deadline - loop.time(), 0),
+                        )
+                    except asyncio.TimeoutError as exc:
+                        raise TaskwarriorError(f"Timeout nach {self.timeout}s") from exc
+                    if chunk:
+                        stdout_bytes += len(chunk)
+                        yield chunk
+                        continue
+                    returncode = await proc.wait()
+                    stderr_raw = await stderr_task
+                    stderr_bytes = len(stderr_raw)
+                    stderr = stderr_raw.decode("utf-8", errors="replace").strip()
+                    if returncode >= 2 and stderr:
+                        raise TaskwarriorError(stderr)
+                    if returncode == 1 and stderr:
+                        logger.debug("Exit-Code 1 mit stderr: %s", stderr)
+                    yield b""
+                    return
+            except TaskwarriorError:
+                failed = True
+                raise
+            finally:
+                # Vorzeitig beendet (limit, Abbruch, Fehler): Rest nicht mehr lesen
+                if proc.returncode is None:
+                    proc.kill()
+                    await proc.wait()
+                stderr_task.cancel()
+                self._record_process(
+                    cmd,
+                    started,
+                    time.perf_counter() - start,
+                    proc.returncode,
+                    stdout_bytes,
+                    stderr_bytes,
+                    failed or stats.failed,
+                    stats.parse_seconds,
+                )
+
+    def _record_process(
+        self,
+        cmd: list[str],
+        started: float,
+        elapsed: float,
+        returncode: int | None,
+        stdout_bytes: int,
+        stderr_bytes: int,
+        failed: bool | None = None,
+        parse_seconds: float = 0.0,
+    ) -> None:
+        """Erfasst einen beendeten Prozess in metrics und im Trace-Log.
+
+        failed: None = aus dem Exit-Code ableiten (≥2 oder abgebrochen).
+        """
+        if failed is None:
+            failed = returncode not in (0, 1)
+        self.metrics.observe_command(cmd, elapsed, failed, stdout_bytes, parse_seconds)
+        logger.debug(
+            "Beendet in %.1f ms (Exit-Code %s, %d Bytes)",
+            elapsed * 1000,
+            returncode,
+            stdout_bytes,
+        )
+        if self._trace is not None:
+            self._trace.write(
+                {
+                    "argv": [cmd[0], *redact(cmd[1:])],
+                    "start": round(started, 6),
+                    "end": round(started + elapsed, 6),
+                    "duration_ms": round(elapsed * 1000, 3),
+                    "exit_code": returncode,
+                    "stdout_bytes": stdout_bytes,
+                    "stderr_bytes": stderr_bytes,
+                    **current_call(),
+                }
+            )
+
+    async def _snapshot(self) -> Snapshot:
+        """Gültiger Snapshot aus dem Cache, bei Bedarf per vollständigem Export neu geladen."""
+        assert self._cache is not None
+        snapshot = self._cache.get()
+        if snapshot is None:
+            # Stempel und Generation vor dem Export: Ändert ein Schreibzugriff (oder
+            # das gc von TW2) die Daten währenddessen, wird das Ergebnis nicht gecacht
+            stamp, generation = self._cache.stamp(), self._cache.generation
+            tasks = await self._export_direct([], SimpleFilter())
+            snapshot = self._cache.store(tasks, stamp, generation)
+            logger.debug("Snapshot %d geladen (%d Tasks)", snapshot.version, len(tasks))
+        return snapshot
+
+    def singleflight_stats(self) -> dict[str, int]:
+        """Gestartete und durch Single-Flight eingesparte Exporte."""
+        return {**self._flights.stats.as_dict(), "in_flight": self._flights.in_flight}
+
+    def cache_stats(self) -> dict[str, int | float] | None:
+        """Treffer-/Fehlschlag-Zähler des Snapshot-Caches (None ohne Cache)."""
+        return self._cache.stats.as_dict() if self._cache is not None else None
+
+    def _stat_groups(self) -> dict[str, dict | None]:
+        return {
+            "cache": self.cache_stats(),
+            "singleflight": self.singleflight_stats(),
+            "scheduler": self._scheduler.stats(),
+        }
+
+    def server_metrics(self) -> dict:
+        """Tool- und Prozessmetriken plus Cache-, Single-Flight- und Scheduler-Zähler."""
+        return {**self.metrics.as_dict(), **self._stat_groups()}
+
+    def prometheus_metrics(self) -> str:
+        """server_metrics im Prometheus-Textformat."""
+        return self.metrics.to_prometheus(self._stat_groups())
+
+    async def add_task(self, description: str, **attrs) -> dict:
         """Fügt einen neuen Task hinzu und gibt ihn mit UUID zurück.
 
-        Nach dem Hinzufügen wird +LATEST export aufgerufen um die UUID zu erhalten.
+        `rc.verbose=new-uuid` lässt `task add` die UUID des neuen Tasks
+        ausgeben; danach genügt ein gezielter Abruf per UUID. Nur wenn keine
+        UUID erkannt wird (sehr alte Versionen), wird auf +LATEST zurückgegriffen.
         """
-        args = ["add", description]
+        args = [NEW_UUID_OVERRIDE, "add", description]
         for key, value in attrs.items():
             if value is None:
                 continue
@@ -129,78 +679,386 @@ class TaskwarriorClient:
                 args.extend(f"+{tag}" for tag in value)
             else:
                 args.append(f"{key}:{value}")
-        self._run(args)
-        # UUID des neu erstellten Tasks via +LATEST abrufen
-        tasks = self.export_tasks(["+LATEST", "limit:1"])
-        if tasks:
-            return tasks[0]
-        return {"error": "Task erstellt, aber Abruf fehlgeschlagen"}
-
-    def get_task(self, uuid: str) -> dict:
-        """Gibt einen einzelnen Task per UUID zurück."""
-        tasks = self.export_tasks([uuid])
+        output = await self._run(args, access="write")
+        match = _CREATED_UUID.search(output)
+        if match is None:
+            logger.warning("Keine UUID in der Ausgabe von task add, nutze +LATEST")
+            tasks = await self.export_tasks(["+LATEST", "limit:1"])
+            if tasks:
+                return tasks[0]
+            return {"error": "Task erstellt, aber Abruf fehlgeschlagen"}
+        uuid = match.group(1)
+        try:
+            return await self.get_task(uuid)
+        except TaskwarriorError:
+            return {"uuid": uuid, "error": "Task erstellt, aber Abruf fehlgeschlagen"}
+
+    async def add_tasks(self, records: list[dict]) -> list[dict]:
+        """Fügt mehrere Tasks mit einem einzigen `task import` hinzu.
+
+        Jeder Record hat die Felder von add_task (description, project, tags, ...).
+        Die UUIDs werden hier erzeugt, sodass ein einziger Export alle neuen
+        Tasks zurückliest. Records mit Wiederholung oder nicht lokal auflösbaren
+        Datumsangaben (z.B. eow) laufen einzeln über add_task, damit `task`
+        sie selbst auswertet.
+
+        Returns:
+            Ein Eintrag pro Record in Eingabereihenfolge: der erstellte Task
+            oder {"error": ...}.
+        """
+        now = time.time()
+        results: list[dict] = [{} for _ in records]
+        payload: list[dict] = []
+        imported: dict[int, str] = {}
+        single: list[int] = []
+        for index, record in enumerate(records):
+            item = _import_record(record, now)
+            if item is None:
+                single.append(index)
+            else:
+                payload.append(item)
+                imported[index] = item["uuid"]
+
+        if payload:
+            error = "Task nach Import nicht gefunden"
+            try:
+                await self._run(["import"], access="write", input=json.dumps(payload))
+            except TaskwarriorError as exc:
+                error = str(exc)
+            # Auch nach einem Fehler zurücklesen: import kann Teilmengen übernehmen
+            readback = await self.export_tasks(list(imported.values()))
+            created = {task["uuid"]: task for task in readback}
+            for index, uuid in imported.items():
+                results[index] = created.get(uuid) or {"error": error}
+
+        for index in single:
+            record = dict(records[index])
+            try:
+                results[index] = await self.add_task(record.pop("description"), **record)
+            except TaskwarriorError as exc:
+                results[index] = {"error": str(exc)}
+        return results
+
+    async def get_task(self, uuid: str) -> dict:
+        """Gibt einen einzelnen Task per UUID zurück.
+
+        Bei gültigem Snapshot ohne Prozess, sonst gezielter Export nur dieses
+        Tasks (ohne den ganzen Snapshot neu zu laden).
+        """
+        query = parse_filter([uuid])
+        snapshot = self._cache.get() if self._cache is not None and query else None
+        if snapshot is not None:
+            tasks = snapshot.select(query, time.time())
+        else:
+            tasks = await self._export_direct([uuid], query)
         if not tasks:
             raise TaskwarriorError(f"Task {uuid} nicht gefunden")
         return tasks[0]
 
-    def modify_task(self, uuid: str, **attrs) -> dict:
+    async def _write_one(self, uuid: str, args: list[str]) -> dict:
+        """Schreibzugriff auf genau einen Task; gibt den Task danach zurück.
+
+        Nur dieser Task wird neu exportiert und im Snapshot ersetzt (samt
+        Indizes), statt den Snapshot zu verwerfen: mit aktivem Cache in dessen
+        Snapshot, sonst im geteilten Export für Übersichten, task_next und
+        task_search (solange report_ttl läuft).
+        """
+        snapshots = self._cache if self._cache is not None else self._reports
+        if snapshots.ttl <= 0:
+            await self._run([uuid, *args], access="write")
+            return await self.get_task(uuid)
+        expected = snapshots.stamp()
+        try:
+            await self._run([uuid, *args], access="write", keep_snapshot=True)
+            tasks = await self._export_direct([uuid], parse_filter([uuid]))
+        except BaseException:
+            snapshots.invalidate()
+            raise
+        if len(tasks) != 1:
+            snapshots.invalidate()
+            raise TaskwarriorError(f"Task {uuid} nicht gefunden")
+        snapshots.replace(tasks[0], expected, snapshots.stamp())
+        return tasks[0]
+
+    async def modify_task(self, uuid: str, **attrs) -> dict:
         """Ändert Attribute eines Tasks und gibt den aktualisierten Task zurück."""
-        args = [uuid, "modify"]
-        for key, value in attrs.items():
-            if value is None:
-                continue
-            if key == "tags_add":
-                args.extend(f"+{tag}" for tag in value)
-            elif key == "tags_remove":
-                args.extend(f"-{tag}" for tag in value)
-            else:
-                args.append(f"{key}:{value}")
-        self._run(args)
-        return self.get_task(uuid)
+        return await self._write_one(uuid, ["modify", *_modify_args(attrs)])
 
-    def complete_task(self, uuid: str) -> str:
+    async def complete_task(self, uuid: str) -> str:
         """Markiert einen Task als erledigt."""
-        result = self._run([uuid, "done"]).strip()
-        if self.auto_sync:
-            self._sync_silent()
-        return result
+        return (await self._run([uuid, "done"], access="write")).strip()
 
-    def delete_task(self, uuid: str) -> str:
+    async def delete_task(self, uuid: str) -> str:
         """Löscht einen Task."""
-        result = self._run([uuid, "delete"]).strip()
-        if self.auto_sync:
-            self._sync_silent()
-        return result
+        return (await self._run([uuid, "delete"], access="write")).strip()
 
-    def start_task(self, uuid: str) -> dict:
+    async def start_task(self, uuid: str) -> dict:
         """Startet die Zeiterfassung für einen Task."""
-        self._run([uuid, "start"])
-        return self.get_task(uuid)
+        return await self._write_one(uuid, ["start"])
 
-    def stop_task(self, uuid: str) -> dict:
+    async def stop_task(self, uuid: str) -> dict:
         """Stoppt die Zeiterfassung für einen Task."""
-        self._run([uuid, "stop"])
-        return self.get_task(uuid)
+        return await self._write_one(uuid, ["stop"])
 
-    def _sync_silent(self) -> None:
-        """Führt task sync durch, ignoriert Fehler (z.B. kein Server konfiguriert)."""
-        try:
-            self._run(["sync"])
-        except TaskwarriorError as exc:
-            logger.debug("Auto-Sync fehlgeschlagen (ignoriert): %s", exc)
+    async def bulk(
+        self,
+        command: str,
+        selector: list[str],
+        modifications: dict | None = None,
+        dry_run: bool = False,
+        max_tasks: int | None = None,
+    ) -> dict:
+        """Wendet done, delete oder modify mit einem `task`-Aufruf auf viele Tasks an.
+
+        selector ist eine UUID-Liste oder ein Filter (bereits aufgesplittet).
+        Die Treffer werden vorab per Export zu UUIDs aufgelöst, der Befehl
+        läuft dann genau über diese UUIDs — so betrifft er nur die gemeldeten
+        Tasks, auch wenn sich zwischenzeitlich etwas ändert. Tasks, auf die
+        der Befehl nicht anwendbar ist (z.B. done auf erledigte), werden
+        übersprungen.
 
-    def sync(self) -> str:
+        Returns:
+            matched/affected/skipped sowie pro Task die geänderten Felder
+            vorher/nachher; mit dry_run nur die Treffer ohne Schreibzugriff.
+        """
+        if not selector:
+            raise TaskwarriorError("Bulk-Operation ohne UUIDs oder Filter ist nicht erlaubt")
+        matched = await self.export_tasks(selector)
+        targets: list[dict] = []
+        skipped: list[dict] = []
+        for task in matched:
+            status = task.get("status", "")
+            if status in _BULK_SKIP_STATUSES[command]:
+                skipped.append({"uuid": task["uuid"], "reason": f"Status {status}"})
+            else:
+                targets.append(task)
+        if max_tasks is not None and len(targets) > max_tasks:
+            raise TaskwarriorError(
+                f"{len(targets)} Tasks betroffen, maximal {max_tasks} erlaubt — Filter eingrenzen"
+            )
+        result: dict = {
+            "command": command,
+            "dry_run": dry_run,
+            "matched": len(matched),
+            "affected": [task["uuid"] for task in targets],
+            "skipped": skipped,
+        }
+        if dry_run or not targets:
+            result["tasks"] = [
+                {"uuid": t["uuid"], "description": t.get("description"), "status": t.get("status")}
+                for t in targets
+            ]
+            return result
+
+        uuids = result["affected"]
+        args = [*uuids, command]
+        if command == "modify":
+            args.extend(_modify_args(modifications or {}))
+        await self._run(args, access="write")
+        after = {task["uuid"]: task for task in await self.export_tasks(uuids)}
+        result["tasks"] = [_change_summary(task, after.get(task["uuid"], {})) for task in targets]
+        return result
+
+    async def _sync_background(self) -> None:
+        """Sync für den SyncWorker: nachrangig gegenüber Lese- und Schreibzugriffen."""
+        # Der Worker-Task erbt den Kontext des ersten Schreibzugriffs — kein Tool-Aufruf
+        with call_context(None):
+            await self._run(["sync"], access="background")
+
+    def sync_status(self) -> dict:
+        """Zustand des Hintergrund-Syncs ({"enabled": False} ohne auto_sync)."""
+        return self._sync.status() if self._sync is not None else {"enabled": False}
+
+    async def close(self) -> None:
+        """Beendet den Hintergrund-Sync (ausstehende Änderungen werden noch
+        synchronisiert, höchstens sync.CLOSE_TIMEOUT Sekunden lang) und schließt
+        Trace- und Slow-Query-Log."""
+        if self._sync is not None:
+            await self._sync.close()
+        for log in (self._trace, self._slow_queries):
+            if log is not None:
+                log.close()
+
+    async def sync(self) -> str:
         """Synchronisiert mit dem Taskserver."""
-        return self._run(["sync"]).strip()
+        return (await self._run(["sync"], access="write")).strip()
+
+    async def get_projects(self) -> dict:
+        """Projektbaum mit offenen und erledigten Tasks je Projekt."""
+        return project_tree(await self._report_tasks())
+
+    async def get_tags(self) -> dict:
+        """Tag-Häufigkeiten offener und erledigter Tasks."""
+        return tag_counts(await self._report_tasks())
+
+    async def get_stats(self) -> dict:
+        """Statuszählung, Durchschnittsalter und weitere Kennzahlen."""
+        return task_stats(await self._report_tasks(), time.time())
+
+    async def next_tasks(self, limit: int, filter_args: list[str] | None = None) -> dict:
+        """Die limit dringendsten offenen Tasks, wie der Report `task next`.
+
+        Offen heißt status:pending (ohne wartende Tasks), optional zusätzlich
+        eingeschränkt durch filter_args. Die Urgency wird spaltenweise über
+        den Snapshot berechnet (UrgencyColumns) und nur die besten limit Tasks
+        per Teilauswahl bestimmt. Nicht nativ auswertbare Filter laufen über
+        `task export`; gerankt wird dann nach dessen urgency-Feld. Ebenso mit
+        urgency.inherit, das UrgencyColumns nicht nachbildet.
+
+        Returns:
+            {"tasks": [...] absteigend nach urgency, "total": Anzahl Kandidaten}
+        """
+        await self.ready()
+        args = ["status:pending"]
+        if filter_args:
+            # Klammern: ein "or" im Filter darf status:pending nicht aushebeln
+            args += ["(", *filter_args, ")"]
+        now = time.time()
+        query = parse_filter(args, self.filter_options(), now)
+        coefficients = self._urgency_coefficients()
+        if query is None or coefficients.inherit:
+            tasks = await self._export_direct(args, None)
+            best = heapq.nlargest(limit, tasks, key=lambda task: task.get("urgency", 0.0))
+            return {"tasks": best, "total": len(tasks)}
+        snapshot = await self._report_snapshot()
+        positions = list(snapshot.matching(query, now))
+        ranked = snapshot.urgency(coefficients).top(positions, limit, now)
+        tasks = [{**snapshot.tasks[position], "urgency": urgency} for position, urgency in ranked]
+        return {"tasks": tasks, "total": len(positions)}
+
+    async def search_tasks(
+        self,
+        text: str,
+        limit: int,
+        status: str | None = None,
+        project: str | None = None,
+    ) -> dict:
+        """Volltextsuche über Beschreibungen und Annotationen, nach Relevanz sortiert.
+
+        Nutzt den SearchIndex des Snapshots; status und project schränken die
+        Treffer wie die gleichnamigen Filter ein (project inklusive
+        Unterprojekten, status:pending ohne wartende Tasks).
+
+        Returns:
+            {"tasks": [...] mit "score", absteigend, "total": Anzahl Treffer}
+        """
+        await self.ready()
+        filter_args = []
+        if status:
+            filter_args.append(f"status:{status}")
+        if project:
+            filter_args.append(f"project:{project}")
+        now = time.time()
+        query = parse_filter(filter_args, self.filter_options(), now)
+        if query is None:
+            raise TaskwarriorError(f"Ungültiger Filter für die Suche: {' '.join(filter_args)}")
+        snapshot = await self._report_snapshot()
+        hits = snapshot.search.search(text)
+        if filter_args:
+            tasks = snapshot.tasks
+            hits = {p: score for p, score in hits.items() if query.matches(tasks[p], now)}
+        # Gleiche Relevanz: Snapshot-Reihenfolge
+        best = heapq.nsmallest(limit, hits.items(), key=lambda hit: (-hit[1], hit[0]))
+        ranked = [
+            {**snapshot.tasks[position], "score": round(score, 4)} for position, score in best
+        ]
+        return {"tasks": ranked, "total": len(hits)}
+
+    def _urgency_coefficients(self) -> "UrgencyCoefficients":
+        if self._coefficients is None:
+            from taskwarrior_mcp.urgency import UrgencyCoefficients
+
+            self._coefficients = UrgencyCoefficients.from_config(self._config)
+        return self._coefficients
+
+    async def _report_tasks(self) -> list[dict]:
+        """Alle Tasks für die Übersichten — ein Export für alle drei."""
+        return (await self._report_snapshot()).tasks
+
+    async def _report_snapshot(self) -> Snapshot:
+        """Vollständiger Export für Übersichten, task_next und task_search.
+
+        Mit aktivem Cache der Snapshot. Sonst teilen sich Aufrufe innerhalb
+        von report_ttl einen vollständigen Export; Schreibzugriffe und geänderte
+        Datendateien verwerfen ihn wie beim Snapshot-Cache. Mit report_ttl=0
+        exportiert jeder Aufruf selbst.
+        """
+        if self._cache is not None:
+            return await self._snapshot()
+        if self._reports.ttl <= 0:
+            return Snapshot(tasks=await self._export_direct([], SimpleFilter()), stamp=())
+        # Gleichzeitige Aufrufe warten auf denselben Export statt eigene zu starten
+        async with self._reports_lock:
+            snapshot = self._reports.get()
+            if snapshot is None:
+                stamp, generation = self._reports.stamp(), self._reports.generation
+                tasks = await self._export_direct([], SimpleFilter())
+                snapshot = self._reports.store(tasks, stamp, generation)
+        return snapshot
+
+
+def _log_verification_error(future: "asyncio.Future[None]") -> None:
+    # Markiert die Exception als abgerufen; gemeldet wird sie beim nächsten Befehl
+    if not future.cancelled() and future.exception() is not None:
+        logger.error("Taskwarrior-Prüfung fehlgeschlagen: %s", future.exception())
+
+
+def _limit_arg(filter_args: list[str]) -> int | None:
+    """Wert des letzten limit:N im Filter (None ohne gültiges limit)."""
+    for arg in reversed(filter_args):
+        if arg.startswith("limit:") and arg[6:].isdigit():
+            return int(arg[6:])
+    return None
+
+
+def _modify_args(attrs: dict) -> list[str]:
+    """Übersetzt Änderungen (inkl. tags_add/tags_remove) in Argumente für `task modify`."""
+    args: list[str] = []
+    for key, value in attrs.items():
+        if value is None:
+            continue
+        if key == "tags_add":
+            args.extend(f"+{tag}" for tag in value)
+        elif key == "tags_remove":
+            args.extend(f"-{tag}" for tag in value)
+        else:
+            args.append(f"{key}:{value}")
+    return args
+
 
-    def get_projects(self) -> str:
-        """Gibt eine Liste aller Projekte zurück."""
-        return self._run(["projects"]).strip()
+def _change_summary(before: dict, after: dict) -> dict:
+    """Geänderte Felder eines Tasks als vorher/nachher (ohne modified/urgency/id)."""
+    keys = (before.keys() | after.keys()) - _SUMMARY_IGNORED
+    changed = sorted(key for key in keys if before.get(key) != after.get(key))
+    return {
+        "uuid": before["uuid"],
+        "description": after.get("description", before.get("description")),
+        "before": {key: before[key] for key in changed if key in before},
+        "after": {key: after[key] for key in changed if key in after},
+    }
 
-    def get_tags(self) -> str:
-        """Gibt eine Liste aller Tags zurück."""
-        return self._run(["tags"]).strip()
 
-    def get_stats(self) -> str:
-        """Gibt Statistiken zurück."""
-        return self._run(["stats"]).strip()
+def _import_record(record: dict, now: float) -> dict | None:
+    """Baut einen Datensatz für `task import`, None wenn `task` ihn auswerten muss."""
+    if record.get("recur"):
+        return None  # Wiederholungen erzeugt nur `task add` korrekt (Template + Instanzen)
+    item = {
+        "uuid": str(uuid4()),
+        "description": record["description"],
+        "status": "pending",
+        "entry": format_date(now),
+    }
+    for key, value in record.items():
+        if value is None or key in item:
+            continue
+        if key in IMPORT_DATE_ATTRIBUTES:
+            epoch = resolve_date(value, now)
+            if epoch is None:
+                return None
+            item[key] = format_date(epoch)
+        elif key == "tags":
+            if value:
+                item["tags"] = list(value)
+        else:
+            item[key] = value
+    return item
@@ -0,0 +1,165 @@
+"""Strukturierte Protokolle für `task`-Prozesse und langsame Exporte.
+
+Mit trace_file schreibt der TaskwarriorClient pro `task`-Prozess eine
+JSON-Zeile (Span): Befehlszeile mit geschwärztem Freitext, Start/Ende
+(Unix-Zeit), Dauer, Exit-Code, stdout/stderr-Bytes sowie Tool und
+Request-ID des auslösenden MCP-Aufrufs. Mit slow_query_file landen Exporte,
+die länger als slow_query_threshold dauern, mit geschwärztem Filter und
+Trefferzahl in einer eigenen Datei — unabhängig davon, ob sie aus dem
+Cache, dem nativen Reader oder `task export` kamen.
+
+Geschwärzt werden Beschreibungen, Suchbegriffe und alle Attributwerte außer
+strukturierten (Status, Priorität, Daten, limit, ...), deren Wert zur
+Grammatik des Attributs passt: `due:eow` bleibt, `due:Anwalt anrufen` wird
+zu `due:***`. Nur das erste Befehlswort bleibt stehen, ein späteres (etwa
+eine Beschreibung `calendar` hinter `add`) gilt als Freitext. Erhalten
+bleibt die Form des Filters, z.B. `project:*** +*** due.before:eow`.
+
+Tool und Request-ID setzt server._instrumented über call_context; Tasks,
+die während eines Aufrufs entstehen (SingleFlight), erben ihn.
+"""
+
+import json
+import logging
+import re
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import IO, Any
+
+from taskwarrior_mcp.commands import SUBCOMMANDS
+from taskwarrior_mcp.dates import resolve_date
+from taskwarrior_mcp.filters import VIRTUAL_TAGS
+from taskwarrior_mcp.native import DATE_ATTRIBUTES
+
+logger = logging.getLogger(__name__)
+
+REDACTED = "***"
+
+# Grammatik der Werte strukturierter Attribute (Daten prüft resolve_date)
+_VALUE_GRAMMAR = {
+    "status": re.compile(r"^(?:pending|completed|deleted|waiting|recurring)$"),
+    "priority": re.compile(r"^[HMLhml]$"),
+    "limit": re.compile(r"^(?:\d+|page)$"),
+    "urgency": re.compile(r"^[+-]?\d+(?:\.\d+)?$"),
+    "recur": re.compile(
+        r"^(?:daily|weekdays|weekly|biweekly|fortnight|monthly|bimonthly|quarterly"
+        r"|semiannual|annual|yearly|biannual|biyearly"
+        r"|\d*(?:d|days?|w|wks?|weeks?|mo|mos|months?|q|qtrs?|quarters?|y|yrs?|years?))$"
+    ),
+    "id": re.compile(r"^\d+(?:[-,]\d+)*$"),
+    "uuid": re.compile(r"^[0-9a-f-]{1,36}$"),
+    "depends": re.compile(r"^[+-]?[0-9a-f-]+(?:,[+-]?[0-9a-f-]+)*$"),
+}
+
+# Attribute, deren Werte kein Freitext sind und (passend zur Grammatik) erhalten bleiben
+STRUCTURED_ATTRIBUTES = DATE_ATTRIBUTES | frozenset(_VALUE_GRAMMAR)
+_OPERATORS = frozenset(
+    {
+        "and",
+        "or",
+        "xor",
+        "not",
+        "!",
+        "(",
+        ")",
+        "<",
+        "<=",
+        ">",
+        ">=",
+        "=",
+        "==",
+        "!=",
+        "~",
+    }
+)
+_ATTRIBUTE = re.compile(r"^([A-Za-z_]\w*)((?:\.\w+)?[:=])(.*)$", re.DOTALL)
+_IDENTIFIER = re.compile(r"^(?:[0-9a-f]{8}(?:-[0-9a-f-]{1,28})?|\d+(?:[-,]\d+)*)$")
+
+# (Tool, Request-ID) des laufenden MCP-Aufrufs
+_CALL: ContextVar[tuple[str, str | None] | None] = ContextVar("tw_mcp_call", default=None)
+
+
+@contextmanager
+def call_context(tool: str | None, request_id: str | None = None) -> Iterator[None]:
+    """Ordnet alle Prozesse innerhalb des Blocks diesem Tool-Aufruf zu (None: keinem)."""
+    token = _CALL.set(None if tool is None else (tool, request_id))
+    try:
+        yield
+    finally:
+        _CALL.reset(token)
+
+
+def current_call() -> dict[str, str | None]:
+    """{"tool", "request_id"} des laufenden Aufrufs (beide None außerhalb)."""
+    call = _CALL.get()
+    return {"tool": call[0], "request_id": call[1]} if call else {"tool": None, "request_id": None}
+
+
+def redact(args: Sequence[str]) -> list[str]:
+    """Ersetzt Freitext in Taskwarrior-Argumenten durch REDACTED."""
+    redacted = []
+    command_seen = False
+    for arg in args:
+        if not command_seen and arg in SUBCOMMANDS:
+            # Nur das erste Befehlswort; spätere sind Beschreibungen
+            command_seen = True
+            redacted.append(arg)
+        else:
+            redacted.append(_redact_arg(arg))
+    return redacted
+
+
+def _structured_value(name: str, value: str) -> bool:
+    """True, wenn value zur Grammatik des strukturierten Attributs name passt."""
+    if any(char.isspace() for char in value):
+        return False
+    if name in DATE_ATTRIBUTES:
+        return resolve_date(value, time.time(), periods=True) is not None
+    grammar = _VALUE_GRAMMAR.get(name)
+    return grammar is not None and grammar.match(value) is not None
+
+
+def _redact_arg(arg: str) -> str:
+    if arg in _OPERATORS or arg.startswith(("rc.", "rc:")) or _IDENTIFIER.match(arg):
+        return arg
+    if arg[:1] in "+-" and len(arg) > 1:
+        return arg if arg[1:] in VIRTUAL_TAGS else arg[0] + REDACTED
+    match = _ATTRIBUTE.match(arg)
+    if match:
+        name, separator, value = match.groups()
+        if not value or _structured_value(name, value):
+            return arg
+        return f"{name}{separator}{REDACTED}"
+    return REDACTED
+
+
+class JsonLinesLog:
+    """Hängt JSON-Zeilen an eine Datei an (zeilengepuffert, mehrere Server möglich).
+
+    Ist die Datei nicht schreibbar, wird einmal gewarnt und nichts mehr geschrieben.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._file: IO[str] | None = None
+        self._disabled = False
+
+    def write(self, record: dict[str, Any]) -> None:
+        if self._disabled:
+            return
+        try:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = self.path.open("a", encoding="utf-8", buffering=1)
+            self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        except OSError as exc:
+            logger.warning("Protokoll %s nicht schreibbar: %s", self.path, exc)
+            self._disabled = True
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,333 @@
+"""Urgency-Berechnung nach der Formel von Taskwarrior.
+
+Wird von den nativen Lesepfaden genutzt, damit deren Ergebnisse dasselbe
+`urgency`-Feld tragen wie `task export`, und spaltenweise (UrgencyColumns)
+von task_next. Koeffizienten kommen aus den
+`urgency.*`-Einträgen der taskrc, Defaults entsprechen Taskwarrior.
+
+Nicht nachgebildet ist `urgency.inherit` (blockierende Tasks erben rekursiv
+die höchste Urgency der von ihnen blockierten). Ist es gesetzt, verzichtet
+der Client auf native Lesezugriffe und task_next rankt nach dem
+urgency-Feld von `task export` (siehe UrgencyCoefficients.inherit).
+"""
+
+import heapq
+from dataclasses import dataclass, field
+
+from taskwarrior_mcp.native import ACTIVE_STATUSES, is_waiting, parse_date
+
+# Defaults aus Taskwarriors eingebauter Konfiguration
+DEFAULT_COEFFICIENTS: dict[str, float] = {
+    "urgency.active.coefficient": 4.0,
+    "urgency.age.coefficient": 2.0,
+    "urgency.age.max": 365.0,
+    "urgency.annotations.coefficient": 1.0,
+    "urgency.blocked.coefficient": -5.0,
+    "urgency.blocking.coefficient": 8.0,
+    "urgency.due.coefficient": 12.0,
+    "urgency.project.coefficient": 1.0,
+    "urgency.scheduled.coefficient": 5.0,
+    "urgency.tags.coefficient": 1.0,
+    "urgency.waiting.coefficient": -3.0,
+    "urgency.user.tag.next.coefficient": 15.0,
+    "urgency.uda.priority.H.coefficient": 6.0,
+    "urgency.uda.priority.M.coefficient": 3.9,
+    "urgency.uda.priority.L.coefficient": 1.8,
+}
+
+# Schreibweisen von "an" für boolesche taskrc-Werte
+_TRUE_VALUES = frozenset({"1", "on", "yes", "y", "true", "t"})
+
+
+@dataclass(frozen=True)
+class UrgencyCoefficients:
+    """Koeffizienten der Urgency-Formel."""
+
+    active: float = 4.0
+    age: float = 2.0
+    age_max: float = 365.0
+    annotations: float = 1.0
+    blocked: float = -5.0
+    blocking: float = 8.0
+    due: float = 12.0
+    project: float = 1.0
+    scheduled: float = 5.0
+    tags: float = 1.0
+    waiting: float = -3.0
+    user_tags: dict[str, float] = field(default_factory=lambda: {"next": 15.0})
+    user_projects: dict[str, float] = field(default_factory=dict)
+    # Teilstring der Beschreibung → Koeffizient (Groß-/Kleinschreibung zählt)
+    user_keywords: dict[str, float] = field(default_factory=dict)
+    # (uda, value) → Koeffizient; value None = Attribut vorhanden
+    udas: dict[tuple[str, str | None], float] = field(
+        default_factory=lambda: {
+            ("priority", "H"): 6.0,
+            ("priority", "M"): 3.9,
+            ("priority", "L"): 1.8,
+        }
+    )
+    # urgency.inherit: nur Taskwarrior selbst rechnet die geerbte Urgency
+    inherit: bool = False
+
+    @classmethod
+    def from_config(cls, config: dict[str, str]) -> "UrgencyCoefficients":
+        """Liest die Koeffizienten aus taskrc-Einträgen (Defaults für fehlende)."""
+        values = dict(DEFAULT_COEFFICIENTS)
+        for key, raw in config.items():
+            if key.startswith("urgency."):
+                try:
+                    values[key] = float(raw)
+                except ValueError:
+                    continue
+        user_tags: dict[str, float] = {}
+        user_projects: dict[str, float] = {}
+        user_keywords: dict[str, float] = {}
+        udas: dict[tuple[str, str | None], float] = {}
+        for key, value in values.items():
+            if not key.endswith(".coefficient"):
+                continue
+            name = key[len("urgency.") : -len(".coefficient")]
+            if name.startswith("user.tag."):
+                user_tags[name[len("user.tag.") :]] = value
+            elif name.startswith("user.project."):
+                user_projects[name[len("user.project.") :]] = value
+            elif name.startswith("user.keyword."):
+                user_keywords[name[len("user.keyword.") :]] = value
+            elif name.startswith("uda."):
+                uda, _, uda_value = name[len("uda.") :].partition(".")
+                udas[(uda, uda_value or None)] = value
+        return cls(
+            active=values["urgency.active.coefficient"],
+            age=values["urgency.age.coefficient"],
+            age_max=values["urgency.age.max"],
+            annotations=values["urgency.annotations.coefficient"],
+            blocked=values["urgency.blocked.coefficient"],
+            blocking=values["urgency.blocking.coefficient"],
+            due=values["urgency.due.coefficient"],
+            project=values["urgency.project.coefficient"],
+            scheduled=values["urgency.scheduled.coefficient"],
+            tags=values["urgency.tags.coefficient"],
+            waiting=values["urgency.waiting.coefficient"],
+            user_tags=user_tags,
+            user_projects=user_projects,
+            user_keywords=user_keywords,
+            udas=udas,
+            inherit=config.get("urgency.inherit", "").strip().lower() in _TRUE_VALUES,
+        )
+
+
+def due_factor(due: float, now: float) -> float:
+    """Bildet die Fälligkeit auf 0.2–1.0 ab (21-Tage-Fenster um das Due-Datum)."""
+    days_overdue = (now - due) / 86400.0
+    if days_overdue >= 7.0:
+        return 1.0
+    if days_overdue >= -14.0:
+        return ((days_overdue + 14.0) * 0.8 / 21.0) + 0.2
+    return 0.2
+
+
+def count_factor(count: int) -> float:
+    """Faktor für Anzahl von Tags bzw. Annotationen."""
+    if count >= 3:
+        return 1.0
+    if count == 2:
+        return 0.9
+    if count == 1:
+        return 0.8
+    return 0.0
+
+
+def age_factor(entry: float, now: float, age_max: float) -> float:
+    """Alter in ganzen Tagen relativ zu urgency.age.max (max. 1.0)."""
+    age = int((now - entry) / 86400)
+    if age_max == 0 or age > age_max:
+        return 1.0
+    return age / age_max
+
+
+def compute_urgency(
+    task: dict,
+    coefficients: UrgencyCoefficients,
+    now: float,
+    blocked: bool = False,
+    blocking: bool = False,
+) -> float:
+    """Berechnet die Urgency eines Tasks im Exportformat."""
+    c = coefficients
+    tags = task.get("tags") or []
+    value = 0.0
+    if task.get("project"):
+        value += c.project
+    if task.get("start"):
+        value += c.active
+    scheduled = task.get("scheduled")
+    if scheduled and parse_date(scheduled) < now:
+        value += c.scheduled
+    if is_waiting(task, now):
+        value += c.waiting
+    if blocked:
+        value += c.blocked
+    value += c.annotations * count_factor(len(task.get("annotations") or []))
+    value += c.tags * count_factor(len(tags))
+    entry = task.get("entry")
+    value += c.age * (age_factor(parse_date(entry), now, c.age_max) if entry else 1.0)
+    due = task.get("due")
+    if due:
+        value += c.due * due_factor(parse_date(due), now)
+    if blocking:
+        value += c.blocking
+    for tag, coefficient in c.user_tags.items():
+        if tag in tags:
+            value += coefficient
+    project = task.get("project") or ""
+    for prefix, coefficient in c.user_projects.items():
+        if project.startswith(prefix):
+            value += coefficient
+    description = task.get("description") or ""
+    for keyword, coefficient in c.user_keywords.items():
+        if keyword in description:
+            value += coefficient
+    for (uda, uda_value), coefficient in c.udas.items():
+        current = task.get(uda)
+        if current is None or current == "":
+            continue
+        if uda_value is None or str(current) == uda_value:
+            value += coefficient
+    # Taskwarrior gibt die Urgency mit 6 signifikanten Stellen aus
+    return float(f"{value:.6g}")
+
+
+def dependency_sets(tasks: list[dict]) -> tuple[set[str], set[str]]:
+    """Ermittelt (offene UUIDs, blockierende UUIDs) aus einer Task-Menge.
+
+    Blockierend ist ein Task, von dem ein offener Task abhängt.
+    """
+    open_uuids: set[str] = set()
+    blocking: set[str] = set()
+    for task in tasks:
+        if task.get("status") in ACTIVE_STATUSES:
+            open_uuids.add(task["uuid"])
+            blocking.update(task.get("depends") or ())
+    return open_uuids, blocking
+
+
+def annotate_urgency(
+    tasks: list[dict],
+    coefficients: UrgencyCoefficients,
+    now: float,
+    open_uuids: set[str],
+    blocking_uuids: set[str],
+) -> None:
+    """Setzt das Feld `urgency` auf allen Tasks (in-place)."""
+    for task in tasks:
+        depends = task.get("depends") or ()
+        blocked = any(dep in open_uuids for dep in depends)
+        is_blocking = task["uuid"] in blocking_uuids and task.get("status") in ACTIVE_STATUSES
+        task["urgency"] = compute_urgency(task, coefficients, now, blocked, is_blocking)
+
+
+class UrgencyColumns:
+    """Urgency spaltenweise über alle Tasks eines Snapshots (für task_next).
+
+    Alles, was nicht von der Uhrzeit abhängt (Projekt, Tags, Schlüsselwörter,
+    Annotationen, UDAs, active, blocked, blocking), wird einmal pro Snapshot zu einer
+    Spalte `static` zusammengefasst; entry, due und scheduled liegen als
+    Epoch-Spalten vor. scores() ergänzt nur noch die zeitabhängigen Terme.
+    Spalten sind nach Position im Snapshot indiziert; Tasks, die nicht offen
+    sind, haben dort neutrale Werte.
+    """
+
+    def __init__(self, tasks: list[dict], coefficients: UrgencyCoefficients) -> None:
+        self.coefficients = coefficients
+        size = len(tasks)
+        self.static = [0.0] * size
+        self.entry: list[float | None] = [None] * size
+        self.due: list[float | None] = [None] * size
+        self.scheduled: list[float | None] = [None] * size
+        self._open_uuids, self._blocking = dependency_sets(tasks)
+        for position, task in enumerate(tasks):
+            if task.get("status") in ACTIVE_STATUSES:
+                self._fill(position, task)
+
+    def _fill(self, position: int, task: dict) -> None:
+        c = self.coefficients
+        tags = task.get("tags") or []
+        project = task.get("project") or ""
+        blocked = any(dep in self._open_uuids for dep in task.get("depends") or ())
+        value = c.project if project else 0.0
+        if task.get("start"):
+            value += c.active
+        if blocked:
+            value += c.blocked
+        if task["uuid"] in self._blocking:
+            value += c.blocking
+        value += c.annotations * count_factor(len(task.get("annotations") or []))
+        value += c.tags * count_factor(len(tags))
+        value += sum(coefficient for tag, coefficient in c.user_tags.items() if tag in tags)
+        value += sum(
+            coefficient
+            for prefix, coefficient in c.user_projects.items()
+            if project.startswith(prefix)
+        )
+        description = task.get("description") or ""
+        value += sum(
+            coefficient
+            for keyword, coefficient in c.user_keywords.items()
+            if keyword in description
+        )
+        for (uda, uda_value), coefficient in c.udas.items():
+            current = task.get(uda)
+            if (
+                current is not None
+                and current != ""
+                and (uda_value is None or str(current) == uda_value)
+            ):
+                value += coefficient
+        self.static[position] = value
+        for column, attr in (
+            (self.entry, "entry"),
+            (self.due, "due"),
+            (self.scheduled, "scheduled"),
+        ):
+            raw = task.get(attr)
+            column[position] = float(parse_date(raw)) if raw else None
+
+    def update(self, position: int, task: dict) -> None:
+        """Berechnet die Zeile eines geänderten Tasks neu (depends und Status unverändert)."""
+        self._fill(position, task)
+
+    def scores(self, positions: list[int], now: float) -> list[float]:
+        """Urgency der Tasks an positions zum Zeitpunkt now (ungerundet, ohne waiting)."""
+        c = self.coefficients
+        static, entry, due, scheduled = self.static, self.entry, self.due, self.scheduled
+        if c.age_max == 0:
+            age = [c.age] * len(positions)
+        else:
+            age = [
+                c.age * (min(int((now - e) / 86400) / c.age_max, 1.0) if e is not None else 1.0)
+                for e in (entry[p] for p in positions)
+            ]
+        # due_factor als geschlossene Form: 0.2 + 0.8 * (Überfälligkeit in [-14, 7] + 14) / 21
+        due_terms = [
+            c.due * (0.2 + (min(max((now - d) / 86400.0, -14.0), 7.0) + 14.0) * 0.8 / 21.0)
+            if d is not None
+            else 0.0
+            for d in (due[p] for p in positions)
+        ]
+        scheduled_terms = [
+            c.scheduled if s is not None and s < now else 0.0
+            for s in (scheduled[p] for p in positions)
+        ]
+        return [
+            static[p] + a + d + s for p, a, d, s in zip(positions, age, due_terms, scheduled_terms)
+        ]
+
+    def top(self, positions: list[int], k: int, now: float) -> list[tuple[int, float]]:
+        """Die k dringendsten Positionen mit Urgency (gerundet wie Taskwarrior).
+
+        heapq.nlargest statt vollständiger Sortierung; bei Gleichstand gewinnt
+        die frühere Position.
+        """
+        scores = self.scores(positions, now)
+        best = heapq.nlargest(k, range(len(positions)), key=scores.__getitem__)
+        return [(positions[i], float(f"{scores[i]:.6g}")) for i in best]
@@ -0,0 +1,183 @@
+"""Synthetische Taskwarrior-Datenbanken für Benchmarks.
+
+generate_tasks() erzeugt reproduzierbare Tasks im Exportformat mit einer
+realistischen Mischung: verschachtelte Projekte, Tags, Prioritäten,
+Fälligkeiten (auch überfällige), wartende, erledigte und gelöschte Tasks,
+Annotationen, Abhängigkeiten und wiederkehrende Vorlagen. populate()
+spielt sie per `task import` in ein isoliertes Datenverzeichnis ein.
+median_ms() misst Mikro-Benchmarks einheitlich.
+"""
+
+import json
+import os
+import random
+import statistics
+import subprocess
+import time
+import uuid
+from collections.abc import Callable
+
+from taskwarrior_mcp.native import format_date
+
+DAY = 86400
+
+PROJECTS = [
+    "Work",
+    "Work.Reports",
+    "Work.Meetings",
+    "Work.Backend",
+    "Work.Backend.Api",
+    "Home",
+    "Home.Garden",
+    "Home.Repairs",
+    "Finance",
+    "Finance.Taxes",
+    "Health",
+    "Learning.Python",
+    "Learning.Rust",
+    "Travel",
+    "Errands",
+]
+TAGS = [
+    "next",
+    "waiting",
+    "call",
+    "email",
+    "errand",
+    "urgent",
+    "someday",
+    "review",
+    "blocked",
+    "office",
+    "home",
+    "phone",
+    "read",
+    "write",
+    "meeting",
+    "idea",
+]
+WORDS = [
+    "bericht",
+    "meeting",
+    "angebot",
+    "rechnung",
+    "kunde",
+    "server",
+    "update",
+    "review",
+    "planen",
+    "schreiben",
+    "prüfen",
+    "anrufen",
+    "bestellen",
+    "migration",
+    "release",
+    "dokumentation",
+    "budget",
+    "vertrag",
+    "urlaub",
+    "einkauf",
+    "steuer",
+    "garten",
+    "reparatur",
+    "termin",
+    "präsentation",
+    "backup",
+    "deployment",
+    "test",
+    "fehler",
+]
+
+# Anteil je Status (Rest: pending)
+COMPLETED = 0.55
+DELETED = 0.05
+WAITING = 0.03
+RECURRING = 0.005
+
+# Tasks pro `task import`
+IMPORT_CHUNK = 5000
+
+
+def median_ms(fn: Callable[[], object], runs: int, digits: int = 3) -> float:
+    """Median der Laufzeit von fn über runs Aufrufe in Millisekunden."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return round(statistics.median(samples) * 1000, digits)
+
+
+def _uuid(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choices(WORDS, k=words)).capitalize()
+
+
+def generate_tasks(count: int, now: float, seed: int = 21) -> list[dict]:
+    """count Tasks im Exportformat (ohne id/urgency), reproduzierbar per seed."""
+    rng = random.Random(seed)
+    tasks: list[dict] = []
+    pending: list[str] = []
+    for _ in range(count):
+        entry = now - rng.randint(1, 720) * DAY - rng.randint(0, DAY)
+        task: dict = {
+            "uuid": _uuid(rng),
+            "description": _text(rng, rng.randint(2, 7)),
+            "entry": format_date(entry),
+            "modified": format_date(entry + rng.randint(0, DAY)),
+            "status": "pending",
+        }
+        roll = rng.random()
+        if rng.random() < 0.85:
+            task["project"] = rng.choice(PROJECTS)
+        if tags := rng.sample(TAGS, rng.choice((0, 0, 1, 1, 2, 3))):
+            task["tags"] = tags
+        if rng.random() < 0.3:
+            task["priority"] = rng.choice("HML")
+        if rng.random() < 0.4:
+            task["due"] = format_date(now + rng.randint(-20, 60) * DAY)
+        if rng.random() < 0.15:
+            task["annotations"] = [
+                {"entry": format_date(entry + n * 3600), "description": _text(rng, 4)}
+                for n in range(rng.randint(1, 3))
+            ]
+        if roll < RECURRING:
+            # Vorlage; die nächste Instanz erzeugt `task` selbst
+            task["status"] = "recurring"
+            task["recur"] = rng.choice(["daily", "weekly", "monthly"])
+            task["due"] = format_date(now + rng.randint(1, 5) * DAY)
+            task["mask"] = ""
+        elif roll < RECURRING + COMPLETED:
+            task["status"] = "completed"
+            task["end"] = format_date(entry + rng.randint(0, 30) * DAY)
+        elif roll < RECURRING + COMPLETED + DELETED:
+            task["status"] = "deleted"
+            task["end"] = format_date(entry + rng.randint(0, 30) * DAY)
+        elif roll < RECURRING + COMPLETED + DELETED + WAITING:
+            task["wait"] = format_date(now + rng.randint(1, 30) * DAY)
+        else:
+            if pending and rng.random() < 0.03:
+                task["depends"] = [rng.choice(pending)]
+            if rng.random() < 0.02:
+                task["start"] = format_date(now - rng.randint(0, 3) * DAY)
+            pending.append(task["uuid"])
+        tasks.append(task)
+    return tasks
+
+
+def populate(env: dict[str, str], tasks: list[dict], binary: str = "task") -> None:
+    """Spielt tasks per `task import` in die Umgebung env ein (TASKRC/TASKDATA)."""
+    process_env = {**os.environ, "TASKRC": env["TASKRC"], "TASKDATA": env["TASKDATA"]}
+    for start in range(0, len(tasks), IMPORT_CHUNK):
+        chunk = tasks[start : start + IMPORT_CHUNK]
+        subprocess.run(
+            [binary, "import"],
+            input=json.dumps(chunk).encode("utf-8"),
+            env=process_env,
+            capture_output=True,
+            check=True,
+            shell=False,
+        )
@@ -0,0 +1,82 @@
+"""Benchmark: typische task_list-Filter über 100k Tasks mit und ohne Index.
+
+Misst den Aufbau des TaskIndex, die Auswertung einiger Filter über
+Snapshot.select (mit Index) und SimpleFilter.select (Scan) sowie das
+Nachführen des Index nach der Änderung eines Tasks.
+
+Ausführen mit: uv run pytest -m benchmark tests/benchmarks -s
+"""
+
+import json
+import random
+import time
+from collections.abc import Callable
+
+import pytest
+
+from taskwarrior_mcp.cache import Snapshot
+from taskwarrior_mcp.filters import FilterOptions, parse_filter
+from taskwarrior_mcp.native import format_date
+from tests.benchmarks.dataset import median_ms
+
+pytestmark = pytest.mark.benchmark
+
+TASK_COUNT = 100_000
+RUNS = 20
+DAY = 86400
+
+# Wie von task_list erzeugt (limit:50 ist dessen Standard)
+FILTERS = [
+    ["project:Work", "+urgent", "due.before:eow", "limit:50"],
+    ["status:pending", "+call", "limit:50"],
+    ["project:P17", "limit:50"],
+    ["due.before:today", "status:pending", "limit:50"],
+    ["(project:Home", "or", "+mail)", "status:pending", "limit:50"],
+]
+
+
+def _tasks(now: float) -> list[dict]:
+    rng = random.Random(100)
+    tasks = []
+    for n in range(TASK_COUNT):
+        task = {
+            "uuid": f"{rng.getrandbits(32):08x}-0000-4000-8000-{n:012x}",
+            "description": f"Task {n}",
+            "status": "pending" if rng.random() < 0.2 else "completed",
+            "project": rng.choice(["Work", "Work.Sub", "Home"] + [f"P{i}" for i in range(50)]),
+        }
+        if rng.random() < 0.5:
+            task["tags"] = rng.sample(["urgent", "call", "mail", "later", "x", "y"], 2)
+        if rng.random() < 0.3:
+            task["due"] = format_date(now + rng.randint(-30 * DAY, 60 * DAY))
+        tasks.append(task)
+    return tasks
+
+
+def test_indexed_filters(record_property: Callable[[str, object], None]):
+    now = time.time()
+    tasks = _tasks(now)
+    snapshot = Snapshot(tasks=tasks, stamp=())
+    start = time.perf_counter()
+    index = snapshot.index
+    results: dict[str, object] = {"build_ms": round((time.perf_counter() - start) * 1000, 1)}
+    options = FilterOptions(periods=True)
+    for args in FILTERS:
+        query = parse_filter(args, options, now)
+        assert snapshot.select(query, now) == query.select(tasks, now)
+        results[" ".join(args)] = {
+            "indexed_ms": median_ms(lambda q=query: snapshot.select(q, now), RUNS),
+            "scan_ms": median_ms(lambda q=query: q.select(tasks, now), RUNS),
+        }
+
+    def update() -> None:
+        old = tasks[500]
+        new = {**old, "tags": ["urgent"], "due": format_date(now)}
+        index.update(500, old, new)
+        index.update(500, new, old)
+
+    results["update_ms"] = median_ms(update, RUNS)
+    record_property("index", results)
+    print(f"\nIndex über {TASK_COUNT} Tasks: {json.dumps(results)}")
+    first = results[" ".join(FILTERS[0])]
+    assert first["indexed_ms"] < first["scan_ms"]
@@ -0,0 +1,117 @@
+"""Benchmark: Top-10 nach Urgency über 100k Tasks.
+
+Vergleicht UrgencyColumns.top (Spalten plus Teilsortierung) mit der
+Berechnung pro Task über compute_urgency und vollständigem Sortieren.
+Ist `task` installiert, wird zusätzlich `task next` auf einer Datenbank
+mit TASK_COUNT_BINARY Tasks gemessen.
+
+Ausführen mit: uv run pytest -m benchmark tests/benchmarks -s
+"""
+
+import json
+import os
+import random
+import subprocess
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from taskwarrior_mcp.native import format_date
+from taskwarrior_mcp.urgency import (
+    UrgencyCoefficients,
+    UrgencyColumns,
+    compute_urgency,
+    dependency_sets,
+)
+from tests.benchmarks.dataset import median_ms
+from tests.conftest import _is_taskwarrior_available
+
+pytestmark = pytest.mark.benchmark
+
+TASK_COUNT = 100_000
+TASK_COUNT_BINARY = 10_000
+RUNS = 5
+DAY = 86400
+
+
+def _tasks(now: float, count: int) -> list[dict]:
+    rng = random.Random(19)
+    tasks = []
+    for n in range(count):
+        task = {
+            "uuid": f"{rng.getrandbits(32):08x}-0000-4000-8000-{n:012x}",
+            "description": f"Task {n}",
+            "status": "pending" if rng.random() < 0.3 else "completed",
+            "entry": format_date(now - rng.randint(0, 400 * DAY)),
+            "project": rng.choice(["Work", "Home"] + [f"P{i}" for i in range(50)]),
+        }
+        if rng.random() < 0.5:
+            task["tags"] = rng.sample(["next", "call", "mail", "later"], 2)
+        if rng.random() < 0.4:
+            task["priority"] = rng.choice("HML")
+        if rng.random() < 0.3:
+            task["due"] = format_date(now + rng.randint(-30 * DAY, 60 * DAY))
+        if n and rng.random() < 0.05:
+            task["depends"] = [tasks[rng.randrange(n)]["uuid"]]
+        tasks.append(task)
+    return tasks
+
+
+def _binary_next_ms(tmp_path: Path, tasks: list[dict]) -> float:
+    env = {**os.environ, "TASKDATA": str(tmp_path / "data"), "TASKRC": str(tmp_path / "rc")}
+    (tmp_path / "data").mkdir()
+    (tmp_path / "rc").write_text("confirmation=off\nverbose=nothing\n")
+    subprocess.run(
+        ["task", "import"],
+        input=json.dumps(tasks).encode(),
+        env=env,
+        capture_output=True,
+        check=True,
+        shell=False,
+    )
+
+    def run() -> None:
+        subprocess.run(
+            ["task", "limit:10", "next"], env=env, capture_output=True, check=False, shell=False
+        )
+
+    return median_ms(run, RUNS, 2)
+
+
+def test_next_ranking(tmp_path: Path, record_property: Callable[[str, object], None]):
+    now = time.time()
+    tasks = _tasks(now, TASK_COUNT)
+    coefficients = UrgencyCoefficients()
+    pending = [n for n, task in enumerate(tasks) if task["status"] == "pending"]
+
+    start = time.perf_counter()
+    columns = UrgencyColumns(tasks, coefficients)
+    results: dict[str, object] = {
+        "tasks": TASK_COUNT,
+        "pending": len(pending),
+        "build_ms": round((time.perf_counter() - start) * 1000, 1),
+    }
+
+    def per_task() -> list[tuple[float, int]]:
+        open_uuids, blocking = dependency_sets(tasks)
+        scored = []
+        for position in pending:
+            task = tasks[position]
+            blocked = any(dep in open_uuids for dep in task.get("depends") or ())
+            urgency = compute_urgency(task, coefficients, now, blocked, task["uuid"] in blocking)
+            scored.append((urgency, position))
+        return sorted(scored, reverse=True)[:10]
+
+    top = columns.top(pending, 10, now)
+    expected = per_task()
+    assert [round(score, 3) for _, score in top] == [round(score, 3) for score, _ in expected]
+    results["columns_top10_ms"] = median_ms(lambda: columns.top(pending, 10, now), RUNS, 2)
+    results["per_task_sort_ms"] = median_ms(per_task, RUNS, 2)
+    if _is_taskwarrior_available():
+        results["task_next_ms"] = _binary_next_ms(tmp_path, _tasks(now, TASK_COUNT_BINARY))
+        results["task_next_tasks"] = TASK_COUNT_BINARY
+    record_property("next", results)
+    print(f"\nUrgency-Ranking: {json.dumps(results)}")
+    assert results["columns_top10_ms"] < results["per_task_sort_ms"]
@@ -0,0 +1,107 @@
+"""Benchmark: task_list mit durchgereichtem JSON gegenüber Parsen und Serialisieren.
+
+Vergleicht für 10k und 100k Tasks (dataset.py, im Zeilenformat von
+`task export`) die CPU-Zeit und den Spitzenspeicher (tracemalloc) von der
+Ausgabe bis zur serialisierten MCP-Antwort:
+
+- parsed: JSONArrayParser, dann FastMCP mit Ausgabeschema wie bisher
+  (Validierung, structuredContent, Text pro Task, jsonschema-Prüfung)
+- passthrough: RawArrayCollector, ein TextContent mit dem Rohtext
+
+Ausführen mit: uv run pytest -m benchmark tests/benchmarks/test_passthrough.py -s
+"""
+
+import codecs
+import json
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+import jsonschema
+import pytest
+from mcp.server.fastmcp.utilities.func_metadata import func_metadata
+from mcp.types import CallToolResult, TextContent
+
+from taskwarrior_mcp.jsonstream import JSONArrayParser, RawArrayCollector
+from taskwarrior_mcp.taskwarrior import STREAM_CHUNK_SIZE
+from tests.benchmarks.dataset import generate_tasks
+
+pytestmark = pytest.mark.benchmark
+
+SIZES = [10_000, 100_000]
+RUNS = 3
+
+
+def _old_task_list() -> list[dict[str, Any]] | dict[str, Any]:
+    """Signatur von task_list vor dem Durchreichen (mit Ausgabeschema)."""
+    return []
+
+
+def _export_output(count: int) -> bytes:
+    tasks = generate_tasks(count, time.time())
+    for position, task in enumerate(tasks, 1):
+        task["id"] = position if task["status"] == "pending" else 0
+        task["urgency"] = round(position % 17 / 3, 4)
+    lines = ",\n".join(json.dumps(task, ensure_ascii=False) for task in tasks)
+    return f"[\n{lines}\n]\n".encode()
+
+
+def _chunks(data: bytes) -> list[bytes]:
+    return [data[i : i + STREAM_CHUNK_SIZE] for i in range(0, len(data), STREAM_CHUNK_SIZE)]
+
+
+def _parsed(chunks: list[bytes]) -> str:
+    metadata = func_metadata(_old_task_list)
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    parser = JSONArrayParser()
+    tasks = []
+    for chunk in chunks:
+        tasks.extend(parser.feed(decoder.decode(chunk)))
+    parser.close()
+    content, structured = metadata.convert_result(tasks)
+    jsonschema.validate(instance=structured, schema=metadata.output_schema)
+    return CallToolResult(content=content, structuredContent=structured).model_dump_json()
+
+
+def _passthrough(chunks: list[bytes]) -> str:
+    collector = RawArrayCollector()
+    for chunk in chunks:
+        collector.feed(chunk)
+    collector.feed(b"")
+    content = TextContent(type="text", text=collector.result())
+    return CallToolResult(content=[content]).model_dump_json()
+
+
+def _measure(fn: Callable[[list[bytes]], str], chunks: list[bytes]) -> dict[str, float]:
+    cpu = []
+    for _ in range(RUNS):
+        start = time.process_time()
+        response = fn(chunks)
+        cpu.append(time.process_time() - start)
+    tracemalloc.start()
+    fn(chunks)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        "cpu_ms": round(statistics.median(cpu) * 1000, 1),
+        "peak_mib": round(peak / 2**20, 1),
+        "response_mib": round(len(response) / 2**20, 1),
+    }
+
+
+@pytest.mark.parametrize("size", SIZES, ids=lambda size: f"{size}_tasks")
+def test_passthrough(size: int, record_property: Callable[[str, object], None]):
+    data = _export_output(size)
+    chunks = _chunks(data)
+    results = {
+        "export_mib": round(len(data) / 2**20, 1),
+        "parsed": _measure(_parsed, chunks),
+        "passthrough": _measure(_passthrough, chunks),
+    }
+    record_property(f"passthrough_{size}", results)
+    print(f"\nJSON-Durchreichen bei {size} Tasks: {json.dumps(results)}")
+    assert json.loads(json.loads(_passthrough(chunks))["content"][0]["text"])[0]["uuid"]
+    assert results["passthrough"]["cpu_ms"] < results["parsed"]["cpu_ms"]
+    assert results["passthrough"]["peak_mib"] < results["parsed"]["peak_mib"]
@@ -0,0 +1,99 @@
+"""Benchmark: Volltextsuche über 100k Tasks mit und ohne Index.
+
+Misst den Aufbau des SearchIndex, Suchen mit exakten Wörtern, Wortteilen
+und Tippfehlern sowie das Nachführen nach einer geänderten Beschreibung.
+Zum Vergleich läuft die entsprechende Teilstringsuche als Scan über alle
+Beschreibungen und Annotationen (wie description.contains:).
+
+Ausführen mit: uv run pytest -m benchmark tests/benchmarks -s
+"""
+
+import json
+import random
+import time
+from collections.abc import Callable
+
+import pytest
+
+from taskwarrior_mcp.search import SearchIndex
+from tests.benchmarks.dataset import median_ms
+
+pytestmark = pytest.mark.benchmark
+
+TASK_COUNT = 100_000
+RUNS = 20
+
+WORDS = [
+    "bericht",
+    "meeting",
+    "angebot",
+    "rechnung",
+    "kunde",
+    "server",
+    "update",
+    "review",
+    "planen",
+    "schreiben",
+    "prüfen",
+    "anrufen",
+    "bestellen",
+    "migration",
+    "release",
+    "dokumentation",
+    "budget",
+    "vertrag",
+    "urlaub",
+    "einkauf",
+] + [f"wort{i}" for i in range(2000)]
+
+QUERIES = ["migration", "kunde vertrag", "dokument", "wort1234", "migraton", "ab"]
+
+
+def _tasks() -> list[dict]:
+    rng = random.Random(20)
+    tasks = []
+    for n in range(TASK_COUNT):
+        task = {"description": " ".join(rng.choices(WORDS, k=rng.randint(2, 8)))}
+        if rng.random() < 0.2:
+            task["annotations"] = [
+                {"entry": "20250101T000000Z", "description": " ".join(rng.choices(WORDS, k=6))}
+            ]
+        tasks.append(task)
+    return tasks
+
+
+def _scan(tasks: list[dict], query: str) -> list[int]:
+    needles = query.split()
+    matched = []
+    for position, task in enumerate(tasks):
+        notes = [a["description"] for a in task.get("annotations") or ()]
+        text = " ".join([task["description"], *notes])
+        if all(needle in text for needle in needles):
+            matched.append(position)
+    return matched
+
+
+def test_search(record_property: Callable[[str, object], None]):
+    tasks = _tasks()
+    start = time.perf_counter()
+    index = SearchIndex(tasks)
+    results: dict[str, object] = {"build_ms": round((time.perf_counter() - start) * 1000, 1)}
+    for query in QUERIES:
+        results[query] = {
+            "hits": len(index.search(query)),
+            "indexed_ms": median_ms(lambda q=query: index.search(q), RUNS),
+            "scan_ms": median_ms(lambda q=query: _scan(tasks, q), RUNS),
+        }
+
+    def update() -> None:
+        old = tasks[500]
+        new = {"description": "neue beschreibung migration"}
+        index.update(500, old, new)
+        index.update(500, new, old)
+
+    results["update_ms"] = median_ms(update, RUNS)
+    record_property("search", results)
+    print(f"\nSuche über {TASK_COUNT} Tasks: {json.dumps(results)}")
+    assert set(index.search("kunde vertrag")) == set(_scan(tasks, "kunde vertrag"))
+    first = results[QUERIES[0]]
+    assert first["indexed_ms"] < first["scan_ms"]
@@ -0,0 +1,102 @@
+"""Benchmark: Zeit vom Prozessstart bis zur Antwort auf `initialize`.
+
+Startet `python -m taskwarrior_mcp` wie ein MCP-Client (stdio) mit einem
+minimalen Fake-Binary, das nur `--version` beantwortet. Gemessen werden
+kalter und warmer Versions-Cache sowie der reine Paket-Import.
+
+Ausführen mit: uv run pytest -m benchmark tests/benchmarks -s
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+pytestmark = pytest.mark.benchmark
+
+RUNS = 5
+
+INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2025-06-18",
+        "capabilities": {},
+        "clientInfo": {"name": "benchmark", "version": "0"},
+    },
+}
+
+
+@pytest.fixture()
+def fake_task(tmp_path: Path) -> Path:
+    binary = tmp_path / "bin" / "task"
+    binary.parent.mkdir()
+    # Langsames --version wie bei einem kalten Dateisystem-Cache
+    binary.write_text("#!/bin/sh\nsleep 0.2\necho 3.1.0\n", encoding="utf-8")
+    binary.chmod(0o755)
+    return binary
+
+
+def _time_to_initialize(env: dict[str, str]) -> float:
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "taskwarrior_mcp"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        env=env,
+    )
+    try:
+        proc.stdin.write((json.dumps(INITIALIZE) + "\n").encode("utf-8"))
+        proc.stdin.flush()
+        response = json.loads(proc.stdout.readline())
+        elapsed = time.perf_counter() - start
+    finally:
+        proc.stdin.close()
+        proc.wait(timeout=10)
+    assert response["id"] == 1 and "result" in response
+    return elapsed
+
+
+def _summary(samples: list[float]) -> dict[str, float]:
+    return {
+        "median_ms": round(statistics.median(samples) * 1000, 1),
+        "min_ms": round(min(samples) * 1000, 1),
+    }
+
+
+def test_time_to_initialize(
+    fake_task: Path, isolated_version_cache: Path, record_property: Callable[[str, object], None]
+):
+    env = {**os.environ, "TW_MCP_TASK_BINARY": str(fake_task), "TW_MCP_LOG_LEVEL": "WARNING"}
+    cold = []
+    for _ in range(RUNS):
+        (isolated_version_cache / "taskwarrior-mcp" / "binary.json").unlink(missing_ok=True)
+        cold.append(_time_to_initialize(env))
+    warm = [_time_to_initialize(env) for _ in range(RUNS)]
+    results = {"cold_version_cache": _summary(cold), "warm_version_cache": _summary(warm)}
+    record_property("startup", results)
+    print(f"\nStartup bis initialize: {json.dumps(results)}")
+    # --version läuft parallel zur Initialisierung und darf sie nicht verzögern
+    assert statistics.median(cold) < statistics.median(warm) + 0.15
+
+
+def test_import_time(record_property: Callable[[str, object], None]):
+    timings = {}
+    for module in ("taskwarrior_mcp", "taskwarrior_mcp.server"):
+        samples = []
+        for _ in range(RUNS):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, "-c", f"import {module}"], check=True)
+            samples.append(time.perf_counter() - start)
+        timings[module] = _summary(samples)
+    record_property("import", timings)
+    print(f"\nImport-Zeit: {json.dumps(timings)}")
+    assert timings["taskwarrior_mcp"]["median_ms"] < timings["taskwarrior_mcp.server"]["median_ms"]
@@ -0,0 +1,224 @@
+"""Benchmark: Latenz und Durchsatz aller Tools auf 1k/10k/100k Tasks.
+
+Baut pro Größe eine isolierte Datenbank (wie tw_env) aus synthetischen
+Tasks (dataset.py) und ruft jedes Tool aus server.py über eine echte
+MCP-Session (In-Memory-Transport) auf — inklusive Validierung und
+JSON-Serialisierung. Lese-Tools laufen vor den schreibenden, damit alle
+Größen mit demselben Datenbestand gemessen werden.
+
+Der Bericht (JSON, Schema siehe _report) landet in TW_MCP_BENCH_REPORT
+bzw. im tmp-Verzeichnis des Tests. Mit TW_MCP_BENCH_BASELINE=<bericht>
+werden die p50-Werte zusätzlich mit einem früheren Lauf verglichen.
+Weitere Server-Einstellungen (z.B. TW_MCP_CACHE_ENABLED=true) gelten wie
+im Betrieb über die Umgebung.
+
+Ausführen mit: uv run pytest -m benchmark tests/benchmarks/test_tools.py -s
+Größen anpassen: TW_MCP_BENCH_SIZES=1000,10000
+"""
+
+import importlib.metadata
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+from collections.abc import Callable, Iterator
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import pytest
+from mcp.shared.memory import create_connected_server_and_client_session
+
+from taskwarrior_mcp.server import mcp
+from tests.benchmarks.dataset import generate_tasks, populate
+from tests.conftest import make_tw_env, requires_taskwarrior
+
+pytestmark = [pytest.mark.benchmark, requires_taskwarrior]
+
+SIZES = [int(n) for n in os.environ.get("TW_MCP_BENCH_SIZES", "1000,10000,100000").split(",")]
+CALLS = int(os.environ.get("TW_MCP_BENCH_CALLS", "20"))
+REPORT_SCHEMA = 1
+
+Scenario = Callable[[int], dict[str, Any]]
+
+
+def _scenarios(tasks: list[dict]) -> Iterator[tuple[str, str, Scenario]]:
+    """(Name, Tool, Argumente pro Aufruf) — Lese-Tools zuerst.
+
+    Schreibende Tools verbrauchen offene Tasks aus einem gemeinsamen Vorrat,
+    damit kein Aufruf auf einen bereits erledigten Task trifft.
+    """
+    pending = [t["uuid"] for t in tasks if t["status"] == "pending" and "wait" not in t]
+    stock = iter(pending[CALLS:])
+
+    def take(n: int) -> list[str]:
+        return [next(stock) for _ in range(n)]
+
+    yield "task_list", "task_list", lambda i: {}
+    yield (
+        "task_list:filter",
+        "task_list",
+        lambda i: {"filter_expr": "due.before:eow", "project": "Work", "tags": ["next"]},
+    )
+    yield (
+        "task_list:fields",
+        "task_list",
+        lambda i: {"status": "completed", "limit": 200, "fields": ["uuid", "description", "end"]},
+    )
+    yield "task_get", "task_get", lambda i: {"uuid": pending[i % len(pending)]}
+    yield "task_next", "task_next", lambda i: {}
+    yield "task_search", "task_search", lambda i: {"query": "kunde vertrag"}
+    yield "task_projects", "task_projects", lambda i: {}
+    yield "task_tags", "task_tags", lambda i: {}
+    yield "task_stats", "task_stats", lambda i: {}
+    yield "task_sync_status", "task_sync_status", lambda i: {}
+    yield (
+        "task_add",
+        "task_add",
+        lambda i: {
+            "description": f"Benchmark {i}",
+            "project": "Bench",
+            "tags": ["bench"],
+            "due": "eow",
+        },
+    )
+    yield (
+        "task_add_batch",
+        "task_add_batch",
+        lambda i: {
+            "tasks": [{"description": f"Batch {i}.{n}", "project": "Bench"} for n in range(10)]
+        },
+    )
+    yield (
+        "task_modify",
+        "task_modify",
+        lambda i: {
+            "uuid": pending[i % len(pending)],
+            "priority": "HL"[i % 2],
+            "tags_add": ["bench"],
+        },
+    )
+    started = take(CALLS)
+    yield "task_start", "task_start", lambda i: {"uuid": started[i]}
+    yield "task_stop", "task_stop", lambda i: {"uuid": started[i]}
+    yield "task_done", "task_done", lambda i: {"uuid": take(1)[0]}
+    yield "task_delete", "task_delete", lambda i: {"uuid": take(1)[0]}
+    yield (
+        "task_bulk_modify",
+        "task_bulk_modify",
+        lambda i: {"uuids": pending[:5], "tags_add": [f"bulk{i}"]},
+    )
+    yield "task_bulk_done", "task_bulk_done", lambda i: {"uuids": take(5)}
+    yield "task_bulk_delete", "task_bulk_delete", lambda i: {"uuids": take(5)}
+
+
+def _summary(samples: list[float], errors: int, wall: float) -> dict[str, Any]:
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {
+        "calls": len(samples),
+        "errors": errors,
+        "p50_ms": round(cuts[49] * 1000, 2),
+        "p95_ms": round(cuts[94] * 1000, 2),
+        "p99_ms": round(cuts[98] * 1000, 2),
+        "mean_ms": round(statistics.fmean(samples) * 1000, 2),
+        "throughput_per_s": round(len(samples) / wall, 1),
+    }
+
+
+async def _measure(env: dict[str, str], tasks: list[dict]) -> dict[str, Any]:
+    results: dict[str, Any] = {}
+    async with create_connected_server_and_client_session(mcp) as session:
+        for name, tool, arguments in _scenarios(tasks):
+            samples: list[float] = []
+            errors = 0
+            wall = time.perf_counter()
+            for i in range(CALLS):
+                args = arguments(i)
+                start = time.perf_counter()
+                result = await session.call_tool(tool, args)
+                samples.append(time.perf_counter() - start)
+                errors += bool(result.isError)
+            results[name] = _summary(samples, errors, time.perf_counter() - wall)
+    return results
+
+
+def _task_version() -> str:
+    result = subprocess.run(
+        ["task", "--version"], capture_output=True, text=True, shell=False, check=False
+    )
+    return result.stdout.strip()
+
+
+def _report(results: dict[int, dict[str, Any]]) -> dict[str, Any]:
+    """{"schema", "meta": {...}, "results": {"<Größe>": {"<Szenario>": {p50_ms, ...}}}}."""
+    return {
+        "schema": REPORT_SCHEMA,
+        "meta": {
+            "package_version": importlib.metadata.version("taskwarrior-mcp"),
+            "taskwarrior_version": _task_version(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "calls": CALLS,
+            "settings": {k: v for k, v in os.environ.items() if k.startswith("TW_MCP_")},
+        },
+        "results": {str(size): scenarios for size, scenarios in results.items()},
+    }
+
+
+def _compare(report: dict[str, Any], baseline: dict[str, Any]) -> dict[str, dict[str, float]]:
+    """p50 relativ zur Baseline (1.0 = unverändert) für alle gemeinsamen Messungen."""
+    ratios: dict[str, dict[str, float]] = {}
+    for size, scenarios in report["results"].items():
+        before = baseline.get("results", {}).get(size, {})
+        ratios[size] = {
+            name: round(stats["p50_ms"] / before[name]["p50_ms"], 2)
+            for name, stats in scenarios.items()
+            if before.get(name, {}).get("p50_ms")
+        }
+    return ratios
+
+
+@pytest.fixture(scope="module", params=SIZES, ids=lambda size: f"{size}_tasks")
+def database(request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory):
+    """Isolierte Umgebung mit size synthetischen Tasks (pro Größe einmal aufgebaut)."""
+    env = make_tw_env(tmp_path_factory.mktemp(f"bench-{request.param}"))
+    tasks = generate_tasks(request.param, time.time())
+    start = time.perf_counter()
+    populate(env, tasks)
+    return request.param, env, tasks, time.perf_counter() - start
+
+
+_RESULTS: dict[int, dict[str, Any]] = {}
+
+
+async def test_tool_latency(
+    database: tuple[int, dict[str, str], list[dict], float],
+    monkeypatch: pytest.MonkeyPatch,
+    record_property: Callable[[str, object], None],
+):
+    size, env, tasks, import_seconds = database
+    monkeypatch.setenv("TW_MCP_TASK_DATA", env["data_dir"])
+    monkeypatch.setenv("TW_MCP_TASKRC", env["taskrc"])
+    results = await _measure(env, tasks)
+    _RESULTS[size] = results
+    record_property(f"tools_{size}", results)
+    print(f"\n{size} Tasks (Import {import_seconds:.1f}s): {json.dumps(results)}")
+    failed = {name: stats["errors"] for name, stats in results.items() if stats["errors"]}
+    assert not failed, f"Tool-Aufrufe mit Fehlern: {failed}"
+
+
+def test_write_report(tmp_path: Path, record_property: Callable[[str, object], None]):
+    """Schreibt den Bericht aller gemessenen Größen (läuft nach test_tool_latency)."""
+    if not _RESULTS:
+        pytest.skip("Keine Messungen")
+    report = _report(_RESULTS)
+    target = Path(os.environ.get("TW_MCP_BENCH_REPORT", tmp_path / "tools-report.json"))
+    target.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"\nBericht: {target}")
+    if baseline := os.environ.get("TW_MCP_BENCH_BASELINE"):
+        ratios = _compare(report, json.loads(Path(baseline).read_text(encoding="utf-8")))
+        record_property("p50_vs_baseline", ratios)
+        print(f"p50 relativ zur Baseline: {json.dumps(ratios)}")
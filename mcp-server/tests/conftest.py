@@ -4,8 +4,13 @@ Stellt eine isolierte Taskwarrior-Umgebung via tmp_path bereit,
 sodass echte Tests keine System-Taskwarrior-Daten beeinflussen.
 """
 
+import asyncio
 import subprocess
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -13,6 +18,107 @@ from taskwarrior_mcp.config import Settings
 from taskwarrior_mcp.taskwarrior import TaskwarriorClient
 
 
+class FakeStream:
+    """Ersatz für asyncio.StreamReader: liefert die Daten in festen Stücken."""
+
+    def __init__(self, data: bytes, chunk_size: int, delay: float = 0.0) -> None:
+        self._data = data
+        self._chunk_size = chunk_size
+        self._delay = delay
+        self._pos = 0
+        self.bytes_read = 0
+
+    async def read(self, n: int = -1) -> bytes:
+        # Verzögerung nur vor dem ersten Chunk (Prozess "arbeitet")
+        await asyncio.sleep(0 if self._pos else self._delay)
+        size = len(self._data) - self._pos if n < 0 else min(n, self._chunk_size)
+        chunk = self._data[self._pos : self._pos + size]
+        self._pos += len(chunk)
+        self.bytes_read += len(chunk)
+        return chunk
+
+
+class FakeProcess:
+    """Minimaler Ersatz für asyncio.subprocess.Process in Unit-Tests."""
+
+    def __init__(
+        self,
+        returncode: int = 0,
+        stdout: str = "",
+        stderr: str = "",
+        delay: float = 0.0,
+        chunk_size: int = 1 << 30,
+    ) -> None:
+        self._returncode = returncode
+        self._stdout = stdout.encode("utf-8")
+        self._stderr = stderr.encode("utf-8")
+        self._delay = delay
+        self.returncode: int | None = None
+        self.killed = False
+        # Für gestreamte Exporte (stream_export liest stdout stückweise)
+        self.stdout = FakeStream(self._stdout, chunk_size, delay)
+        self.stderr = FakeStream(self._stderr, chunk_size)
+
+    async def communicate(self, input: bytes | None = None) -> tuple[bytes, bytes]:
+        if self._delay:
+            await asyncio.sleep(self._delay)
+        self.returncode = self._returncode
+        return self._stdout, self._stderr
+
+    def kill(self) -> None:
+        self.killed = True
+        self.returncode = -9
+
+    async def wait(self) -> int:
+        if self.returncode is None:
+            self.returncode = self._returncode
+        return self.returncode
+
+
+def make_client(**overrides: Any) -> TaskwarriorClient:
+    """TaskwarriorClient für Unit-Tests (Versionsabfrage gemockt: 3.0.0).
+
+    overrides ergänzen bzw. ersetzen die Settings (task_binary="task").
+    """
+    with patch("taskwarrior_mcp.taskwarrior.subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(returncode=0, stdout="3.0.0\n", stderr="")
+        return TaskwarriorClient(Settings(**{"task_binary": "task", **overrides}))
+
+
+@contextmanager
+def patch_exec(stdout: str = "", **process: Any) -> Iterator[AsyncMock]:
+    """Ersetzt create_subprocess_exec; jeder Aufruf liefert einen neuen FakeProcess.
+
+    process wird an FakeProcess weitergereicht (returncode, delay, ...).
+    """
+    with patch(
+        "taskwarrior_mcp.taskwarrior.asyncio.create_subprocess_exec", new_callable=AsyncMock
+    ) as mock:
+        mock.side_effect = lambda *args, **kwargs: FakeProcess(stdout=stdout, **process)
+        yield mock
+
+
+@pytest.fixture()
+def client() -> TaskwarriorClient:
+    """TaskwarriorClient mit Standard-Settings (Module überschreiben bei Bedarf)."""
+    return make_client()
+
+
+@pytest.fixture()
+def mock_exec() -> Iterator[AsyncMock]:
+    """Gemocktes create_subprocess_exec mit leerer Ausgabe."""
+    with patch_exec() as mock:
+        yield mock
+
+
+@pytest.fixture(autouse=True)
+def isolated_version_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Eigener Versions-Cache pro Test (sonst liefert ein früherer Test die Version)."""
+    cache_home = tmp_path / "xdg-cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    return cache_home
+
+
 @pytest.fixture()
 def mock_settings() -> Settings:
     """Erstellt Settings für Unit-Tests (kein echtes Taskwarrior benötigt)."""
@@ -31,15 +137,16 @@ def tw_env(tmp_path: Path) -> dict[str, str]:
     Setzt TASKDATA und TASKRC auf temporäre Verzeichnisse,
     sodass Tests keine echten Taskwarrior-Daten lesen oder schreiben.
     """
+    return make_tw_env(tmp_path)
+
+
+def make_tw_env(tmp_path: Path) -> dict[str, str]:
+    """Legt Datenverzeichnis und .taskrc für tw_env an (auch für breitere Scopes)."""
     data_dir = tmp_path / "taskdata"
     data_dir.mkdir()
     taskrc = tmp_path / ".taskrc"
     taskrc.write_text(
-        f"data.location={data_dir}\n"
-        "confirmation=no\n"
-        "verbose=nothing\n"
-        "json.array=on\n"
-        "bulk=0\n",
+        f"data.location={data_dir}\nconfirmation=no\nverbose=nothing\njson.array=on\nbulk=0\n",
         encoding="utf-8",
     )
     return {
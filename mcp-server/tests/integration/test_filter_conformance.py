@@ -0,0 +1,113 @@
+"""Konformitätstests: native Filterauswertung gegen echtes `task export`.
+
+Erzeugt eine Datenbank mit zufälligen (aber reproduzierbaren) Tasks und
+vergleicht für jeden Filter die Treffermenge von parse_filter().select()
+mit der von `task export`. Wird übersprungen, wenn Taskwarrior fehlt.
+"""
+
+import json
+import random
+import time
+import uuid
+
+import pytest
+
+from taskwarrior_mcp.filters import parse_filter
+from taskwarrior_mcp.native import format_date
+from taskwarrior_mcp.taskwarrior import TaskwarriorClient
+from tests.conftest import requires_taskwarrior
+
+PROJECTS = ["Work", "Work.Sub", "Work.Sub.Deep", "Workshop", "Home", "Home.Garden", None]
+TAGS = ["urgent", "later", "call", "mail", "x"]
+WORDS = ["Meeting", "meeting", "Bericht", "Einkauf", "Review", "Telefonat", "Notiz"]
+DAY = 86400
+
+FILTERS = [
+    ["project:Work"],
+    ["project:Work.Sub"],
+    ["project:Workshop"],
+    ["(", "project:Work", "or", "+x", ")"],
+    ["project:"],
+    ["priority:H"],
+    ["priority:"],
+    ["+urgent"],
+    ["-urgent", "-later"],
+    ["status:pending"],
+    ["status:completed"],
+    ["status:waiting"],
+    ["status:deleted"],
+    ["project:Work", "+urgent", "status:pending"],
+    ["(", "project:Home", "or", "+call", ")"],
+    ["(project:Home", "or", "priority:L)", "status:pending"],
+    ["project:Work", "or", "+mail", "and", "priority:M"],
+    ["(", "+x", "or", "+later", ")", "and", "(", "project:Home", "or", "project:", ")"],
+    ["due:"],
+    ["due.before:today"],
+    ["due.before:tomorrow"],
+    ["due.after:now"],
+    ["due.before:eow"],
+    ["due.after:eom"],
+    ["due.before:eoy", "due.after:sow"],
+    ["due.before:+3d"],
+    ["due.after:-2w", "status:pending"],
+    ["scheduled.before:now"],
+    ["scheduled:"],
+    ["wait.after:now"],
+    ["end.after:-10d"],
+    ["entry.before:-30d"],
+    ["description.contains:Meeting"],
+    ["description.contains:meeting", "or", "+call"],
+    ["(due.before:today", "or", "priority:H)", "-later", "status:pending"],
+]
+
+
+def _random_task(rng: random.Random, now: float) -> dict:
+    entry = now - rng.randint(1, 90) * DAY
+    task: dict = {
+        "uuid": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+        "description": " ".join(rng.sample(WORDS, rng.randint(1, 3))),
+        "status": rng.choice(["pending"] * 5 + ["completed", "deleted"]),
+        "entry": format_date(entry),
+    }
+    project = rng.choice(PROJECTS)
+    if project:
+        task["project"] = project
+    tags = rng.sample(TAGS, rng.randint(0, 2))
+    if tags:
+        task["tags"] = tags
+    if rng.random() < 0.5:
+        task["priority"] = rng.choice("HML")
+    for attr in ("due", "scheduled"):
+        if rng.random() < 0.6:
+            task[attr] = format_date(now + rng.randint(-20 * DAY, 60 * DAY))
+    if task["status"] == "pending" and rng.random() < 0.15:
+        task["wait"] = format_date(now + rng.randint(DAY, 10 * DAY))
+    if task["status"] != "pending":
+        task["end"] = format_date(now - rng.randint(0, 20) * DAY)
+    return task
+
+
+@requires_taskwarrior
+class TestFilterConformance:
+    """Gleiche Treffer wie `task export` für alle nativ unterstützten Filter."""
+
+    @pytest.fixture()
+    async def database(self, isolated_client: TaskwarriorClient) -> list[dict]:
+        rng = random.Random(17)
+        now = time.time()
+        payload = [_random_task(rng, now) for _ in range(300)]
+        await isolated_client._run(["import"], access="write", input=json.dumps(payload))
+        return [task async for task in isolated_client.stream_export([])]
+
+    @pytest.mark.parametrize("args", FILTERS, ids=" ".join)
+    async def test_same_matches_as_task(
+        self, isolated_client: TaskwarriorClient, database: list[dict], args: list[str]
+    ):
+        options = isolated_client.filter_options()
+        query = parse_filter(args, options)
+        if query is None and not options.periods:
+            pytest.skip("Periodengrenzen erst ab Taskwarrior 2.6")
+        assert query is not None, f"Filter sollte nativ auswertbar sein: {args}"
+        native = {task["uuid"] for task in query.select(database, time.time())}
+        expected = {task["uuid"] async for task in isolated_client.stream_export(args)}
+        assert native == expected
@@ -4,141 +4,269 @@ Nutzt echte Taskwarrior-Installation in isolierter Umgebung (tmp_path).
 Tests werden übersprungen wenn Taskwarrior nicht installiert ist.
 """
 
+import asyncio
+from pathlib import Path
+
 import pytest
 
-from tests.conftest import requires_taskwarrior
+from taskwarrior_mcp.config import Settings
 from taskwarrior_mcp.taskwarrior import TaskwarriorClient, TaskwarriorError
+from tests.conftest import requires_taskwarrior
 
 
 @requires_taskwarrior
 class TestCRUDCycle:
     """Vollständiger CRUD-Zyklus mit echtem Taskwarrior."""
 
-    def test_add_task_returns_uuid(self, isolated_client: TaskwarriorClient):
-        task = isolated_client.add_task("Integration-Test Task")
+    async def test_add_task_returns_uuid(self, isolated_client: TaskwarriorClient):
+        task = await isolated_client.add_task("Integration-Test Task")
         assert "uuid" in task
         assert len(task["uuid"]) == 36  # Standard UUID-Format
         assert task["description"] == "Integration-Test Task"
         assert task["status"] == "pending"
 
-    def test_add_task_with_project(self, isolated_client: TaskwarriorClient):
-        task = isolated_client.add_task("Task mit Projekt", project="TestProjekt")
+    async def test_add_task_with_project(self, isolated_client: TaskwarriorClient):
+        task = await isolated_client.add_task("Task mit Projekt", project="TestProjekt")
         assert task["project"] == "TestProjekt"
 
-    def test_add_task_with_priority(self, isolated_client: TaskwarriorClient):
-        task = isolated_client.add_task("Wichtiger Task", priority="H")
+    async def test_add_task_with_priority(self, isolated_client: TaskwarriorClient):
+        task = await isolated_client.add_task("Wichtiger Task", priority="H")
         assert task["priority"] == "H"
 
-    def test_add_task_with_tags(self, isolated_client: TaskwarriorClient):
-        task = isolated_client.add_task("Tag-Task", tags=["urgent", "work"])
+    async def test_add_task_with_tags(self, isolated_client: TaskwarriorClient):
+        task = await isolated_client.add_task("Tag-Task", tags=["urgent", "work"])
         tags = task.get("tags", [])
         assert "urgent" in tags
         assert "work" in tags
 
-    def test_get_task_by_uuid(self, isolated_client: TaskwarriorClient):
-        added = isolated_client.add_task("Task zum Abrufen")
+    async def test_concurrent_adds_return_their_own_task(self, isolated_client: TaskwarriorClient):
+        descriptions = [f"Parallel {n}" for n in range(5)]
+        tasks = await asyncio.gather(*(isolated_client.add_task(d) for d in descriptions))
+        assert [t["description"] for t in tasks] == descriptions
+        assert len({t["uuid"] for t in tasks}) == len(descriptions)
+
+    async def test_add_tasks_batch(self, isolated_client: TaskwarriorClient):
+        records = [
+            {"description": "Batch A", "project": "Plan", "due": "2030-01-15"},
+            {"description": "Batch B", "tags": ["x"], "due": "eow"},
+            {"description": "Batch C", "due": "2030-01-01", "recur": "monthly"},
+        ]
+        results = await isolated_client.add_tasks(records)
+        assert [r["description"] for r in results] == ["Batch A", "Batch B", "Batch C"]
+        assert results[0]["project"] == "Plan"
+        assert results[0]["due"].startswith("203001")
+        assert results[1]["tags"] == ["x"]
+
+    async def test_get_task_by_uuid(self, isolated_client: TaskwarriorClient):
+        added = await isolated_client.add_task("Task zum Abrufen")
         uuid = added["uuid"]
-        retrieved = isolated_client.get_task(uuid)
+        retrieved = await isolated_client.get_task(uuid)
         assert retrieved["uuid"] == uuid
         assert retrieved["description"] == "Task zum Abrufen"
 
-    def test_get_task_by_prefix(self, isolated_client: TaskwarriorClient):
-        added = isolated_client.add_task("Task mit UUID-Prefix")
+    async def test_get_task_by_prefix(self, isolated_client: TaskwarriorClient):
+        added = await isolated_client.add_task("Task mit UUID-Prefix")
         uuid = added["uuid"]
         prefix = uuid[:8]
-        retrieved = isolated_client.get_task(prefix)
+        retrieved = await isolated_client.get_task(prefix)
         assert retrieved["uuid"] == uuid
 
-    def test_get_nonexistent_task_raises(self, isolated_client: TaskwarriorClient):
+    async def test_get_nonexistent_task_raises(self, isolated_client: TaskwarriorClient):
         with pytest.raises(TaskwarriorError):
-            isolated_client.get_task("00000000-0000-0000-0000-000000000000")
+            await isolated_client.get_task("00000000-0000-0000-0000-000000000000")
 
-    def test_modify_task_description(self, isolated_client: TaskwarriorClient):
-        added = isolated_client.add_task("Original Beschreibung")
+    async def test_modify_task_description(self, isolated_client: TaskwarriorClient):
+        added = await isolated_client.add_task("Original Beschreibung")
         uuid = added["uuid"]
-        modified = isolated_client.modify_task(uuid, description="Neue Beschreibung")
+        modified = await isolated_client.modify_task(uuid, description="Neue Beschreibung")
         assert modified["description"] == "Neue Beschreibung"
 
-    def test_modify_task_project(self, isolated_client: TaskwarriorClient):
-        added = isolated_client.add_task("Task ohne Projekt")
+    async def test_modify_task_project(self, isolated_client: TaskwarriorClient):
+        added = await isolated_client.add_task("Task ohne Projekt")
         uuid = added["uuid"]
-        modified = isolated_client.modify_task(uuid, project="NeuesProjekt")
+        modified = await isolated_client.modify_task(uuid, project="NeuesProjekt")
         assert modified["project"] == "NeuesProjekt"
 
-    def test_complete_task(self, isolated_client: TaskwarriorClient):
-        added = isolated_client.add_task("Task abschließen")
+    async def test_complete_task(self, isolated_client: TaskwarriorClient):
+        added = await isolated_client.add_task("Task abschließen")
         uuid = added["uuid"]
-        isolated_client.complete_task(uuid)
+        await isolated_client.complete_task(uuid)
         # Abgeschlossener Task sollte in pending nicht mehr auftauchen
-        pending = isolated_client.export_tasks(["status:pending"])
+        pending = await isolated_client.export_tasks(["status:pending"])
         uuids = [t["uuid"] for t in pending]
         assert uuid not in uuids
 
-    def test_delete_task(self, isolated_client: TaskwarriorClient):
-        added = isolated_client.add_task("Task löschen")
+    async def test_delete_task(self, isolated_client: TaskwarriorClient):
+        added = await isolated_client.add_task("Task löschen")
         uuid = added["uuid"]
-        isolated_client.delete_task(uuid)
+        await isolated_client.delete_task(uuid)
         # Gelöschter Task nicht mehr in pending
-        pending = isolated_client.export_tasks(["status:pending"])
+        pending = await isolated_client.export_tasks(["status:pending"])
         uuids = [t["uuid"] for t in pending]
         assert uuid not in uuids
 
-    def test_start_and_stop_task(self, isolated_client: TaskwarriorClient):
-        added = isolated_client.add_task("Zeiterfassung-Task")
+    async def test_start_and_stop_task(self, isolated_client: TaskwarriorClient):
+        added = await isolated_client.add_task("Zeiterfassung-Task")
         uuid = added["uuid"]
 
-        started = isolated_client.start_task(uuid)
+        started = await isolated_client.start_task(uuid)
         assert started.get("start") is not None
 
-        stopped = isolated_client.stop_task(uuid)
+        stopped = await isolated_client.stop_task(uuid)
         # Nach stop: kein aktiver Start mehr
         assert stopped.get("start") is None
 
 
+@requires_taskwarrior
+class TestBulk:
+    """Bulk-Operationen mit echtem Taskwarrior."""
+
+    async def test_bulk_done_by_filter(self, isolated_client: TaskwarriorClient):
+        for n in range(3):
+            await isolated_client.add_task(f"Sprint {n}", project="Sprint")
+        other = await isolated_client.add_task("Anderes", project="Other")
+        preview = await isolated_client.bulk("done", ["project:Sprint"], dry_run=True)
+        assert len(preview["affected"]) == 3
+        result = await isolated_client.bulk("done", ["project:Sprint"])
+        assert sorted(result["affected"]) == sorted(preview["affected"])
+        assert all(t["after"]["status"] == "completed" for t in result["tasks"])
+        assert (await isolated_client.get_task(other["uuid"]))["status"] == "pending"
+
+    async def test_bulk_modify_by_uuids(self, isolated_client: TaskwarriorClient):
+        tasks = [await isolated_client.add_task(f"Task {n}") for n in range(2)]
+        result = await isolated_client.bulk(
+            "modify", [t["uuid"] for t in tasks], modifications={"tags_add": ["sprint"]}
+        )
+        assert [t["after"]["tags"] for t in result["tasks"]] == [["sprint"], ["sprint"]]
+
+
 @requires_taskwarrior
 class TestExportFilters:
     """Tests für export_tasks mit verschiedenen Filtern."""
 
-    def test_export_empty_returns_list(self, isolated_client: TaskwarriorClient):
-        result = isolated_client.export_tasks(["status:pending"])
+    async def test_export_empty_returns_list(self, isolated_client: TaskwarriorClient):
+        result = await isolated_client.export_tasks(["status:pending"])
         assert isinstance(result, list)
 
-    def test_export_with_project_filter(self, isolated_client: TaskwarriorClient):
-        isolated_client.add_task("Arbeit-Task", project="Arbeit")
-        isolated_client.add_task("Privat-Task", project="Privat")
+    async def test_export_with_project_filter(self, isolated_client: TaskwarriorClient):
+        await isolated_client.add_task("Arbeit-Task", project="Arbeit")
+        await isolated_client.add_task("Privat-Task", project="Privat")
 
-        arbeit_tasks = isolated_client.export_tasks(["project:Arbeit", "status:pending"])
+        arbeit_tasks = await isolated_client.export_tasks(["project:Arbeit", "status:pending"])
         assert all(t.get("project") == "Arbeit" for t in arbeit_tasks)
         assert len(arbeit_tasks) >= 1
 
-    def test_export_nonexistent_project_returns_empty(self, isolated_client: TaskwarriorClient):
-        result = isolated_client.export_tasks(["project:GibtEsNicht", "status:pending"])
+    async def test_export_nonexistent_project_returns_empty(
+        self, isolated_client: TaskwarriorClient
+    ):
+        result = await isolated_client.export_tasks(["project:GibtEsNicht", "status:pending"])
         assert result == []
 
 
+@requires_taskwarrior
+class TestNextTasks:
+    """task_next rangiert wie die Urgency von Taskwarrior."""
+
+    async def test_order_matches_export_urgency(self, isolated_client: TaskwarriorClient):
+        await isolated_client.add_task("Niedrig", priority="L")
+        await isolated_client.add_task("Hoch", priority="H", tags=["next"])
+        await isolated_client.add_task("Fällig", due="today")
+        await isolated_client.add_task("Projekt", project="Arbeit", priority="M")
+
+        result = await isolated_client.next_tasks(4)
+        exported = await isolated_client._export_direct(["status:pending"], None)
+        expected = sorted(exported, key=lambda t: -t["urgency"])
+        assert [t["uuid"] for t in result["tasks"]] == [t["uuid"] for t in expected]
+        by_uuid = {t["uuid"]: t["urgency"] for t in exported}
+        for task in result["tasks"]:
+            assert task["urgency"] == pytest.approx(by_uuid[task["uuid"]], abs=1e-3)
+
+
+@requires_taskwarrior
+class TestSearchTasks:
+    """task_search über echte Exporte."""
+
+    async def test_search_after_modify(self, isolated_client: TaskwarriorClient):
+        task = await isolated_client.add_task("Angebot schreiben", project="Arbeit")
+        await isolated_client.add_task("Angebote vergleichen", project="Privat")
+
+        result = await isolated_client.search_tasks("angebot", 10, project="Arbeit")
+        assert [t["uuid"] for t in result["tasks"]] == [task["uuid"]]
+        await isolated_client.modify_task(task["uuid"], description="Rechnung schreiben")
+        result = await isolated_client.search_tasks("rechnug", 10)
+        assert [t["uuid"] for t in result["tasks"]] == [task["uuid"]]
+
+
 @requires_taskwarrior
 class TestProjectsAndTags:
     """Tests für Metadaten-Abfragen."""
 
-    def test_get_projects_returns_string(self, isolated_client: TaskwarriorClient):
-        isolated_client.add_task("Test", project="TestProjekt")
-        result = isolated_client.get_projects()
-        assert isinstance(result, str)
+    async def test_get_projects(self, isolated_client: TaskwarriorClient):
+        await isolated_client.add_task("Test", project="TestProjekt.Unter")
+        result = await isolated_client.get_projects()
+        project = result["projects"][0]
+        assert (project["project"], project["pending"]) == ("TestProjekt", 1)
+        assert project["children"][0]["project"] == "TestProjekt.Unter"
 
-    def test_get_tags_returns_string(self, isolated_client: TaskwarriorClient):
-        isolated_client.add_task("Test", tags=["test-tag"])
-        result = isolated_client.get_tags()
-        assert isinstance(result, str)
+    async def test_get_tags(self, isolated_client: TaskwarriorClient):
+        await isolated_client.add_task("Test", tags=["test-tag"])
+        result = await isolated_client.get_tags()
+        assert result["tags"] == [{"tag": "test-tag", "pending": 1, "completed": 0}]
 
-    def test_get_stats_returns_string(self, isolated_client: TaskwarriorClient):
-        result = isolated_client.get_stats()
-        assert isinstance(result, str)
+    async def test_get_stats(self, isolated_client: TaskwarriorClient):
+        task = await isolated_client.add_task("Test")
+        await isolated_client.complete_task(task["uuid"])
+        await isolated_client.add_task("Offen")
+        result = await isolated_client.get_stats()
+        assert result["status"]["pending"] == 1
+        assert result["status"]["completed"] == 1
+        assert result["average_age_days"] is not None
 
 
 @requires_taskwarrior
 class TestVersionDetection:
     """Tests für Versions-Erkennung."""
 
-    def test_client_detects_version(self, isolated_client: TaskwarriorClient):
+    async def test_client_detects_version(self, isolated_client: TaskwarriorClient):
         assert isolated_client.version != ""
         assert isolated_client.major_version in (2, 3)
+
+
+@requires_taskwarrior
+class TestAutoSync:
+    """Hintergrund-Sync gegen einen lokalen Sync-Server (sync.local.server_dir, TW3)."""
+
+    @staticmethod
+    def _replica_settings(tmp_path: Path, name: str, server_dir: Path, **extra) -> Settings:
+        data_dir = tmp_path / name
+        data_dir.mkdir()
+        taskrc = tmp_path / f"{name}.taskrc"
+        taskrc.write_text(
+            f"data.location={data_dir}\n"
+            f"sync.local.server_dir={server_dir}\n"
+            "confirmation=no\n"
+            "verbose=nothing\n"
+            "json.array=on\n",
+            encoding="utf-8",
+        )
+        return Settings(task_binary="task", task_data=str(data_dir), taskrc=str(taskrc), **extra)
+
+    async def test_writes_reach_second_replica(self, tmp_path: Path):
+        server_dir = tmp_path / "server"
+        server_dir.mkdir()
+        client = TaskwarriorClient(
+            self._replica_settings(tmp_path, "a", server_dir, auto_sync=True, sync_debounce=0.2)
+        )
+        if client.major_version < 3:
+            pytest.skip("sync.local.server_dir gibt es erst ab Taskwarrior 3")
+        for n in range(3):
+            await client.add_task(f"Sync {n}")
+        await asyncio.wait_for(client._sync.wait_idle(), 30)
+        status = client.sync_status()
+        assert (status["last_status"], status["syncs"]) == ("ok", 1)
+
+        other = TaskwarriorClient(self._replica_settings(tmp_path, "b", server_dir))
+        await other.sync()
+        tasks = await other.export_tasks(["status:pending"])
+        assert sorted(t["description"] for t in tasks) == ["Sync 0", "Sync 1", "Sync 2"]
+        await client.close()
@@ -0,0 +1,71 @@
+"""Unit-Tests für den Versions-Cache und den schnellen Serverstart.
+
+Verifiziert:
+- Versionen werden pro Binary gespeichert und bei Änderung verworfen
+- Kaputte Cache-Dateien sind kein Fehler
+- `import taskwarrior_mcp` lädt das mcp-Paket erst bei Bedarf
+"""
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from taskwarrior_mcp.binary import VersionCache, default_cache_path
+
+
+def _binary(tmp_path: Path) -> Path:
+    binary = tmp_path / "task"
+    binary.write_text("#!/bin/sh\necho 3.1.0\n", encoding="utf-8")
+    binary.chmod(0o755)
+    return binary
+
+
+class TestVersionCache:
+    def test_roundtrip(self, tmp_path: Path):
+        binary = _binary(tmp_path)
+        cache = VersionCache(tmp_path / "cache" / "binary.json")
+        assert cache.get(str(binary)) is None
+        cache.put(str(binary), "3.1.0")
+        assert VersionCache(cache.path).get(str(binary)) == "3.1.0"
+
+    def test_changed_binary_invalidates(self, tmp_path: Path):
+        binary = _binary(tmp_path)
+        cache = VersionCache(tmp_path / "binary.json")
+        cache.put(str(binary), "3.1.0")
+        os.utime(binary, ns=(time.time_ns(), time.time_ns() + 1_000_000_000))
+        assert cache.get(str(binary)) is None
+
+    def test_symlink_shares_entry(self, tmp_path: Path):
+        binary = _binary(tmp_path)
+        link = tmp_path / "task-link"
+        link.symlink_to(binary)
+        cache = VersionCache(tmp_path / "binary.json")
+        cache.put(str(link), "3.1.0")
+        assert cache.get(str(binary)) == "3.1.0"
+
+    def test_corrupt_file_is_ignored(self, tmp_path: Path):
+        binary = _binary(tmp_path)
+        cache = VersionCache(tmp_path / "binary.json")
+        cache.path.write_text("{kaputt", encoding="utf-8")
+        assert cache.get(str(binary)) is None
+        cache.put(str(binary), "3.1.0")
+        assert cache.get(str(binary)) == "3.1.0"
+
+    def test_default_path_follows_xdg(self, isolated_version_cache: Path):
+        assert default_cache_path() == isolated_version_cache / "taskwarrior-mcp" / "binary.json"
+
+
+class TestLazyImport:
+    def test_package_import_does_not_load_mcp(self):
+        code = "import sys, taskwarrior_mcp.dates; print('mcp' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
+    def test_mcp_attribute_is_resolved_on_access(self):
+        import taskwarrior_mcp
+
+        assert taskwarrior_mcp.mcp.name == "Taskwarrior"
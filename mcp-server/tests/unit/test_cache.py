@@ -0,0 +1,275 @@
+"""Unit-Tests für den Snapshot-Cache.
+
+Verifiziert:
+- Invalidierung über Dateistempel, TTL und Schreibzugriffe
+- Lesezugriffe aus dem Snapshot ohne weiteren `task`-Prozess
+- Projekt- und Tag-Listen aus dem Snapshot
+- Ersetzen einzelner geänderter Tasks (replace)
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from taskwarrior_mcp.cache import SnapshotCache, get_snapshot_cache
+from taskwarrior_mcp.taskwarrior import TaskwarriorClient, TaskwarriorError
+from tests.conftest import FakeProcess, make_client, patch_exec
+
+TASKS = [
+    {
+        "id": 1,
+        "uuid": "aaaaaaaa-0000-0000-0000-000000000001",
+        "description": "Bericht",
+        "status": "pending",
+        "project": "Work.Reports",
+        "tags": ["office"],
+    },
+    {
+        "id": 2,
+        "uuid": "aaaaaaaa-0000-0000-0000-000000000002",
+        "description": "Einkaufen",
+        "status": "pending",
+        "project": "Home",
+        "tags": ["errand", "office"],
+    },
+    {
+        "id": 0,
+        "uuid": "bbbbbbbb-0000-0000-0000-000000000003",
+        "description": "Erledigt",
+        "status": "completed",
+        "project": "Work",
+    },
+]
+
+
+class TestSnapshotCache:
+    """Tests für SnapshotCache selbst."""
+
+    def test_hit_after_store(self, tmp_path: Path):
+        cache = SnapshotCache(tmp_path)
+        assert cache.get() is None
+        cache.store(TASKS, cache.stamp())
+        assert cache.get().tasks is TASKS
+        assert cache.stats.as_dict()["hits"] == 1
+        assert cache.stats.as_dict()["misses"] == 1
+
+    def test_file_change_invalidates(self, tmp_path: Path):
+        data = tmp_path / "pending.data"
+        data.write_text("[a]\n", encoding="utf-8")
+        cache = SnapshotCache(tmp_path)
+        cache.store(TASKS, cache.stamp())
+        data.write_text("[a]\n[b]\n", encoding="utf-8")
+        assert cache.get() is None
+
+    def test_mtime_change_invalidates(self, tmp_path: Path):
+        data = tmp_path / "taskchampion.sqlite3"
+        data.write_bytes(b"x")
+        cache = SnapshotCache(tmp_path)
+        cache.store(TASKS, cache.stamp())
+        os.utime(data, ns=(time.time_ns(), time.time_ns() + 1_000_000_000))
+        assert cache.get() is None
+
+    def test_ttl_expires(self, tmp_path: Path):
+        cache = SnapshotCache(tmp_path, ttl=0.0)
+        cache.store(TASKS, cache.stamp())
+        assert cache.get() is None
+
+    def test_invalidate(self, tmp_path: Path):
+        cache = SnapshotCache(tmp_path)
+        first = cache.store(TASKS, cache.stamp())
+        cache.invalidate()
+        assert cache.get() is None
+        assert cache.stats.invalidations == 1
+        assert cache.store(TASKS, cache.stamp()).version > first.version
+
+    def test_write_during_export_is_not_stored(self, tmp_path: Path):
+        cache = SnapshotCache(tmp_path)
+        stamp, generation = cache.stamp(), cache.generation
+        cache.invalidate()
+        assert cache.store(TASKS, stamp, generation).tasks is TASKS
+        assert cache.get() is None
+        assert cache.stats.discarded == 1
+
+    def test_file_change_during_export_is_not_stored(self, tmp_path: Path):
+        cache = SnapshotCache(tmp_path)
+        stamp, generation = cache.stamp(), cache.generation
+        (tmp_path / "pending.data").write_text("[a]\n", encoding="utf-8")
+        cache.store(TASKS, stamp, generation)
+        assert cache.get() is None
+        assert cache.stats.loads == 0
+
+    def test_shared_per_data_dir(self, tmp_path: Path):
+        assert get_snapshot_cache(tmp_path) is get_snapshot_cache(tmp_path / ".")
+        assert get_snapshot_cache(tmp_path) is not get_snapshot_cache(tmp_path / "other")
+
+
+@pytest.fixture()
+def client(tmp_path: Path) -> TaskwarriorClient:
+    return make_client(
+        task_data=str(tmp_path), taskrc=str(tmp_path / "missing.taskrc"), cache_enabled=True
+    )
+
+
+@pytest.fixture()
+def mock_exec():
+    with patch_exec(stdout=json.dumps(TASKS)) as mock:
+        yield mock
+
+
+class TestClientCache:
+    """TaskwarriorClient liest bei aktivem Cache aus dem Snapshot."""
+
+    async def test_reads_share_one_export(self, client: TaskwarriorClient, mock_exec: AsyncMock):
+        pending = await client.export_tasks(["status:pending"])
+        work = await client.export_tasks(["project:Work"])
+        task = await client.get_task("aaaaaaaa-0000-0000-0000-000000000002")
+        assert mock_exec.call_count == 1
+        assert list(mock_exec.call_args.args)[-1] == "export"
+        assert [t["id"] for t in pending] == [1, 2]
+        assert [t["description"] for t in work] == ["Bericht", "Erledigt"]
+        assert task["description"] == "Einkaufen"
+
+    async def test_results_are_copies(self, client: TaskwarriorClient, mock_exec: AsyncMock):
+        first = await client.export_tasks(["status:pending"])
+        first[0]["description"] = "verändert"
+        second = await client.export_tasks(["status:pending"])
+        assert second[0]["description"] == "Bericht"
+
+    async def test_write_invalidates(self, client: TaskwarriorClient, mock_exec: AsyncMock):
+        await client.export_tasks([])
+        await client._run(["1", "done"], access="write")
+        await client.export_tasks([])
+        exports = [c for c in mock_exec.call_args_list if list(c.args)[-1] == "export"]
+        assert len(exports) == 2
+
+    async def test_write_during_export_not_cached(
+        self, client: TaskwarriorClient, mock_exec: AsyncMock
+    ):
+        def export_with_concurrent_write(*args, **kwargs) -> FakeProcess:
+            # Ein Schreibzugriff endet, während der Export noch läuft
+            client._cache.invalidate()
+            return FakeProcess(stdout=json.dumps(TASKS))
+
+        mock_exec.side_effect = export_with_concurrent_write
+        assert len(await client.export_tasks([])) == 3
+        assert client._cache.get() is None
+        await client.export_tasks([])
+        assert mock_exec.call_count == 2
+
+    async def test_failed_write_invalidates(self, client: TaskwarriorClient, mock_exec: AsyncMock):
+        await client.export_tasks([])
+        mock_exec.side_effect = None
+        mock_exec.return_value = FakeProcess(returncode=2, stderr="Fehler")
+        with pytest.raises(TaskwarriorError):
+            await client._run(["1", "done"], access="write")
+        assert client._cache.get() is None
+
+    async def test_unsupported_filter_bypasses_cache(
+        self, client: TaskwarriorClient, mock_exec: AsyncMock
+    ):
+        await client.export_tasks(["+OVERDUE"])
+        assert list(mock_exec.call_args.args)[-2:] == ["+OVERDUE", "export"]
+        assert client._cache.stats.loads == 0
+
+    async def test_get_task_without_snapshot_exports_single_task(
+        self, client: TaskwarriorClient, mock_exec: AsyncMock
+    ):
+        await client.get_task("aaaaaaaa")
+        assert list(mock_exec.call_args.args)[-2:] == ["aaaaaaaa", "export"]
+        assert client._cache.stats.loads == 0
+
+    async def test_projects_and_tags_from_snapshot(
+        self, client: TaskwarriorClient, mock_exec: AsyncMock
+    ):
+        projects = await client.get_projects()
+        tags = await client.get_tags()
+        await client.get_stats()
+        assert mock_exec.call_count == 1
+        work = projects["projects"][1]
+        assert (work["project"], work["pending"], work["completed"]) == ("Work", 1, 1)
+        assert work["children"][0]["project"] == "Work.Reports"
+        assert [(t["tag"], t["pending"]) for t in tags["tags"]] == [("office", 2), ("errand", 1)]
+        assert client.cache_stats()["loads"] == 1
+
+
+class TestReplace:
+    """Einzelne geänderte Tasks werden im Snapshot ersetzt statt ihn zu verwerfen."""
+
+    def test_replace_updates_snapshot_and_index(self, tmp_path: Path):
+        cache = SnapshotCache(tmp_path)
+        stamp = cache.stamp()
+        old = cache.store(TASKS, stamp)
+        changed = {**TASKS[0], "project": "Home", "tags": ["neu"]}
+        assert cache.replace(changed, stamp, stamp)
+        snapshot = cache.get()
+        assert snapshot.version > old.version
+        assert snapshot.tasks[0] is changed
+        assert TASKS[0]["project"] == "Work.Reports"  # alter Snapshot bleibt unverändert
+        assert snapshot.index.tags["neu"] == 0b1
+        assert cache.stats.updates == 1
+
+    def test_replace_updates_search_index(self, tmp_path: Path):
+        cache = SnapshotCache(tmp_path)
+        stamp = cache.stamp()
+        assert cache.store(TASKS, stamp).search.search("bericht").keys() == {0}
+        changed = {**TASKS[0], "description": "Quartalsbericht"}
+        assert cache.replace(changed, stamp, stamp)
+        search = cache.get().search
+        assert search.search("bericht").keys() == {0}
+        assert "bericht" not in search.postings
+
+    def test_stale_snapshot_is_dropped(self, tmp_path: Path):
+        cache = SnapshotCache(tmp_path)
+        cache.store(TASKS, cache.stamp())
+        other = (("pending.data", 1, 2, 3),)
+        assert not cache.replace(dict(TASKS[0]), other, other)
+        assert cache.get() is None
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            {"status": "completed"},
+            {"depends": ["bbbbbbbb-0000-0000-0000-000000000003"]},
+            {"recur": "weekly"},
+            {"uuid": "cccccccc-0000-0000-0000-000000000009"},
+        ],
+    )
+    def test_wider_changes_invalidate(self, tmp_path: Path, change: dict):
+        cache = SnapshotCache(tmp_path)
+        stamp = cache.stamp()
+        cache.store(TASKS, stamp)
+        assert not cache.replace({**TASKS[0], **change}, stamp, stamp)
+        assert cache.get() is None
+
+
+class TestClientReplace:
+    """modify/start/stop exportieren nur den geänderten Task."""
+
+    async def test_modify_keeps_snapshot(self, client: TaskwarriorClient, mock_exec: AsyncMock):
+        await client.export_tasks([])
+        changed = {**TASKS[0], "tags": ["office", "neu"]}
+        mock_exec.side_effect = [
+            FakeProcess(returncode=0),  # modify
+            FakeProcess(stdout=json.dumps([changed])),  # Export nur dieses Tasks
+        ]
+        task = await client.modify_task(TASKS[0]["uuid"], tags_add=["neu"])
+        assert task["tags"] == ["office", "neu"]
+        assert list(mock_exec.call_args.args)[-2:] == [TASKS[0]["uuid"], "export"]
+        tagged = await client.export_tasks(["+neu"])
+        assert [t["uuid"] for t in tagged] == [TASKS[0]["uuid"]]
+        assert mock_exec.call_count == 3
+        assert client.cache_stats()["updates"] == 1
+
+    async def test_failed_write_drops_snapshot(
+        self, client: TaskwarriorClient, mock_exec: AsyncMock
+    ):
+        await client.export_tasks([])
+        mock_exec.side_effect = None
+        mock_exec.return_value = FakeProcess(returncode=2, stderr="Fehler")
+        with pytest.raises(TaskwarriorError):
+            await client.start_task(TASKS[0]["uuid"])
+        assert client._cache.get() is None
@@ -0,0 +1,236 @@
+"""Unit-Tests für den nativen TW2-Lesepfad (DataFile, DataDirReader).
+
+Verifiziert:
+- FF4-Parsing inklusive Escapes
+- Inkrementelles Parsen (nur angehängte bzw. geänderte Zeilen)
+- Exportformat und IDs wie bei `task export`
+- Fallback des Clients auf `task`
+"""
+
+import os
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from taskwarrior_mcp.config import Settings
+from taskwarrior_mcp.datafile import DataDirReader, DataFile, parse_ff4_line
+from taskwarrior_mcp.filters import parse_filter
+from taskwarrior_mcp.taskwarrior import TaskwarriorClient
+from taskwarrior_mcp.urgency import UrgencyCoefficients
+
+ENTRY = str(int(time.time()) - 3600)
+
+
+def ff4(uuid: str, description: str, status: str = "pending", **extra: str) -> str:
+    """Baut eine FF4-Zeile wie Taskwarrior 2."""
+    attrs = {"description": description, "entry": ENTRY, "status": status, "uuid": uuid, **extra}
+    body = " ".join(f'{key}:"{value}"' for key, value in sorted(attrs.items()))
+    return f"[{body}]\n"
+
+
+def uuid_for(n: int) -> str:
+    return f"{n:08x}-0000-0000-0000-000000000000"
+
+
+class TestParseLine:
+    """Tests für parse_ff4_line."""
+
+    def test_basic_attributes(self):
+        attrs = parse_ff4_line(ff4(uuid_for(1), "Einkaufen", project="Home", tags="a,b"))
+        assert attrs["description"] == "Einkaufen"
+        assert attrs["project"] == "Home"
+        assert attrs["tags"] == "a,b"
+
+    def test_escapes(self):
+        line = '[description:"Sag \\"Hallo\\" &open;1&close; C:\\\\tmp" uuid:"x"]'
+        attrs = parse_ff4_line(line)
+        assert attrs["description"] == 'Sag "Hallo" [1] C:\\tmp'
+
+    def test_unicode(self):
+        assert parse_ff4_line(ff4(uuid_for(1), "Äpfel & Birnen"))["description"] == "Äpfel & Birnen"
+
+    def test_rejects_garbage(self):
+        with pytest.raises(ValueError):
+            parse_ff4_line("kein ff4")
+
+
+class TestIncrementalParsing:
+    """DataFile parst nur Neues bzw. Geändertes."""
+
+    def test_unchanged_file_is_not_reparsed(self, tmp_path: Path):
+        path = tmp_path / "pending.data"
+        path.write_text(ff4(uuid_for(1), "A") + ff4(uuid_for(2), "B"), encoding="utf-8")
+        data = DataFile(path)
+        assert len(data.tasks()) == 2
+        assert len(data.tasks()) == 2
+        assert data.parsed_lines == 2
+
+    def test_appended_lines_only(self, tmp_path: Path):
+        path = tmp_path / "pending.data"
+        path.write_text(ff4(uuid_for(1), "A") + ff4(uuid_for(2), "B"), encoding="utf-8")
+        data = DataFile(path)
+        data.tasks()
+        with path.open("a", encoding="utf-8") as f:
+            f.write(ff4(uuid_for(3), "C"))
+        tasks = data.tasks()
+        assert [t["description"] for t in tasks] == ["A", "B", "C"]
+        assert data.parsed_lines == 3
+
+    def test_changed_line_only(self, tmp_path: Path):
+        path = tmp_path / "pending.data"
+        lines = [ff4(uuid_for(n), f"Task {n}") for n in range(1, 6)]
+        path.write_text("".join(lines), encoding="utf-8")
+        data = DataFile(path)
+        data.tasks()
+        lines[2] = ff4(uuid_for(3), "Geändert und deutlich länger")
+        path.write_text("".join(lines), encoding="utf-8")
+        tasks = data.tasks()
+        assert tasks[2]["description"] == "Geändert und deutlich länger"
+        assert data.parsed_lines == 6
+
+    def test_rewrite_with_growth_detects_modification(self, tmp_path: Path):
+        """Geänderte Zeile plus angehängter Task darf nicht als reines Anhängen gelten."""
+        path = tmp_path / "pending.data"
+        path.write_text(ff4(uuid_for(1), "A") + ff4(uuid_for(2), "B"), encoding="utf-8")
+        data = DataFile(path)
+        data.tasks()
+        path.write_text(
+            ff4(uuid_for(1), "X") + ff4(uuid_for(2), "B") + ff4(uuid_for(3), "C"),
+            encoding="utf-8",
+        )
+        assert [t["description"] for t in data.tasks()] == ["X", "B", "C"]
+
+    def test_middle_change_beyond_edge_windows(self, tmp_path: Path):
+        """Längenänderung außerhalb der Vergleichsfenster verschiebt das Ende."""
+        path = tmp_path / "pending.data"
+        lines = [ff4(uuid_for(n), f"Task {n}") for n in range(1, 21)]
+        path.write_text("".join(lines), encoding="utf-8")
+        data = DataFile(path)
+        with patch("taskwarrior_mcp.datafile.EDGE_WINDOW", 200):
+            data.tasks()
+            lines[10] = ff4(uuid_for(11), "Mitte, länger")
+            path.write_text("".join(lines) + ff4(uuid_for(21), "Neu"), encoding="utf-8")
+            tasks = data.tasks()
+        assert tasks[10]["description"] == "Mitte, länger"
+        assert len(tasks) == 21
+
+    def test_incomplete_last_line_is_deferred(self, tmp_path: Path):
+        path = tmp_path / "pending.data"
+        complete = ff4(uuid_for(1), "A")
+        partial = ff4(uuid_for(2), "B")
+        path.write_text(complete + partial[:20], encoding="utf-8")
+        data = DataFile(path)
+        assert len(data.tasks()) == 1
+        path.write_text(complete + partial, encoding="utf-8")
+        assert len(data.tasks()) == 2
+
+    def test_missing_and_truncated_file(self, tmp_path: Path):
+        path = tmp_path / "completed.data"
+        data = DataFile(path)
+        assert data.tasks() == []
+        path.write_text(ff4(uuid_for(1), "A"), encoding="utf-8")
+        assert len(data.tasks()) == 1
+        path.write_text("", encoding="utf-8")
+        os.utime(path, ns=(time.time_ns(), time.time_ns() + 1_000_000))
+        assert data.tasks() == []
+
+
+@pytest.fixture()
+def data_dir(tmp_path: Path) -> Path:
+    (tmp_path / "pending.data").write_text(
+        ff4(uuid_for(1), "Erster", project="Work", tags="urgent")
+        + ff4(uuid_for(2), "Zweiter", project="Home", depends=uuid_for(1))
+        + ff4(uuid_for(3), "Fertig, noch nicht verschoben", status="completed", end=ENTRY),
+        encoding="utf-8",
+    )
+    (tmp_path / "completed.data").write_text(
+        ff4(uuid_for(4), "Archiv", status="completed", end=ENTRY), encoding="utf-8"
+    )
+    return tmp_path
+
+
+class TestDataDirReader:
+    """Tests für DataDirReader.export."""
+
+    def test_pending_ids_and_format(self, data_dir: Path):
+        reader = DataDirReader(data_dir, UrgencyCoefficients())
+        tasks = reader.export(parse_filter(["status:pending"]))
+        assert [(t["id"], t["description"]) for t in tasks] == [(1, "Erster"), (2, "Zweiter")]
+        assert tasks[0]["tags"] == ["urgent"]
+        assert tasks[1]["depends"] == [uuid_for(1)]
+        assert tasks[0]["entry"].endswith("Z")
+        assert "urgency" in tasks[0]
+
+    def test_ids_skip_completed_lines(self, tmp_path: Path):
+        (tmp_path / "pending.data").write_text(
+            ff4(uuid_for(1), "Erster")
+            + ff4(uuid_for(2), "Erledigt", status="completed", end=ENTRY)
+            + ff4(uuid_for(3), "Dritter")
+            + ff4(uuid_for(4), "Gelöscht", status="deleted", end=ENTRY)
+            + ff4(uuid_for(5), "Fünfter", status="waiting", wait=str(int(time.time()) + 3600)),
+            encoding="utf-8",
+        )
+        reader = DataDirReader(tmp_path, UrgencyCoefficients())
+        tasks = reader.export(parse_filter([]))
+        assert [(t["id"], t["description"]) for t in tasks] == [
+            (1, "Erster"),
+            (0, "Erledigt"),
+            (2, "Dritter"),
+            (0, "Gelöscht"),
+            (3, "Fünfter"),
+        ]
+        assert {task["id"] for task in reader.pending.tasks()} == {0}
+
+    def test_completed_reads_both_files(self, data_dir: Path):
+        reader = DataDirReader(data_dir, UrgencyCoefficients())
+        tasks = reader.export(parse_filter(["status:completed"]))
+        assert [(t["id"], t["description"]) for t in tasks] == [
+            (0, "Fertig, noch nicht verschoben"),
+            (0, "Archiv"),
+        ]
+
+    def test_pending_query_skips_completed_file(self, data_dir: Path):
+        reader = DataDirReader(data_dir, UrgencyCoefficients())
+        reader.export(parse_filter(["status:pending"]))
+        assert reader.completed.parsed_lines == 0
+
+    def test_results_are_copies(self, data_dir: Path):
+        reader = DataDirReader(data_dir, UrgencyCoefficients())
+        first = reader.export(parse_filter(["status:pending"]))
+        first[0]["description"] = "verändert"
+        second = reader.export(parse_filter(["status:pending"]))
+        assert second[0]["description"] == "Erster"
+
+    def test_completed_results_are_copies(self, data_dir: Path):
+        reader = DataDirReader(data_dir, UrgencyCoefficients())
+        tasks = reader.export(parse_filter(["status:completed"]))
+        assert all("urgency" in task for task in tasks)
+        assert "urgency" not in reader.completed.tasks()[0]
+
+    def test_limit(self, data_dir: Path):
+        reader = DataDirReader(data_dir, UrgencyCoefficients())
+        assert len(reader.export(parse_filter(["limit:1"]))) == 1
+
+
+class TestClientIntegration:
+    """TaskwarriorClient nutzt unter TW2 den DataDirReader."""
+
+    async def test_reads_without_process(self, data_dir: Path):
+        settings = Settings(
+            task_binary="task",
+            task_data=str(data_dir),
+            taskrc=str(data_dir / "missing.taskrc"),
+            native_reads=True,
+        )
+        with patch("taskwarrior_mcp.taskwarrior.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="2.6.2\n", stderr="")
+            client = TaskwarriorClient(settings)
+        assert isinstance(client._native, DataDirReader)
+        with patch(
+            "taskwarrior_mcp.taskwarrior.asyncio.create_subprocess_exec", new_callable=AsyncMock
+        ) as mock_exec:
+            task = await client.get_task(uuid_for(2))
+        mock_exec.assert_not_called()
+        assert task["description"] == "Zweiter"
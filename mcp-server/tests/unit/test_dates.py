@@ -0,0 +1,126 @@
+"""Unit-Tests für resolve_date.
+
+Verifiziert:
+- ISO-, Kompakt- und Epoch-Formate
+- Benannte Daten relativ zu einem festen Zeitpunkt (lokale Zeitzone)
+- Relative Dauern
+- Periodengrenzen (sow/eow, eom, eoq, eoy) mit weekstart
+- None für Formen, die nur `task` sicher auswertet
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from taskwarrior_mcp.dates import resolve_date
+
+# Mittwoch, 2025-03-12 15:30 lokale Zeit
+NOW = datetime(2025, 3, 12, 15, 30).timestamp()
+
+
+def local(*parts: int) -> float:
+    return datetime(*parts).timestamp()
+
+
+class TestAbsolute:
+    def test_iso_date_is_local_midnight(self):
+        assert resolve_date("2025-03-15", NOW) == local(2025, 3, 15)
+
+    def test_iso_datetime(self):
+        assert resolve_date("2025-03-15T09:45", NOW) == local(2025, 3, 15, 9, 45)
+        assert resolve_date("2025-03-15 09:45:10", NOW) == local(2025, 3, 15, 9, 45, 10)
+
+    def test_utc_forms(self):
+        expected = datetime(2025, 3, 15, 9, 45, tzinfo=timezone.utc).timestamp()
+        assert resolve_date("2025-03-15T09:45:00Z", NOW) == expected
+        assert resolve_date("20250315T094500Z", NOW) == expected
+
+    def test_epoch(self):
+        assert resolve_date("1741800000", NOW) == 1741800000.0
+
+    def test_invalid_calendar_date(self):
+        assert resolve_date("2025-02-30", NOW) is None
+
+
+class TestNamed:
+    def test_day_names(self):
+        assert resolve_date("now", NOW) == NOW
+        assert resolve_date("today", NOW) == local(2025, 3, 12)
+        assert resolve_date("sod", NOW) == local(2025, 3, 12)
+        assert resolve_date("Tomorrow", NOW) == local(2025, 3, 13)
+        assert resolve_date("yesterday", NOW) == local(2025, 3, 11)
+
+    def test_weekday_is_next_occurrence(self):
+        assert resolve_date("friday", NOW) == local(2025, 3, 14)
+        assert resolve_date("mon", NOW) == local(2025, 3, 17)
+        # Heute (Mittwoch) zählt nicht — eine Woche später
+        assert resolve_date("wednesday", NOW) == local(2025, 3, 19)
+
+    def test_start_of_periods(self):
+        assert resolve_date("som", NOW) == local(2025, 3, 1)
+        assert resolve_date("soy", NOW) == local(2025, 1, 1)
+
+
+class TestDurations:
+    @pytest.mark.parametrize(
+        ("value", "offset"),
+        [
+            ("+2d", 2 * 86400),
+            ("2d", 2 * 86400),
+            ("-1h", -3600),
+            ("3weeks", 3 * 604800),
+            ("1mo", 30 * 86400),
+            ("+90min", 5400),
+        ],
+    )
+    def test_relative(self, value: str, offset: int):
+        assert resolve_date(value, NOW) == NOW + offset
+
+
+class TestUnresolved:
+    @pytest.mark.parametrize("value", ["eow", "eom", "eoy", "later", "now+1d", "", "2d3h", "1x"])
+    def test_returns_none(self, value: str):
+        assert resolve_date(value, NOW) is None
+
+
+class TestPeriods:
+    """Periodengrenzen wie Taskwarrior ≥ 2.6 (eo* = letzte Sekunde)."""
+
+    def test_disabled_by_default(self):
+        assert resolve_date("eow", NOW) is None
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("eod", local(2025, 3, 12, 23, 59, 59)),
+            ("sow", local(2025, 3, 9)),
+            ("eow", local(2025, 3, 15, 23, 59, 59)),
+            ("eom", local(2025, 3, 31, 23, 59, 59)),
+            ("soq", local(2025, 1, 1)),
+            ("eoq", local(2025, 3, 31, 23, 59, 59)),
+            ("eoy", local(2025, 12, 31, 23, 59, 59)),
+            ("som", local(2025, 3, 1)),
+        ],
+    )
+    def test_sunday_weekstart(self, value: str, expected: float):
+        assert resolve_date(value, NOW, periods=True) == expected
+
+    def test_monday_weekstart(self):
+        assert resolve_date("sow", NOW, periods=True, weekstart="monday") == local(2025, 3, 10)
+        assert resolve_date("eow", NOW, periods=True, weekstart="monday") == local(
+            2025, 3, 16, 23, 59, 59
+        )
+
+    def test_week_boundary_days(self):
+        saturday = local(2025, 3, 15, 10)
+        assert resolve_date("eow", saturday, periods=True) == local(2025, 3, 15, 23, 59, 59)
+        sunday = local(2025, 3, 16, 10)
+        assert resolve_date("sow", sunday, periods=True) == local(2025, 3, 16)
+
+    def test_year_end(self):
+        december = local(2025, 12, 20)
+        assert resolve_date("eom", december, periods=True) == local(2025, 12, 31, 23, 59, 59)
+        assert resolve_date("eoq", december, periods=True) == local(2025, 12, 31, 23, 59, 59)
+
+    def test_unknown_weekstart(self):
+        assert resolve_date("eow", NOW, periods=True, weekstart="wednesday") is None
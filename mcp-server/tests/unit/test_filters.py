@@ -0,0 +1,177 @@
+"""Unit-Tests für die native Filterauswertung (filters.py).
+
+Verifiziert:
+- and/or/Klammern mit Taskwarrior-Vorrang (and vor or)
+- Datumsvergleiche mit benannten Daten, leere Attribute
+- description.contains mit und ohne search.case.sensitive
+- Rückfall auf `task` (None) für nicht unterstützte Syntax
+- FilterOptions aus taskrc und Version
+"""
+
+from datetime import datetime
+
+import pytest
+
+from taskwarrior_mcp.filters import AnyOf, Condition, FilterOptions, parse_filter
+from taskwarrior_mcp.native import format_date
+
+# Mittwoch, 2025-03-12 15:30 lokale Zeit
+NOW = datetime(2025, 3, 12, 15, 30).timestamp()
+PERIODS = FilterOptions(periods=True)
+
+
+def _task(uuid: str, **attrs) -> dict:
+    return {"uuid": uuid, "status": "pending", "description": uuid, **attrs}
+
+
+def _at(*parts: int) -> str:
+    return format_date(datetime(*parts).timestamp())
+
+
+TASKS = [
+    _task("a", project="Work", tags=["urgent"], due=_at(2025, 3, 13, 9)),
+    _task("b", project="Work.Sub", priority="H", due=_at(2025, 3, 20)),
+    _task("c", project="Home", tags=["urgent", "later"], description="Meeting vorbereiten"),
+    _task("d", description="Einkaufen", due=_at(2025, 3, 12, 8)),
+    _task("e", project="Workshop", status="completed", end=_at(2025, 3, 1)),
+]
+
+
+def _uuids(args: list[str], options: FilterOptions = PERIODS) -> list[str]:
+    query = parse_filter(args, options, NOW)
+    assert query is not None, args
+    return [task["uuid"] for task in query.select(TASKS, NOW)]
+
+
+class TestBoolean:
+    def test_or_in_parentheses(self):
+        assert _uuids(["(", "project:Home", "or", "+urgent", ")"]) == ["a", "c"]
+
+    def test_attached_parentheses(self):
+        assert _uuids(["(project:Home", "or", "priority:H)"]) == ["b", "c"]
+
+    def test_and_binds_tighter_than_or(self):
+        # project:Home or (+urgent and project:Work)
+        assert _uuids(["project:Home", "or", "+urgent", "project:Work"]) == ["a", "c"]
+        assert _uuids(["(project:Home", "or", "+urgent)", "project:Work"]) == ["a"]
+
+    def test_explicit_and(self):
+        assert _uuids(["+urgent", "and", "-later"]) == ["a"]
+
+    def test_top_level_terms_fill_fields(self):
+        query = parse_filter(["project:Work", "+urgent", "status:pending"], PERIODS, NOW)
+        assert query.project == "Work"
+        assert query.status == "pending"
+        assert query.tags_include == ["urgent"]
+        assert query.conditions == []
+
+    def test_or_group_becomes_condition(self):
+        query = parse_filter(["status:pending", "(+a", "or", "+b)"], PERIODS, NOW)
+        assert query.status == "pending"
+        assert isinstance(query.conditions[0], AnyOf)
+
+    def test_repeated_attribute_is_conjunction(self):
+        assert _uuids(["project:Work", "project:Work.Sub"]) == ["b"]
+        assert _uuids(["status:pending", "status:completed"]) == []
+
+    def test_status_inside_or(self):
+        assert _uuids(["(status:completed", "or", "project:Home)"]) == ["c", "e"]
+
+
+class TestProject:
+    def test_includes_subprojects_only(self):
+        assert _uuids(["project:Work"]) == ["a", "b"]
+        assert _uuids(["project:Workshop"]) == ["e"]
+        assert _uuids(["project:Wor"]) == []
+
+    def test_nested_condition(self):
+        assert _uuids(["(project:Work", "or", "+later)"]) == ["a", "b", "c"]
+
+    def test_condition_is_abstract(self):
+        with pytest.raises(TypeError):
+            Condition()  # type: ignore[abstract]
+
+
+class TestDates:
+    def test_before_named_date(self):
+        assert _uuids(["due.before:tomorrow"]) == ["d"]
+        assert _uuids(["due.before:eow"]) == ["a", "d"]
+
+    def test_after_relative_duration(self):
+        assert _uuids(["due.after:+2d"]) == ["b"]
+
+    def test_tasks_without_date_never_match(self):
+        assert "c" not in _uuids(["due.after:2000-01-01"])
+        assert "c" not in _uuids(["due.before:2100-01-01"])
+
+    def test_missing_attribute(self):
+        assert _uuids(["due:"]) == ["c", "e"]
+
+    def test_aliases(self):
+        assert _uuids(["due.below:tomorrow"]) == _uuids(["due.before:tomorrow"])
+        assert _uuids(["end.over:2025-02-01"]) == ["e"]
+
+    def test_periods_need_option(self):
+        assert parse_filter(["due.before:eow"], FilterOptions(), NOW) is None
+
+    def test_weekstart_monday(self):
+        # Mit Montag als Wochenbeginn endet die Woche erst am Sonntag, 16.03.
+        monday = FilterOptions(weekstart="monday", periods=True)
+        sunday = _at(2025, 3, 16, 12)
+        tasks = [_task("x", due=sunday)]
+        assert parse_filter(["due.before:eow"], monday, NOW).select(tasks, NOW)
+        assert not parse_filter(["due.before:eow"], PERIODS, NOW).select(tasks, NOW)
+
+
+class TestContains:
+    def test_case_sensitive_by_default(self):
+        assert _uuids(["description.contains:Meeting"]) == ["c"]
+        assert _uuids(["description.contains:meeting"]) == []
+
+    def test_case_insensitive(self):
+        options = FilterOptions(case_sensitive=False, periods=True)
+        assert _uuids(["description.contains:meeting"], options) == ["c"]
+
+
+class TestUnsupported:
+    @pytest.mark.parametrize(
+        "args",
+        [
+            ["(", "project:A"],
+            ["project:A", ")"],
+            ["project:A", "or"],
+            ["project:A", "or", "limit:5"],
+            ["(", "0123abcd", "or", "project:A", ")"],
+            ["not", "+a"],
+            ["due:today"],
+            ["due.before:eow", "due<tomorrow"],
+            ["description.contains:"],
+            ["tags.contains:x"],
+        ],
+    )
+    def test_falls_back_to_task(self, args: list[str]):
+        assert parse_filter(args, PERIODS, NOW) is None
+
+    def test_empty_filter(self):
+        query = parse_filter([], PERIODS, NOW)
+        assert len(query.select(TASKS, NOW)) == len(TASKS)
+
+
+class TestFilterOptions:
+    def test_from_config(self):
+        options = FilterOptions.from_config(
+            {"weekstart": "Monday", "search.case.sensitive": "no"}, "3.1.0"
+        )
+        assert options == FilterOptions(weekstart="monday", case_sensitive=False, periods=True)
+
+    @pytest.mark.parametrize(
+        ("version", "periods"),
+        [
+            ("2.5.3", False),
+            ("2.6.0", True),
+            ("3.0.2", True),
+            ("", False),
+        ],
+    )
+    def test_periods_by_version(self, version: str, periods: bool):
+        assert FilterOptions.from_config({}, version).periods is periods
@@ -0,0 +1,160 @@
+"""Unit-Tests für die Sekundärindizes (index.py).
+
+Verifiziert:
+- Gleiche Treffer (und Reihenfolge) wie SimpleFilter.select ohne Index
+- Bereichsabfragen über due/scheduled/wait
+- Inkrementelle Aktualisierung einzelner Tasks
+- Kein Index für nicht indizierte Bedingungen (Rückfall auf den Scan)
+"""
+
+import random
+from datetime import datetime
+
+import pytest
+
+from taskwarrior_mcp.cache import Snapshot
+from taskwarrior_mcp.filters import FilterOptions, parse_filter
+from taskwarrior_mcp.index import TaskIndex, iter_positions, to_mask
+from taskwarrior_mcp.native import format_date
+
+# Mittwoch, 2025-03-12 15:30 lokale Zeit
+NOW = datetime(2025, 3, 12, 15, 30).timestamp()
+OPTIONS = FilterOptions(periods=True)
+DAY = 86400
+
+PROJECTS = ["Work", "Work.Sub", "Workshop", "Home", None]
+TAGS = ["urgent", "later", "call", "mail"]
+
+
+def _random_tasks(count: int, seed: int = 18) -> list[dict]:
+    rng = random.Random(seed)
+    tasks = []
+    for n in range(count):
+        task = {
+            "uuid": f"{rng.getrandbits(32):08x}-0000-4000-8000-{n:012x}",
+            "description": f"Task {n}",
+            "status": rng.choice(["pending", "pending", "pending", "completed", "deleted"]),
+        }
+        if project := rng.choice(PROJECTS):
+            task["project"] = project
+        if tags := rng.sample(TAGS, rng.randint(0, 2)):
+            task["tags"] = tags
+        if rng.random() < 0.4:
+            task["priority"] = rng.choice("HML")
+        for attr in ("due", "scheduled", "wait"):
+            if rng.random() < 0.4:
+                task[attr] = format_date(NOW + rng.randint(-10 * DAY, 30 * DAY))
+        tasks.append(task)
+    return tasks
+
+
+FILTERS = [
+    [],
+    ["status:pending"],
+    ["status:waiting"],
+    ["status:completed"],
+    ["project:Work"],
+    ["project:"],
+    ["+urgent"],
+    ["+urgent", "+call"],
+    ["-urgent", "status:pending"],
+    ["project:Work", "+urgent", "due.before:eow"],
+    ["due.before:today"],
+    ["due.after:+7d"],
+    ["scheduled.before:now", "wait.after:now"],
+    ["(project:Home", "or", "+mail)", "status:pending"],
+    ["(due.before:tomorrow", "or", "priority:H)"],
+    ["priority:H"],
+    ["description.contains:Task 1"],
+    ["project:Work", "limit:3"],
+]
+
+
+class TestCandidates:
+    @pytest.mark.parametrize("args", FILTERS, ids=" ".join)
+    def test_same_result_as_scan(self, args: list[str]):
+        tasks = _random_tasks(500)
+        query = parse_filter(args, OPTIONS, NOW)
+        snapshot = Snapshot(tasks=tasks, stamp=())
+        assert snapshot.select(query, NOW) == query.select(tasks, NOW)
+
+    def test_uuid_prefix(self):
+        tasks = _random_tasks(200)
+        query = parse_filter([tasks[5]["uuid"][:8], tasks[9]["uuid"]], OPTIONS, NOW)
+        positions, residual = TaskIndex(tasks).plan(query)
+        assert list(positions) == [5, 9]
+        assert residual.uuids == []
+
+    def test_exact_terms_leave_only_limit(self):
+        query = parse_filter(["project:Work", "+urgent", "due.before:eow", "limit:5"], OPTIONS, NOW)
+        _, residual = TaskIndex(_random_tasks(50)).plan(query)
+        assert residual == type(query)(limit=5)
+
+    def test_waiting_group_is_rechecked(self):
+        query = parse_filter(["status:pending", "+urgent"], OPTIONS, NOW)
+        _, residual = TaskIndex(_random_tasks(50)).plan(query)
+        assert residual.status == "pending"
+        assert residual.tags_include == []
+
+    def test_unindexed_conditions_scan(self):
+        query = parse_filter(["priority:H", "-later"], OPTIONS, NOW)
+        assert TaskIndex(_random_tasks(50)).plan(query) is None
+
+    def test_or_with_unindexed_term_scans(self):
+        query = parse_filter(["(+urgent", "or", "priority:H)"], OPTIONS, NOW)
+        assert TaskIndex(_random_tasks(50)).plan(query) is None
+
+    def test_date_range_bounds_are_exclusive(self):
+        due = format_date(NOW)
+        tasks = [{"uuid": "a", "status": "pending", "due": due}]
+        index = TaskIndex(tasks)
+        assert index.dates["due"].range("before", due) == 0
+        assert index.dates["due"].range("after", due) == 0
+
+    def test_date_ranges_across_prefix_steps(self):
+        tasks = _random_tasks(3000)
+        index = TaskIndex(tasks)
+        for bound in (NOW - 5 * DAY, NOW, NOW + 20 * DAY):
+            key = format_date(bound)
+            before = {n for n, t in enumerate(tasks) if t.get("due") and t["due"] < key}
+            after = {n for n, t in enumerate(tasks) if t.get("due") and t["due"] > key}
+            assert set(iter_positions(index.dates["due"].range("before", key))) == before
+            assert set(iter_positions(index.dates["due"].range("after", key))) == after
+
+
+class TestMasks:
+    def test_roundtrip(self):
+        positions = [0, 3, 7, 8, 64, 999]
+        assert list(iter_positions(to_mask(positions, 1000))) == positions
+
+    def test_empty(self):
+        assert list(iter_positions(0)) == []
+
+
+class TestUpdate:
+    def test_update_matches_rebuild(self):
+        tasks = _random_tasks(300)
+        index = TaskIndex(tasks)
+        rng = random.Random(1)
+        for _ in range(100):
+            position = rng.randrange(len(tasks))
+            old = tasks[position]
+            new = dict(old)
+            new["project"] = rng.choice(["Work", "Home.Garden", "Neu"])
+            new["tags"] = rng.sample(TAGS, rng.randint(0, 3))
+            if rng.random() < 0.5:
+                new["due"] = format_date(NOW + rng.randint(-5 * DAY, 5 * DAY))
+            else:
+                new.pop("due", None)
+            tasks[position] = new
+            index.update(position, old, new)
+        rebuilt = TaskIndex(tasks)
+        for args in FILTERS[1:] + [["project:Neu"], ["project:Home.Garden", "+mail"]]:
+            query = parse_filter(args, OPTIONS, NOW)
+            expected = rebuilt.plan(query)
+            actual = index.plan(query)
+            if expected is None:
+                assert actual is None, args
+            else:
+                assert list(actual[0]) == list(expected[0]), args
+        assert index.dates["due"].keys == rebuilt.dates["due"].keys
@@ -0,0 +1,113 @@
+"""Unit-Tests für JSONArrayParser und RawArrayCollector.
+
+Verifiziert:
+- Objekte werden geliefert, sobald sie vollständig sind
+- Beliebige Chunk-Grenzen (auch mitten in Strings und Escapes)
+- JSON-Lines-Ausgabe ohne Array-Klammern
+- Fehler bei abgeschnittener oder ungültiger Ausgabe
+- Rohtext-Durchreichen der Zeilenform von `task export` inkl. limit
+"""
+
+import json
+
+import pytest
+
+from taskwarrior_mcp.jsonstream import JSONArrayParser, RawArrayCollector
+
+TASKS = [
+    {"id": 1, "description": 'Sag "Hallo" [1], {2}', "tags": ["a", "b"]},
+    {"id": 2, "description": "Äpfel ☃", "annotations": [{"description": "x"}]},
+    {"id": 3, "description": "Ende"},
+]
+
+
+def _feed_in_chunks(text: str, size: int) -> list:
+    parser = JSONArrayParser()
+    items = []
+    for start in range(0, len(text), size):
+        items.extend(parser.feed(text[start : start + size]))
+    parser.close()
+    return items
+
+
+class TestJSONArrayParser:
+    def test_whole_array(self):
+        assert _feed_in_chunks(json.dumps(TASKS), 1 << 20) == TASKS
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 16])
+    def test_arbitrary_chunk_boundaries(self, size: int):
+        assert _feed_in_chunks(json.dumps(TASKS, ensure_ascii=False), size) == TASKS
+
+    def test_taskwarrior_layout(self):
+        text = "[\n" + ",\n".join(json.dumps(t) for t in TASKS) + "\n]\n"
+        assert _feed_in_chunks(text, 10) == TASKS
+
+    def test_json_lines(self):
+        text = "\n".join(json.dumps(t) for t in TASKS) + "\n"
+        assert _feed_in_chunks(text, 5) == TASKS
+
+    def test_objects_available_before_end(self):
+        parser = JSONArrayParser()
+        text = json.dumps(TASKS)
+        first_end = len(json.dumps(TASKS[0])) + 1
+        assert parser.feed(text[: first_end + 1]) == [TASKS[0]]
+
+    def test_empty_output_and_empty_array(self):
+        assert _feed_in_chunks("", 4) == []
+        assert _feed_in_chunks("[]\n", 1) == []
+
+    def test_truncated_output_raises(self):
+        parser = JSONArrayParser()
+        parser.feed(json.dumps(TASKS)[:-10])
+        with pytest.raises(ValueError):
+            parser.close()
+
+    def test_garbage_raises(self):
+        parser = JSONArrayParser()
+        assert parser.feed("Fehler: keine Daten") == []
+        with pytest.raises(ValueError):
+            parser.close()
+
+
+def _export_layout(tasks: list) -> bytes:
+    return ("[\n" + ",\n".join(json.dumps(t, ensure_ascii=False) for t in tasks) + "\n]\n").encode()
+
+
+def _collect(data: bytes, size: int, limit: int | None = None) -> RawArrayCollector:
+    collector = RawArrayCollector(limit)
+    for start in range(0, len(data), size):
+        collector.feed(data[start : start + size])
+    collector.feed(b"")
+    return collector
+
+
+class TestRawArrayCollector:
+    @pytest.mark.parametrize("size", [1, 3, 16, 1 << 20])
+    def test_passes_export_through(self, size: int):
+        collector = _collect(_export_layout(TASKS), size)
+        assert json.loads(collector.result()) == TASKS
+        assert collector.count == 3
+
+    def test_limit_stops_early(self):
+        collector = RawArrayCollector(limit=2)
+        data = _export_layout(TASKS)
+        collector.feed(data[: data.index(b"Ende")])
+        assert collector.done
+        assert json.loads(collector.result()) == TASKS[:2]
+
+    @pytest.mark.parametrize("data", [b"", b"[\n]\n", b"[]\n"])
+    def test_empty(self, data: bytes):
+        assert _collect(data, 4).result() == "[]"
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            json.dumps(TASKS).encode(),  # alles in einer Zeile
+            "\n".join(json.dumps(t) for t in TASKS).encode(),  # JSON Lines
+            _export_layout(TASKS)[:-4],  # abgeschnitten
+            b"Fehler: keine Daten",
+        ],
+    )
+    def test_other_layouts_raise(self, data: bytes):
+        with pytest.raises(ValueError):
+            _collect(data, 7).result()
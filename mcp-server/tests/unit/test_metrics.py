@@ -0,0 +1,159 @@
+"""Unit-Tests für die Laufzeitmetriken (metrics.py).
+
+Verifiziert:
+- Histogramm-Quantile und Erkennung des Unterbefehls
+- Prometheus-Textformat und periodische Metrik-Datei
+- Erfassung von task-Prozessen im TaskwarriorClient
+- Erfassung von Tool-Aufrufen im Server
+"""
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from taskwarrior_mcp.metrics import Histogram, Metrics, MetricsFileWriter, subcommand
+from taskwarrior_mcp.server import _instrumented
+from taskwarrior_mcp.taskwarrior import TaskwarriorClient, TaskwarriorError
+from tests.conftest import FakeProcess
+
+
+class TestHistogram:
+    """Tests für Histogram."""
+
+    def test_empty(self):
+        assert Histogram().quantile(0.5) == 0.0
+
+    def test_single_value_is_exact(self):
+        hist = Histogram()
+        hist.observe(0.0042)
+        assert hist.quantile(0.5) == pytest.approx(0.0042)
+        assert hist.quantile(0.99) == pytest.approx(0.0042)
+
+    def test_quantiles_within_bucket_bounds(self):
+        hist = Histogram(buckets=(0.01, 0.1, 1.0))
+        for value in [0.005] * 90 + [0.5] * 10:
+            hist.observe(value)
+        assert hist.counts == [90, 0, 10, 0]
+        assert hist.quantile(0.5) <= 0.01
+        assert 0.1 < hist.quantile(0.95) <= 0.5
+        assert hist.summary_ms()["max_ms"] == 500.0
+
+
+class TestSubcommand:
+    """Tests für subcommand."""
+
+    @pytest.mark.parametrize(
+        ("cmd", "expected"),
+        [
+            (["task", "rc.verbose=nothing", "status:pending", "export"], "export"),
+            (["task", "rc.verbose=new-uuid", "add", "export report"], "add"),
+            (["task", "abcd1234", "modify", "priority:H"], "modify"),
+            (["task", "--version"], "--version"),
+            (["task", "rc.json.array=on", "calendar"], "calendar"),
+            (["task", "rc.json.array=on", "frobnicate"], "other"),
+        ],
+    )
+    def test_detects_first_command(self, cmd: list[str], expected: str):
+        assert subcommand(cmd) == expected
+
+
+class TestPrometheus:
+    """Tests für das Prometheus-Textformat."""
+
+    def test_counters_and_histograms(self):
+        metrics = Metrics()
+        metrics.observe_tool("task_list", 0.003, failed=False)
+        metrics.observe_tool("task_list", 0.2, failed=True)
+        metrics.observe_command(["task", "export"], 0.002, False, 120, 0.0005)
+        text = metrics.to_prometheus({"cache": {"hits": 3, "hit_rate": 0.5}, "none": None})
+        lines = text.splitlines()
+        assert 'taskwarrior_mcp_tool_calls_total{tool="task_list"} 2' in lines
+        assert 'taskwarrior_mcp_tool_errors_total{tool="task_list"} 1' in lines
+        assert 'taskwarrior_mcp_tool_duration_seconds_bucket{tool="task_list",le="+Inf"} 2' in lines
+        assert 'taskwarrior_mcp_command_stdout_bytes_total{command="export"} 120' in lines
+        assert "taskwarrior_mcp_cache_hits 3" in lines
+        assert "# TYPE taskwarrior_mcp_command_duration_seconds histogram" in lines
+        # Buckets sind kumulativ
+        buckets = [
+            int(line.rsplit(" ", 1)[1])
+            for line in lines
+            if line.startswith("taskwarrior_mcp_tool_duration_seconds_bucket")
+        ]
+        assert buckets == sorted(buckets)
+
+    async def test_file_writer(self, tmp_path: Path):
+        target = tmp_path / "tw.prom"
+        metrics = Metrics()
+        writer = MetricsFileWriter(target, metrics.to_prometheus, interval=3600)
+        writer.start()
+        metrics.observe_tool("task_get", 0.001, failed=False)
+        await writer.close()
+        assert 'taskwarrior_mcp_tool_calls_total{tool="task_get"} 1' in target.read_text()
+        assert not (tmp_path / "tw.prom.tmp").exists()
+
+
+class TestClientMetrics:
+    """Der TaskwarriorClient erfasst jeden task-Prozess."""
+
+    async def test_export_and_write(self, client: TaskwarriorClient):
+        output = json.dumps([{"uuid": "a", "description": "x"}])
+        with patch(
+            "taskwarrior_mcp.taskwarrior.asyncio.create_subprocess_exec",
+            new=AsyncMock(
+                side_effect=[
+                    FakeProcess(stdout=output),
+                    FakeProcess(returncode=2, stderr="Fehler"),
+                ]
+            ),
+        ):
+            await client.export_tasks(["project:A"])
+            with pytest.raises(TaskwarriorError):
+                await client.complete_task("abcd1234")
+        commands = client.server_metrics()["commands"]
+        assert commands["export"]["spawns"] == 1
+        assert commands["export"]["stdout_bytes"] == len(output)
+        assert commands["export"]["failures"] == 0
+        assert (commands["done"]["spawns"], commands["done"]["failures"]) == (1, 1)
+
+    async def test_limit_is_not_a_failure(self, client: TaskwarriorClient):
+        output = json.dumps([{"uuid": str(n)} for n in range(100)])
+        with patch(
+            "taskwarrior_mcp.taskwarrior.asyncio.create_subprocess_exec",
+            new=AsyncMock(return_value=FakeProcess(stdout=output, chunk_size=16)),
+        ):
+            tasks = await client.export_tasks(["limit:2"])
+        assert len(tasks) == 2
+        assert client.server_metrics()["commands"]["export"]["failures"] == 0
+
+    def test_includes_cache_and_singleflight(self, client: TaskwarriorClient):
+        result = client.server_metrics()
+        assert result["cache"] is None
+        assert result["singleflight"]["executed"] == 0
+        assert "running" in result["scheduler"]
+
+
+class TestToolMetrics:
+    """_instrumented zählt Aufrufe, Fehler und Latenz pro Tool."""
+
+    async def test_counts_calls_and_errors(self, client: TaskwarriorClient):
+        ctx = SimpleNamespace(
+            request_context=SimpleNamespace(
+                request_id=7, lifespan_context=SimpleNamespace(tw=client, profiler=None)
+            )
+        )
+
+        @_instrumented
+        async def task_demo(ctx, fail: bool = False) -> str:
+            if fail:
+                raise TaskwarriorError("kaputt")
+            return "ok"
+
+        assert await task_demo(ctx) == "ok"
+        with pytest.raises(TaskwarriorError):
+            await task_demo(ctx=ctx, fail=True)
+        stats = client.server_metrics()["tools"]["task_demo"]
+        assert (stats["calls"], stats["errors"]) == (2, 1)
+        assert task_demo.__name__ == "task_demo"
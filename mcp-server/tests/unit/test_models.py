@@ -10,13 +10,24 @@ Verifiziert:
 import pytest
 from pydantic import ValidationError
 
-from taskwarrior_mcp.models import TaskAddInput, TaskListInput, TaskModifyInput, UUIDInput
+from taskwarrior_mcp.models import (
+    MAX_BATCH_SIZE,
+    TaskAddBatchInput,
+    TaskAddInput,
+    TaskBulkInput,
+    TaskBulkModifyInput,
+    TaskListInput,
+    TaskModifyInput,
+    TaskNextInput,
+    TaskSearchInput,
+    UUIDInput,
+)
 
 
 class TestShellInjectionPrevention:
     """Testet die Shell-Injection-Abwehr."""
 
-    INJECTION_STRINGS = [
+    INJECTION_STRINGS = (
         "Task; rm -rf /",
         "Task | cat /etc/passwd",
         "Task & background_cmd",
@@ -25,7 +36,7 @@ class TestShellInjectionPrevention:
         "Task ${HOME}",
         "Task { echo evil }",
         "Task \\ escaped",
-    ]
+    )
 
     @pytest.mark.parametrize("evil_input", INJECTION_STRINGS)
     def test_blocks_shell_injection_in_description(self, evil_input: str):
@@ -56,31 +67,47 @@ class TestShellInjectionPrevention:
         assert inp.description == "E-Mail schreiben an Max-Müller"
 
     @pytest.mark.parametrize("field", ["due", "scheduled", "wait", "recur"])
-    @pytest.mark.parametrize("evil_input", [
-        "tomorrow; rm -rf /",
-        "eow | cat /etc/passwd",
-        "today & evil",
-        "$(date)",
-        "`date`",
-    ])
+    @pytest.mark.parametrize(
+        "evil_input",
+        [
+            "tomorrow; rm -rf /",
+            "eow | cat /etc/passwd",
+            "today & evil",
+            "$(date)",
+            "`date`",
+        ],
+    )
     def test_blocks_shell_injection_in_date_fields_add(self, field: str, evil_input: str):
         with pytest.raises(ValidationError):
             TaskAddInput(description="Test", **{field: evil_input})
 
     @pytest.mark.parametrize("field", ["due", "scheduled", "wait", "recur"])
-    @pytest.mark.parametrize("evil_input", [
-        "tomorrow; rm -rf /",
-        "eow | cat /etc/passwd",
-        "$(date)",
-    ])
+    @pytest.mark.parametrize(
+        "evil_input",
+        [
+            "tomorrow; rm -rf /",
+            "eow | cat /etc/passwd",
+            "$(date)",
+        ],
+    )
     def test_blocks_shell_injection_in_date_fields_modify(self, field: str, evil_input: str):
         with pytest.raises(ValidationError):
             TaskModifyInput(uuid="abcdef12", **{field: evil_input})
 
     @pytest.mark.parametrize("field", ["due", "scheduled", "wait", "recur"])
-    @pytest.mark.parametrize("valid_input", [
-        "today", "tomorrow", "eow", "eom", "+2d", "2025-12-31", "monday", "weekly",
-    ])
+    @pytest.mark.parametrize(
+        "valid_input",
+        [
+            "today",
+            "tomorrow",
+            "eow",
+            "eom",
+            "+2d",
+            "2025-12-31",
+            "monday",
+            "weekly",
+        ],
+    )
     def test_allows_valid_date_fields(self, field: str, valid_input: str):
         inp = TaskAddInput(description="Test", **{field: valid_input})
         assert getattr(inp, field) == valid_input
@@ -212,6 +239,22 @@ class TestTaskAddInput:
             TaskAddInput(description="")
 
 
+class TestTaskAddBatchInput:
+    """Tests für das TaskAddBatchInput Model."""
+
+    def test_accepts_records(self):
+        inp = TaskAddBatchInput(tasks=[{"description": "A"}, {"description": "B"}])
+        assert len(inp.tasks) == 2
+
+    def test_empty_batch_raises(self):
+        with pytest.raises(ValidationError):
+            TaskAddBatchInput(tasks=[])
+
+    def test_oversized_batch_raises(self):
+        with pytest.raises(ValidationError):
+            TaskAddBatchInput(tasks=[{"description": "x"}] * (MAX_BATCH_SIZE + 1))
+
+
 class TestTaskModifyInput:
     """Tests für das TaskModifyInput Model."""
 
@@ -230,6 +273,118 @@ class TestTaskModifyInput:
         assert inp.tags_remove == ["old-tag"]
 
 
+class TestTaskBulkInput:
+    """Tests für TaskBulkInput und TaskBulkModifyInput."""
+
+    def test_uuids(self):
+        inp = TaskBulkInput(uuids=["12345678", "abcdef01"])
+        assert inp.uuids == ["12345678", "abcdef01"]
+        assert inp.dry_run is False
+
+    def test_filter(self):
+        assert TaskBulkInput(filter_expr="project:Sprint +review").filter_expr
+
+    def test_requires_exactly_one_selector(self):
+        with pytest.raises(ValidationError):
+            TaskBulkInput()
+        with pytest.raises(ValidationError):
+            TaskBulkInput(uuids=["12345678"], filter_expr="project:X")
+
+    def test_empty_filter_raises(self):
+        with pytest.raises(ValidationError, match="alle Tasks"):
+            TaskBulkInput(filter_expr="   ")
+
+    @pytest.mark.parametrize("expr", ["()", "( )", "not", "and", "( not )"])
+    def test_filter_without_term_raises(self, expr: str):
+        with pytest.raises(ValidationError, match="ohne Term"):
+            TaskBulkInput(filter_expr=expr)
+
+    def test_empty_uuid_list_raises(self):
+        with pytest.raises(ValidationError):
+            TaskBulkInput(uuids=[])
+
+    def test_invalid_uuid_raises(self):
+        with pytest.raises(ValidationError):
+            TaskBulkInput(uuids=["12345678", "nicht-hex"])
+
+    @pytest.mark.parametrize(
+        "expr",
+        [
+            "project:X delete",
+            "+a done",
+            "1 modify",
+            "project:X del",
+            "1 mod",
+            "+a dup",
+            "1 ann",
+            "config",
+            "context",
+            "execute",
+            "calc",
+            "gc",
+            "show",
+            "news",
+            "burndown",
+            "+a SYNC",
+        ],
+    )
+    def test_filter_with_command_raises(self, expr: str):
+        with pytest.raises(ValidationError, match="Befehle"):
+            TaskBulkInput(filter_expr=expr)
+
+    @pytest.mark.parametrize(
+        "expr",
+        [
+            "project:X rc.confirmation=no",
+            "+a rc.data.location=/tmp/x",
+            "rc:/tmp/evil.taskrc +a",
+            "project:X RC.verbose:off",
+        ],
+    )
+    def test_filter_with_rc_override_raises(self, expr: str):
+        with pytest.raises(ValidationError, match="rc-Overrides"):
+            TaskBulkInput(filter_expr=expr)
+
+    @pytest.mark.parametrize("expr", ["meeting", "project:X 'zwei Wörter'", "/re.ex/", "x"])
+    def test_filter_with_free_text_raises(self, expr: str):
+        with pytest.raises(ValidationError, match="Filterterm"):
+            TaskBulkInput(filter_expr=expr)
+
+    @pytest.mark.parametrize(
+        "expr",
+        [
+            "project:Sprint12 +review",
+            "(project:A or project:B) and -waiting",
+            "1-3,7 status:pending",
+            "a1b2c3d4 a1b2c3d4-e5f6",
+            "due.before:eow +OVERDUE",
+            "'description.contains:zwei Wörter' priority:H",
+            "not +next xor urgency.over:5",
+            "project=Home",
+        ],
+    )
+    def test_filter_terms_accepted(self, expr: str):
+        assert TaskBulkInput(filter_expr=expr).filter_expr == expr
+
+    def test_unbalanced_quotes_raise(self):
+        with pytest.raises(ValidationError, match="nicht lesbar"):
+            TaskBulkInput(filter_expr="project:'X")
+
+    def test_filter_shell_injection_raises(self):
+        with pytest.raises(ValidationError):
+            TaskBulkInput(filter_expr="project:X; rm -rf /")
+
+    def test_modify_requires_change(self):
+        with pytest.raises(ValidationError, match="Änderung"):
+            TaskBulkModifyInput(filter_expr="project:X")
+        inp = TaskBulkModifyInput(filter_expr="project:X", priority="H", tags_add=["sprint"])
+        assert inp.priority == "H"
+
+    def test_modify_validates_fields(self):
+        with pytest.raises(ValidationError):
+            TaskBulkModifyInput(uuids=["12345678"], priority="X")
+
+
 class TestTaskListInput:
     """Tests für das TaskListInput Model."""
 
@@ -251,6 +406,31 @@ class TestTaskListInput:
         with pytest.raises(ValidationError):
             TaskListInput(limit=0)
 
+    def test_cursor_accepts_base64url(self):
+        assert TaskListInput(cursor="eyJ2IjoxfQ_-").cursor == "eyJ2IjoxfQ_-"
+        assert TaskListInput().paginate is False
+
+    @pytest.mark.parametrize("cursor", ["a b", "abc;rm", "x" * 513])
+    def test_invalid_cursor_raises(self, cursor: str):
+        with pytest.raises(ValidationError):
+            TaskListInput(cursor=cursor)
+
+    def test_fields(self):
+        assert TaskListInput(fields=["uuid", "due", "my_uda"]).fields == ["uuid", "due", "my_uda"]
+
+    @pytest.mark.parametrize("fields", [[], ["a b"], ["due;rm"], ["x"] * 65])
+    def test_invalid_fields_raise(self, fields: list[str]):
+        with pytest.raises(ValidationError):
+            TaskListInput(fields=fields)
+
+    @pytest.mark.parametrize("fmt", ["objects", "columnar", "table"])
+    def test_formats(self, fmt: str):
+        assert TaskListInput(format=fmt).format == fmt
+
+    def test_invalid_format_raises(self):
+        with pytest.raises(ValidationError):
+            TaskListInput(format="csv")
+
     def test_valid_filter_expr(self):
         inp = TaskListInput(filter_expr="project:Work due.before:eow")
         assert inp.filter_expr == "project:Work due.before:eow"
@@ -264,3 +444,48 @@ class TestTaskListInput:
     def test_invalid_status_raises(self, status: str):
         with pytest.raises(ValidationError):
             TaskListInput(status=status)
+
+
+class TestTaskNextInput:
+    """Tests für das TaskNextInput Model."""
+
+    def test_defaults(self):
+        inp = TaskNextInput()
+        assert inp.limit == 10
+        assert inp.filter_expr is None
+
+    @pytest.mark.parametrize("limit", [0, 101])
+    def test_limit_bounds(self, limit: int):
+        with pytest.raises(ValidationError):
+            TaskNextInput(limit=limit)
+
+    def test_filter_injection_raises(self):
+        with pytest.raises(ValidationError):
+            TaskNextInput(filter_expr="+work; rm -rf /")
+
+    def test_invalid_tag_raises(self):
+        with pytest.raises(ValidationError):
+            TaskNextInput(tags=["a b"])
+
+
+class TestTaskSearchInput:
+    """Tests für das TaskSearchInput Model."""
+
+    def test_defaults(self):
+        inp = TaskSearchInput(query="bericht")
+        assert inp.limit == 20
+        assert inp.status is None
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"query": ""},
+            {"query": "a; rm"},
+            {"query": "x", "status": "offen"},
+            {"query": "x", "project": "a|b"},
+            {"query": "x", "limit": 201},
+        ],
+    )
+    def test_invalid_raises(self, kwargs: dict):
+        with pytest.raises(ValidationError):
+            TaskSearchInput(**kwargs)
@@ -0,0 +1,293 @@
+"""Unit-Tests für die Bausteine der nativen Lesepfade.
+
+Verifiziert:
+- Konvertierung gespeicherter Attribute ins Exportformat
+- taskrc-Parsing und Auflösung von data.location
+- Urgency-Formel
+- Auswertung einfacher Filter
+"""
+
+import calendar
+import random
+from pathlib import Path
+
+import pytest
+
+from taskwarrior_mcp.filters import parse_filter
+from taskwarrior_mcp.native import (
+    build_task,
+    date_udas,
+    effective_status,
+    format_date,
+    numeric_udas,
+    parse_date,
+    read_taskrc,
+    resolve_data_location,
+    uda_names,
+)
+from taskwarrior_mcp.urgency import (
+    UrgencyCoefficients,
+    UrgencyColumns,
+    annotate_urgency,
+    compute_urgency,
+    dependency_sets,
+    due_factor,
+)
+
+NOW = calendar.timegm((2025, 3, 15, 12, 0, 0))
+UUID = "12345678-1234-1234-1234-123456789012"
+
+
+class TestDates:
+    """Tests für Datumskonvertierung."""
+
+    def test_format_date(self):
+        assert format_date(str(NOW)) == "20250315T120000Z"
+
+    @pytest.mark.parametrize("epoch", [0, 86399, 951782400, 1709251199, NOW, 4102444800])
+    def test_parse_date_roundtrip(self, epoch: int):
+        assert parse_date(format_date(epoch)) == epoch
+
+
+class TestBuildTask:
+    """Tests für build_task."""
+
+    def test_tw3_attributes(self):
+        attrs = {
+            "description": "Test",
+            "status": "pending",
+            "entry": str(NOW),
+            "tag_work": "",
+            "tag_urgent": "",
+            "dep_abcdef12-0000-0000-0000-000000000000": "",
+            f"annotation_{NOW + 60}": "zweite",
+            f"annotation_{NOW}": "erste",
+        }
+        task = build_task(UUID, attrs, task_id=3)
+        assert task["id"] == 3
+        assert task["uuid"] == UUID
+        assert task["entry"] == "20250315T120000Z"
+        assert sorted(task["tags"]) == ["urgent", "work"]
+        assert task["depends"] == ["abcdef12-0000-0000-0000-000000000000"]
+        assert [a["description"] for a in task["annotations"]] == ["erste", "zweite"]
+
+    def test_tw2_attributes(self):
+        attrs = {"description": "Test", "status": "pending", "tags": "a,b", "depends": "x,y"}
+        task = build_task(UUID, attrs)
+        assert task["tags"] == ["a", "b"]
+        assert task["depends"] == ["x", "y"]
+        assert task["id"] == 0
+
+    def test_numeric_values(self):
+        task = build_task(UUID, {"imask": "2", "estimate": "1.5"}, numeric=frozenset({"estimate"}))
+        assert task["imask"] == 2
+        assert task["estimate"] == 1.5
+
+    def test_date_udas(self):
+        attrs = {"reviewed": str(NOW), "note": str(NOW)}
+        task = build_task(UUID, attrs, dates=frozenset({"reviewed"}))
+        assert task["reviewed"] == "20250315T120000Z"
+        assert task["note"] == str(NOW)
+
+    def test_waiting_is_virtual_status(self):
+        task = build_task(UUID, {"status": "pending", "wait": str(NOW + 3600)})
+        assert task["status"] == "pending"
+        assert effective_status(task, NOW) == "waiting"
+        assert effective_status(task, NOW + 7200) == "pending"
+
+
+class TestTaskrc:
+    """Tests für read_taskrc und resolve_data_location."""
+
+    def test_reads_values_and_includes(self, tmp_path: Path):
+        (tmp_path / "extra.rc").write_text("urgency.due.coefficient=9.0\n", encoding="utf-8")
+        rc = tmp_path / ".taskrc"
+        rc.write_text(
+            "# Kommentar\ndata.location=~/tasks  # inline\ninclude extra.rc\n",
+            encoding="utf-8",
+        )
+        config = read_taskrc(rc)
+        assert config["data.location"] == "~/tasks"
+        assert config["urgency.due.coefficient"] == "9.0"
+
+    def test_missing_file_is_empty(self, tmp_path: Path):
+        assert read_taskrc(tmp_path / "missing") == {}
+
+    def test_override_wins(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv("TASKDATA", "/from/env")
+        assert resolve_data_location("/override", {"data.location": "/rc"}) == Path("/override")
+        assert resolve_data_location(None, {"data.location": "/rc"}) == Path("/from/env")
+        monkeypatch.delenv("TASKDATA")
+        assert resolve_data_location(None, {"data.location": "/rc"}) == Path("/rc")
+
+    def test_udas(self):
+        config = {
+            "uda.estimate.type": "numeric",
+            "uda.client.type": "string",
+            "uda.client.label": "Kunde",
+            "uda.reviewed.type": "date",
+        }
+        assert uda_names(config) == {"estimate", "client", "reviewed"}
+        assert numeric_udas(config) == {"estimate"}
+        assert date_udas(config) == {"reviewed"}
+
+
+class TestUrgency:
+    """Tests für die Urgency-Formel."""
+
+    def test_due_factor_bounds(self):
+        assert due_factor(NOW - 8 * 86400, NOW) == 1.0
+        assert due_factor(NOW + 30 * 86400, NOW) == 0.2
+        assert due_factor(NOW, NOW) == pytest.approx(14 * 0.8 / 21 + 0.2)
+
+    def test_typical_task(self):
+        task = {
+            "uuid": UUID,
+            "status": "pending",
+            "entry": format_date(NOW),
+            "project": "Work",
+            "priority": "H",
+            "tags": ["next"],
+        }
+        # project 1.0 + priority 6.0 + tags 0.8 + next 15.0 + age 0
+        assert compute_urgency(task, UrgencyCoefficients(), NOW) == pytest.approx(22.8)
+
+    def test_coefficients_from_config(self):
+        coefficients = UrgencyCoefficients.from_config(
+            {
+                "urgency.project.coefficient": "2.5",
+                "urgency.user.tag.home.coefficient": "-1",
+                "urgency.uda.priority.H.coefficient": "10",
+            }
+        )
+        assert coefficients.project == 2.5
+        assert coefficients.user_tags["home"] == -1.0
+        assert coefficients.user_tags["next"] == 15.0
+        assert coefficients.udas[("priority", "H")] == 10.0
+
+    def test_keyword_coefficients(self):
+        coefficients = UrgencyCoefficients.from_config(
+            {"urgency.user.keyword.Rechnung.coefficient": "3", "urgency.inherit": "on"}
+        )
+        assert coefficients.inherit is True
+        task = {"uuid": UUID, "status": "pending", "entry": format_date(NOW)}
+        assert compute_urgency({**task, "description": "Rechnung zahlen"}, coefficients, NOW) == 3.0
+        assert compute_urgency({**task, "description": "rechnung zahlen"}, coefficients, NOW) == 0.0
+        assert UrgencyCoefficients.from_config({}).inherit is False
+
+    def test_blocked_and_blocking(self):
+        task = {"uuid": UUID, "status": "pending", "entry": format_date(NOW)}
+        assert compute_urgency(task, UrgencyCoefficients(), NOW, blocked=True) == -5.0
+        assert compute_urgency(task, UrgencyCoefficients(), NOW, blocking=True) == 8.0
+
+
+class TestUrgencyColumns:
+    """UrgencyColumns liefert dieselben Werte wie compute_urgency."""
+
+    @staticmethod
+    def _tasks() -> list[dict]:
+        rng = random.Random(19)
+        tasks = []
+        for n in range(300):
+            task = {
+                "uuid": f"{n:08x}-0000-4000-8000-000000000000",
+                "status": rng.choice(["pending", "pending", "completed"]),
+                "entry": format_date(NOW - rng.randint(0, 800) * 86400),
+                "description": rng.choice(["Task", "Notiz"]),
+            }
+            if rng.random() < 0.5:
+                task["project"] = rng.choice(["Work", "Home.Garden"])
+            if tags := rng.sample(["next", "home", "x", "y"], rng.randint(0, 3)):
+                task["tags"] = tags
+            if rng.random() < 0.5:
+                task["priority"] = rng.choice("HML")
+            for attr in ("due", "scheduled"):
+                if rng.random() < 0.5:
+                    task[attr] = format_date(NOW + rng.randint(-30, 30) * 86400 + 3600)
+            if rng.random() < 0.2:
+                task["start"] = format_date(NOW)
+            if rng.random() < 0.2:
+                task["annotations"] = [{"entry": format_date(NOW), "description": "a"}]
+            if n and rng.random() < 0.2:
+                task["depends"] = [tasks[rng.randrange(n)]["uuid"]]
+            tasks.append(task)
+        return tasks
+
+    def test_matches_compute_urgency(self):
+        tasks = self._tasks()
+        coefficients = UrgencyCoefficients.from_config(
+            {
+                "urgency.user.project.Home.coefficient": "2",
+                "urgency.user.tag.home.coefficient": "-1.5",
+                "urgency.user.keyword.Task.coefficient": "0.5",
+            }
+        )
+        columns = UrgencyColumns(tasks, coefficients)
+        open_uuids, blocking = dependency_sets(tasks)
+        expected = [dict(task) for task in tasks]
+        annotate_urgency(expected, coefficients, NOW, open_uuids, blocking)
+        positions = [n for n, task in enumerate(tasks) if task["status"] == "pending"]
+        scores = columns.scores(positions, NOW)
+        for position, score in zip(positions, scores):
+            assert float(f"{score:.6g}") == pytest.approx(expected[position]["urgency"])
+
+    def test_top_is_partial_sort(self):
+        tasks = self._tasks()
+        columns = UrgencyColumns(tasks, UrgencyCoefficients())
+        positions = [n for n, task in enumerate(tasks) if task["status"] == "pending"]
+        scores = columns.scores(positions, NOW)
+        expected = sorted(zip(positions, scores), key=lambda item: -item[1])[:10]
+        assert [p for p, _ in columns.top(positions, 10, NOW)] == [p for p, _ in expected]
+
+    def test_update_row(self):
+        tasks = self._tasks()
+        columns = UrgencyColumns(tasks, UrgencyCoefficients())
+        changed = {**tasks[0], "status": "pending", "priority": "H", "tags": ["next"]}
+        columns.update(0, changed)
+        open_uuids, blocking = dependency_sets(tasks)
+        blocked = any(dep in open_uuids for dep in changed.get("depends") or ())
+        expected = compute_urgency(
+            changed, UrgencyCoefficients(), NOW, blocked, changed["uuid"] in blocking
+        )
+        assert columns.top([0], 1, NOW)[0][1] == pytest.approx(expected)
+
+
+class TestSimpleFilter:
+    """Tests für parse_filter."""
+
+    def test_supported_arguments(self):
+        query = parse_filter(["project:Work", "+urgent", "-later", "status:pending", "limit:5"])
+        assert query is not None
+        assert query.project == "Work"
+        assert query.tags_include == ["urgent"]
+        assert query.tags_exclude == ["later"]
+        assert query.limit == 5
+
+    @pytest.mark.parametrize(
+        "args",
+        [
+            ["+OVERDUE"],
+            ["due.before:quatsch"],
+            ["description.contains:mee.ing"],
+            ["freier", "text"],
+            ["project:A", "xor", "project:B"],
+        ],
+    )
+    def test_unsupported_arguments(self, args: list[str]):
+        assert parse_filter(args) is None
+
+    def test_project_matches_hierarchy(self):
+        query = parse_filter(["project:Work"])
+        assert query.matches({"uuid": UUID, "project": "Work.Sub"}, NOW)
+        assert not query.matches({"uuid": UUID, "project": "Home"}, NOW)
+        assert not query.matches({"uuid": UUID}, NOW)
+
+    def test_uuid_prefix(self):
+        query = parse_filter([UUID[:8]])
+        assert query.matches({"uuid": UUID}, NOW)
+        assert not query.matches({"uuid": "ffffffff" + UUID[8:]}, NOW)
+
+    def test_status_waiting(self):
+        waiting = {"uuid": UUID, "status": "pending", "wait": format_date(NOW + 60)}
+        assert parse_filter(["status:waiting"]).matches(waiting, NOW)
+        assert not parse_filter(["status:pending"]).matches(waiting, NOW)
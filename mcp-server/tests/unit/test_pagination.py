@@ -0,0 +1,104 @@
+"""Unit-Tests für die Cursor-Paginierung.
+
+Verifiziert:
+- Cursor-Kodierung und Ablehnung manipulierter Cursor
+- Vollständiges, überschneidungsfreies Durchblättern
+- Folgeseiten ohne erneuten Export aus demselben Snapshot
+- LRU/TTL des PageStore
+"""
+
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from taskwarrior_mcp.pagination import (
+    CursorError,
+    PageStore,
+    decode_cursor,
+    encode_cursor,
+)
+from taskwarrior_mcp.taskwarrior import TaskwarriorClient, TaskwarriorError
+from tests.conftest import FakeProcess
+
+
+def _tasks(count: int) -> list[dict]:
+    # Absteigende entry-Werte: die Sortierung muss sie umdrehen
+    return [
+        {"uuid": f"{n:08x}-0000-0000-0000-000000000000", "entry": f"2025{1300 - n:04d}T000000Z"}
+        for n in range(count)
+    ]
+
+
+class TestCursor:
+    def test_roundtrip(self):
+        cursor = encode_cursor(7, ("20250101T000000Z", "abc"), "f00")
+        assert decode_cursor(cursor) == (7, ("20250101T000000Z", "abc"), "f00")
+        assert "=" not in cursor
+
+    @pytest.mark.parametrize(
+        "cursor", ["", "kaputt", "e30", encode_cursor(1, ("a", "b"), "f")[:-4]]
+    )
+    def test_invalid_cursor(self, cursor: str):
+        with pytest.raises(CursorError):
+            decode_cursor(cursor)
+
+
+class TestPageStore:
+    def test_walks_all_tasks_once(self):
+        store = PageStore()
+        snapshot = store.add(_tasks(25), ["status:pending"])
+        page = snapshot.page(None, 10)
+        seen = [t["uuid"] for t in page["tasks"]]
+        while page["next_cursor"]:
+            snapshot, after = store.resume(page["next_cursor"], ["status:pending"])
+            page = snapshot.page(after, 10)
+            seen.extend(t["uuid"] for t in page["tasks"])
+        assert len(seen) == 25
+        assert len(set(seen)) == 25
+        assert seen[0] == _tasks(25)[-1]["uuid"]  # ältester zuerst
+
+    def test_last_page_has_no_cursor(self):
+        page = PageStore().add(_tasks(10), []).page(None, 10)
+        assert page["next_cursor"] is None
+        assert page["total"] == 10
+
+    def test_cursor_for_other_filter_rejected(self):
+        store = PageStore()
+        cursor = store.add(_tasks(5), ["project:A"]).page(None, 2)["next_cursor"]
+        with pytest.raises(CursorError, match="anderen Abfrage"):
+            store.resume(cursor, ["project:B"])
+
+    def test_evicted_snapshot_expires(self):
+        store = PageStore(max_snapshots=1)
+        cursor = store.add(_tasks(5), []).page(None, 2)["next_cursor"]
+        store.add(_tasks(5), [])
+        with pytest.raises(CursorError, match="abgelaufen"):
+            store.resume(cursor, [])
+
+    def test_ttl_expires(self):
+        store = PageStore(ttl=0.0)
+        cursor = store.add(_tasks(5), []).page(None, 2)["next_cursor"]
+        with pytest.raises(CursorError, match="abgelaufen"):
+            store.resume(cursor, [])
+
+
+class TestClientPagination:
+    async def test_following_pages_do_not_export_again(self, client: TaskwarriorClient):
+        with patch(
+            "taskwarrior_mcp.taskwarrior.asyncio.create_subprocess_exec", new_callable=AsyncMock
+        ) as mock_exec:
+            mock_exec.return_value = FakeProcess(stdout=json.dumps(_tasks(120)))
+            first = await client.export_page(["status:pending"], 50)
+            second = await client.export_page(["status:pending"], 50, first["next_cursor"])
+            third = await client.export_page(["status:pending"], 50, second["next_cursor"])
+        assert mock_exec.call_count == 1
+        # Ohne limit: exportiert werden alle Treffer
+        assert not any(arg.startswith("limit:") for arg in mock_exec.call_args.args)
+        assert [len(p["tasks"]) for p in (first, second, third)] == [50, 50, 20]
+        assert third["next_cursor"] is None
+        assert second["offset"] == 50
+
+    async def test_invalid_cursor_raises_taskwarrior_error(self, client: TaskwarriorClient):
+        with pytest.raises(TaskwarriorError, match="Ungültiger Cursor"):
+            await client.export_page(["status:pending"], 50, "kaputt")
@@ -0,0 +1,132 @@
+"""Unit-Tests für das optionale Profiling (profiling.py).
+
+Verifiziert:
+- Auswahl nach Tool und Stichprobe
+- Profil- und tracemalloc-Dateien mit Tool-Name, Argument-Hash und Dauer
+- Schwelle für langsame Aufrufe und parallele Aufrufe
+- Einbindung in _instrumented
+"""
+
+import asyncio
+import pstats
+import tracemalloc
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from taskwarrior_mcp.profiling import Profiler, args_hash
+from taskwarrior_mcp.server import _instrumented
+from tests.conftest import make_client
+
+
+async def _work() -> list[int]:
+    await asyncio.sleep(0)
+    return [n * n for n in range(1000)]
+
+
+class TestSelection:
+    """Tests für Profiler.selects."""
+
+    def test_tool_filter(self, tmp_path: Path):
+        profiler = Profiler(tmp_path, tools=frozenset({"task_list"}))
+        assert profiler.selects("task_list")
+        assert not profiler.selects("task_add")
+
+    def test_sampling(self, tmp_path: Path):
+        profiler = Profiler(tmp_path, rate=0.25)
+        with patch("taskwarrior_mcp.profiling.random.random", side_effect=[0.1, 0.9]):
+            assert profiler.selects("task_list")
+            assert not profiler.selects("task_list")
+        assert not Profiler(tmp_path, rate=0.0).selects("task_list")
+
+
+class TestArgsHash:
+    """Tests für args_hash."""
+
+    def test_stable_and_order_independent(self):
+        assert args_hash({"a": 1, "b": [2]}) == args_hash({"b": [2], "a": 1})
+        assert args_hash({"a": 1}) != args_hash({"a": 2})
+        assert len(args_hash({})) == 12
+
+
+class TestRun:
+    """Tests für Profiler.run."""
+
+    async def test_writes_profile_and_snapshot(self, tmp_path: Path):
+        profiler = Profiler(tmp_path / "profiles")
+        result = await profiler.run("task_list", {"project": "Work"}, _work)
+        assert result[3] == 9
+        files = sorted(p.name for p in (tmp_path / "profiles").iterdir())
+        assert len(files) == 2
+        prefix = f"task_list-{args_hash({'project': 'Work'})}-"
+        assert all(name.startswith(prefix) for name in files)
+        assert files[0].endswith(".prof") and files[1].endswith(".tracemalloc")
+        assert "ms-" in files[0]
+        stats = pstats.Stats(str(tmp_path / "profiles" / files[0]))
+        assert any(func[2] == "_work" for func in stats.stats)  # type: ignore[attr-defined]
+        tracemalloc.Snapshot.load(str(tmp_path / "profiles" / files[1]))
+        assert not tracemalloc.is_tracing()
+        assert profiler.stats == {"profiled": 1, "written": 1, "skipped_busy": 0}
+
+    async def test_fast_calls_not_written(self, tmp_path: Path):
+        profiler = Profiler(tmp_path / "profiles", slow=60.0, memory=False)
+        await profiler.run("task_list", {}, _work)
+        assert not (tmp_path / "profiles").exists()
+        assert profiler.stats["profiled"] == 1
+
+    async def test_errors_still_profiled(self, tmp_path: Path):
+        profiler = Profiler(tmp_path / "profiles", memory=False)
+
+        async def fail() -> None:
+            raise ValueError("kaputt")
+
+        with pytest.raises(ValueError):
+            await profiler.run("task_get", {}, fail)
+        assert [p.suffix for p in (tmp_path / "profiles").iterdir()] == [".prof"]
+
+    async def test_concurrent_calls_run_unprofiled(self, tmp_path: Path):
+        profiler = Profiler(tmp_path / "profiles", memory=False)
+        gate = asyncio.Event()
+
+        async def slow() -> str:
+            await gate.wait()
+            return "langsam"
+
+        first = asyncio.ensure_future(profiler.run("task_list", {}, slow))
+        await asyncio.sleep(0)
+        assert await profiler.run("task_get", {}, _work)
+        gate.set()
+        assert await first == "langsam"
+        assert profiler.stats["skipped_busy"] == 1
+        assert len(list((tmp_path / "profiles").iterdir())) == 1
+
+    async def test_unwritable_directory_is_logged(self, tmp_path: Path):
+        blocker = tmp_path / "datei"
+        blocker.write_text("")
+        profiler = Profiler(blocker / "profiles", memory=False)
+        assert await profiler.run("task_list", {}, _work)
+        assert profiler.stats["written"] == 0
+
+
+class TestInstrumented:
+    """_instrumented leitet Aufrufe über den Profiler."""
+
+    async def test_profiles_tool_call(self, tmp_path: Path):
+        client = make_client()
+        profiler = Profiler(tmp_path / "profiles", memory=False)
+        ctx = SimpleNamespace(
+            request_context=SimpleNamespace(
+                request_id=7, lifespan_context=SimpleNamespace(tw=client, profiler=profiler)
+            )
+        )
+
+        @_instrumented
+        async def task_demo(ctx, project: str | None = None) -> int:
+            return len(await _work())
+
+        assert await task_demo(ctx, project="Work") == 1000
+        [written] = (tmp_path / "profiles").iterdir()
+        assert written.name.startswith("task_demo-")
+        assert client.server_metrics()["tools"]["task_demo"]["calls"] == 1
@@ -0,0 +1,179 @@
+"""Unit-Tests für den nativen TW3-Lesepfad (SQLiteReplicaReader).
+
+Baut eine TaskChampion-kompatible SQLite-Datenbank in tmp_path und prüft,
+dass der Reader dieselben Dicts wie `task export` liefert und der Client
+bei nicht unterstützten Filtern auf `task` zurückfällt.
+"""
+
+import json
+import sqlite3
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from taskwarrior_mcp.config import Settings
+from taskwarrior_mcp.filters import parse_filter
+from taskwarrior_mcp.native import NativeReadError
+from taskwarrior_mcp.replica import REPLICA_FILENAME, SQLiteReplicaReader
+from taskwarrior_mcp.taskwarrior import TaskwarriorClient
+from taskwarrior_mcp.urgency import UrgencyCoefficients
+from tests.conftest import FakeProcess
+
+UUID_A = "aaaaaaaa-0000-0000-0000-000000000001"
+UUID_B = "bbbbbbbb-0000-0000-0000-000000000002"
+UUID_C = "cccccccc-0000-0000-0000-000000000003"
+
+
+def make_replica(path: Path, tasks: dict[str, dict[str, str]], working_set: list[str]) -> None:
+    """Legt eine Replica mit dem Schema von TaskChampion an."""
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE tasks (uuid STRING PRIMARY KEY, data STRING)")
+    conn.execute("CREATE TABLE working_set (id INTEGER PRIMARY KEY, uuid STRING)")
+    for uuid, attrs in tasks.items():
+        conn.execute("INSERT INTO tasks VALUES (?, ?)", (uuid, json.dumps(attrs)))
+    for index, uuid in enumerate(working_set, start=1):
+        conn.execute("INSERT INTO working_set VALUES (?, ?)", (index, uuid))
+    conn.commit()
+    conn.close()
+
+
+@pytest.fixture()
+def replica(tmp_path: Path) -> Path:
+    entry = str(int(time.time()) - 86400)
+    tasks = {
+        UUID_A: {
+            "description": "Bericht schreiben",
+            "status": "pending",
+            "entry": entry,
+            "project": "Work.Reports",
+            "priority": "H",
+            "tag_urgent": "",
+            "dep_" + UUID_B: "",
+        },
+        UUID_B: {
+            "description": "Daten sammeln",
+            "status": "pending",
+            "entry": entry,
+            "project": "Work",
+        },
+        UUID_C: {
+            "description": "Alter Task",
+            "status": "completed",
+            "entry": entry,
+            "end": entry,
+        },
+    }
+    path = tmp_path / REPLICA_FILENAME
+    make_replica(path, tasks, [UUID_B, UUID_A])
+    return path
+
+
+@pytest.fixture()
+def reader(replica: Path) -> SQLiteReplicaReader:
+    return SQLiteReplicaReader(replica, UrgencyCoefficients())
+
+
+class TestReplicaReader:
+    """Tests für SQLiteReplicaReader.export."""
+
+    def test_pending_in_working_set_order(self, reader: SQLiteReplicaReader):
+        tasks = reader.export(parse_filter(["status:pending"]))
+        assert [t["uuid"] for t in tasks] == [UUID_B, UUID_A]
+        assert [t["id"] for t in tasks] == [1, 2]
+
+    def test_export_format(self, reader: SQLiteReplicaReader):
+        (task,) = reader.export(parse_filter([UUID_A]))
+        assert task["tags"] == ["urgent"]
+        assert task["depends"] == [UUID_B]
+        assert len(task["entry"]) == 16 and task["entry"].endswith("Z")
+        assert isinstance(task["urgency"], float)
+
+    def test_blocked_and_blocking_urgency(self, reader: SQLiteReplicaReader):
+        tasks = {t["uuid"]: t for t in reader.export(parse_filter(["status:pending"]))}
+        age = 2.0 / 365
+        # A: Projekt 1.0 + Priorität H 6.0 + ein Tag 0.8 + blockiert -5.0
+        assert tasks[UUID_A]["urgency"] == pytest.approx(2.8 + age, abs=1e-4)
+        # B: Projekt 1.0 + blockiert A 8.0
+        assert tasks[UUID_B]["urgency"] == pytest.approx(9.0 + age, abs=1e-4)
+
+    def test_completed_has_id_zero(self, reader: SQLiteReplicaReader):
+        (task,) = reader.export(parse_filter(["status:completed"]))
+        assert task["uuid"] == UUID_C
+        assert task["id"] == 0
+
+    def test_uuid_prefix(self, reader: SQLiteReplicaReader):
+        (task,) = reader.export(parse_filter([UUID_C[:8]]))
+        assert task["description"] == "Alter Task"
+
+    def test_project_and_limit(self, reader: SQLiteReplicaReader):
+        tasks = reader.export(parse_filter(["project:Work", "status:pending", "limit:1"]))
+        assert [t["uuid"] for t in tasks] == [UUID_B]
+
+    def test_tag_filter(self, reader: SQLiteReplicaReader):
+        tasks = reader.export(parse_filter(["-urgent", "status:pending"]))
+        assert [t["uuid"] for t in tasks] == [UUID_B]
+
+    def test_missing_database_raises(self, tmp_path: Path):
+        reader = SQLiteReplicaReader(tmp_path / "missing.sqlite3", UrgencyCoefficients())
+        with pytest.raises(NativeReadError):
+            reader.export(parse_filter([]))
+
+    def test_opens_read_only(self, reader: SQLiteReplicaReader):
+        reader.export(parse_filter([]))
+        with pytest.raises(sqlite3.OperationalError):
+            reader._connection().execute("DELETE FROM tasks")
+
+
+class TestClientNativeReads:
+    """TaskwarriorClient nutzt den Reader und fällt bei Bedarf auf task zurück."""
+
+    @pytest.fixture()
+    def client(self, replica: Path) -> TaskwarriorClient:
+        settings = Settings(
+            task_binary="task",
+            task_data=str(replica.parent),
+            taskrc=str(replica.parent / "missing.taskrc"),
+            native_reads=True,
+        )
+        with patch("taskwarrior_mcp.taskwarrior.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="3.1.0\n", stderr="")
+            return TaskwarriorClient(settings)
+
+    async def test_supported_filter_spawns_no_process(self, client: TaskwarriorClient):
+        with patch(
+            "taskwarrior_mcp.taskwarrior.asyncio.create_subprocess_exec", new_callable=AsyncMock
+        ) as mock_exec:
+            tasks = await client.export_tasks(["status:pending", "limit:50"])
+            task = await client.get_task(UUID_A[:8])
+        mock_exec.assert_not_called()
+        assert len(tasks) == 2
+        assert task["uuid"] == UUID_A
+
+    async def test_unsupported_filter_falls_back(self, client: TaskwarriorClient):
+        with patch(
+            "taskwarrior_mcp.taskwarrior.asyncio.create_subprocess_exec", new_callable=AsyncMock
+        ) as mock_exec:
+            mock_exec.return_value = FakeProcess(stdout="[]")
+            await client.export_tasks(["+OVERDUE"])
+        mock_exec.assert_awaited_once()
+
+    def test_uses_replica_for_taskwarrior_3(self, client: TaskwarriorClient):
+        assert isinstance(client._native, SQLiteReplicaReader)
+
+    def test_date_udas_from_taskrc(self, replica: Path):
+        taskrc = replica.parent / ".taskrc"
+        taskrc.write_text("uda.reviewed.type=date\nuda.estimate.type=numeric\n")
+        settings = Settings(
+            task_binary="task",
+            task_data=str(replica.parent),
+            taskrc=str(taskrc),
+            native_reads=True,
+        )
+        with patch("taskwarrior_mcp.taskwarrior.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="3.1.0\n", stderr="")
+            client = TaskwarriorClient(settings)
+        assert isinstance(client._native, SQLiteReplicaReader)
+        assert client._native.dates == {"reviewed"}
+        assert client._native.numeric == {"estimate"}
@@ -0,0 +1,115 @@
+"""Unit-Tests für die strukturierten Übersichten.
+
+Verifiziert:
+- Projektbaum mit offenen und erledigten Tasks, Eltern zählen Kinder mit
+- Tag-Häufigkeiten, häufigste zuerst
+- Statuszählung (inkl. waiting), Durchschnittsalter und Bearbeitungsdauer
+"""
+
+from taskwarrior_mcp.native import format_date
+from taskwarrior_mcp.reports import project_tree, tag_counts, task_stats
+
+NOW = 1_750_000_000.0
+DAY = 86400
+
+
+def _task(n: int, status: str = "pending", **extra) -> dict:
+    return {
+        "uuid": f"{n:08x}-0000-0000-0000-000000000000",
+        "description": f"Task {n}",
+        "status": status,
+        "entry": format_date(NOW - 10 * DAY),
+        **extra,
+    }
+
+
+class TestProjectTree:
+    def test_hierarchy_and_counts(self):
+        tasks = [
+            _task(1, project="Work.Reports"),
+            _task(2, project="Work"),
+            _task(3, "completed", project="Work.Reports"),
+            _task(4, "deleted", project="Work"),
+            _task(5, project="Home"),
+            _task(6),
+        ]
+        result = project_tree(tasks)
+        home, work = result["projects"]
+        assert (home["name"], home["pending"], home["completed"]) == ("Home", 1, 0)
+        assert (work["pending"], work["completed"]) == (2, 1)
+        reports = work["children"][0]
+        assert (reports["name"], reports["project"]) == ("Reports", "Work.Reports")
+        assert (reports["pending"], reports["completed"]) == (1, 1)
+        assert result["without_project"] == {"pending": 1, "completed": 0}
+
+    def test_empty(self):
+        assert project_tree([]) == {
+            "projects": [],
+            "without_project": {"pending": 0, "completed": 0},
+        }
+
+
+class TestTagCounts:
+    def test_frequencies(self):
+        tasks = [
+            _task(1, tags=["b", "a"]),
+            _task(2, tags=["b"]),
+            _task(3, "completed", tags=["c"]),
+            _task(4),
+        ]
+        result = tag_counts(tasks)
+        assert [(t["tag"], t["pending"], t["completed"]) for t in result["tags"]] == [
+            ("b", 2, 0),
+            ("a", 1, 0),
+            ("c", 0, 1),
+        ]
+        assert result["untagged_pending"] == 1
+
+
+class TestTaskStats:
+    def test_status_counts(self):
+        tasks = [
+            _task(1),
+            _task(2, wait=format_date(NOW + DAY)),
+            _task(3, "waiting"),
+            _task(4, "completed", end=format_date(NOW - 6 * DAY)),
+            _task(5, "deleted"),
+            _task(6, "recurring"),
+        ]
+        stats = task_stats(tasks, NOW)
+        assert stats["total"] == 6
+        assert stats["status"] == {
+            "pending": 1,
+            "waiting": 2,
+            "recurring": 1,
+            "completed": 1,
+            "deleted": 1,
+        }
+
+    def test_ages(self):
+        tasks = [
+            _task(1),
+            _task(2, entry=format_date(NOW - 20 * DAY)),
+            _task(3, "completed", end=format_date(NOW - 6 * DAY)),
+        ]
+        stats = task_stats(tasks, NOW)
+        assert stats["average_age_days"] == 15.0
+        assert stats["average_completion_days"] == 4.0
+        assert stats["oldest_entry"] == format_date(NOW - 20 * DAY)
+
+    def test_active_overdue_blocked(self):
+        blocker = _task(1, start=format_date(NOW - DAY), due=format_date(NOW - DAY))
+        tasks = [
+            blocker,
+            _task(2, depends=[blocker["uuid"]], tags=["x"], annotations=[{"description": "n"}]),
+            _task(3, "completed"),
+        ]
+        stats = task_stats(tasks, NOW)
+        assert (stats["active"], stats["overdue"], stats["blocked"]) == (1, 1, 1)
+        assert (stats["annotations"], stats["tagged"], stats["unique_tags"]) == (1, 1, 1)
+
+    def test_empty(self):
+        stats = task_stats([], NOW)
+        assert stats["total"] == 0
+        assert stats["average_age_days"] is None
+        assert stats["oldest_entry"] is None
@@ -0,0 +1,79 @@
+"""Unit-Tests für die Aufbereitung von Task-Listen (responses)."""
+
+import calendar
+import json
+
+from taskwarrior_mcp.responses import project, to_columnar
+
+TASKS = [
+    {
+        "id": 1,
+        "uuid": "aaaaaaaa-0000-0000-0000-000000000001",
+        "description": "Bericht",
+        "due": "20250315T000000Z",
+        "annotations": [{"entry": "20250101T000000Z", "description": "lang " * 50}],
+        "urgency": 8.2,
+    },
+    {"id": 2, "uuid": "aaaaaaaa-0000-0000-0000-000000000002", "description": "Ohne Datum"},
+]
+
+
+class TestProject:
+    def test_keeps_requested_fields_in_order(self):
+        result = project(TASKS, ["description", "uuid", "due"])
+        assert list(result[0]) == ["description", "uuid", "due"]
+        assert result[1] == {"description": "Ohne Datum", "uuid": TASKS[1]["uuid"]}
+
+    def test_does_not_modify_input(self):
+        project(TASKS, ["uuid"])
+        assert "annotations" in TASKS[0]
+
+    def test_shrinks_payload(self):
+        full = len(json.dumps(TASKS))
+        assert len(json.dumps(project(TASKS, ["uuid", "description"]))) * 2 < full
+
+
+class TestColumnar:
+    def test_columns_and_rows(self):
+        tasks = [
+            {"uuid": "a", "description": "A", "tags": ["x", "y"], "due": "20250315T000000Z"},
+            {"uuid": "b", "description": "B", "priority": "H"},
+        ]
+        result = to_columnar(tasks)
+        assert result["columns"] == ["uuid", "description", "tags", "due", "priority"]
+        epoch = calendar.timegm((2025, 3, 15, 0, 0, 0))
+        assert result["rows"] == [
+            ["a", "A", "x y", epoch, None],
+            ["b", "B", None, None, "H"],
+        ]
+
+    def test_requested_fields_and_annotations(self):
+        result = to_columnar(TASKS, ["uuid", "annotations"])
+        assert result["columns"] == ["uuid", "annotations"]
+        entry = calendar.timegm((2025, 1, 1, 0, 0, 0))
+        assert result["rows"][0][1] == [[entry, "lang " * 50]]
+        assert result["rows"][1][1] is None
+
+    def test_smaller_than_objects(self):
+        tasks = [
+            {
+                "id": n,
+                "uuid": f"{n:08x}-0000-0000-0000-000000000000",
+                "description": f"Task {n}",
+                "status": "pending",
+                "entry": "20250101T000000Z",
+                "modified": "20250102T000000Z",
+                "urgency": 1.5,
+            }
+            for n in range(200)
+        ]
+        result = to_columnar(tasks)
+        assert "bytes" not in result
+        objects = len(json.dumps(tasks, separators=(",", ":")))
+        columnar = len(json.dumps(result, separators=(",", ":")))
+        assert columnar < 0.7 * objects
+
+    def test_empty_list(self):
+        result = to_columnar([])
+        assert result["rows"] == []
+        assert result["columns"] == []
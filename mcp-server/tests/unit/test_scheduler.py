@@ -0,0 +1,173 @@
+"""Unit-Tests für den ExecutionScheduler.
+
+Verifiziert:
+- Begrenzung paralleler Lesezugriffe
+- Serialisierte Schreibzugriffe
+- Vorrang von Lesezugriffen vor Hintergrundarbeit
+- Gemeinsamer Scheduler pro data.location
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from taskwarrior_mcp.scheduler import ExecutionScheduler, get_scheduler
+from taskwarrior_mcp.taskwarrior import TaskwarriorClient, TaskwarriorError
+from tests.conftest import FakeProcess, make_client
+
+
+async def _track(scheduler: ExecutionScheduler, access: str, log: list, name: str, hold: float):
+    async with scheduler.slot(access):
+        log.append(("start", name))
+        await asyncio.sleep(hold)
+        log.append(("end", name))
+
+
+def _max_parallel(log: list) -> int:
+    running = peak = 0
+    for event, _ in log:
+        running += 1 if event == "start" else -1
+        peak = max(peak, running)
+    return peak
+
+
+class TestReadSlots:
+    """Tests für den Pool paralleler Lesezugriffe."""
+
+    async def test_reads_are_bounded(self):
+        scheduler = ExecutionScheduler(max_parallel_reads=2)
+        log: list = []
+        await asyncio.gather(*(_track(scheduler, "read", log, f"r{i}", 0.02) for i in range(6)))
+        assert _max_parallel(log) == 2
+
+    async def test_reads_run_in_parallel(self):
+        scheduler = ExecutionScheduler(max_parallel_reads=4)
+        log: list = []
+        await asyncio.gather(*(_track(scheduler, "read", log, f"r{i}", 0.02) for i in range(4)))
+        assert _max_parallel(log) == 4
+
+    async def test_cancelled_waiter_does_not_leak_slot(self):
+        scheduler = ExecutionScheduler(max_parallel_reads=1)
+        log: list = []
+        holder = asyncio.create_task(_track(scheduler, "read", log, "holder", 0.05))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(_track(scheduler, "read", log, "waiter", 0))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        await holder
+        # Slot muss wieder frei sein
+        await asyncio.wait_for(_track(scheduler, "read", log, "after", 0), timeout=1)
+        assert scheduler.stats()["running"] == 0
+
+
+class TestWriteQueue:
+    """Tests für die Single-Writer-Queue."""
+
+    async def test_writes_are_serialized(self):
+        scheduler = ExecutionScheduler(max_parallel_reads=4)
+        log: list = []
+        await asyncio.gather(*(_track(scheduler, "write", log, f"w{i}", 0.01) for i in range(4)))
+        assert _max_parallel(log) == 1
+        # FIFO-Reihenfolge bleibt erhalten
+        assert [name for event, name in log if event == "start"] == ["w0", "w1", "w2", "w3"]
+
+    async def test_reads_run_while_writing(self):
+        scheduler = ExecutionScheduler(max_parallel_reads=2)
+        log: list = []
+        await asyncio.gather(
+            _track(scheduler, "write", log, "w", 0.03),
+            _track(scheduler, "read", log, "r", 0.01),
+        )
+        assert _max_parallel(log) == 2
+
+    async def test_full_write_queue_raises(self):
+        scheduler = ExecutionScheduler(max_parallel_reads=1, max_pending_writes=1)
+        log: list = []
+        first = asyncio.create_task(_track(scheduler, "write", log, "w0", 0.03))
+        await asyncio.sleep(0)
+        with pytest.raises(RuntimeError, match="Schreibzugriffe"):
+            await _track(scheduler, "write", log, "w1", 0)
+        await first
+
+
+class TestPriorities:
+    """Lesezugriffe haben Vorrang vor Hintergrundarbeit."""
+
+    async def test_read_overtakes_waiting_background(self):
+        scheduler = ExecutionScheduler(max_parallel_reads=1)
+        log: list = []
+        holder = asyncio.create_task(_track(scheduler, "read", log, "holder", 0.02))
+        await asyncio.sleep(0)
+        background = asyncio.create_task(_track(scheduler, "background", log, "sync", 0))
+        await asyncio.sleep(0)
+        read = asyncio.create_task(_track(scheduler, "read", log, "read", 0))
+        await asyncio.gather(holder, background, read)
+        starts = [name for event, name in log if event == "start"]
+        assert starts == ["holder", "read", "sync"]
+
+
+class TestRegistry:
+    """Ein Scheduler pro data.location/taskrc."""
+
+    def test_same_location_shares_scheduler(self, tmp_path):
+        data = str(tmp_path / "data")
+        assert get_scheduler(data, None) is get_scheduler(data + "/", None)
+
+    def test_different_locations_get_own_scheduler(self, tmp_path):
+        assert get_scheduler(str(tmp_path / "a"), None) is not get_scheduler(
+            str(tmp_path / "b"), None
+        )
+
+
+class TestClientIntegration:
+    """Der TaskwarriorClient plant Befehle über den Scheduler ein."""
+
+    @pytest.fixture()
+    def client(self, tmp_path) -> TaskwarriorClient:
+        return make_client(
+            task_data=str(tmp_path / "data"), max_parallel_reads=2, max_pending_writes=0
+        )
+
+    async def test_parallel_exports_are_bounded(self, client: TaskwarriorClient):
+        running = peak = 0
+
+        async def fake_exec(*args, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            proc = FakeProcess(stdout="[]", delay=0.02)
+            original_wait = proc.wait
+
+            # export_tasks streamt stdout und wartet dann auf das Prozessende
+            async def wait():
+                nonlocal running
+                finished = proc.returncode is not None
+                try:
+                    return await original_wait()
+                finally:
+                    if not finished:
+                        running -= 1
+
+            proc.wait = wait
+            return proc
+
+        with patch(
+            "taskwarrior_mcp.taskwarrior.asyncio.create_subprocess_exec",
+            new=AsyncMock(side_effect=fake_exec),
+        ):
+            # Unterschiedliche Filter: identische Exporte würde Single-Flight bündeln
+            await asyncio.gather(*(client.export_tasks([f"project:P{n}"]) for n in range(6)))
+        assert peak == 2
+
+    async def test_busy_write_queue_raises_taskwarrior_error(self, client: TaskwarriorClient):
+        client._scheduler.max_pending_writes = 1
+        with patch(
+            "taskwarrior_mcp.taskwarrior.asyncio.create_subprocess_exec",
+            new=AsyncMock(side_effect=lambda *a, **kw: FakeProcess(delay=0.03)),
+        ):
+            first = asyncio.create_task(client._run(["x", "done"], access="write"))
+            await asyncio.sleep(0)
+            with pytest.raises(TaskwarriorError):
+                await client._run(["y", "done"], access="write")
+            await first
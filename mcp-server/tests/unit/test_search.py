@@ -0,0 +1,114 @@
+"""Unit-Tests für den Volltextindex (search.py).
+
+Verifiziert:
+- Tokenisierung und Trigramme
+- Exakte, Teilstring-, Präfix- und unscharfe Treffer
+- Ranking (Beschreibung vor Annotation, exakt vor Teilstring)
+- Inkrementelles Nachführen per update()
+"""
+
+import random
+
+import pytest
+
+from taskwarrior_mcp.search import SearchIndex, tokenize, trigrams
+
+
+def _task(description: str, *notes: str) -> dict:
+    task: dict = {"description": description}
+    if notes:
+        task["annotations"] = [{"entry": "20250101T000000Z", "description": n} for n in notes]
+    return task
+
+
+TASKS = [
+    _task("Meeting mit Anna vorbereiten"),
+    _task("Steuererklärung abgeben", "Belege vom Meeting sammeln"),
+    _task("Team-Meetings planen"),
+    _task("Fahrrad reparieren"),
+    _task("Einkaufen: Milch, Brot"),
+]
+
+
+class TestTokenize:
+    """Tests für tokenize und trigrams."""
+
+    def test_words_casefolded(self):
+        assert tokenize("Team-Meeting: Straße, 2x!") == ["team", "meeting", "strasse", "2x"]
+
+    def test_trigrams(self):
+        assert trigrams("ab") == {"  a", " ab", "ab "}
+        assert trigrams("abcd", padded=False) == {"abc", "bcd"}
+
+
+class TestSearch:
+    """Tests für SearchIndex.search."""
+
+    @pytest.fixture()
+    def index(self) -> SearchIndex:
+        return SearchIndex(TASKS)
+
+    def test_all_terms_required(self, index: SearchIndex):
+        assert index.search("meeting anna").keys() == {0}
+        assert index.search("meeting fahrrad") == {}
+
+    def test_case_insensitive(self, index: SearchIndex):
+        assert index.search("FAHRRAD").keys() == {3}
+
+    def test_annotations_are_searched(self, index: SearchIndex):
+        assert index.search("belege").keys() == {1}
+
+    def test_description_ranks_above_annotation(self, index: SearchIndex):
+        scores = index.search("meeting")
+        assert scores.keys() == {0, 1, 2}
+        assert scores[0] > scores[1]
+
+    def test_exact_ranks_above_substring(self, index: SearchIndex):
+        scores = index.search("meeting")
+        assert scores[0] > scores[2]  # "meetings" enthält den Begriff nur
+
+    def test_substring(self, index: SearchIndex):
+        assert index.search("erklär").keys() == {1}
+        assert index.search("paRIER").keys() == {3}
+
+    def test_short_prefix(self, index: SearchIndex):
+        assert index.search("fa").keys() == {3}
+
+    def test_typo(self, index: SearchIndex):
+        assert index.search("fahrad").keys() == {3}
+        assert index.search("meetign").keys() == {0, 1, 2}
+
+    def test_no_words(self, index: SearchIndex):
+        assert index.search("  ,;  ") == {}
+        assert SearchIndex([]).search("x") == {}
+
+
+class TestUpdate:
+    """update() entspricht einem Neuaufbau."""
+
+    def test_update_matches_rebuild(self):
+        rng = random.Random(20)
+        words = ["alpha", "beta", "gamma", "delta", "epsilon", "zeta", "eta", "theta"]
+        tasks = [
+            _task(" ".join(rng.sample(words, 3)), *rng.sample(words, rng.randint(0, 2)))
+            for _ in range(50)
+        ]
+        index = SearchIndex(tasks)
+        for _ in range(200):
+            position = rng.randrange(len(tasks))
+            new = _task(" ".join(rng.sample(words + ["neu"], 2)), *rng.sample(words, 1))
+            index.update(position, tasks[position], new)
+            tasks[position] = new
+        rebuilt = SearchIndex(tasks)
+        assert index.postings == rebuilt.postings
+        assert index.total_length == rebuilt.total_length
+        assert index.documents == rebuilt.documents
+        for query in ["alpha", "neu", "et", "thet", "gama beta"]:
+            assert index.search(query) == pytest.approx(rebuilt.search(query))
+
+    def test_removed_token_is_gone(self):
+        index = SearchIndex([_task("Einmalig")])
+        index.update(0, _task("Einmalig"), _task("Anders"))
+        assert index.search("einmalig") == {}
+        assert index.search("ein") == {}
+        assert index.search("anders").keys() == {0}
@@ -0,0 +1,139 @@
+"""Unit-Tests für Single-Flight.
+
+Verifiziert:
+- Gleichzeitige identische Aufrufe teilen sich eine Ausführung
+- Fehler erreichen alle Wartenden
+- Abbruch eines Aufrufers beendet die Ausführung nicht für die anderen
+- forget() nach Schreibzugriffen
+- TaskwarriorClient: identische Exporte starten nur einen Prozess
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from taskwarrior_mcp.singleflight import SingleFlight
+from taskwarrior_mcp.taskwarrior import TaskwarriorClient
+from tests.conftest import patch_exec
+
+
+class _Slow:
+    def __init__(self, result: object = "ok", error: Exception | None = None) -> None:
+        self.calls = 0
+        self.result = result
+        self.error = error
+
+    async def __call__(self) -> object:
+        self.calls += 1
+        await asyncio.sleep(0.02)
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class TestSingleFlight:
+    async def test_concurrent_calls_share_one_execution(self):
+        flights = SingleFlight()
+        fn = _Slow()
+        results = await asyncio.gather(*(flights.run("k", fn) for _ in range(5)))
+        assert fn.calls == 1
+        assert results == [("ok", True)] * 5
+        assert flights.stats.as_dict() == {"executed": 1, "shared": 4}
+        assert flights.in_flight == 0
+
+    async def test_single_call_is_not_shared(self):
+        assert await SingleFlight().run("k", _Slow()) == ("ok", False)
+
+    async def test_different_keys_run_separately(self):
+        flights = SingleFlight()
+        fn = _Slow()
+        await asyncio.gather(flights.run("a", fn), flights.run("b", fn))
+        assert fn.calls == 2
+
+    async def test_sequential_calls_run_again(self):
+        flights = SingleFlight()
+        fn = _Slow()
+        await flights.run("k", fn)
+        await flights.run("k", fn)
+        assert fn.calls == 2
+
+    async def test_error_reaches_all_waiters(self):
+        flights = SingleFlight()
+        fn = _Slow(error=RuntimeError("kaputt"))
+        results = await asyncio.gather(
+            flights.run("k", fn), flights.run("k", fn), return_exceptions=True
+        )
+        assert fn.calls == 1
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        flights = SingleFlight()
+        fn = _Slow()
+        first = asyncio.ensure_future(flights.run("k", fn))
+        second = asyncio.ensure_future(flights.run("k", fn))
+        await asyncio.sleep(0)
+        first.cancel()
+        assert await second == ("ok", True)
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    async def test_execution_cancelled_when_all_callers_leave(self):
+        flights = SingleFlight()
+        started = asyncio.Event()
+
+        async def forever() -> None:
+            started.set()
+            await asyncio.sleep(10)
+
+        caller = asyncio.ensure_future(flights.run("k", forever))
+        await started.wait()
+        task = flights._calls["k"].task
+        caller.cancel()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert task.cancelled()
+
+    async def test_forget_starts_new_execution(self):
+        flights = SingleFlight()
+        fn = _Slow()
+        first = asyncio.ensure_future(flights.run("k", fn))
+        await asyncio.sleep(0)
+        flights.forget()
+        second = asyncio.ensure_future(flights.run("k", fn))
+        await asyncio.gather(first, second)
+        assert fn.calls == 2
+
+
+@pytest.fixture()
+def mock_exec():
+    tasks = [{"uuid": "aaaaaaaa-0000-0000-0000-000000000001", "description": "A"}]
+    with patch_exec(stdout=json.dumps(tasks), delay=0.02) as mock:
+        yield mock
+
+
+class TestClientSingleFlight:
+    async def test_identical_reads_spawn_once(
+        self, client: TaskwarriorClient, mock_exec: AsyncMock
+    ):
+        results = await asyncio.gather(
+            *(client.export_tasks(["project:A"]) for _ in range(4)),
+            client.get_task("aaaaaaaa"),
+            client.get_task("aaaaaaaa"),
+        )
+        assert mock_exec.call_count == 2
+        assert client.singleflight_stats() == {"executed": 2, "shared": 4, "in_flight": 0}
+        # Jeder Aufrufer bekommt eigene Dicts
+        results[0][0]["description"] = "geändert"
+        assert results[1][0]["description"] == "A"
+
+    async def test_read_after_write_does_not_join(
+        self, client: TaskwarriorClient, mock_exec: AsyncMock
+    ):
+        before = asyncio.ensure_future(client.export_tasks(["project:A"]))
+        await asyncio.sleep(0)
+        await client._run(["aaaaaaaa", "done"], access="write")
+        await asyncio.gather(before, client.export_tasks(["project:A"]))
+        exports = [c for c in mock_exec.call_args_list if list(c.args)[-1] == "export"]
+        assert len(exports) == 2
@@ -0,0 +1,188 @@
+"""Unit-Tests für den Hintergrund-Sync.
+
+Verifiziert:
+- Eine Serie von Schreibzugriffen führt zu genau einem Sync nach der Ruhezeit
+- Fehlschläge werden mit wachsender Pause wiederholt und im Status gemeldet
+- close() synchronisiert ausstehende Änderungen, höchstens bis zum Timeout
+- Ein erfolgreiches task_sync erledigt ausstehende Änderungen
+- TaskwarriorClient: Schreibzugriffe warten nicht auf `task sync`
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from taskwarrior_mcp.server import task_sync
+from taskwarrior_mcp.sync import SyncWorker
+from taskwarrior_mcp.taskwarrior import TaskwarriorClient, TaskwarriorError
+from tests.conftest import FakeProcess, make_client
+
+
+class _Remote:
+    """Zählt Syncs; die ersten `fail` Aufrufe schlagen fehl."""
+
+    def __init__(self, fail: int = 0) -> None:
+        self.calls = 0
+        self.fail = fail
+
+    async def __call__(self) -> None:
+        self.calls += 1
+        if self.calls <= self.fail:
+            raise TaskwarriorError("Server nicht erreichbar")
+
+
+class TestSyncWorker:
+    async def test_burst_is_coalesced(self):
+        remote = _Remote()
+        worker = SyncWorker(remote, debounce=0.05)
+        for _ in range(5):
+            worker.mark_dirty()
+            await asyncio.sleep(0.01)
+        assert remote.calls == 0
+        await asyncio.wait_for(worker.wait_idle(), 1)
+        assert remote.calls == 1
+        status = worker.status()
+        assert (status["dirty"], status["last_status"], status["syncs"]) == (False, "ok", 1)
+        assert status["last_success"] is not None
+        await worker.close()
+
+    async def test_failure_backs_off_and_retries(self):
+        remote = _Remote(fail=2)
+        worker = SyncWorker(remote, debounce=0.01)
+        worker.mark_dirty()
+        await asyncio.sleep(0.05)
+        status = worker.status()
+        assert status["last_status"] == "error"
+        assert status["last_error"] == "Server nicht erreichbar"
+        assert status["dirty"] is True
+        assert status["retry_in"] is not None
+        await asyncio.wait_for(worker.wait_idle(), 2)
+        status = worker.status()
+        assert remote.calls == 3
+        assert (status["failures"], status["consecutive_failures"]) == (2, 0)
+        assert status["last_status"] == "ok"
+        await worker.close()
+
+    async def test_backoff_is_capped(self):
+        remote = _Remote(fail=100)
+        worker = SyncWorker(remote, debounce=0.01, max_backoff=0.02)
+        worker.mark_dirty()
+        await asyncio.sleep(0.3)
+        # Ohne Obergrenze (0.01, 0.02, 0.04, ...) wären es nach 0.3s nur etwa 5 Versuche
+        assert worker.failures > 8
+        remote.fail = 0
+        await asyncio.wait_for(worker.wait_idle(), 1)
+        await worker.close()
+
+    async def test_close_flushes_pending_changes(self):
+        remote = _Remote()
+        worker = SyncWorker(remote, debounce=60)
+        worker.mark_dirty()
+        await worker.close()
+        assert remote.calls == 1
+        assert worker.status()["dirty"] is False
+
+    async def test_close_gives_up_after_timeout(self):
+        async def unreachable() -> None:
+            await asyncio.sleep(60)
+
+        worker = SyncWorker(unreachable, debounce=60)
+        worker.mark_dirty()
+        await asyncio.wait_for(worker.close(timeout=0.05), 1)
+        assert worker.status()["dirty"] is True
+
+    async def test_os_error_is_retried(self):
+        calls = []
+
+        async def flaky() -> None:
+            calls.append(1)
+            if len(calls) == 1:
+                raise OSError("Netzwerk weg")
+
+        worker = SyncWorker(flaky, debounce=0.01)
+        worker.mark_dirty()
+        await asyncio.wait_for(worker.wait_idle(), 1)
+        assert (len(calls), worker.failures) == (2, 1)
+        await worker.close()
+
+    async def test_close_without_changes_does_nothing(self):
+        remote = _Remote()
+        await SyncWorker(remote).close()
+        assert remote.calls == 0
+
+
+@pytest.fixture()
+def client() -> TaskwarriorClient:
+    return make_client(auto_sync=True, sync_debounce=0.05)
+
+
+def _commands(mock_exec: AsyncMock) -> list[str]:
+    return [list(call.args)[-1] for call in mock_exec.call_args_list]
+
+
+class TestClientAutoSync:
+    async def test_writes_do_not_wait_for_sync(
+        self, client: TaskwarriorClient, mock_exec: AsyncMock
+    ):
+        await client.complete_task("aaaaaaaa")
+        await client.delete_task("bbbbbbbb")
+        assert _commands(mock_exec) == ["done", "delete"]
+        await asyncio.wait_for(client._sync.wait_idle(), 1)
+        assert _commands(mock_exec) == ["done", "delete", "sync"]
+        await client.close()
+
+    async def test_all_writes_mark_dirty(self, client: TaskwarriorClient, mock_exec: AsyncMock):
+        await client._run(["aaaaaaaa", "start"], access="write")
+        assert client.sync_status()["dirty"] is True
+        await client.close()
+        assert _commands(mock_exec)[-1] == "sync"
+
+    async def test_reads_and_explicit_sync_do_not_mark_dirty(
+        self, client: TaskwarriorClient, mock_exec: AsyncMock
+    ):
+        await client._run(["export"])
+        await client.sync()
+        assert client.sync_status()["dirty"] is False
+
+    async def test_explicit_sync_clears_dirty(
+        self, client: TaskwarriorClient, mock_exec: AsyncMock
+    ):
+        await client._run(["aaaaaaaa", "start"], access="write")
+        assert client.sync_status()["dirty"] is True
+        await client.sync()
+        status = client.sync_status()
+        assert (status["dirty"], status["last_status"]) == (False, "ok")
+        await client.close()
+        assert _commands(mock_exec) == ["start", "sync"]
+
+    async def test_failed_explicit_sync_keeps_dirty(
+        self, client: TaskwarriorClient, mock_exec: AsyncMock
+    ):
+        await client._run(["aaaaaaaa", "start"], access="write")
+        mock_exec.side_effect = lambda *a, **kw: FakeProcess(returncode=2, stderr="kein Server")
+        with pytest.raises(TaskwarriorError):
+            await client.sync()
+        assert client.sync_status()["dirty"] is True
+        await client._sync.close(timeout=0.1)
+
+    async def test_task_sync_tool_clears_dirty(
+        self, client: TaskwarriorClient, mock_exec: AsyncMock
+    ):
+        ctx = SimpleNamespace(
+            request_context=SimpleNamespace(
+                request_id=1, lifespan_context=SimpleNamespace(tw=client, profiler=None)
+            )
+        )
+        await client._run(["aaaaaaaa", "start"], access="write")
+        mock_exec.side_effect = lambda *a, **kw: FakeProcess(stdout="Sync successful.\n")
+        result = await task_sync(ctx)
+        assert result["output"] == "Sync successful."
+        assert (result["status"]["dirty"], result["status"]["last_status"]) == (False, "ok")
+        assert client.server_metrics()["tools"]["task_sync"]["calls"] == 1
+        await client.close()
+        assert _commands(mock_exec) == ["start", "sync"]
+
+    def test_disabled_status(self):
+        assert make_client().sync_status() == {"enabled": False}
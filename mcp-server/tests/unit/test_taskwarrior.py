@@ -1,19 +1,24 @@
 """Unit-Tests für TaskwarriorClient.
 
-Alle Tests mocken subprocess.run und verifizieren:
-- shell=False wird IMMER verwendet
+Alle Tests mocken subprocess.run (Versionsprüfung) bzw.
+asyncio.create_subprocess_exec (Befehle) und verifizieren:
+- shell=False bzw. exec ohne Shell wird IMMER verwendet
 - Korrekte Argument-Listen werden aufgebaut
 - Exit-Code 1 ist kein Fehler
 - Exit-Code ≥2 wirft TaskwarriorError
 """
 
+import asyncio
 import json
-from unittest.mock import MagicMock, patch
+from contextlib import aclosing
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from taskwarrior_mcp.config import Settings
 from taskwarrior_mcp.taskwarrior import TaskwarriorClient, TaskwarriorError
+from tests.conftest import FakeProcess, make_client
 
 
 @pytest.fixture()
@@ -34,6 +39,22 @@ def mock_subprocess():
         yield mock_run
 
 
+@pytest.fixture()
+def mock_exec():
+    """Mockt asyncio.create_subprocess_exec für alle Taskwarrior-Befehle."""
+    with patch(
+        "taskwarrior_mcp.taskwarrior.asyncio.create_subprocess_exec",
+        new_callable=AsyncMock,
+    ) as mock:
+        mock.return_value = FakeProcess(returncode=0, stdout="[]")
+        yield mock
+
+
+def _cmd(call) -> list[str]:
+    """Extrahiert die Argumentliste aus einem create_subprocess_exec-Aufruf."""
+    return list(call.args)
+
+
 @pytest.fixture()
 def client(settings: Settings, mock_subprocess: MagicMock) -> TaskwarriorClient:
     """Erstellt einen TaskwarriorClient mit gemocktem subprocess."""
@@ -41,7 +62,7 @@ def client(settings: Settings, mock_subprocess: MagicMock) -> TaskwarriorClient:
 
 
 class TestShellFalse:
-    """Verifiziert dass shell=False IMMER verwendet wird."""
+    """Verifiziert dass niemals eine Shell verwendet wird."""
 
     def test_verify_installation_uses_shell_false(self, settings: Settings):
         with patch("taskwarrior_mcp.taskwarrior.subprocess.run") as mock_run:
@@ -52,81 +73,190 @@ class TestShellFalse:
                     "subprocess.run muss shell=False verwenden!"
                 )
 
-    def test_run_uses_shell_false(self, client: TaskwarriorClient, mock_subprocess: MagicMock):
-        mock_subprocess.return_value = MagicMock(returncode=0, stdout="[]", stderr="")
-        client._run(["export"])
-        # Letzter Aufruf (export, nicht --version)
-        last_call = mock_subprocess.call_args
-        assert last_call.kwargs.get("shell") is False
+    async def test_run_uses_exec_without_shell(
+        self, client: TaskwarriorClient, mock_exec: AsyncMock
+    ):
+        with patch("taskwarrior_mcp.taskwarrior.asyncio.create_subprocess_shell") as mock_shell:
+            await client._run(["export"])
+            mock_shell.assert_not_called()
+        cmd = _cmd(mock_exec.call_args)
+        assert cmd[0] == "task"
+        assert cmd[-1] == "export"
+
+    async def test_run_does_not_inherit_stdin(
+        self, client: TaskwarriorClient, mock_exec: AsyncMock
+    ):
+        """stdin des Servers ist der MCP-Kanal und darf nicht vererbt werden."""
+        await client._run(["export"])
+        assert mock_exec.call_args.kwargs.get("stdin") == asyncio.subprocess.DEVNULL
 
-    def test_export_tasks_uses_shell_false(self, client: TaskwarriorClient, mock_subprocess: MagicMock):
-        mock_subprocess.return_value = MagicMock(returncode=0, stdout="[]", stderr="")
-        client.export_tasks([])
-        last_call = mock_subprocess.call_args
-        assert last_call.kwargs.get("shell") is False
+    async def test_export_tasks_uses_exec(self, client: TaskwarriorClient, mock_exec: AsyncMock):
+        await client.export_tasks([])
+        assert mock_exec.await_count == 1
+        assert "export" in _cmd(mock_exec.call_args)
 
 
 class TestExitCodes:
     """Verifiziert korrektes Verhalten bei verschiedenen Exit-Codes."""
 
-    def test_exit_code_0_is_success(self, client: TaskwarriorClient, mock_subprocess: MagicMock):
-        mock_subprocess.return_value = MagicMock(returncode=0, stdout="[]", stderr="")
-        result = client.export_tasks()
+    async def test_exit_code_0_is_success(self, client: TaskwarriorClient, mock_exec: AsyncMock):
+        mock_exec.return_value = FakeProcess(returncode=0, stdout="[]")
+        result = await client.export_tasks()
         assert result == []
 
-    def test_exit_code_1_is_not_an_error(self, client: TaskwarriorClient, mock_subprocess: MagicMock):
+    async def test_exit_code_1_is_not_an_error(
+        self, client: TaskwarriorClient, mock_exec: AsyncMock
+    ):
         """Exit-Code 1 = 'no matching tasks' — kein Fehler!"""
-        mock_subprocess.return_value = MagicMock(returncode=1, stdout="", stderr="")
+        mock_exec.return_value = FakeProcess(returncode=1, stdout="")
         # Darf KEINE Exception werfen
-        result = client.export_tasks()
+        result = await client.export_tasks()
         assert result == []
 
-    def test_exit_code_2_raises_error(self, client: TaskwarriorClient, mock_subprocess: MagicMock):
-        mock_subprocess.return_value = MagicMock(
-            returncode=2, stdout="", stderr="Taskwarrior config error"
-        )
+    async def test_exit_code_2_raises_error(self, client: TaskwarriorClient, mock_exec: AsyncMock):
+        mock_exec.return_value = FakeProcess(returncode=2, stderr="Taskwarrior config error")
         with pytest.raises(TaskwarriorError, match="config error"):
-            client.export_tasks()
+            await client.export_tasks()
 
-    def test_exit_code_higher_raises_error(self, client: TaskwarriorClient, mock_subprocess: MagicMock):
-        mock_subprocess.return_value = MagicMock(
-            returncode=5, stdout="", stderr="Fatal error"
-        )
+    async def test_exit_code_higher_raises_error(
+        self, client: TaskwarriorClient, mock_exec: AsyncMock
+    ):
+        mock_exec.return_value = FakeProcess(returncode=5, stderr="Fatal error")
         with pytest.raises(TaskwarriorError):
-            client._run(["some", "command"])
+            await client._run(["some", "command"])
 
 
 class TestExportTasks:
     """Tests für export_tasks."""
 
-    def test_returns_empty_list_on_empty_output(
-        self, client: TaskwarriorClient, mock_subprocess: MagicMock
+    async def test_returns_empty_list_on_empty_output(
+        self, client: TaskwarriorClient, mock_exec: AsyncMock
     ):
-        mock_subprocess.return_value = MagicMock(returncode=0, stdout="", stderr="")
-        assert client.export_tasks() == []
+        mock_exec.return_value = FakeProcess(returncode=0, stdout="")
+        assert await client.export_tasks() == []
 
-    def test_parses_json_output(self, client: TaskwarriorClient, mock_subprocess: MagicMock):
+    async def test_parses_json_output(self, client: TaskwarriorClient, mock_exec: AsyncMock):
         tasks = [{"uuid": "abc123", "description": "Test-Task", "status": "pending"}]
-        mock_subprocess.return_value = MagicMock(
-            returncode=0, stdout=json.dumps(tasks), stderr=""
-        )
-        result = client.export_tasks()
+        mock_exec.return_value = FakeProcess(returncode=0, stdout=json.dumps(tasks))
+        result = await client.export_tasks()
         assert result == tasks
 
-    def test_appends_export_to_args(self, client: TaskwarriorClient, mock_subprocess: MagicMock):
-        mock_subprocess.return_value = MagicMock(returncode=0, stdout="[]", stderr="")
-        client.export_tasks(["status:pending"])
-        last_call = mock_subprocess.call_args
-        cmd = last_call.args[0]
+    async def test_decodes_utf8_output(self, client: TaskwarriorClient, mock_exec: AsyncMock):
+        tasks = [{"uuid": "abc123", "description": "Äpfel kaufen", "status": "pending"}]
+        mock_exec.return_value = FakeProcess(
+            returncode=0, stdout=json.dumps(tasks, ensure_ascii=False)
+        )
+        result = await client.export_tasks()
+        assert result[0]["description"] == "Äpfel kaufen"
+
+    async def test_appends_export_to_args(self, client: TaskwarriorClient, mock_exec: AsyncMock):
+        await client.export_tasks(["status:pending"])
+        cmd = _cmd(mock_exec.call_args)
         assert "export" in cmd
         assert "status:pending" in cmd
 
+    async def test_invalid_json_returns_empty_list(
+        self, client: TaskwarriorClient, mock_exec: AsyncMock
+    ):
+        mock_exec.return_value = FakeProcess(returncode=0, stdout="[{kaputt")
+        assert await client.export_tasks() == []
+
+
+class TestStreamExport:
+    """export_tasks liest stdout stückweise und bricht beim limit ab."""
+
+    def _tasks(self, count: int) -> list[dict]:
+        return [
+            {"id": n, "uuid": f"{n:08x}-0000-0000-0000-000000000000", "description": "x" * 40}
+            for n in range(1, count + 1)
+        ]
+
+    async def test_stops_reading_at_limit(self, client: TaskwarriorClient, mock_exec: AsyncMock):
+        output = json.dumps(self._tasks(1000))
+        proc = FakeProcess(returncode=0, stdout=output, chunk_size=512)
+        mock_exec.return_value = proc
+        result = await client.export_tasks(["status:completed", "limit:5"])
+        assert [t["id"] for t in result] == [1, 2, 3, 4, 5]
+        # Prozess beendet, Rest der Ausgabe nie gelesen
+        assert proc.killed
+        assert proc.stdout.bytes_read < len(output) // 10
+
+    async def test_reads_everything_without_limit(
+        self, client: TaskwarriorClient, mock_exec: AsyncMock
+    ):
+        proc = FakeProcess(returncode=0, stdout=json.dumps(self._tasks(50)), chunk_size=7)
+        mock_exec.return_value = proc
+        result = await client.export_tasks(["status:completed"])
+        assert len(result) == 50
+        assert not proc.killed
+
+    async def test_early_close_kills_process(self, client: TaskwarriorClient, mock_exec: AsyncMock):
+        proc = FakeProcess(returncode=0, stdout=json.dumps(self._tasks(100)), chunk_size=256)
+        mock_exec.return_value = proc
+        async with aclosing(client.stream_export([])) as stream:
+            async for task in stream:
+                assert task["id"] == 1
+                break
+        assert proc.killed
+        assert client._scheduler.stats()["running"] == 0
+
+    async def test_error_exit_code(self, client: TaskwarriorClient, mock_exec: AsyncMock):
+        mock_exec.return_value = FakeProcess(returncode=2, stderr="Filter ungültig")
+        with pytest.raises(TaskwarriorError, match="Filter ungültig"):
+            await client.export_tasks(["due.before:quatsch"])
+
+    async def test_timeout_kills_process(self, client: TaskwarriorClient, mock_exec: AsyncMock):
+        proc = FakeProcess(stdout="[]", delay=5)
+        mock_exec.return_value = proc
+        client.timeout = 0.05
+        with pytest.raises(TaskwarriorError, match="Timeout"):
+            await client.export_tasks()
+        assert proc.killed
+
+
+class TestExportJson:
+    """export_json reicht die Ausgabe von `task export` als Text durch."""
+
+    def _output(self, count: int) -> str:
+        tasks = [{"id": n, "description": f"Äpfel {n}"} for n in range(1, count + 1)]
+        return "[\n" + ",\n".join(json.dumps(t, ensure_ascii=False) for t in tasks) + "\n]\n"
+
+    async def test_passthrough(self, client: TaskwarriorClient, mock_exec: AsyncMock):
+        output = self._output(3)
+        mock_exec.return_value = FakeProcess(stdout=output, chunk_size=10)
+        text = await client.export_json(["status:pending"])
+        assert text == output.strip()
+        assert _cmd(mock_exec.call_args)[-1] == "export"
+        export = client.server_metrics()["commands"]["export"]
+        assert (export["spawns"], export["failures"]) == (1, 0)
+
+    async def test_limit_truncates_and_kills(self, client: TaskwarriorClient, mock_exec: AsyncMock):
+        output = self._output(1000)
+        proc = FakeProcess(stdout=output, chunk_size=512)
+        mock_exec.return_value = proc
+        text = await client.export_json(["status:pending", "limit:5"])
+        assert [t["id"] for t in json.loads(text)] == [1, 2, 3, 4, 5]
+        assert proc.killed
+
+    async def test_other_layout_is_parsed(self, client: TaskwarriorClient, mock_exec: AsyncMock):
+        tasks = [{"id": 1, "description": "Äpfel"}]
+        mock_exec.side_effect = [
+            FakeProcess(stdout=json.dumps(tasks)),
+            FakeProcess(stdout=json.dumps(tasks)),
+        ]
+        assert json.loads(await client.export_json([])) == tasks
+
+    async def test_error_exit_code(self, client: TaskwarriorClient, mock_exec: AsyncMock):
+        mock_exec.return_value = FakeProcess(returncode=2, stderr="Filter ungültig")
+        with pytest.raises(TaskwarriorError, match="Filter ungültig"):
+            await client.export_json(["due.before:quatsch"])
+
 
 class TestAddTask:
     """Tests für add_task."""
 
-    def test_add_task_returns_task_with_uuid(
-        self, client: TaskwarriorClient, mock_subprocess: MagicMock
+    async def test_add_task_returns_task_with_uuid(
+        self, client: TaskwarriorClient, mock_exec: AsyncMock
     ):
         new_task = {
             "uuid": "12345678-1234-1234-1234-123456789012",
@@ -134,55 +264,439 @@ class TestAddTask:
             "status": "pending",
         }
         # add gibt nichts zurück, dann +LATEST export gibt Task zurück
-        mock_subprocess.side_effect = [
-            MagicMock(returncode=0, stdout="", stderr=""),       # add
-            MagicMock(returncode=0, stdout=json.dumps([new_task]), stderr=""),  # +LATEST export
+        mock_exec.side_effect = [
+            FakeProcess(returncode=0, stdout=""),  # add
+            FakeProcess(returncode=0, stdout=json.dumps([new_task])),  # +LATEST export
         ]
-        result = client.add_task("Neuer Task")
+        result = await client.add_task("Neuer Task")
         assert result["uuid"] == "12345678-1234-1234-1234-123456789012"
 
-    def test_add_task_includes_project(self, client: TaskwarriorClient, mock_subprocess: MagicMock):
-        mock_subprocess.side_effect = [
-            MagicMock(returncode=0, stdout="", stderr=""),
-            MagicMock(returncode=0, stdout="[]", stderr=""),
+    async def test_add_task_uses_created_uuid(
+        self, client: TaskwarriorClient, mock_exec: AsyncMock
+    ):
+        uuid = "12345678-1234-1234-1234-123456789012"
+        new_task = {"uuid": uuid, "description": "Neuer Task", "status": "pending"}
+        mock_exec.side_effect = [
+            FakeProcess(returncode=0, stdout=f"Created task {uuid}.\n"),
+            FakeProcess(returncode=0, stdout=json.dumps([new_task])),
         ]
-        client.add_task("Task", project="Arbeit")
-        # call_args_list[0] = _verify_installation, [1] = add, [2] = +LATEST export
-        first_run = mock_subprocess.call_args_list[1]
-        cmd = first_run.args[0]
+        result = await client.add_task("Neuer Task")
+        assert result == new_task
+        add_cmd = _cmd(mock_exec.call_args_list[0])
+        # new-uuid muss nach rc.verbose=nothing stehen, damit es gewinnt
+        assert add_cmd.index("rc.verbose=new-uuid") > add_cmd.index("rc.verbose=nothing")
+        get_cmd = _cmd(mock_exec.call_args_list[1])
+        assert get_cmd[-2:] == [uuid, "export"]
+        assert "+LATEST" not in get_cmd
+        assert mock_exec.call_count == 2
+
+    async def test_add_task_recurring_template_uuid(
+        self, client: TaskwarriorClient, mock_exec: AsyncMock
+    ):
+        uuid = "abcdef01-1234-1234-1234-123456789012"
+        mock_exec.side_effect = [
+            FakeProcess(returncode=0, stdout=f"Created task {uuid} (recurrence template).\n"),
+            FakeProcess(returncode=0, stdout=json.dumps([{"uuid": uuid}])),
+        ]
+        result = await client.add_task("Miete", due="eom", recur="monthly")
+        assert result["uuid"] == uuid
+
+    async def test_add_task_reports_uuid_if_readback_fails(
+        self, client: TaskwarriorClient, mock_exec: AsyncMock
+    ):
+        uuid = "12345678-1234-1234-1234-123456789012"
+        mock_exec.side_effect = [
+            FakeProcess(returncode=0, stdout=f"Created task {uuid}.\n"),
+            FakeProcess(returncode=0, stdout="[]"),
+        ]
+        result = await client.add_task("Neuer Task")
+        assert result["uuid"] == uuid
+        assert "error" in result
+
+    async def test_add_task_includes_project(self, client: TaskwarriorClient, mock_exec: AsyncMock):
+        mock_exec.side_effect = [
+            FakeProcess(returncode=0, stdout=""),
+            FakeProcess(returncode=0, stdout="[]"),
+        ]
+        await client.add_task("Task", project="Arbeit")
+        # call_args_list[0] = add, [1] = +LATEST export
+        cmd = _cmd(mock_exec.call_args_list[0])
         assert "project:Arbeit" in cmd
 
-    def test_add_task_includes_tags(self, client: TaskwarriorClient, mock_subprocess: MagicMock):
-        mock_subprocess.side_effect = [
-            MagicMock(returncode=0, stdout="", stderr=""),
-            MagicMock(returncode=0, stdout="[]", stderr=""),
+    async def test_add_task_includes_tags(self, client: TaskwarriorClient, mock_exec: AsyncMock):
+        mock_exec.side_effect = [
+            FakeProcess(returncode=0, stdout=""),
+            FakeProcess(returncode=0, stdout="[]"),
         ]
-        client.add_task("Task", tags=["urgent", "work"])
-        first_run = mock_subprocess.call_args_list[1]
-        cmd = first_run.args[0]
+        await client.add_task("Task", tags=["urgent", "work"])
+        cmd = _cmd(mock_exec.call_args_list[0])
         assert "+urgent" in cmd
         assert "+work" in cmd
 
 
+class _LazyExport(FakeProcess):
+    """FakeProcess, dessen stdout erst beim ersten Lesen berechnet wird."""
+
+    def __init__(self, produce) -> None:
+        super().__init__(returncode=0)
+        original_read = self.stdout.read
+
+        async def read(n: int = -1) -> bytes:
+            if not self.stdout.bytes_read:
+                self.stdout._data = json.dumps(produce()).encode("utf-8")
+            return await original_read(n)
+
+        self.stdout.read = read
+
+
+class TestAddTasks:
+    """Tests für add_tasks (Batch via task import)."""
+
+    async def test_single_import_and_single_readback(
+        self, client: TaskwarriorClient, mock_exec: AsyncMock
+    ):
+        records = [
+            {"description": f"Task {n}", "project": "Plan", "tags": ["x"], "due": f"2030-01-0{n}"}
+            for n in range(1, 4)
+        ]
+        imported: list[dict] = []
+
+        class ImportProcess(FakeProcess):
+            async def communicate(self, input=None):
+                imported.extend(json.loads(input))
+                return await super().communicate(input)
+
+        # Readback liefert die importierten Tasks in umgekehrter Reihenfolge
+        mock_exec.side_effect = [
+            ImportProcess(returncode=0),
+            _LazyExport(lambda: list(reversed(imported))),
+        ]
+        results = await client.add_tasks(records)
+
+        assert mock_exec.call_count == 2
+        import_call = mock_exec.call_args_list[0]
+        assert _cmd(import_call)[-1] == "import"
+        assert import_call.kwargs["stdin"] == asyncio.subprocess.PIPE
+        readback = _cmd(mock_exec.call_args_list[1])
+        assert readback[-1] == "export"
+        assert [r["description"] for r in results] == ["Task 1", "Task 2", "Task 3"]
+        assert imported[0]["status"] == "pending"
+        assert imported[0]["due"].startswith("2030010")
+        assert imported[0]["tags"] == ["x"]
+        assert len({r["uuid"] for r in results}) == 3
+        assert {r["uuid"] for r in results} <= set(readback)
+
+    async def test_missing_after_import_is_reported(
+        self, client: TaskwarriorClient, mock_exec: AsyncMock
+    ):
+        mock_exec.side_effect = [
+            FakeProcess(returncode=2, stderr="Import fehlgeschlagen"),
+            FakeProcess(returncode=0, stdout="[]"),
+        ]
+        results = await client.add_tasks([{"description": "A"}])
+        assert results == [{"error": "Import fehlgeschlagen"}]
+
+    async def test_unresolvable_records_use_task_add(
+        self, client: TaskwarriorClient, mock_exec: AsyncMock
+    ):
+        uuid = "12345678-1234-1234-1234-123456789012"
+        mock_exec.side_effect = [
+            FakeProcess(returncode=0),  # import
+            FakeProcess(returncode=0, stdout="[]"),  # readback
+            FakeProcess(returncode=0, stdout=f"Created task {uuid}."),  # add (eow)
+            FakeProcess(returncode=0, stdout=json.dumps([{"uuid": uuid, "description": "B"}])),
+        ]
+        results = await client.add_tasks([{"description": "A"}, {"description": "B", "due": "eow"}])
+        add_cmd = _cmd(mock_exec.call_args_list[2])
+        assert "add" in add_cmd
+        assert "due:eow" in add_cmd
+        assert results[1]["uuid"] == uuid
+        assert "error" in results[0]
+
+    async def test_recurring_records_use_task_add(
+        self, client: TaskwarriorClient, mock_exec: AsyncMock
+    ):
+        mock_exec.side_effect = [
+            FakeProcess(returncode=0, stdout=""),
+            FakeProcess(returncode=0, stdout="[]"),
+        ]
+        await client.add_tasks([{"description": "Miete", "due": "2030-01-01", "recur": "monthly"}])
+        assert "import" not in _cmd(mock_exec.call_args_list[0])
+
+
+def _task(n: int, status: str = "pending", **extra) -> dict:
+    return {
+        "uuid": f"{n:08x}-0000-0000-0000-000000000000",
+        "description": f"Task {n}",
+        "status": status,
+        **extra,
+    }
+
+
+class TestBulk:
+    """Tests für bulk (done/delete/modify über viele Tasks)."""
+
+    async def test_done_by_filter_runs_one_command(
+        self, client: TaskwarriorClient, mock_exec: AsyncMock
+    ):
+        before = [_task(1), _task(2), _task(3, status="completed")]
+        after = [_task(1, status="completed"), _task(2, status="completed")]
+        mock_exec.side_effect = [
+            FakeProcess(returncode=0, stdout=json.dumps(before)),
+            FakeProcess(returncode=0, stdout=""),
+            FakeProcess(returncode=0, stdout=json.dumps(after)),
+        ]
+        result = await client.bulk("done", ["project:Sprint"])
+        assert mock_exec.call_count == 3
+        assert _cmd(mock_exec.call_args_list[0])[-2:] == ["project:Sprint", "export"]
+        done_cmd = _cmd(mock_exec.call_args_list[1])
+        assert done_cmd[-3:] == [before[0]["uuid"], before[1]["uuid"], "done"]
+        assert result["matched"] == 3
+        assert result["affected"] == [before[0]["uuid"], before[1]["uuid"]]
+        assert result["skipped"] == [{"uuid": before[2]["uuid"], "reason": "Status completed"}]
+        assert result["tasks"][0]["before"] == {"status": "pending"}
+        assert result["tasks"][0]["after"] == {"status": "completed"}
+
+    async def test_dry_run_does_not_write(self, client: TaskwarriorClient, mock_exec: AsyncMock):
+        mock_exec.return_value = FakeProcess(returncode=0, stdout=json.dumps([_task(1)]))
+        result = await client.bulk("delete", ["+old"], dry_run=True)
+        assert mock_exec.call_count == 1
+        assert result["dry_run"] is True
+        assert result["affected"] == [_task(1)["uuid"]]
+        assert result["tasks"] == [
+            {"uuid": _task(1)["uuid"], "description": "Task 1", "status": "pending"}
+        ]
+
+    async def test_modify_arguments_and_summary(
+        self, client: TaskwarriorClient, mock_exec: AsyncMock
+    ):
+        before = [_task(1, tags=["a"], urgency=1.0)]
+        after = [_task(1, tags=["a", "sprint"], priority="H", urgency=7.0)]
+        mock_exec.side_effect = [
+            FakeProcess(returncode=0, stdout=json.dumps(before)),
+            FakeProcess(returncode=0, stdout=""),
+            FakeProcess(returncode=0, stdout=json.dumps(after)),
+        ]
+        result = await client.bulk(
+            "modify", [before[0]["uuid"]], modifications={"priority": "H", "tags_add": ["sprint"]}
+        )
+        cmd = _cmd(mock_exec.call_args_list[1])
+        assert cmd[-4:] == [before[0]["uuid"], "modify", "priority:H", "+sprint"]
+        summary = result["tasks"][0]
+        assert summary["before"] == {"tags": ["a"]}
+        assert summary["after"] == {"priority": "H", "tags": ["a", "sprint"]}
+
+    async def test_nothing_matched(self, client: TaskwarriorClient, mock_exec: AsyncMock):
+        mock_exec.return_value = FakeProcess(returncode=1, stdout="")
+        result = await client.bulk("done", ["project:Leer"])
+        assert mock_exec.call_count == 1
+        assert result["affected"] == []
+
+    async def test_empty_selector_raises(self, client: TaskwarriorClient, mock_exec: AsyncMock):
+        with pytest.raises(TaskwarriorError):
+            await client.bulk("delete", [])
+        mock_exec.assert_not_called()
+
+    async def test_max_tasks(self, client: TaskwarriorClient, mock_exec: AsyncMock):
+        tasks = [_task(n) for n in range(1, 5)]
+        mock_exec.return_value = FakeProcess(returncode=0, stdout=json.dumps(tasks))
+        with pytest.raises(TaskwarriorError, match="maximal 3"):
+            await client.bulk("done", ["project:Gross"], max_tasks=3)
+        assert mock_exec.call_count == 1
+
+
+class TestCheckFields:
+    """Tests für check_fields (Projektion in task_list/task_get)."""
+
+    def test_core_fields(self, client: TaskwarriorClient):
+        assert client.check_fields(["uuid", "description", "due", "uuid"]) == [
+            "uuid",
+            "description",
+            "due",
+        ]
+
+    def test_unknown_field_raises(self, client: TaskwarriorClient):
+        with pytest.raises(TaskwarriorError, match="Unbekannte Felder: estimat"):
+            client.check_fields(["uuid", "estimat"])
+
+    def test_udas_from_taskrc(self, tmp_path, mock_subprocess: MagicMock):
+        rc = tmp_path / ".taskrc"
+        rc.write_text("uda.estimate.type=numeric\n", encoding="utf-8")
+        client = TaskwarriorClient(Settings(task_binary="task", taskrc=str(rc)))
+        assert client.check_fields(["estimate"]) == ["estimate"]
+
+
 class TestGetTask:
     """Tests für get_task."""
 
-    def test_get_task_raises_if_not_found(
-        self, client: TaskwarriorClient, mock_subprocess: MagicMock
+    async def test_get_task_raises_if_not_found(
+        self, client: TaskwarriorClient, mock_exec: AsyncMock
     ):
-        mock_subprocess.return_value = MagicMock(returncode=1, stdout="", stderr="")
+        mock_exec.return_value = FakeProcess(returncode=1, stdout="")
         with pytest.raises(TaskwarriorError, match="nicht gefunden"):
-            client.get_task("nonexistent-uuid")
+            await client.get_task("nonexistent-uuid")
 
-    def test_get_task_returns_task(self, client: TaskwarriorClient, mock_subprocess: MagicMock):
+    async def test_get_task_returns_task(self, client: TaskwarriorClient, mock_exec: AsyncMock):
         task = {"uuid": "abc123", "description": "Test"}
-        mock_subprocess.return_value = MagicMock(
-            returncode=0, stdout=json.dumps([task]), stderr=""
-        )
-        result = client.get_task("abc123")
+        mock_exec.return_value = FakeProcess(returncode=0, stdout=json.dumps([task]))
+        result = await client.get_task("abc123")
         assert result == task
 
 
+class TestReports:
+    """Tests für get_projects/get_tags/get_stats ohne Snapshot-Cache."""
+
+    async def test_three_reports_share_one_export(
+        self, client: TaskwarriorClient, mock_exec: AsyncMock
+    ):
+        tasks = [_task(1, project="A", tags=["x"]), _task(2, status="completed", project="A")]
+        mock_exec.side_effect = lambda *a, **kw: FakeProcess(stdout=json.dumps(tasks), delay=0.05)
+        projects, tags, stats = await asyncio.gather(
+            client.get_projects(), client.get_tags(), client.get_stats()
+        )
+        assert mock_exec.call_count == 1
+        assert _cmd(mock_exec.call_args)[-1] == "export"
+        assert projects["projects"][0]["completed"] == 1
+        assert tags["tags"][0]["tag"] == "x"
+        assert stats["total"] == 2
+
+    async def test_write_discards_shared_export(
+        self, client: TaskwarriorClient, mock_exec: AsyncMock
+    ):
+        await client.get_stats()
+        await client._run(["1", "done"], access="write")
+        await client.get_stats()
+        exports = [c for c in mock_exec.call_args_list if _cmd(c)[-1] == "export"]
+        assert len(exports) == 2
+
+    async def test_write_during_export_not_shared(
+        self, client: TaskwarriorClient, mock_exec: AsyncMock
+    ):
+        def export_with_concurrent_write(*args, **kwargs) -> FakeProcess:
+            client._reports.invalidate()
+            return FakeProcess(stdout=json.dumps([_task(1)]))
+
+        mock_exec.side_effect = export_with_concurrent_write
+        await client.get_stats()
+        assert client._reports.get() is None
+
+    async def test_modify_patches_shared_export(
+        self, client: TaskwarriorClient, mock_exec: AsyncMock
+    ):
+        tasks = [_task(1, description="Angebot schreiben"), _task(2)]
+        changed = {**tasks[0], "description": "Rechnung schreiben"}
+
+        def fake_exec(*args, **kwargs) -> FakeProcess:
+            if args[-1] != "export":
+                return FakeProcess()
+            return FakeProcess(stdout=json.dumps([changed] if tasks[0]["uuid"] in args else tasks))
+
+        mock_exec.side_effect = fake_exec
+        assert (await client.search_tasks("angebot", 5))["total"] == 1
+        await client.modify_task(tasks[0]["uuid"], description="Rechnung schreiben")
+        result = await client.search_tasks("rechnung", 5)
+        assert [t["uuid"] for t in result["tasks"]] == [tasks[0]["uuid"]]
+        assert (await client.search_tasks("angebot", 5))["total"] == 0
+        # Ein vollständiger Export; danach nur noch der geänderte Task
+        exports = [_cmd(c)[-2] for c in mock_exec.call_args_list if _cmd(c)[-1] == "export"]
+        assert exports.count(tasks[0]["uuid"]) == 1 and len(exports) == 2
+        assert client._reports.stats.updates == 1
+
+    async def test_report_ttl_zero_disables_sharing(
+        self, settings: Settings, mock_subprocess: MagicMock, mock_exec: AsyncMock
+    ):
+        client = TaskwarriorClient(settings.model_copy(update={"report_ttl": 0.0}))
+        await client.get_stats()
+        await client.get_tags()
+        exports = [c for c in mock_exec.call_args_list if _cmd(c)[-1] == "export"]
+        assert len(exports) == 2
+        assert client._reports.stats.loads == 0
+
+
+class TestNextTasks:
+    """Tests für next_tasks (task_next)."""
+
+    async def test_ranks_pending_by_urgency(self, client: TaskwarriorClient, mock_exec: AsyncMock):
+        tasks = [
+            _task(1, priority="L"),
+            _task(2, priority="H", tags=["next"]),
+            _task(3, status="completed", priority="H"),
+            _task(4, wait="29991231T000000Z"),
+            _task(5, priority="M"),
+        ]
+        mock_exec.return_value = FakeProcess(stdout=json.dumps(tasks))
+        result = await client.next_tasks(2)
+        assert [t["description"] for t in result["tasks"]] == ["Task 2", "Task 5"]
+        assert result["total"] == 3
+        # project 0 + tags 0.8 + next 15 + priority 6 + age 2 (kein entry)
+        assert result["tasks"][0]["urgency"] == pytest.approx(23.8)
+        assert _cmd(mock_exec.call_args)[-1] == "export"
+
+    async def test_filter_with_or_keeps_status(
+        self, client: TaskwarriorClient, mock_exec: AsyncMock
+    ):
+        tasks = [_task(1, project="A"), _task(2, status="completed", project="B")]
+        mock_exec.return_value = FakeProcess(stdout=json.dumps(tasks))
+        result = await client.next_tasks(5, ["project:A", "or", "project:B"])
+        assert [t["description"] for t in result["tasks"]] == ["Task 1"]
+
+    async def test_unsupported_filter_uses_task_urgency(
+        self, client: TaskwarriorClient, mock_exec: AsyncMock
+    ):
+        tasks = [_task(1, urgency=1.5), _task(2, urgency=9.0), _task(3, urgency=4.0)]
+        mock_exec.return_value = FakeProcess(stdout=json.dumps(tasks))
+        result = await client.next_tasks(2, ["+OVERDUE"])
+        assert [t["urgency"] for t in result["tasks"]] == [9.0, 4.0]
+        assert _cmd(mock_exec.call_args)[-5:] == ["status:pending", "(", "+OVERDUE", ")", "export"]
+
+    async def test_inherit_uses_task_urgency(self, tmp_path: Path, mock_exec: AsyncMock):
+        taskrc = tmp_path / ".taskrc"
+        taskrc.write_text("urgency.inherit=on\n", encoding="utf-8")
+        client = make_client(taskrc=str(taskrc), task_data=str(tmp_path), native_reads=True)
+        assert client._native is None
+        tasks = [_task(1, urgency=2.0, priority="H"), _task(2, urgency=9.01)]
+        mock_exec.return_value = FakeProcess(stdout=json.dumps(tasks))
+        result = await client.next_tasks(1, ["project:A"])
+        assert [t["urgency"] for t in result["tasks"]] == [9.01]
+        assert _cmd(mock_exec.call_args)[-5:] == ["status:pending", "(", "project:A", ")", "export"]
+
+
+class TestSearchTasks:
+    """Tests für search_tasks (task_search)."""
+
+    async def test_ranked_with_filters(self, client: TaskwarriorClient, mock_exec: AsyncMock):
+        note = {"entry": "20250101T000000Z", "description": "Bericht fehlt"}
+        tasks = [
+            _task(1, project="Work", annotations=[note]),
+            _task(2, project="Work.Sub", description="Bericht schreiben"),
+            _task(3, project="Home", description="Bericht lesen"),
+            _task(4, status="completed", project="Work", description="Bericht alt"),
+        ]
+        mock_exec.return_value = FakeProcess(stdout=json.dumps(tasks))
+        result = await client.search_tasks("bericht", 10, status="pending", project="Work")
+        assert [t["uuid"] for t in result["tasks"]] == [tasks[1]["uuid"], tasks[0]["uuid"]]
+        assert result["total"] == 2
+        assert result["tasks"][0]["score"] > result["tasks"][1]["score"]
+        everything = await client.search_tasks("bericht", 1)
+        assert everything["total"] == 4
+        assert len(everything["tasks"]) == 1
+        assert mock_exec.call_count == 1
+
+
+class TestConcurrency:
+    """Tests für nebenläufige Ausführung."""
+
+    async def test_concurrent_calls_overlap(self, client: TaskwarriorClient, mock_exec: AsyncMock):
+        """Zwei langsame Exports laufen parallel statt nacheinander."""
+        mock_exec.side_effect = lambda *a, **kw: FakeProcess(stdout="[]", delay=0.2)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        # Verschiedene Filter, sonst teilen sie sich per Single-Flight einen Prozess
+        await asyncio.gather(client.export_tasks(["+a"]), client.export_tasks(["+b"]))
+        assert mock_exec.call_count == 2
+        assert loop.time() - start < 0.35
+
+
 class TestBuildCommand:
     """Tests für _build_command."""
 
@@ -211,22 +725,34 @@ class TestBuildCommand:
 class TestTimeout:
     """Tests für Timeout-Handling."""
 
-    def test_timeout_raises_taskwarrior_error(
-        self, client: TaskwarriorClient, mock_subprocess: MagicMock
+    async def test_timeout_raises_taskwarrior_error(
+        self, client: TaskwarriorClient, mock_exec: AsyncMock
     ):
-        import subprocess as sp
-        mock_subprocess.side_effect = sp.TimeoutExpired(cmd="task", timeout=10)
+        proc = FakeProcess(stdout="[]", delay=5)
+        mock_exec.return_value = proc
+        client.timeout = 0.05
         with pytest.raises(TaskwarriorError, match="Timeout"):
-            client._run(["export"])
+            await client._run(["export"])
+        # Hängender Prozess muss beendet werden
+        assert proc.killed
+
+    async def test_missing_binary_at_runtime_raises_error(
+        self, client: TaskwarriorClient, mock_exec: AsyncMock
+    ):
+        mock_exec.side_effect = FileNotFoundError("task")
+        with pytest.raises(TaskwarriorError, match="nicht gefunden"):
+            await client._run(["export"])
 
 
 class TestInstallationCheck:
     """Tests für _verify_installation."""
 
     def test_missing_binary_raises_error(self, settings: Settings):
-        with patch("taskwarrior_mcp.taskwarrior.shutil.which", return_value=None):
-            with pytest.raises(TaskwarriorError, match="not found in PATH"):
-                TaskwarriorClient(settings)
+        with (
+            patch("taskwarrior_mcp.taskwarrior.shutil.which", return_value=None),
+            pytest.raises(TaskwarriorError, match="not found in PATH"),
+        ):
+            TaskwarriorClient(settings)
 
     def test_version_parsed_correctly(self, settings: Settings):
         with patch("taskwarrior_mcp.taskwarrior.subprocess.run") as mock_run:
@@ -234,3 +760,47 @@ class TestInstallationCheck:
             client = TaskwarriorClient(settings)
             assert client.version == "3.1.2"
             assert client.major_version == 3
+
+    def test_cached_version_skips_process(self, settings: Settings):
+        with patch("taskwarrior_mcp.taskwarrior.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="3.1.2\n", stderr="")
+            TaskwarriorClient(settings)
+            client = TaskwarriorClient(settings)
+        assert mock_run.call_count == 1
+        assert client.version == "3.1.2"
+
+    def test_failed_version_call_is_not_cached(self, settings: Settings):
+        with patch("taskwarrior_mcp.taskwarrior.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=2, stdout="", stderr="kaputt")
+            TaskwarriorClient(settings)
+            TaskwarriorClient(settings)
+        assert mock_run.call_count == 2
+
+    def test_version_cache_can_be_disabled(self):
+        settings = Settings(task_binary="task", version_cache=False)
+        with patch("taskwarrior_mcp.taskwarrior.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="3.1.2\n", stderr="")
+            TaskwarriorClient(settings)
+            TaskwarriorClient(settings)
+        assert mock_run.call_count == 2
+
+    async def test_background_verification(self, settings: Settings, mock_exec: AsyncMock):
+        with patch("taskwarrior_mcp.taskwarrior.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="3.1.2\n", stderr="")
+            client = TaskwarriorClient(settings, verify=False)
+            mock_run.assert_not_called()
+            client.verify_in_background()
+            await client._run(["export"])
+        assert client.version == "3.1.2"
+        mock_exec.assert_awaited_once()
+
+    async def test_background_verification_error_reaches_commands(
+        self, settings: Settings, mock_exec: AsyncMock
+    ):
+        with patch("taskwarrior_mcp.taskwarrior.shutil.which", return_value=None):
+            client = TaskwarriorClient(settings, verify=False)
+            client.verify_in_background()
+            for _ in range(2):
+                with pytest.raises(TaskwarriorError, match="not found in PATH"):
+                    await client.export_tasks([])
+        mock_exec.assert_not_called()
@@ -0,0 +1,159 @@
+"""Unit-Tests für Trace- und Slow-Query-Log (tracing.py).
+
+Verifiziert:
+- Schwärzen von Freitext in Befehlszeilen und Filtern
+- Zuordnung zu Tool und Request-ID über call_context
+- Spans pro task-Prozess und Einträge für langsame Exporte
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from taskwarrior_mcp.taskwarrior import TaskwarriorError
+from taskwarrior_mcp.tracing import JsonLinesLog, call_context, current_call, redact
+from tests.conftest import FakeProcess, make_client, patch_exec
+
+
+class TestRedact:
+    """Tests für redact."""
+
+    @pytest.mark.parametrize(
+        ("arg", "expected"),
+        [
+            ("export", "export"),
+            ("rc.verbose=nothing", "rc.verbose=nothing"),
+            ("Steuererklärung abgeben", "***"),
+            ("project:Kunde.Acme", "project:***"),
+            ("description.contains:geheim", "description.contains:***"),
+            ("status:pending", "status:pending"),
+            ("due.before:eow", "due.before:eow"),
+            ("due:", "due:"),
+            ("limit:10", "limit:10"),
+            ("+privat", "+***"),
+            ("-privat", "-***"),
+            ("+OVERDUE", "+OVERDUE"),
+            ("(", "("),
+            ("or", "or"),
+            ("abcd1234", "abcd1234"),
+            ("a1b2c3d4-e5f6-4a7b-8c9d-0e1f2a3b4c5d", "a1b2c3d4-e5f6-4a7b-8c9d-0e1f2a3b4c5d"),
+            ("12", "12"),
+            ("meeting", "***"),
+            ("due:2026-03-01", "due:2026-03-01"),
+            ("priority:H", "priority:H"),
+            ("recur:weekly", "recur:weekly"),
+            ("depends:abcd1234,-12ef5678", "depends:abcd1234,-12ef5678"),
+            ("due: Anwalt wegen der Scheidung anrufen", "due:***"),
+            ("due:Anwalt", "due:***"),
+            ("status:geheim", "status:***"),
+            ("priority:Chefsache", "priority:***"),
+            ("limit:10 Kunden", "limit:***"),
+        ],
+    )
+    def test_args(self, arg: str, expected: str):
+        assert redact([arg]) == [expected]
+
+    def test_only_first_command_word_kept(self):
+        assert redact(["rc.confirmation=off", "add", "calendar"]) == [
+            "rc.confirmation=off",
+            "add",
+            "***",
+        ]
+
+
+class TestCallContext:
+    """Tests für call_context und current_call."""
+
+    def test_nested(self):
+        assert current_call() == {"tool": None, "request_id": None}
+        with call_context("task_list", "3"):
+            assert current_call() == {"tool": "task_list", "request_id": "3"}
+            with call_context(None):
+                assert current_call()["tool"] is None
+            assert current_call()["tool"] == "task_list"
+        assert current_call()["tool"] is None
+
+
+class TestJsonLinesLog:
+    """Tests für JsonLinesLog."""
+
+    def test_appends_lines(self, tmp_path: Path):
+        log = JsonLinesLog(tmp_path / "logs" / "trace.jsonl")
+        log.write({"a": 1})
+        log.write({"b": "ä"})
+        log.close()
+        lines = (tmp_path / "logs" / "trace.jsonl").read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line) for line in lines] == [{"a": 1}, {"b": "ä"}]
+
+    def test_unwritable_disables(self, tmp_path: Path):
+        blocker = tmp_path / "datei"
+        blocker.write_text("")
+        log = JsonLinesLog(blocker / "trace.jsonl")
+        log.write({"a": 1})
+        log.write({"a": 2})
+        assert log._disabled
+
+
+def _records(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+class TestTraceLog:
+    """Der TaskwarriorClient schreibt pro Prozess einen Span."""
+
+    async def test_spans(self, tmp_path: Path):
+        trace = tmp_path / "trace.jsonl"
+        client = make_client(trace_file=str(trace))
+        output = json.dumps([{"uuid": "a", "description": "geheim"}])
+        with patch(
+            "taskwarrior_mcp.taskwarrior.asyncio.create_subprocess_exec",
+            new=AsyncMock(
+                side_effect=[
+                    FakeProcess(stdout=output),
+                    FakeProcess(returncode=2, stderr="Fehler"),
+                ]
+            ),
+        ):
+            with call_context("task_list", "42"):
+                await client.export_tasks(["project:Privat", "+geheim"])
+            with pytest.raises(TaskwarriorError):
+                await client.add_task("Geheime Beschreibung")
+        await client.close()
+        export, add = _records(trace)
+        assert export["argv"][-3:] == ["project:***", "+***", "export"]
+        assert (export["tool"], export["request_id"]) == ("task_list", "42")
+        assert export["exit_code"] == 0
+        assert export["stdout_bytes"] == len(output)
+        assert export["end"] >= export["start"]
+        assert export["duration_ms"] >= 0
+        assert "Geheime Beschreibung" not in json.dumps(add)
+        assert (add["exit_code"], add["stderr_bytes"], add["tool"]) == (2, len("Fehler"), None)
+
+    def test_disabled_by_default(self):
+        client = make_client()
+        assert client._trace is None and client._slow_queries is None
+
+
+class TestSlowQueryLog:
+    """Exporte ab slow_query_threshold landen im Slow-Query-Log."""
+
+    async def test_logs_slow_export(self, tmp_path: Path):
+        slow = tmp_path / "slow.jsonl"
+        client = make_client(slow_query_file=str(slow), slow_query_threshold=0.0)
+        output = json.dumps([{"uuid": str(n), "description": "x"} for n in range(3)])
+        with patch_exec(stdout=output), call_context("task_list", "1"):
+            await client.export_tasks(["description.contains:rechnung", "status:pending"])
+        [record] = _records(slow)
+        assert record["filter"] == ["description.contains:***", "status:pending"]
+        assert record["rows"] == 3
+        assert record["native_filter"] is True
+        assert record["tool"] == "task_list"
+
+    async def test_fast_export_not_logged(self, tmp_path: Path):
+        slow = tmp_path / "slow.jsonl"
+        client = make_client(slow_query_file=str(slow), slow_query_threshold=60.0)
+        with patch_exec(stdout="[]"):
+            await client.export_tasks([])
+        assert not slow.exists()